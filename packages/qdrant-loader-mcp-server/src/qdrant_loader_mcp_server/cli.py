@@ -90,7 +90,11 @@ async def start_http_server(
         # Initialize components
         search_engine = SearchEngine()
         query_processor = QueryProcessor(config.openai)
-        mcp_handler = MCPHandler(search_engine, query_processor)
+        mcp_handler = MCPHandler(
+            search_engine,
+            query_processor,
+            enable_intelligence_tools=config.search.enable_intelligence_tools,
+        )
 
         # Initialize search engine
         try:
@@ -241,7 +245,11 @@ async def handle_stdio(config: Config, log_level: str):
         # Initialize components
         search_engine = SearchEngine()
         query_processor = QueryProcessor(config.openai)
-        mcp_handler = MCPHandler(search_engine, query_processor)
+        mcp_handler = MCPHandler(
+            search_engine,
+            query_processor,
+            enable_intelligence_tools=config.search.enable_intelligence_tools,
+        )
 
         # Initialize search engine
         try:
@@ -252,6 +260,34 @@ async def handle_stdio(config: Config, log_level: str):
             logger.error("Failed to initialize search engine", exc_info=True)
             raise RuntimeError("Failed to initialize search engine") from e
 
+        async def process_request(request: dict) -> None:
+            """Handle one request and write its response to stdout."""
+            try:
+                response = await mcp_handler.handle_request(request)
+                if not disable_console_logging:
+                    logger.debug("Sending response", response=response)
+                # Only write to stdout if response is not empty (not a notification)
+                if response:
+                    sys.stdout.write(json.dumps(response) + "\n")
+                    sys.stdout.flush()
+            except Exception as e:
+                if not disable_console_logging:
+                    logger.error("Error processing request", exc_info=True)
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request.get("id"),
+                    "error": {
+                        "code": -32603,
+                        "message": "Internal error",
+                        "data": str(e),
+                    },
+                }
+                sys.stdout.write(json.dumps(response) + "\n")
+                sys.stdout.flush()
+
+        # Requests run as tasks so the loop keeps reading, e.g. cancellations
+        pending: set[asyncio.Task] = set()
+
         reader = await read_stdin()
         if not disable_console_logging:
             logger.info("Server ready to handle requests")
@@ -333,28 +369,9 @@ async def handle_stdio(config: Config, log_level: str):
                     continue
 
                 # Process the request
-                try:
-                    response = await mcp_handler.handle_request(request)
-                    if not disable_console_logging:
-                        logger.debug("Sending response", response=response)
-                    # Only write to stdout if response is not empty (not a notification)
-                    if response:
-                        sys.stdout.write(json.dumps(response) + "\n")
-                        sys.stdout.flush()
-                except Exception as e:
-                    if not disable_console_logging:
-                        logger.error("Error processing request", exc_info=True)
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "error": {
-                            "code": -32603,
-                            "message": "Internal error",
-                            "data": str(e),
-                        },
-                    }
-                    sys.stdout.write(json.dumps(response) + "\n")
-                    sys.stdout.flush()
+                task = asyncio.create_task(process_request(request))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
 
             except asyncio.CancelledError:
                 if not disable_console_logging:
@@ -365,6 +382,10 @@ async def handle_stdio(config: Config, log_level: str):
                     logger.error("Error handling request", exc_info=True)
                 continue
 
+        # Finish the requests still in progress before cleaning up
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
         # Cleanup
         await search_engine.cleanup()
 
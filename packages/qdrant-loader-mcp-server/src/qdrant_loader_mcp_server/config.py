@@ -3,7 +3,7 @@
 import os
 import json
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -157,13 +157,45 @@ class SearchConfig(BaseModel):
         "fallback": 0,
     }
     conflict_use_llm: bool = True
-    conflict_max_llm_pairs: Annotated[int, Field(ge=0, le=10)] = 2
+    conflict_max_llm_pairs: Annotated[int, Field(ge=0, le=10)] = 8
     conflict_llm_model: str = "gpt-4o-mini"
     conflict_llm_timeout_s: Annotated[float, Field(gt=0, le=60)] = 12.0
     conflict_overall_timeout_s: Annotated[float, Field(gt=0, le=60)] = 9.0
     conflict_text_window_chars: Annotated[int, Field(ge=200, le=8000)] = 2000
     conflict_embeddings_timeout_s: Annotated[float, Field(gt=0, le=30)] = 2.0
     conflict_embeddings_max_concurrency: Annotated[int, Field(ge=1, le=20)] = 5
+    conflict_llm_max_concurrency: Annotated[int, Field(ge=1, le=10)] = 4
+    # SQLite file persisting LLM conflict verdicts across runs; None keeps
+    # them in memory only
+    conflict_llm_cache_path: str | None = None
+
+    # Knowledge graph written by the loader (global.knowledge_graph.path),
+    # loaded at startup; None disables graph-based reranking
+    knowledge_graph_path: str | None = None
+
+    # Algorithm of the semantic_embedding clustering strategy
+    clustering_algorithm: Literal["kmeans", "agglomerative", "hdbscan"] = "kmeans"
+
+    # Parsed spaCy Docs kept across requests; 0 caches them per request only
+    spacy_doc_cache_size: Annotated[int, Field(ge=0, le=100_000)] = 512
+
+    # Reassembled documents kept for expand_document/expand_cluster, for
+    # cache_ttl seconds; 0 disables the cache
+    document_cache_size: Annotated[int, Field(ge=0, le=10_000)] = 128
+
+    # Worker threads for CPU-bound analysis (clustering, similarity, facets,
+    # spaCy), concurrent calls per tool, and the run-time limit of one call
+    # (0 disables it)
+    analysis_max_workers: Annotated[int, Field(ge=1, le=64)] = 4
+    analysis_tool_concurrency: Annotated[int, Field(ge=1, le=64)] = 2
+    analysis_timeout_s: Annotated[float, Field(ge=0, le=600)] = 0.0
+
+    # Expose the cross-document intelligence tools; when disabled their
+    # components (spaCy similarity, clustering, facets) are never built
+    enable_intelligence_tools: bool = True
+    # Load the spaCy model and the intelligence components in the background
+    # after startup instead of on the first request that needs them
+    warmup_enabled: bool = True
 
     def __init__(self, **data):
         """Initialize with environment variables if not provided.
@@ -227,7 +259,7 @@ class SearchConfig(BaseModel):
             data["conflict_use_llm"] = parse_bool_env("SEARCH_CONFLICT_USE_LLM", True)
         if "conflict_max_llm_pairs" not in data:
             data["conflict_max_llm_pairs"] = parse_int_env(
-                "SEARCH_CONFLICT_MAX_LLM_PAIRS", 2, min_value=0, max_value=10
+                "SEARCH_CONFLICT_MAX_LLM_PAIRS", 8, min_value=0, max_value=10
             )
         if "conflict_llm_model" not in data:
             data["conflict_llm_model"] = os.getenv(
@@ -253,6 +285,48 @@ class SearchConfig(BaseModel):
             data["conflict_embeddings_max_concurrency"] = parse_int_env(
                 "SEARCH_CONFLICT_EMBEDDINGS_MAX_CONCURRENCY", 5, min_value=1, max_value=20
             )
+        if "conflict_llm_max_concurrency" not in data:
+            data["conflict_llm_max_concurrency"] = parse_int_env(
+                "SEARCH_CONFLICT_LLM_MAX_CONCURRENCY", 4, min_value=1, max_value=10
+            )
+        if "conflict_llm_cache_path" not in data:
+            data["conflict_llm_cache_path"] = (
+                os.getenv("SEARCH_CONFLICT_LLM_CACHE_PATH") or None
+            )
+        if "knowledge_graph_path" not in data:
+            data["knowledge_graph_path"] = (
+                os.getenv("SEARCH_KNOWLEDGE_GRAPH_PATH") or None
+            )
+        if "clustering_algorithm" not in data:
+            data["clustering_algorithm"] = (
+                os.getenv("SEARCH_CLUSTERING_ALGORITHM", "kmeans").strip().lower()
+            )
+        if "spacy_doc_cache_size" not in data:
+            data["spacy_doc_cache_size"] = parse_int_env(
+                "SEARCH_SPACY_DOC_CACHE_SIZE", 512, min_value=0, max_value=100_000
+            )
+        if "document_cache_size" not in data:
+            data["document_cache_size"] = parse_int_env(
+                "SEARCH_DOCUMENT_CACHE_SIZE", 128, min_value=0, max_value=10_000
+            )
+        if "analysis_max_workers" not in data:
+            data["analysis_max_workers"] = parse_int_env(
+                "SEARCH_ANALYSIS_MAX_WORKERS", 4, min_value=1, max_value=64
+            )
+        if "analysis_tool_concurrency" not in data:
+            data["analysis_tool_concurrency"] = parse_int_env(
+                "SEARCH_ANALYSIS_TOOL_CONCURRENCY", 2, min_value=1, max_value=64
+            )
+        if "analysis_timeout_s" not in data:
+            data["analysis_timeout_s"] = parse_float_env(
+                "SEARCH_ANALYSIS_TIMEOUT_S", 0.0, min_value=0.0, max_value=600.0
+            )
+        if "enable_intelligence_tools" not in data:
+            data["enable_intelligence_tools"] = parse_bool_env(
+                "SEARCH_ENABLE_INTELLIGENCE_TOOLS", True
+            )
+        if "warmup_enabled" not in data:
+            data["warmup_enabled"] = parse_bool_env("SEARCH_WARMUP_ENABLED", True)
         super().__init__(**data)
 
 
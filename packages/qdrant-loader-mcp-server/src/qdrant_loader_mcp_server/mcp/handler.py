@@ -1,8 +1,10 @@
 """MCP Handler implementation."""
 
+import asyncio
 from typing import Any
 
 from ..search.engine import SearchEngine
+from ..search.nlp.spacy_analyzer import doc_cache_scope
 from ..search.processor import QueryProcessor
 from ..utils import LoggingConfig, get_version
 from .intelligence_handler import IntelligenceHandler
@@ -13,15 +15,39 @@ from .search_handler import SearchHandler
 # Get logger for this module
 logger = LoggingConfig.get_logger("src.mcp.handler")
 
+# Direct JSON-RPC methods of the cross-document intelligence tools
+INTELLIGENCE_METHODS = frozenset(
+    {
+        "analyze_document_relationships",
+        "find_similar_documents",
+        "detect_document_conflicts",
+        "find_complementary_content",
+        "cluster_documents",
+    }
+)
+
 
 class MCPHandler:
     """MCP Handler for processing RAG requests."""
 
-    def __init__(self, search_engine: SearchEngine, query_processor: QueryProcessor):
-        """Initialize MCP Handler."""
+    def __init__(
+        self,
+        search_engine: SearchEngine,
+        query_processor: QueryProcessor,
+        enable_intelligence_tools: bool = True,
+    ):
+        """Initialize MCP Handler.
+
+        Args:
+            search_engine: Search engine serving the tools
+            query_processor: Processor of natural language queries
+            enable_intelligence_tools: Expose the cross-document intelligence
+                tools; when False they are neither listed nor callable
+        """
         self.protocol = MCPProtocol()
         self.search_engine = search_engine
         self.query_processor = query_processor
+        self.enable_intelligence_tools = enable_intelligence_tools
 
         # Initialize specialized handlers
         self.search_handler = SearchHandler(
@@ -29,21 +55,41 @@ class MCPHandler:
         )
         self.intelligence_handler = IntelligenceHandler(search_engine, self.protocol)
 
+        # Requests in progress by (session, request id), so that clients can
+        # cancel them; request ids are only unique within a session
+        self._inflight: dict[tuple[str | None, str | int], asyncio.Task] = {}
+        self._cancelled: set[tuple[str | None, str | int]] = set()
+
         # Reduce noise on startup: use DEBUG level instead of INFO
         logger.debug("MCP Handler initialized")
 
     async def handle_request(
-        self, request: dict[str, Any], headers: dict[str, str] | None = None
+        self,
+        request: dict[str, Any],
+        headers: dict[str, str] | None = None,
+        session_id: str | None = None,
     ) -> dict[str, Any]:
         """Handle MCP request.
 
         Args:
             request: The request to handle
             headers: Optional HTTP headers for protocol validation
+            session_id: Session of the client that sent the request
 
         Returns:
             Dict[str, Any]: The response
         """
+        # Parse each text with spaCy at most once per request
+        with doc_cache_scope():
+            return await self._handle_request(request, headers, session_id)
+
+    async def _handle_request(
+        self,
+        request: dict[str, Any],
+        headers: dict[str, str] | None,
+        session_id: str | None,
+    ) -> dict[str, Any]:
+        """Validate a request and dispatch it to the handler of its method."""
         logger.debug("Handling request", request=request)
 
         # Optional protocol version validation from headers
@@ -88,8 +134,14 @@ class MCPHandler:
         # Handle notifications (requests without id)
         if request_id is None:
             logger.debug("Handling notification", method=method)
+            if method == "notifications/cancelled" and isinstance(params, dict):
+                self._cancel_request(params.get("requestId"), session_id)
             return {}
 
+        key = (session_id, request_id)
+        task = asyncio.current_task()
+        if task is not None:
+            self._inflight[key] = task
         try:
             if method == "initialize":
                 logger.info("Handling initialize request")
@@ -120,6 +172,8 @@ class MCPHandler:
             elif method == "search":
                 logger.info("Handling search request")
                 return await self.search_handler.handle_search(request_id, params)
+            elif method in INTELLIGENCE_METHODS and not self.enable_intelligence_tools:
+                return self._tool_disabled_response(request_id, method)
             # Cross-Document Intelligence Methods
             elif method == "analyze_document_relationships":
                 logger.info("Handling document relationship analysis request")
@@ -151,7 +205,12 @@ class MCPHandler:
             elif method == "tools/call":
                 logger.info("Handling tools/call request")
                 tool_name = params.get("name")
-                if tool_name == "search":
+                if (
+                    tool_name in MCPSchemas.INTELLIGENCE_TOOLS
+                    and not self.enable_intelligence_tools
+                ):
+                    return self._tool_disabled_response(request_id, tool_name)
+                elif tool_name == "search":
                     return await self.search_handler.handle_search(
                         request_id, params.get("arguments", {})
                     )
@@ -218,12 +277,57 @@ class MCPHandler:
                         "data": f"Method '{method}' not found",
                     },
                 )
+        except asyncio.CancelledError:
+            # Only answer requests the client cancelled; shutdown still cancels
+            if key not in self._cancelled or task is None:
+                raise
+            task.uncancel()
+            logger.info("Request cancelled by client", request_id=request_id)
+            return self.protocol.create_response(
+                request_id,
+                error={"code": -32800, "message": "Request cancelled"},
+            )
         except Exception as e:
             logger.error("Error handling request", exc_info=True)
             return self.protocol.create_response(
                 request_id,
                 error={"code": -32603, "message": "Internal error", "data": str(e)},
             )
+        finally:
+            # A reused id may already belong to a newer request of the session
+            if task is not None and self._inflight.get(key) is task:
+                del self._inflight[key]
+                self._cancelled.discard(key)
+
+    def _cancel_request(
+        self, request_id: str | int | None, session_id: str | None
+    ) -> None:
+        """Cancel a request in progress, stopping its analysis work."""
+        key = (session_id, request_id)
+        task = self._inflight.get(key) if request_id is not None else None
+        if task is None or task.done():
+            logger.debug("No request in progress to cancel", request_id=request_id)
+            return
+        logger.info("Cancelling request", request_id=request_id)
+        self._cancelled.add(key)
+        task.cancel()
+
+    def _tool_disabled_response(
+        self, request_id: str | int | None, tool_name: str
+    ) -> dict[str, Any]:
+        """Create the error response for a call to a disabled tool."""
+        logger.warning("Disabled tool requested", tool_name=tool_name)
+        return self.protocol.create_response(
+            request_id,
+            error={
+                "code": -32601,
+                "message": "Method not found",
+                "data": (
+                    f"Tool '{tool_name}' is disabled "
+                    "(SEARCH_ENABLE_INTELLIGENCE_TOOLS=false)"
+                ),
+            },
+        )
 
     async def _handle_initialize(
         self, request_id: str | int | None, params: dict[str, Any]
@@ -266,7 +370,9 @@ class MCPHandler:
         logger.debug("Listing offerings with params", params=params)
 
         # Get all tool schemas from the schemas module
-        all_tools = MCPSchemas.get_all_tool_schemas()
+        all_tools = MCPSchemas.get_all_tool_schemas(
+            include_intelligence=self.enable_intelligence_tools
+        )
 
         # If the method is tools/list, return the tools array with nextCursor
         if method == "tools/list":
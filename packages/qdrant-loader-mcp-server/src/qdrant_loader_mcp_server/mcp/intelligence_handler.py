@@ -2,6 +2,8 @@
 
 import hashlib
 import json
+import secrets
+from collections import OrderedDict
 from typing import Any
 import math
 
@@ -17,11 +19,16 @@ logger = LoggingConfig.get_logger("src.mcp.intelligence_handler")
 class IntelligenceHandler:
     """Handler for cross-document intelligence operations."""
 
+    # Clusters of recent cluster_documents calls kept for expand_cluster
+    CLUSTER_CACHE_SIZE = 64
+
     def __init__(self, search_engine: SearchEngine, protocol: MCPProtocol):
         """Initialize intelligence handler."""
         self.search_engine = search_engine
         self.protocol = protocol
         self.formatters = MCPFormatters()
+        # Namespaced cluster ID -> name and members
+        self._clusters: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     def _get_or_create_document_id(self, doc: Any) -> str:
         """Return a stable, collision-resistant document id.
@@ -349,8 +356,11 @@ class IntelligenceHandler:
         """Handle find similar documents request."""
         logger.debug("Handling find similar documents with params", params=params)
 
-        # Validate required parameters
-        if "target_query" not in params or "comparison_query" not in params:
+        # Validate required parameters; vector mode needs no comparison query
+        similarity_mode = params.get("similarity_mode", "metrics")
+        if "target_query" not in params or (
+            similarity_mode != "vector" and "comparison_query" not in params
+        ):
             logger.error(
                 "Missing required parameters: target_query and comparison_query"
             )
@@ -367,17 +377,24 @@ class IntelligenceHandler:
             logger.info(
                 "Performing find similar documents using SearchEngine...",
                 target_query=params["target_query"],
-                comparison_query=params["comparison_query"],
+                comparison_query=params.get("comparison_query"),
+                similarity_mode=similarity_mode,
             )
 
             # Use the sophisticated SearchEngine method
+            # Build kwargs, include the mode only if explicitly provided
+            similar_kwargs: dict[str, Any] = {
+                "target_query": params["target_query"],
+                "comparison_query": params.get("comparison_query"),
+                "similarity_metrics": params.get("similarity_metrics"),
+                "max_similar": params.get("max_similar", 5),
+                "source_types": params.get("source_types"),
+                "project_ids": params.get("project_ids"),
+            }
+            if "similarity_mode" in params:
+                similar_kwargs["similarity_mode"] = similarity_mode
             similar_docs = await self.search_engine.find_similar_documents(
-                target_query=params["target_query"],
-                comparison_query=params["comparison_query"],
-                similarity_metrics=params.get("similarity_metrics"),
-                max_similar=params.get("max_similar", 5),
-                source_types=params.get("source_types"),
-                project_ids=params.get("project_ids"),
+                **similar_kwargs
             )
 
             logger.info(f"Got {len(similar_docs)} similar documents from SearchEngine")
@@ -406,7 +423,9 @@ class IntelligenceHandler:
             # ✅ Create structured content for MCP compliance using lightweight formatter
             structured_content = (
                 self.formatters.create_lightweight_similar_documents_results(
-                    similar_docs, params["target_query"], params["comparison_query"]
+                    similar_docs,
+                    params["target_query"],
+                    params.get("comparison_query", ""),
                 )
             )
 
@@ -624,9 +643,11 @@ class IntelligenceHandler:
                 strategy=params.get("strategy", "mixed_features"),
                 source_types=params.get("source_types"),
                 project_ids=params.get("project_ids"),
+                incremental=params.get("incremental", False),
             )
 
             logger.info("Document clustering completed successfully")
+            clustering_results = self._remember_clusters(clustering_results)
 
             # Create lightweight clustering response following hierarchy_search pattern
             mcp_clustering_results = self.formatters.create_lightweight_cluster_results(
@@ -656,6 +677,106 @@ class IntelligenceHandler:
                 error={"code": -32603, "message": "Internal server error"},
             )
 
+    def _remember_clusters(self, clustering_results: dict[str, Any]) -> dict[str, Any]:
+        """Keep the members of each cluster for expand_cluster.
+
+        Cluster IDs are only unique within one clustering call, so they are
+        prefixed with a token of the call; the results are returned with the
+        prefixed IDs. Members are deduplicated by document ID, and members
+        without one are kept as they are since they cannot be fetched again.
+        """
+        call_token = secrets.token_hex(4)
+        clusters = []
+        for cluster in clustering_results.get("clusters", []):
+            cluster_id = cluster.get("id")
+            if cluster_id is None:
+                clusters.append(cluster)
+                continue
+            cluster_id = f"{call_token}:{cluster_id}"
+            # Member key -> None when fetched by document ID, else the result
+            members: dict[str, Any] = {}
+            for doc in cluster.get("documents", []):
+                doc_id = (
+                    doc.get("document_id")
+                    if isinstance(doc, dict)
+                    else getattr(doc, "document_id", None)
+                )
+                if doc_id:
+                    members.setdefault(doc_id, None)
+                else:
+                    members.setdefault(self._get_or_create_document_id(doc), doc)
+            self._clusters[cluster_id] = {
+                "name": cluster.get("name", str(cluster["id"])),
+                "members": list(members.items()),
+            }
+            self._clusters.move_to_end(cluster_id)
+            clusters.append({**cluster, "id": cluster_id})
+        while len(self._clusters) > self.CLUSTER_CACHE_SIZE:
+            self._clusters.popitem(last=False)
+        return {**clustering_results, "clusters": clusters}
+
+    async def _expand_known_cluster(
+        self,
+        request_id: str | int | None,
+        cluster_id: str,
+        cluster: dict[str, Any],
+        limit: int,
+        offset: int,
+        include_metadata: bool,
+    ) -> dict[str, Any]:
+        """Fetch a page of the documents of a remembered cluster by ID."""
+        members = cluster["members"]
+        page = members[offset : offset + limit]
+        page_ids = [key for key, result in page if result is None]
+        # One lookup for the whole page, without searching
+        fetched = await self.search_engine.get_documents(page_ids) if page_ids else {}
+        documents = [
+            fetched.get(key) if result is None else result for key, result in page
+        ]
+        documents = [document for document in documents if document is not None]
+
+        structured_documents = self.formatters.create_structured_search_results(
+            documents
+        )
+        if not include_metadata:
+            for document in structured_documents:
+                document.pop("metadata", None)
+
+        total = len(members)
+        expansion_result = {
+            "cluster_id": cluster_id,
+            "cluster_info": {
+                "cluster_name": cluster["name"],
+                "document_count": total,
+                "documents_found": len(documents),
+                "include_metadata": include_metadata,
+            },
+            "documents": structured_documents,
+            "pagination": {
+                "offset": offset,
+                "limit": limit,
+                "total": total,
+                "has_more": offset + limit < total,
+            },
+        }
+
+        text = (
+            f"🔄 **Cluster Expansion: {cluster['name']}**\n\n"
+            f"Cluster ID: {cluster_id}\n"
+            f"Showing {len(documents)} of {total} documents (offset {offset})\n\n"
+        ) + "\n\n".join(
+            self.formatters.format_search_result(document) for document in documents
+        )
+
+        return self.protocol.create_response(
+            request_id,
+            result={
+                "content": [{"type": "text", "text": text}],
+                "structuredContent": expansion_result,
+                "isError": False,
+            },
+        )
+
     async def handle_expand_cluster(
         self, request_id: str | int | None, params: dict[str, Any]
     ) -> dict[str, Any]:
@@ -683,12 +804,20 @@ class IntelligenceHandler:
                 f"Expanding cluster {cluster_id} with limit={limit}, offset={offset}"
             )
 
-            # For now, we need to re-run clustering to get cluster data
-            # In a production system, this would be cached or stored
-            # This is a placeholder implementation
+            cluster = self._clusters.get(str(cluster_id))
+            if cluster is not None:
+                self._clusters.move_to_end(str(cluster_id))
+                return await self._expand_known_cluster(
+                    request_id,
+                    str(cluster_id),
+                    cluster,
+                    limit,
+                    offset,
+                    include_metadata,
+                )
 
-            # Since we don't have cluster data persistence yet, return a helpful message
-            # In the future, this would retrieve stored cluster data and expand it
+            # Clusters are only known from recent cluster_documents calls;
+            # for any other ID, ask for clustering to be run again
 
             expansion_result = {
                 "cluster_id": cluster_id,
@@ -716,10 +845,9 @@ class IntelligenceHandler:
                         {
                             "type": "text",
                             "text": f"🔄 **Cluster Expansion Request**\n\nCluster ID: {cluster_id}\n\n"
-                            + "Currently, cluster expansion requires re-running the clustering operation. "
-                            + "The lightweight cluster response provides the first 5 documents per cluster. "
-                            + "For complete cluster content, please run `cluster_documents` again.\n\n"
-                            + "💡 **Future Enhancement**: Cluster data will be cached to enable true lazy loading.",
+                            + "This cluster is not among the clusters of recent `cluster_documents` calls, "
+                            + "so its documents cannot be expanded. "
+                            + "Please run `cluster_documents` again and expand one of its cluster IDs.",
                         }
                     ],
                     "structuredContent": expansion_result,
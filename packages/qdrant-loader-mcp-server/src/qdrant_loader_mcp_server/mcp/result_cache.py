@@ -0,0 +1,94 @@
+"""Server-side cache of search result sets for cursor-based pagination."""
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..utils import LoggingConfig
+
+logger = LoggingConfig.get_logger("src.mcp.result_cache")
+
+
+@dataclass
+class ResultSet:
+    """Results of one search tool call, kept for paging through them."""
+
+    set_id: str
+    tool: str
+    results: list[Any]
+    # Arguments of the original call, reused to format later pages
+    params: dict[str, Any]
+    created_at: float = field(default_factory=time.time)
+
+
+class ResultSetCache:
+    """Keeps recent result sets so that later pages skip retrieval.
+
+    A cursor names a result set and the offset of the next page. Result sets
+    expire after ``ttl`` seconds and the least recently paged set is evicted
+    once ``max_size`` sets are cached.
+    """
+
+    def __init__(self, max_size: int = 64, ttl: int = 600):
+        """Initialize the result set cache.
+
+        Args:
+            max_size: Maximum number of cached result sets
+            ttl: Time-to-live of a result set in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._sets: OrderedDict[str, ResultSet] = OrderedDict()
+
+    def store(self, tool: str, results: list[Any], params: dict[str, Any]) -> ResultSet:
+        """Cache the results of a tool call and return the new result set."""
+        self._evict_expired()
+        result_set = ResultSet(
+            set_id=secrets.token_urlsafe(12),
+            tool=tool,
+            results=results,
+            params={k: v for k, v in params.items() if k != "cursor"},
+            created_at=time.time(),
+        )
+        self._sets[result_set.set_id] = result_set
+        while len(self._sets) > self.max_size:
+            self._sets.popitem(last=False)
+        logger.debug(
+            "Cached result set",
+            tool=tool,
+            set_id=result_set.set_id,
+            result_count=len(results),
+        )
+        return result_set
+
+    @staticmethod
+    def cursor(result_set: ResultSet, offset: int) -> str:
+        """Create the cursor of the page of ``result_set`` starting at ``offset``."""
+        return f"{result_set.set_id}:{offset}"
+
+    def resolve(self, cursor: str, tool: str) -> tuple[ResultSet, int] | None:
+        """Get the result set and page offset of a cursor.
+
+        Returns:
+            None if the cursor is malformed, expired or belongs to another tool
+        """
+        self._evict_expired()
+        set_id, _, offset = str(cursor).rpartition(":")
+        result_set = self._sets.get(set_id)
+        if result_set is None or result_set.tool != tool or not offset.isdigit():
+            return None
+        self._sets.move_to_end(set_id)
+        return result_set, int(offset)
+
+    def _evict_expired(self) -> None:
+        """Remove result sets older than the time-to-live."""
+        expired_before = time.time() - self.ttl
+        expired = [
+            set_id
+            for set_id, result_set in self._sets.items()
+            if result_set.created_at <= expired_before
+        ]
+        for set_id in expired:
+            del self._sets[set_id]
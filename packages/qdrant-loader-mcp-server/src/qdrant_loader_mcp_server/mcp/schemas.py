@@ -6,6 +6,18 @@ from typing import Any
 class MCPSchemas:
     """Tool schema definitions for MCP server."""
 
+    # Cross-document intelligence tools, which can be disabled as a group
+    INTELLIGENCE_TOOLS = frozenset(
+        {
+            "analyze_relationships",
+            "find_similar_documents",
+            "detect_document_conflicts",
+            "find_complementary_content",
+            "cluster_documents",
+            "expand_cluster",
+        }
+    )
+
     @staticmethod
     def get_search_tool_schema() -> dict[str, Any]:
         """Get the basic search tool schema."""
@@ -46,6 +58,14 @@ class MCPSchemas:
                         "description": "Maximum number of results to return",
                         "default": 5,
                     },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Split the results retrieved for limit into pages of this size (raise limit to page through more results); the response then includes a next_cursor while more pages remain",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor of a previous call, to get the next page without searching again (other arguments are ignored)",
+                    },
                 },
                 "required": ["query"],
             },
@@ -74,6 +94,7 @@ class MCPSchemas:
                         },
                     },
                     "total_found": {"type": "integer"},
+                    "next_cursor": {"type": "string"},
                     "query_context": {
                         "type": "object",
                         "properties": {
@@ -137,6 +158,14 @@ class MCPSchemas:
                         "description": "Maximum number of results to return",
                         "default": 10,
                     },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Split the results retrieved for limit into pages of this size (raise limit to page through more results); the response then includes a next_cursor while more pages remain",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor of a previous call, to get the next page without searching again (other arguments are ignored)",
+                    },
                 },
                 "required": ["query"],
             },
@@ -166,6 +195,7 @@ class MCPSchemas:
                         },
                     },
                     "total_found": {"type": "integer"},
+                    "next_cursor": {"type": "string"},
                     "hierarchy_organization": {
                         "type": "object",
                         "properties": {
@@ -233,6 +263,14 @@ class MCPSchemas:
                         "description": "Maximum number of results to return",
                         "default": 10,
                     },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Split the results retrieved for limit into pages of this size (raise limit to page through more results); the response then includes a next_cursor while more pages remain",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor of a previous call, to get the next page without searching again (other arguments are ignored)",
+                    },
                 },
                 "required": ["query"],
             },
@@ -269,6 +307,7 @@ class MCPSchemas:
                         },
                     },
                     "total_found": {"type": "integer"},
+                    "next_cursor": {"type": "string"},
                     "attachment_summary": {
                         "type": "object",
                         "properties": {
@@ -374,7 +413,7 @@ class MCPSchemas:
                     },
                     "comparison_query": {
                         "type": "string",
-                        "description": "Query to get documents to compare against",
+                        "description": "Query to get documents to compare against (not used in vector mode)",
                     },
                     "similarity_metrics": {
                         "type": "array",
@@ -406,8 +445,14 @@ class MCPSchemas:
                         "items": {"type": "string"},
                         "description": "Optional list of project IDs to filter by",
                     },
+                    "similarity_mode": {
+                        "type": "string",
+                        "enum": ["metrics", "vector"],
+                        "description": "'metrics' compares the target with the comparison query results; 'vector' searches the whole collection using the stored embeddings of the target",
+                        "default": "metrics",
+                    },
                 },
-                "required": ["target_query", "comparison_query"],
+                "required": ["target_query"],
             },
             "outputSchema": {
                 "type": "object",
@@ -663,9 +708,10 @@ class MCPSchemas:
                             "topic_based",
                             "project_based",
                             "hierarchical",
+                            "semantic_embedding",
                             "adaptive",
                         ],
-                        "description": "Clustering strategy to use (adaptive automatically selects the best strategy)",
+                        "description": "Clustering strategy to use (adaptive automatically selects the best strategy; semantic_embedding clusters the stored document vectors)",
                         "default": "mixed_features",
                     },
                     "max_clusters": {
@@ -693,6 +739,11 @@ class MCPSchemas:
                         "items": {"type": "string"},
                         "description": "Optional list of project IDs to filter by",
                     },
+                    "incremental": {
+                        "type": "boolean",
+                        "description": "With semantic_embedding, assign documents to the clusters of earlier requests when they fit instead of clustering again",
+                        "default": False,
+                    },
                 },
                 "required": ["query"],
             },
@@ -888,9 +939,15 @@ class MCPSchemas:
         }
 
     @classmethod
-    def get_all_tool_schemas(cls) -> list[dict[str, Any]]:
-        """Get all tool schemas."""
-        return [
+    def get_all_tool_schemas(
+        cls, include_intelligence: bool = True
+    ) -> list[dict[str, Any]]:
+        """Get all tool schemas.
+
+        Args:
+            include_intelligence: Include the cross-document intelligence tools
+        """
+        schemas = [
             cls.get_search_tool_schema(),
             cls.get_hierarchy_search_tool_schema(),
             cls.get_attachment_search_tool_schema(),
@@ -902,3 +959,6 @@ class MCPSchemas:
             cls.get_expand_document_tool_schema(),  # ✅ Add expand_document tool
             cls.get_expand_cluster_tool_schema(),  # ✅ Add expand_cluster tool
         ]
+        if include_intelligence:
+            return schemas
+        return [s for s in schemas if s["name"] not in cls.INTELLIGENCE_TOOLS]
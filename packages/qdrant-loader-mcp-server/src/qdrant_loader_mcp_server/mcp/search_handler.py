@@ -9,6 +9,7 @@ from ..search.processor import QueryProcessor
 from ..utils import LoggingConfig
 from .formatters import MCPFormatters
 from .protocol import MCPProtocol
+from .result_cache import ResultSet, ResultSetCache
 
 # Get logger for this module
 logger = LoggingConfig.get_logger("src.mcp.search_handler")
@@ -22,12 +23,15 @@ class SearchHandler:
         search_engine: SearchEngine,
         query_processor: QueryProcessor,
         protocol: MCPProtocol,
+        result_cache: ResultSetCache | None = None,
     ):
         """Initialize search handler."""
         self.search_engine = search_engine
         self.query_processor = query_processor
         self.protocol = protocol
         self.formatters = MCPFormatters()
+        # Result sets of paged searches, resumed by cursor
+        self.result_cache = result_cache or ResultSetCache()
 
     async def handle_search(
         self, request_id: str | int | None, params: dict[str, Any]
@@ -35,6 +39,15 @@ class SearchHandler:
         """Handle basic search request."""
         logger.debug("Handling search request with params", params=params)
 
+        # Continue a paged result set without re-running retrieval
+        result_set, offset = None, 0
+        if params.get("cursor"):
+            resumed = self.result_cache.resolve(params["cursor"], "search")
+            if resumed is None:
+                return self._invalid_cursor_response(request_id, params["cursor"])
+            result_set, offset = resumed
+            params = result_set.params
+
         # Validate required parameters
         if "query" not in params:
             logger.error("Missing required parameter: query")
@@ -62,36 +75,42 @@ class SearchHandler:
         )
 
         try:
-            # Process the query
-            logger.debug("Processing query with OpenAI")
-            processed_query = await self.query_processor.process_query(query)
-            logger.debug(
-                "Query processed successfully", processed_query=processed_query
-            )
+            if result_set is None:
+                # Process the query
+                logger.debug("Processing query with OpenAI")
+                processed_query = await self.query_processor.process_query(query)
+                logger.debug(
+                    "Query processed successfully", processed_query=processed_query
+                )
 
-            # Perform the search
-            logger.debug("Executing search in Qdrant")
-            results = await self.search_engine.search(
-                query=processed_query["query"],
-                source_types=source_types,
-                project_ids=project_ids,
-                limit=limit,
-            )
-            logger.info(
-                "Search completed successfully",
-                result_count=len(results),
-                first_result_score=results[0].score if results else None,
+                # Perform the search
+                logger.debug("Executing search in Qdrant")
+                results = await self.search_engine.search(
+                    query=processed_query["query"],
+                    source_types=source_types,
+                    project_ids=project_ids,
+                    limit=limit,
+                )
+                logger.info(
+                    "Search completed successfully",
+                    result_count=len(results),
+                    first_result_score=results[0].score if results else None,
+                )
+            else:
+                results = result_set.results
+
+            page, next_cursor = self._paginate(
+                "search", results, params, result_set, offset
             )
 
             # Create structured results for MCP 2025-06-18 compliance
-            structured_results = self.formatters.create_structured_search_results(
-                results
-            )
+            structured_results = self.formatters.create_structured_search_results(page)
 
             # Keep existing text response for backward compatibility
             text_response = f"Found {len(results)} results:\n\n" + "\n\n".join(
-                self.formatters.format_search_result(result) for result in results
+                self.formatters.format_search_result(result) for result in page
             )
+            text_response += self._next_page_hint("search", next_cursor)
 
             # Format the response with both text and structured content
             response = self.protocol.create_response(
@@ -103,15 +122,19 @@ class SearchHandler:
                             "text": text_response,
                         }
                     ],
-                    "structuredContent": {
-                        "results": structured_results,
-                        "total_found": len(results),
-                        "query_context": {
-                            "original_query": query,
-                            "source_types_filtered": source_types,
-                            "project_ids_filtered": project_ids,
+                    "structuredContent": self._with_page_info(
+                        {
+                            "results": structured_results,
+                            "total_found": len(results),
+                            "query_context": {
+                                "original_query": query,
+                                "source_types_filtered": source_types,
+                                "project_ids_filtered": project_ids,
+                            },
                         },
-                    },
+                        len(results),
+                        next_cursor,
+                    ),
                     "isError": False,
                 },
             )
@@ -131,6 +154,15 @@ class SearchHandler:
         """Handle hierarchical search request for Confluence documents."""
         logger.debug("Handling hierarchy search request with params", params=params)
 
+        # Continue a paged result set without re-running retrieval
+        result_set, offset = None, 0
+        if params.get("cursor"):
+            resumed = self.result_cache.resolve(params["cursor"], "hierarchy_search")
+            if resumed is None:
+                return self._invalid_cursor_response(request_id, params["cursor"])
+            result_set, offset = resumed
+            params = result_set.params
+
         # Validate required parameters
         if "query" not in params:
             logger.error("Missing required parameter: query")
@@ -158,62 +190,77 @@ class SearchHandler:
         )
 
         try:
-            # Process the query
-            logger.debug("Processing query with OpenAI")
-            processed_query = await self.query_processor.process_query(query)
-            logger.debug(
-                "Query processed successfully", processed_query=processed_query
-            )
+            if result_set is None:
+                # Process the query
+                logger.debug("Processing query with OpenAI")
+                processed_query = await self.query_processor.process_query(query)
+                logger.debug(
+                    "Query processed successfully", processed_query=processed_query
+                )
 
-            # Perform the search (All source types for hierarchy - localfiles have folder structure)
-            logger.debug("Executing hierarchy search in Qdrant")
-            results = await self.search_engine.search(
-                query=processed_query["query"],
-                source_types=[
-                    "confluence",
-                    "localfile",
-                ],  # Include localfiles with folder structure
-                limit=max(
-                    limit * 2, 40
-                ),  # Get enough results to filter for hierarchy navigation
-            )
+                # Perform the search (All source types for hierarchy - localfiles have folder structure)
+                logger.debug("Executing hierarchy search in Qdrant")
+                results = await self.search_engine.search(
+                    query=processed_query["query"],
+                    source_types=[
+                        "confluence",
+                        "localfile",
+                    ],  # Include localfiles with folder structure
+                    limit=max(
+                        limit * 2, 40
+                    ),  # Get enough results to filter for hierarchy navigation
+                )
 
-            # Apply hierarchy filters (support sync or async patched functions in tests)
-            maybe_filtered = self._apply_hierarchy_filters(results, hierarchy_filter)
-            filtered_results = (
-                await maybe_filtered
-                if inspect.isawaitable(maybe_filtered)
-                else maybe_filtered
-            )
+                # Apply hierarchy filters (support sync or async patched functions in tests)
+                maybe_filtered = self._apply_hierarchy_filters(
+                    results, hierarchy_filter
+                )
+                filtered_results = (
+                    await maybe_filtered
+                    if inspect.isawaitable(maybe_filtered)
+                    else maybe_filtered
+                )
+
+                # For hierarchy search, prioritize returning more documents for better hierarchy navigation
+                # Limit to maximum of 20 documents for hierarchy index (not just the user's limit)
+                hierarchy_limit = max(limit, 20)
+                filtered_results = filtered_results[:hierarchy_limit]
+            else:
+                filtered_results = result_set.results
 
-            # For hierarchy search, prioritize returning more documents for better hierarchy navigation
-            # Limit to maximum of 20 documents for hierarchy index (not just the user's limit)
-            hierarchy_limit = max(limit, 20)
-            filtered_results = filtered_results[:hierarchy_limit]
+            all_results = filtered_results
+            filtered_results, next_cursor = self._paginate(
+                "hierarchy_search", all_results, params, result_set, offset
+            )
 
             # Organize results if requested
             organized_results = None
             if organize_by_hierarchy:
                 organized_results = self._organize_by_hierarchy(filtered_results)
                 response_text = self._format_lightweight_hierarchy_text(
-                    organized_results, len(filtered_results)
+                    organized_results, len(all_results)
                 )
             else:
                 response_text = self._format_lightweight_hierarchy_text(
-                    {}, len(filtered_results)
+                    {}, len(all_results)
                 )
+            response_text += self._next_page_hint("hierarchy_search", next_cursor)
 
             logger.info(
                 "Hierarchy search completed successfully",
-                result_count=len(filtered_results),
+                result_count=len(all_results),
                 first_result_score=(
                     filtered_results[0].score if filtered_results else None
                 ),
             )
 
             # Create structured content for MCP compliance
-            structured_content = self.formatters.create_lightweight_hierarchy_results(
-                filtered_results, organized_results, query
+            structured_content = self._with_page_info(
+                self.formatters.create_lightweight_hierarchy_results(
+                    filtered_results, organized_results, query
+                ),
+                len(all_results),
+                next_cursor,
             )
 
             # Format the response with both text and structured content
@@ -246,6 +293,15 @@ class SearchHandler:
         """Handle attachment search request."""
         logger.debug("Handling attachment search request with params", params=params)
 
+        # Continue a paged result set without re-running retrieval
+        result_set, offset = None, 0
+        if params.get("cursor"):
+            resumed = self.result_cache.resolve(params["cursor"], "attachment_search")
+            if resumed is None:
+                return self._invalid_cursor_response(request_id, params["cursor"])
+            result_set, offset = resumed
+            params = result_set.params
+
         # Validate required parameters
         if "query" not in params:
             logger.error("Missing required parameter: query")
@@ -273,36 +329,44 @@ class SearchHandler:
         )
 
         try:
-            # Process the query
-            logger.debug("Processing query with OpenAI")
-            processed_query = await self.query_processor.process_query(query)
-            logger.debug(
-                "Query processed successfully", processed_query=processed_query
-            )
+            if result_set is None:
+                # Process the query
+                logger.debug("Processing query with OpenAI")
+                processed_query = await self.query_processor.process_query(query)
+                logger.debug(
+                    "Query processed successfully", processed_query=processed_query
+                )
 
-            # Perform the search
-            logger.debug("Executing attachment search in Qdrant")
-            results = await self.search_engine.search(
-                query=processed_query["query"],
-                source_types=None,  # Search all sources for attachments
-                limit=limit * 2,  # Get more results to filter
-            )
+                # Perform the search
+                logger.debug("Executing attachment search in Qdrant")
+                results = await self.search_engine.search(
+                    query=processed_query["query"],
+                    source_types=None,  # Search all sources for attachments
+                    limit=limit * 2,  # Get more results to filter
+                )
 
-            # Apply lightweight attachment filters (NEW - supports multi-source)
-            filtered_results = self._apply_lightweight_attachment_filters(
-                results, attachment_filter
-            )
+                # Apply lightweight attachment filters (NEW - supports multi-source)
+                filtered_results = self._apply_lightweight_attachment_filters(
+                    results, attachment_filter
+                )
 
-            # Limit to reasonable number for performance (ensure good navigation)
-            attachment_limit = max(limit, 15)  # At least 15 for good navigation
-            filtered_results = filtered_results[:attachment_limit]
+                # Limit to reasonable number for performance (ensure good navigation)
+                attachment_limit = max(limit, 15)  # At least 15 for good navigation
+                filtered_results = filtered_results[:attachment_limit]
 
-            logger.info(
-                "Attachment search completed successfully",
-                result_count=len(filtered_results),
-                first_result_score=(
-                    filtered_results[0].score if filtered_results else None
-                ),
+                logger.info(
+                    "Attachment search completed successfully",
+                    result_count=len(filtered_results),
+                    first_result_score=(
+                        filtered_results[0].score if filtered_results else None
+                    ),
+                )
+            else:
+                filtered_results = result_set.results
+
+            all_results = filtered_results
+            filtered_results, next_cursor = self._paginate(
+                "attachment_search", all_results, params, result_set, offset
             )
 
             # Create attachment groups for organized display
@@ -322,12 +386,17 @@ class SearchHandler:
 
             # Create lightweight text response
             response_text = self._format_lightweight_attachment_text(
-                organized_results, len(filtered_results)
+                organized_results, len(all_results)
             )
+            response_text += self._next_page_hint("attachment_search", next_cursor)
 
             # Create lightweight structured content for MCP compliance
-            structured_content = self.formatters.create_lightweight_attachment_results(
-                filtered_results, attachment_filter, query
+            structured_content = self._with_page_info(
+                self.formatters.create_lightweight_attachment_results(
+                    filtered_results, attachment_filter, query
+                ),
+                len(all_results),
+                next_cursor,
             )
 
             response = self.protocol.create_response(
@@ -353,6 +422,67 @@ class SearchHandler:
                 error={"code": -32603, "message": "Internal error", "data": str(e)},
             )
 
+    def _paginate(
+        self,
+        tool: str,
+        results: list[HybridSearchResult],
+        params: dict[str, Any],
+        result_set: ResultSet | None = None,
+        offset: int = 0,
+    ) -> tuple[list[HybridSearchResult], str | None]:
+        """Get the page of ``results`` at ``offset`` and the cursor of the next one.
+
+        Without a ``page_size`` argument all results are returned. The first
+        call that leaves results for later pages caches the result set.
+        """
+        page_size = params.get("page_size")
+        if not page_size or page_size < 1:
+            return results, None
+
+        end = offset + page_size
+        next_cursor = None
+        if end < len(results):
+            if result_set is None:
+                result_set = self.result_cache.store(tool, results, params)
+            next_cursor = self.result_cache.cursor(result_set, end)
+        return results[offset:end], next_cursor
+
+    @staticmethod
+    def _with_page_info(
+        structured_content: dict[str, Any],
+        total_found: int,
+        next_cursor: str | None,
+    ) -> dict[str, Any]:
+        """Report the size of the whole result set and the next page cursor."""
+        structured_content["total_found"] = total_found
+        if next_cursor:
+            structured_content["next_cursor"] = next_cursor
+        return structured_content
+
+    @staticmethod
+    def _next_page_hint(tool: str, next_cursor: str | None) -> str:
+        """Tell the agent how to fetch the next page of results."""
+        if not next_cursor:
+            return ""
+        return (
+            f"\n\n➡️ More results available: call {tool} with "
+            f'cursor="{next_cursor}" to get the next page.'
+        )
+
+    def _invalid_cursor_response(
+        self, request_id: str | int | None, cursor: str
+    ) -> dict[str, Any]:
+        """Create the error response for an unknown or expired cursor."""
+        logger.warning("Unknown or expired cursor", cursor=cursor)
+        return self.protocol.create_response(
+            request_id,
+            error={
+                "code": -32602,
+                "message": "Invalid params",
+                "data": f"Unknown or expired cursor: {cursor}. Run the search again.",
+            },
+        )
+
     def _apply_hierarchy_filters(
         self, results: list[HybridSearchResult], hierarchy_filter: dict[str, Any]
     ) -> list[HybridSearchResult]:
@@ -674,26 +804,9 @@ class SearchHandler:
         try:
             logger.info(f"Expanding document with ID: {document_id}")
 
-            # Search for the document - field search doesn't guarantee exact matches
-            # Try document_id field search first, but get more results to filter
-            results = await self.search_engine.search(
-                query=f"document_id:{document_id}",
-                limit=10,  # Get more results to ensure we find the exact match
-            )
-
-            # Filter for exact document_id matches
-            exact_matches = [r for r in results if r.document_id == document_id]
-            if exact_matches:
-                results = exact_matches[:1]  # Take only the first exact match
-            else:
-                # Fallback to general search if no exact match in field search
-                results = await self.search_engine.search(query=document_id, limit=10)
-                # Filter again for exact document_id matches
-                exact_matches = [r for r in results if r.document_id == document_id]
-                if exact_matches:
-                    results = exact_matches[:1]
-                else:
-                    results = []
+            # Direct payload lookup on the indexed document_id field
+            document = await self.search_engine.get_document(document_id)
+            results = [document] if document is not None else []
 
             if not results:
                 logger.warning(f"Document not found with ID: {document_id}")
@@ -1,5 +1,7 @@
 """Search components for hybrid search functionality."""
 
+from .analysis_executor import AnalysisExecutor
+from .document_store import DocumentStore
 from .field_query_parser import FieldQuery, FieldQueryParser, ParsedQuery
 from .keyword_search_service import KeywordSearchService
 from .metadata_extractor import MetadataExtractor
@@ -21,6 +23,8 @@ from .search_result_models import (
 from .vector_search_service import VectorSearchService
 
 __all__ = [
+    "AnalysisExecutor",
+    "DocumentStore",
     "QueryProcessor",
     "VectorSearchService",
     "KeywordSearchService",
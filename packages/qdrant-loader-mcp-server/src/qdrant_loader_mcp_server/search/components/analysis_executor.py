@@ -0,0 +1,190 @@
+"""Executor running CPU-bound analysis off the event loop."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from ...utils.logging import LoggingConfig
+
+T = TypeVar("T")
+
+# Cancellation flag of the analysis job running in the current worker thread
+_cancel_event: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar(
+    "analysis_cancel_event", default=None
+)
+
+
+class AnalysisCancelledError(Exception):
+    """Raised inside an analysis job whose caller was cancelled or timed out."""
+
+
+def raise_if_cancelled() -> None:
+    """Stop the current analysis job if its caller no longer waits for it.
+
+    Long loops call this between iterations; outside of an analysis job it
+    does nothing.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise AnalysisCancelledError("Analysis cancelled")
+
+
+@dataclass
+class _ToolStats:
+    """Timing counters of one tool."""
+
+    calls: int = 0
+    runs: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    run_ms_total: float = 0.0
+    run_ms_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        runs = max(self.runs, 1)
+        return {
+            "calls": self.calls,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.wait_ms_total / runs, 2),
+            "max_wait_ms": round(self.wait_ms_max, 2),
+            "avg_run_ms": round(self.run_ms_total / runs, 2),
+            "max_run_ms": round(self.run_ms_max, 2),
+        }
+
+
+class AnalysisExecutor:
+    """Runs CPU-bound intelligence work in a thread pool.
+
+    Every call belongs to a tool (e.g. ``cluster_documents``). Each tool gets
+    its own concurrency limit, so one slow tool cannot occupy all workers,
+    and the time spent waiting for a slot is measured separately from the
+    time spent running, which is what sizing the pool needs.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        tool_concurrency: int = 2,
+        tool_limits: dict[str, int] | None = None,
+        timeout_s: float | None = None,
+    ):
+        """Initialize the analysis executor.
+
+        Args:
+            max_workers: Worker threads shared by all tools
+            tool_concurrency: Concurrent calls allowed per tool
+            tool_limits: Concurrency overrides by tool name
+            timeout_s: Maximum run time of one call; None waits indefinitely
+        """
+        self.max_workers = max_workers
+        self.tool_concurrency = tool_concurrency
+        self.tool_limits = dict(tool_limits or {})
+        self.timeout_s = timeout_s
+        self.logger = LoggingConfig.get_logger(__name__)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcp-analysis"
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, _ToolStats] = {}
+
+    async def run(self, tool: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run ``func(*args, **kwargs)`` in the pool within the limit of ``tool``.
+
+        Context variables of the caller, such as the request Doc cache, are
+        visible to ``func``. When the caller is cancelled or the timeout
+        expires, a call that has not started is dropped and a running one
+        stops at its next ``raise_if_cancelled`` check; its slot is only
+        freed once the worker thread has returned.
+
+        Raises:
+            asyncio.CancelledError: If the caller is cancelled
+            TimeoutError: If the call runs longer than ``timeout_s``
+        """
+        stats = self._stats.setdefault(tool, _ToolStats())
+        semaphore = self._semaphores.get(tool)
+        if semaphore is None:
+            limit = self.tool_limits.get(tool, self.tool_concurrency)
+            semaphore = self._semaphores[tool] = asyncio.Semaphore(max(1, limit))
+
+        stats.calls += 1
+        queued = time.perf_counter()
+        try:
+            await semaphore.acquire()
+            wait_ms = (time.perf_counter() - queued) * 1000
+            stats.runs += 1
+            stats.wait_ms_total += wait_ms
+            stats.wait_ms_max = max(stats.wait_ms_max, wait_ms)
+
+            cancel_event = threading.Event()
+            context = contextvars.copy_context()
+            context.run(_cancel_event.set, cancel_event)
+            try:
+                job = self._executor.submit(context.run, func, *args, **kwargs)
+            except BaseException:
+                semaphore.release()
+                raise
+            # The slot is held until the worker thread is done with the job,
+            # not only until the caller stops waiting for it
+            job.add_done_callback(self._release_callback(semaphore))
+
+            started = time.perf_counter()
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout_s)
+            except (asyncio.CancelledError, TimeoutError):
+                # Tell a job that is already running to stop early
+                cancel_event.set()
+                raise
+            finally:
+                run_ms = (time.perf_counter() - started) * 1000
+                stats.run_ms_total += run_ms
+                stats.run_ms_max = max(stats.run_ms_max, run_ms)
+                self.logger.debug(
+                    "Analysis finished",
+                    tool=tool,
+                    wait_ms=round(wait_ms, 2),
+                    run_ms=round(run_ms, 2),
+                )
+        except (asyncio.CancelledError, TimeoutError, AnalysisCancelledError):
+            stats.cancelled += 1
+            self.logger.info("Analysis cancelled", tool=tool)
+            raise
+        except Exception:
+            stats.failed += 1
+            raise
+
+    @staticmethod
+    def _release_callback(
+        semaphore: asyncio.Semaphore,
+    ) -> Callable[[Future], None]:
+        """Build a done-callback releasing ``semaphore`` on the running loop."""
+        loop = asyncio.get_running_loop()
+
+        def release(_job: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # The loop was closed while the job was running
+                pass
+
+        return release
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue-wait and run-time statistics per tool."""
+        return {
+            "max_workers": self.max_workers,
+            "tool_concurrency": self.tool_concurrency,
+            "tools": {tool: stats.as_dict() for tool, stats in self._stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, dropping calls that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
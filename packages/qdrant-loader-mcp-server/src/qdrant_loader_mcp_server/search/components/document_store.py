@@ -0,0 +1,244 @@
+"""Direct document lookup by ID in Qdrant."""
+
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from ...utils.logging import LoggingConfig
+from .result_combiner import ResultCombiner
+from .search_result_models import HybridSearchResult
+
+
+class DocumentStore:
+    """Fetches documents with a payload filter on ``document_id``.
+
+    The loader indexes ``document_id``, so a lookup is a single scroll request,
+    without embedding, keyword scoring or reranking. The chunks of a document
+    are put back in order and joined into one result, and the most recently
+    fetched documents are kept in an LRU cache. Cached documents expire after
+    ``cache_ttl`` seconds, so re-ingested documents are fetched again.
+    """
+
+    # Points per scroll request; one request covers most lookups
+    SCROLL_PAGE_SIZE = 256
+    # Bounds of the text overlap between consecutive chunks that is removed
+    # when joining them
+    MIN_CHUNK_OVERLAP = 16
+    MAX_CHUNK_OVERLAP = 2000
+
+    def __init__(
+        self,
+        qdrant_client: AsyncQdrantClient,
+        collection_name: str,
+        result_combiner: ResultCombiner,
+        cache_size: int = 128,
+        cache_ttl: int = 300,
+    ):
+        """Initialize the document store.
+
+        Args:
+            qdrant_client: Asynchronous Qdrant client instance
+            collection_name: Name of the Qdrant collection
+            result_combiner: Combiner building search results from payloads
+            cache_size: Number of reassembled documents to cache (0 disables)
+            cache_ttl: Time-to-live of a cached document in seconds
+        """
+        self.qdrant_client = qdrant_client
+        self.collection_name = collection_name
+        self.result_combiner = result_combiner
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # Cached documents with the time they were fetched
+        self._documents: OrderedDict[str, tuple[HybridSearchResult, float]] = (
+            OrderedDict()
+        )
+        self.logger = LoggingConfig.get_logger(__name__)
+
+    async def get_chunks(
+        self, document_id: str, limit: int | None = None
+    ) -> list[HybridSearchResult]:
+        """Get the chunks of a document, in chunk order.
+
+        Args:
+            document_id: ID of the document
+            limit: Maximum number of chunks, None for all
+
+        Returns:
+            Chunks as search results with a score of 1.0; empty if the
+            document does not exist
+        """
+        points = await self._scroll(
+            models.MatchValue(value=document_id), limit=limit
+        )
+        self.logger.debug(
+            "Fetched document chunks", document_id=document_id, chunks=len(points)
+        )
+        return [
+            self.result_combiner.build_result(self._payload_info(point.payload), 1.0)
+            for point in self._in_chunk_order(points)
+        ]
+
+    async def get_document(self, document_id: str) -> HybridSearchResult | None:
+        """Get a whole document, its chunks joined into one result.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            The document with a score of 1.0, or None if it does not exist
+        """
+        documents = await self.get_documents([document_id])
+        return documents.get(document_id)
+
+    async def get_documents(
+        self, document_ids: list[str]
+    ) -> dict[str, HybridSearchResult]:
+        """Get whole documents, fetching the uncached ones in one lookup.
+
+        Args:
+            document_ids: IDs of the documents
+
+        Returns:
+            Documents by ID, in the order of ``document_ids``; missing
+            documents are left out
+        """
+        found: dict[str, HybridSearchResult] = {}
+        missing: list[str] = []
+        expired_before = time.time() - self.cache_ttl
+        for document_id in dict.fromkeys(document_ids):
+            cached = self._documents.get(document_id)
+            if cached is not None and cached[1] > expired_before:
+                self._documents.move_to_end(document_id)
+                found[document_id] = cached[0]
+            else:
+                missing.append(document_id)
+
+        if missing:
+            match = (
+                models.MatchValue(value=missing[0])
+                if len(missing) == 1
+                else models.MatchAny(any=missing)
+            )
+            points_by_document: dict[str, list[Any]] = defaultdict(list)
+            for point in await self._scroll(match):
+                points_by_document[point.payload.get("document_id")].append(point)
+
+            for document_id in missing:
+                points = points_by_document.get(document_id)
+                if points:
+                    document = self._assemble(points)
+                    found[document_id] = document
+                    self._remember(document_id, document)
+                else:
+                    # Drop the expired copy of a document that was deleted
+                    self._documents.pop(document_id, None)
+
+        self.logger.debug(
+            "Fetched documents",
+            requested=len(document_ids),
+            cache_hits=len(document_ids) - len(missing),
+            found=len(found),
+        )
+        return {
+            document_id: found[document_id]
+            for document_id in document_ids
+            if document_id in found
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached documents."""
+        self._documents.clear()
+
+    async def _scroll(
+        self,
+        match: models.MatchValue | models.MatchAny,
+        limit: int | None = None,
+    ) -> list[Any]:
+        """Scroll the points whose ``document_id`` matches, up to ``limit``."""
+        scroll_filter = models.Filter(
+            must=[models.FieldCondition(key="document_id", match=match)]
+        )
+        points: list[Any] = []
+        offset = None
+        while True:
+            page_size = self.SCROLL_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - len(points))
+            batch, offset = await self.qdrant_client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            points.extend(point for point in batch if point.payload)
+            if offset is None or (limit is not None and len(points) >= limit):
+                return points
+
+    def _assemble(self, points: list[Any]) -> HybridSearchResult:
+        """Join the chunks of a document into one result."""
+        ordered = self._in_chunk_order(points)
+        info = self._payload_info(ordered[0].payload)
+        info["text"] = self._join_chunks(
+            [point.payload.get("content", "") for point in ordered]
+        )
+        return self.result_combiner.build_result(info, 1.0)
+
+    def _remember(self, document_id: str, document: HybridSearchResult) -> None:
+        """Cache a document, evicting the least recently used ones."""
+        if self.cache_size <= 0:
+            return
+        self._documents[document_id] = (document, time.time())
+        self._documents.move_to_end(document_id)
+        while len(self._documents) > self.cache_size:
+            self._documents.popitem(last=False)
+
+    @staticmethod
+    def _in_chunk_order(points: list[Any]) -> list[Any]:
+        """Sort points by the chunk index of their metadata."""
+
+        def chunk_index(point: Any) -> int:
+            metadata = point.payload.get("metadata") or {}
+            index = metadata.get("chunk_index")
+            return index if isinstance(index, int) else 0
+
+        return sorted(points, key=chunk_index)
+
+    @classmethod
+    def _join_chunks(cls, texts: list[str]) -> str:
+        """Join chunk texts, dropping the text repeated by overlapping chunks."""
+        if not texts:
+            return ""
+        parts = [texts[0]]
+        for previous, text in zip(texts, texts[1:], strict=False):
+            overlap = cls._overlap(previous, text)
+            parts.append(text[overlap:] if overlap else "\n\n" + text)
+        return "".join(parts)
+
+    @classmethod
+    def _overlap(cls, previous: str, text: str) -> int:
+        """Length of the longest end of ``previous`` that starts ``text``."""
+        longest = min(len(previous), len(text), cls.MAX_CHUNK_OVERLAP)
+        for size in range(longest, cls.MIN_CHUNK_OVERLAP - 1, -1):
+            if previous.endswith(text[:size]):
+                return size
+        return 0
+
+    @staticmethod
+    def _payload_info(payload: dict[str, Any]) -> dict[str, Any]:
+        """Get the result fields of a point payload."""
+        return {
+            "text": payload.get("content", ""),
+            "metadata": payload.get("metadata", {}),
+            "source_type": payload.get("source_type", "unknown"),
+            "title": payload.get("title", ""),
+            "url": payload.get("url", ""),
+            "document_id": payload.get("document_id", ""),
+            "source": payload.get("source", ""),
+            "created_at": payload.get("created_at", ""),
+            "updated_at": payload.get("updated_at", ""),
+        }
@@ -110,7 +110,7 @@ class ResultCombiner:
         adaptive_config = query_context.get("adaptive_config")
         result_filters = adaptive_config.result_filters if adaptive_config else {}
 
-        for text, info in combined_dict.items():
+        for info in combined_dict.values():
             # Skip if source type doesn't match filter
             if source_types and info["source_type"] not in source_types:
                 continue
@@ -128,131 +128,12 @@ class ResultCombiner:
             )
 
             if combined_score >= self.min_score:
-                # Extract all metadata components
-                metadata_components = self.metadata_extractor.extract_all_metadata(
-                    metadata
-                )
-
                 # Boost score with metadata
                 boosted_score = self._boost_score_with_metadata(
                     combined_score, metadata, query_context
                 )
 
-                # Extract fields from both direct payload fields and nested metadata
-                # Use direct fields from Qdrant payload when available, fallback to metadata
-                title = info.get("title", "") or metadata.get("title", "")
-
-                # Extract rich metadata from nested metadata object
-                file_name = metadata.get("file_name", "")
-                metadata.get("file_type", "")
-                chunk_index = metadata.get("chunk_index")
-                total_chunks = metadata.get("total_chunks")
-
-                # Enhanced title generation using actual Qdrant structure
-                # Priority: root title > nested section_title > file_name + chunk info > source
-                root_title = info.get(
-                    "title", ""
-                )  # e.g., "Stratégie commerciale MYA.pdf - Chunk 2"
-                nested_title = metadata.get("title", "")  # e.g., "Preamble (Part 2)"
-                section_title = metadata.get("section_title", "")
-
-                if root_title:
-                    title = root_title
-                elif nested_title:
-                    title = nested_title
-                elif section_title:
-                    title = section_title
-                elif file_name:
-                    title = file_name
-                    # Add chunk info if available from nested metadata
-                    sub_chunk_index = metadata.get("sub_chunk_index")
-                    total_sub_chunks = metadata.get("total_sub_chunks")
-                    if sub_chunk_index is not None and total_sub_chunks is not None:
-                        title += (
-                            f" - Chunk {int(sub_chunk_index) + 1}/{total_sub_chunks}"
-                        )
-                    elif chunk_index is not None and total_chunks is not None:
-                        title += f" - Chunk {int(chunk_index) + 1}/{total_chunks}"
-                else:
-                    source = info.get("source", "") or metadata.get("source", "")
-                    if source:
-                        # Extract filename from path-like sources
-                        import os
-
-                        title = (
-                            os.path.basename(source)
-                            if "/" in source or "\\" in source
-                            else source
-                        )
-                    else:
-                        title = "Untitled"
-
-                # Create enhanced metadata dict with rich Qdrant fields
-                enhanced_metadata = {
-                    # Core fields from root level of Qdrant payload
-                    "source_url": info.get("url", ""),
-                    "document_id": info.get("document_id", ""),
-                    "created_at": info.get("created_at", ""),
-                    "last_modified": info.get("updated_at", ""),
-                    "repo_name": info.get("source", ""),
-                    # Construct file path from nested metadata
-                    "file_path": (
-                        metadata.get("file_directory", "").rstrip("/")
-                        + "/"
-                        + metadata.get("file_name", "")
-                        if metadata.get("file_name") and metadata.get("file_directory")
-                        else metadata.get("file_name", "")
-                    ),
-                }
-
-                # Add rich metadata from nested metadata object (confirmed structure)
-                rich_metadata_fields = {
-                    "original_filename": metadata.get("file_name"),
-                    "file_size": metadata.get("file_size"),
-                    "original_file_type": metadata.get("file_type")
-                    or metadata.get("original_file_type"),
-                    "word_count": metadata.get("word_count"),
-                    "char_count": metadata.get("character_count")
-                    or metadata.get("char_count")
-                    or metadata.get("line_count"),
-                    "chunk_index": metadata.get("sub_chunk_index", chunk_index),
-                    "total_chunks": metadata.get("total_sub_chunks", total_chunks),
-                    "chunking_strategy": metadata.get("chunking_strategy")
-                    or metadata.get("conversion_method"),
-                    "project_id": metadata.get("project_id"),
-                    "project_name": metadata.get("project_name"),
-                    "project_description": metadata.get("project_description"),
-                    "collection_name": metadata.get("collection_name"),
-                    # Additional rich fields from actual Qdrant structure
-                    "section_title": metadata.get("section_title"),
-                    "parent_section": metadata.get("parent_section"),
-                    "file_encoding": metadata.get("file_encoding"),
-                    "conversion_failed": metadata.get("conversion_failed", False),
-                    "is_excel_sheet": metadata.get("is_excel_sheet", False),
-                }
-
-                # Only add non-None values to avoid conflicts
-                for key, value in rich_metadata_fields.items():
-                    if value is not None:
-                        enhanced_metadata[key] = value
-
-                # Merge with flattened metadata components (flattened takes precedence for conflicts)
-                flattened_components = self._flatten_metadata_components(
-                    metadata_components
-                )
-                enhanced_metadata.update(flattened_components)
-
-                # Create HybridSearchResult using factory function
-                hybrid_result = create_hybrid_search_result(
-                    score=boosted_score,
-                    text=text,
-                    source_type=info["source_type"],
-                    source_title=title,
-                    vector_score=info["vector_score"],
-                    keyword_score=info["keyword_score"],
-                    **enhanced_metadata,
-                )
-
+                hybrid_result = self.build_result(info, boosted_score)
                 combined_results.append(hybrid_result)
 
         # Sort by combined score
@@ -273,6 +154,133 @@ class ResultCombiner:
 
         return combined_results[:limit]
 
+    def build_result(self, info: dict[str, Any], score: float) -> HybridSearchResult:
+        """Create a search result from the fields of a Qdrant point.
+
+        Args:
+            info: Root payload fields (text, metadata, source_type, title, url,
+                document_id, ...) plus the vector and keyword scores
+            score: Final score of the result
+
+        Returns:
+            HybridSearchResult carrying the rich metadata of the payload
+        """
+        metadata = info["metadata"]
+
+        # Extract all metadata components
+        metadata_components = self.metadata_extractor.extract_all_metadata(metadata)
+
+        # Extract fields from both direct payload fields and nested metadata
+        # Use direct fields from Qdrant payload when available, fallback to metadata
+        title = info.get("title", "") or metadata.get("title", "")
+
+        # Extract rich metadata from nested metadata object
+        file_name = metadata.get("file_name", "")
+        metadata.get("file_type", "")
+        chunk_index = metadata.get("chunk_index")
+        total_chunks = metadata.get("total_chunks")
+
+        # Enhanced title generation using actual Qdrant structure
+        # Priority: root title > nested section_title > file_name + chunk info > source
+        root_title = info.get(
+            "title", ""
+        )  # e.g., "Stratégie commerciale MYA.pdf - Chunk 2"
+        nested_title = metadata.get("title", "")  # e.g., "Preamble (Part 2)"
+        section_title = metadata.get("section_title", "")
+
+        if root_title:
+            title = root_title
+        elif nested_title:
+            title = nested_title
+        elif section_title:
+            title = section_title
+        elif file_name:
+            title = file_name
+            # Add chunk info if available from nested metadata
+            sub_chunk_index = metadata.get("sub_chunk_index")
+            total_sub_chunks = metadata.get("total_sub_chunks")
+            if sub_chunk_index is not None and total_sub_chunks is not None:
+                title += f" - Chunk {int(sub_chunk_index) + 1}/{total_sub_chunks}"
+            elif chunk_index is not None and total_chunks is not None:
+                title += f" - Chunk {int(chunk_index) + 1}/{total_chunks}"
+        else:
+            source = info.get("source", "") or metadata.get("source", "")
+            if source:
+                # Extract filename from path-like sources
+                import os
+
+                title = (
+                    os.path.basename(source)
+                    if "/" in source or "\\" in source
+                    else source
+                )
+            else:
+                title = "Untitled"
+
+        # Create enhanced metadata dict with rich Qdrant fields
+        enhanced_metadata = {
+            # Core fields from root level of Qdrant payload
+            "source_url": info.get("url", ""),
+            "document_id": info.get("document_id", ""),
+            "created_at": info.get("created_at", ""),
+            "last_modified": info.get("updated_at", ""),
+            "repo_name": info.get("source", ""),
+            # Construct file path from nested metadata
+            "file_path": (
+                metadata.get("file_directory", "").rstrip("/")
+                + "/"
+                + metadata.get("file_name", "")
+                if metadata.get("file_name") and metadata.get("file_directory")
+                else metadata.get("file_name", "")
+            ),
+        }
+
+        # Add rich metadata from nested metadata object (confirmed structure)
+        rich_metadata_fields = {
+            "original_filename": metadata.get("file_name"),
+            "file_size": metadata.get("file_size"),
+            "original_file_type": metadata.get("file_type")
+            or metadata.get("original_file_type"),
+            "word_count": metadata.get("word_count"),
+            "char_count": metadata.get("character_count")
+            or metadata.get("char_count")
+            or metadata.get("line_count"),
+            "chunk_index": metadata.get("sub_chunk_index", chunk_index),
+            "total_chunks": metadata.get("total_sub_chunks", total_chunks),
+            "chunking_strategy": metadata.get("chunking_strategy")
+            or metadata.get("conversion_method"),
+            "project_id": metadata.get("project_id"),
+            "project_name": metadata.get("project_name"),
+            "project_description": metadata.get("project_description"),
+            "collection_name": metadata.get("collection_name"),
+            # Additional rich fields from actual Qdrant structure
+            "section_title": metadata.get("section_title"),
+            "parent_section": metadata.get("parent_section"),
+            "file_encoding": metadata.get("file_encoding"),
+            "conversion_failed": metadata.get("conversion_failed", False),
+            "is_excel_sheet": metadata.get("is_excel_sheet", False),
+        }
+
+        # Only add non-None values to avoid conflicts
+        for key, value in rich_metadata_fields.items():
+            if value is not None:
+                enhanced_metadata[key] = value
+
+        # Merge with flattened metadata components (flattened takes precedence for conflicts)
+        flattened_components = self._flatten_metadata_components(metadata_components)
+        enhanced_metadata.update(flattened_components)
+
+        # Create HybridSearchResult using factory function
+        return create_hybrid_search_result(
+            score=score,
+            text=info["text"],
+            source_type=info["source_type"],
+            source_title=title,
+            vector_score=info.get("vector_score", 0.0),
+            keyword_score=info.get("keyword_score", 0.0),
+            **enhanced_metadata,
+        )
+
     def _should_skip_result(
         self, metadata: dict, result_filters: dict, query_context: dict
     ) -> bool:
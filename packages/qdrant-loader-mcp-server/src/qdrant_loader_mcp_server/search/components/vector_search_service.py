@@ -6,6 +6,7 @@ from asyncio import Lock
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 from openai import AsyncOpenAI
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
@@ -238,29 +239,7 @@ class VectorSearchService:
                 with_payload=True,  # 🔧 CRITICAL: Explicitly request payload data
             )
 
-        extracted_results = []
-        for hit in results:
-            extracted = {
-                "score": hit.score,
-                "text": hit.payload.get("content", "") if hit.payload else "",
-                "metadata": hit.payload.get("metadata", {}) if hit.payload else {},
-                "source_type": (
-                    hit.payload.get("source_type", "unknown")
-                    if hit.payload
-                    else "unknown"
-                ),
-                # Extract fields directly from Qdrant payload
-                "title": hit.payload.get("title", "") if hit.payload else "",
-                "url": hit.payload.get("url", "") if hit.payload else "",
-                "document_id": (
-                    hit.payload.get("document_id", "") if hit.payload else ""
-                ),
-                "source": hit.payload.get("source", "") if hit.payload else "",
-                "created_at": hit.payload.get("created_at", "") if hit.payload else "",
-                "updated_at": hit.payload.get("updated_at", "") if hit.payload else "",
-            }
-
-            extracted_results.append(extracted)
+        extracted_results = [self._extract_result(hit) for hit in results]
 
         # Store results in cache if caching is enabled
         if self.cache_enabled:
@@ -279,6 +258,167 @@ class VectorSearchService:
 
         return extracted_results
 
+    def _extract_result(self, hit: Any) -> dict[str, Any]:
+        """Convert a Qdrant point into a search result dictionary."""
+        payload = hit.payload or {}
+        return {
+            "score": hit.score,
+            "text": payload.get("content", ""),
+            "metadata": payload.get("metadata", {}),
+            "source_type": payload.get("source_type", "unknown"),
+            # Extract fields directly from Qdrant payload
+            "title": payload.get("title", ""),
+            "url": payload.get("url", ""),
+            "document_id": payload.get("document_id", ""),
+            "source": payload.get("source", ""),
+            "created_at": payload.get("created_at", ""),
+            "updated_at": payload.get("updated_at", ""),
+        }
+
+    async def recommend_similar_documents(
+        self,
+        document_id: str,
+        limit: int,
+        source_types: list[str] | None = None,
+        project_ids: list[str] | None = None,
+        max_examples: int = 64,
+    ) -> list[dict[str, Any]]:
+        """Find the documents closest to a document using its stored vectors.
+
+        The chunks of the document are used as recommendation examples, so no
+        embedding has to be generated, and Qdrant groups the hits by document
+        so each similar document is returned once, with its best chunk.
+
+        Args:
+            document_id: ID of the target document
+            limit: Maximum number of similar documents
+            source_types: Optional source type filters
+            project_ids: Optional project ID filters
+            max_examples: Maximum number of target chunks to use as examples
+
+        Returns:
+            List of search results, one per similar document, best first
+        """
+        document_condition = models.FieldCondition(
+            key="document_id", match=models.MatchValue(value=document_id)
+        )
+        points, _ = await self.qdrant_client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=models.Filter(must=[document_condition]),
+            limit=max_examples,
+            with_payload=False,
+            with_vectors=False,
+        )
+        if not points:
+            return []
+
+        must: list[models.Condition] = []
+        if source_types:
+            must.append(
+                models.FieldCondition(
+                    key="source_type", match=models.MatchAny(any=source_types)
+                )
+            )
+        if project_ids:
+            must.append(
+                models.FieldCondition(
+                    key="project_id", match=models.MatchAny(any=project_ids)
+                )
+            )
+
+        groups = await self.qdrant_client.recommend_groups(
+            collection_name=self.collection_name,
+            group_by="document_id",
+            positive=[point.id for point in points],
+            query_filter=models.Filter(
+                must=must or None, must_not=[document_condition]
+            ),
+            search_params=models.SearchParams(
+                hnsw_ef=self.hnsw_ef, exact=bool(self.use_exact_search)
+            ),
+            limit=limit,
+            group_size=1,
+            with_payload=True,
+        )
+        return [self._extract_result(group.hits[0]) for group in groups.groups]
+
+    async def get_document_vectors(
+        self,
+        document_ids: list[str],
+        page_size: int = 256,
+        max_chunks_per_document: int = 64,
+    ) -> dict[str, list[float]]:
+        """Get one stored vector per document, the mean of its chunk vectors.
+
+        The chunks of all documents are read with a filtered scroll, so no
+        embedding has to be generated. A document whose chunk limit is reached
+        is dropped from the filter, so large documents cannot use up the
+        reads of the others.
+
+        Args:
+            document_ids: IDs of the documents
+            page_size: Points read per scroll request
+            max_chunks_per_document: Maximum number of chunks read per document
+
+        Returns:
+            Normalized mean chunk vector by document ID; documents without
+            stored vectors are missing
+        """
+        pending = list(dict.fromkeys(doc_id for doc_id in document_ids if doc_id))
+        if not pending:
+            return {}
+
+        sums: dict[str, np.ndarray] = {}
+        counts: dict[str, int] = dict.fromkeys(pending, 0)
+        offset = None
+        while pending:
+            points, offset = await self.qdrant_client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="document_id", match=models.MatchAny(any=pending)
+                        )
+                    ]
+                ),
+                limit=page_size,
+                offset=offset,
+                with_payload=["document_id"],
+                with_vectors=True,
+            )
+            for point in points:
+                vector = point.vector
+                if isinstance(vector, dict):
+                    # Named vectors: use the first dense one
+                    vector = next(
+                        (v for v in vector.values() if isinstance(v, list)), None
+                    )
+                doc_id = (point.payload or {}).get("document_id")
+                if doc_id not in counts or not vector:
+                    continue
+                if counts[doc_id] >= max_chunks_per_document:
+                    continue
+                counts[doc_id] += 1
+                chunk = np.asarray(vector, dtype=float)
+                norm = np.linalg.norm(chunk)
+                if norm == 0 or (doc_id in sums and len(sums[doc_id]) != len(chunk)):
+                    continue
+                sums[doc_id] = sums.get(doc_id, 0.0) + chunk / norm
+            if offset is None or not points:
+                break
+            # The scroll offset is a point ID, so it stays valid for the
+            # narrower filter
+            pending = [
+                doc_id for doc_id in pending if counts[doc_id] < max_chunks_per_document
+            ]
+
+        vectors = {}
+        for doc_id, total in sums.items():
+            norm = np.linalg.norm(total)
+            if norm > 0:
+                vectors[doc_id] = (total / norm).tolist()
+        return vectors
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache performance statistics.
 
@@ -1,5 +1,7 @@
 """Search engine service for the MCP server."""
 
+import asyncio
+import json
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -9,6 +11,7 @@ from ..config import OpenAIConfig, QdrantConfig, SearchConfig
 from ..utils.logging import LoggingConfig
 from .components.search_result_models import HybridSearchResult
 from .enhanced.cross_document_intelligence import ClusteringStrategy, SimilarityMetric
+from .enhanced.precomputed_graph import load_knowledge_graph
 from .enhanced.topic_search_chain import ChainStrategy, TopicSearchChain
 from .hybrid_search import HybridSearchEngine
 
@@ -24,6 +27,7 @@ class SearchEngine:
         self.config: QdrantConfig | None = None
         self.openai_client: AsyncOpenAI | None = None
         self.hybrid_search: HybridSearchEngine | None = None
+        self._warmup_task: asyncio.Task | None = None
         self.logger = LoggingConfig.get_logger(__name__)
 
     async def initialize(
@@ -60,6 +64,15 @@ class SearchEngine:
                     ),
                 )
 
+            # Load the knowledge graph the loader precomputed for the collection
+            precomputed_graph = None
+            if search_config and search_config.knowledge_graph_path:
+                precomputed_graph = await asyncio.to_thread(
+                    load_knowledge_graph,
+                    search_config.knowledge_graph_path,
+                    config.collection_name,
+                )
+
             # Initialize hybrid search (single path; pass through search_config which may be None)
             if self.client and self.openai_client:
                 self.hybrid_search = HybridSearchEngine(
@@ -67,8 +80,14 @@ class SearchEngine:
                     openai_client=self.openai_client,
                     collection_name=config.collection_name,
                     search_config=search_config,
+                    precomputed_graph=precomputed_graph,
                 )
 
+                # Build the NLP and intelligence components in the background
+                # so that the server answers requests right away
+                if search_config and search_config.warmup_enabled:
+                    self._warmup_task = asyncio.create_task(self._warm_up())
+
             self.logger.info("Successfully connected to Qdrant", url=config.url)
         except Exception as e:
             self.logger.error(
@@ -82,8 +101,20 @@ class SearchEngine:
                 "Please ensure Qdrant is running and accessible."
             ) from None  # Suppress the original exception
 
+    async def _warm_up(self) -> None:
+        """Warm up the hybrid search components in a worker thread."""
+        try:
+            await asyncio.to_thread(self.hybrid_search.warm_up)
+        except Exception as e:
+            # Components are built on first use instead
+            self.logger.warning("Search engine warm-up failed", error=str(e))
+
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        if self.hybrid_search:
+            self.hybrid_search.analysis_executor.shutdown()
         if self.client:
             await self.client.close()
             self.client = None
@@ -134,6 +165,52 @@ class SearchEngine:
             self.logger.error("Search failed", error=str(e), query=query)
             raise
 
+    async def get_document_chunks(
+        self, document_id: str, limit: int | None = None
+    ) -> list[HybridSearchResult]:
+        """Fetch the chunks of a document by ID, in order, without a search.
+
+        Args:
+            document_id: ID of the document
+            limit: Maximum number of chunks to return, None for all
+        """
+        if not self.hybrid_search:
+            raise RuntimeError("Search engine not initialized")
+
+        return await self.hybrid_search.document_store.get_chunks(
+            document_id, limit=limit
+        )
+
+    async def get_document(self, document_id: str) -> HybridSearchResult | None:
+        """Fetch a whole document by ID, its chunks joined into one result.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            The document, or None if no document has this ID
+        """
+        if not self.hybrid_search:
+            raise RuntimeError("Search engine not initialized")
+
+        return await self.hybrid_search.document_store.get_document(document_id)
+
+    async def get_documents(
+        self, document_ids: list[str]
+    ) -> dict[str, HybridSearchResult]:
+        """Fetch whole documents by ID in a single lookup.
+
+        Args:
+            document_ids: IDs of the documents
+
+        Returns:
+            Documents by ID, in the given order; unknown IDs are left out
+        """
+        if not self.hybrid_search:
+            raise RuntimeError("Search engine not initialized")
+
+        return await self.hybrid_search.document_store.get_documents(document_ids)
+
     async def generate_topic_chain(
         self, query: str, strategy: str = "mixed_exploration", max_links: int = 5
     ) -> TopicSearchChain:
@@ -577,28 +654,37 @@ class SearchEngine:
     async def find_similar_documents(
         self,
         target_query: str,
-        comparison_query: str,
+        comparison_query: str | None = None,
         similarity_metrics: list[str] | None = None,
         max_similar: int = 5,
         source_types: list[str] | None = None,
         project_ids: list[str] | None = None,
+        similarity_mode: str = "metrics",
     ) -> list[dict[str, Any]]:
         """
         Find documents similar to a target document.
 
         Args:
             target_query: Query to find the target document
-            comparison_query: Query to get documents to compare against
+            comparison_query: Query to get documents to compare against,
+                required in "metrics" mode
             similarity_metrics: Similarity metrics to use
             max_similar: Maximum number of similar documents to return
             source_types: Optional list of source types to filter by
             project_ids: Optional list of project IDs to filter by
+            similarity_mode: "metrics" compares the target with the results of
+                the comparison query; "vector" searches the whole collection
+                with the stored embeddings of the target document
 
         Returns:
             List of similar documents with similarity scores
         """
         if not self.hybrid_search:
             raise RuntimeError("Search engine not initialized")
+        if similarity_mode not in ("metrics", "vector"):
+            raise ValueError(f"Unknown similarity mode: {similarity_mode}")
+        if similarity_mode == "metrics" and not comparison_query:
+            raise ValueError("comparison_query is required in metrics mode")
 
         try:
             # Get target document (first result from target query)
@@ -614,14 +700,6 @@ class SearchEngine:
 
             target_document = target_results[0]
 
-            # Get comparison documents
-            comparison_documents = await self.hybrid_search.search(
-                query=comparison_query,
-                limit=20,
-                source_types=source_types,
-                project_ids=project_ids,
-            )
-
             # Convert string metrics to SimilarityMetric enums with validation
             metrics = None
             if similarity_metrics:
@@ -636,6 +714,23 @@ class SearchEngine:
                         )
                 metrics = valid_metrics if valid_metrics else None
 
+            if similarity_mode == "vector":
+                return await self.hybrid_search.find_similar_documents_by_vector(
+                    target_document=target_document,
+                    similarity_metrics=metrics,
+                    max_similar=max_similar,
+                    source_types=source_types,
+                    project_ids=project_ids,
+                )
+
+            # Get comparison documents
+            comparison_documents = await self.hybrid_search.search(
+                query=comparison_query,
+                limit=20,
+                source_types=source_types,
+                project_ids=project_ids,
+            )
+
             # Find similar documents
             similar_docs = await self.hybrid_search.find_similar_documents(
                 target_document=target_document,
@@ -944,18 +1039,22 @@ class SearchEngine:
         limit: int = 25,
         source_types: list[str] | None = None,
         project_ids: list[str] | None = None,
+        incremental: bool = False,
     ) -> dict[str, Any]:
         """
         Cluster documents based on similarity and relationships.
 
         Args:
             query: Search query to get documents for clustering
-            strategy: Clustering strategy (mixed_features, entity_based, topic_based, project_based)
+            strategy: Clustering strategy (mixed_features, entity_based, topic_based,
+                project_based, hierarchical, semantic_embedding)
             max_clusters: Maximum number of clusters to create
             min_cluster_size: Minimum size for a cluster
             limit: Maximum number of documents to cluster
             source_types: Optional list of source types to filter by
             project_ids: Optional list of project IDs to filter by
+            incremental: With semantic_embedding, assign documents to the
+                cluster centroids cached by earlier requests when they fit
 
         Returns:
             Document clusters with metadata and relationships
@@ -1001,6 +1100,11 @@ class SearchEngine:
                 strategy=clustering_strategy,
                 max_clusters=max_clusters,
                 min_cluster_size=min_cluster_size,
+                incremental=incremental,
+                # Centroids learned for one result set only fit that one
+                cache_scope=json.dumps(
+                    [query, sorted(source_types or []), sorted(project_ids or [])]
+                ),
             )
 
             # Add query metadata (ensure key exists and is a dict)
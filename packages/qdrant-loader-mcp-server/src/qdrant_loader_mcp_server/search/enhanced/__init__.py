@@ -53,6 +53,7 @@ from .knowledge_graph import (
     RelationshipType,
     TraversalStrategy,
 )
+from .precomputed_graph import PrecomputedKnowledgeGraph, load_knowledge_graph
 
 # 🔥 Topic-Driven Search Chaining
 from .topic_search_chain import (
@@ -62,6 +63,7 @@ from .topic_search_chain import (
     TopicSearchChain,
     TopicSearchChainGenerator,
 )
+from .vector_clustering import ClusteringAlgorithm, VectorClusteringEngine
 
 __all__ = [
     # Knowledge Graph
@@ -73,6 +75,8 @@ __all__ = [
     "TraversalStrategy",
     "GraphTraverser",
     "GraphBuilder",
+    "PrecomputedKnowledgeGraph",
+    "load_knowledge_graph",
     # Intent-Aware Adaptive Search
     "IntentType",
     "SearchIntent",
@@ -107,4 +111,6 @@ __all__ = [
     "ComplementaryContentFinder",
     "ConflictDetector",
     "CrossDocumentIntelligenceEngine",
+    "ClusteringAlgorithm",
+    "VectorClusteringEngine",
 ]
@@ -0,0 +1,118 @@
+"""Persistent cache of LLM conflict verdicts.
+
+Asking the LLM whether two documents conflict is the slowest and most costly
+step of conflict detection, and the answer only depends on the two documents
+and the model. Verdicts are stored in a SQLite database keyed by a hash of
+each document and the model name, so repeated conflict checks over the same
+corpus do not call the LLM again, even across server restarts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ...utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def document_hash(title: str | None, text: str | None) -> str:
+    """Hash the parts of a document that are sent to the LLM."""
+    return hashlib.sha256(f"{title or ''}\0{text or ''}".encode()).hexdigest()
+
+
+def swap_documents(verdict: dict[str, Any]) -> dict[str, Any]:
+    """Return a verdict with the roles of the two documents exchanged."""
+    swapped = dict(verdict)
+    swapped["structured_indicators"] = [
+        {
+            **indicator,
+            "doc1_snippet": indicator.get("doc2_snippet"),
+            "doc2_snippet": indicator.get("doc1_snippet"),
+        }
+        for indicator in verdict.get("structured_indicators", [])
+    ]
+    return swapped
+
+
+class ConflictVerdictCache:
+    """SQLite-backed store of LLM conflict verdicts for document pairs."""
+
+    def __init__(self, path: str | Path):
+        """Open or create the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "doc1_hash TEXT NOT NULL, doc2_hash TEXT NOT NULL, "
+                "model TEXT NOT NULL, verdict TEXT, created_at REAL NOT NULL, "
+                "PRIMARY KEY (doc1_hash, doc2_hash, model))"
+            )
+
+    def get(
+        self, doc1_hash: str, doc2_hash: str, model: str
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Look up the verdict for a document pair in either order.
+
+        Returns:
+            Whether a verdict was found, and the verdict; None means the
+            documents do not conflict
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT doc1_hash, verdict FROM verdicts WHERE model = ? AND "
+                    "((doc1_hash = ? AND doc2_hash = ?) OR "
+                    "(doc1_hash = ? AND doc2_hash = ?))",
+                    (model, doc1_hash, doc2_hash, doc2_hash, doc1_hash),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Failed to read cached conflict verdict", error=str(e))
+            return False, None
+
+        if row is None:
+            return False, None
+        stored_doc1_hash, raw_verdict = row
+        verdict = json.loads(raw_verdict) if raw_verdict else None
+        if verdict is not None and stored_doc1_hash != doc1_hash:
+            verdict = swap_documents(verdict)
+        return True, verdict
+
+    def put(
+        self,
+        doc1_hash: str,
+        doc2_hash: str,
+        model: str,
+        verdict: dict[str, Any] | None,
+    ) -> None:
+        """Store the verdict for a document pair."""
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+                    (
+                        doc1_hash,
+                        doc2_hash,
+                        model,
+                        json.dumps(verdict) if verdict is not None else None,
+                        time.time(),
+                    ),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Failed to cache conflict verdict", error=str(e))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -18,6 +18,7 @@ Key Features:
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import time
 import warnings
 from collections import Counter, defaultdict
@@ -38,10 +39,17 @@ else:
     AsyncOpenAI = None  # type: ignore[assignment]
 
 from ...utils.logging import LoggingConfig
+from ..components.analysis_executor import raise_if_cancelled
 from ..components.search_result_models import HybridSearchResult
 from ..models import SearchResult
 from ..nlp.spacy_analyzer import SpaCyQueryAnalyzer
+from .conflict_verdict_cache import (
+    ConflictVerdictCache,
+    document_hash,
+    swap_documents,
+)
 from .knowledge_graph import DocumentKnowledgeGraph
+from .vector_clustering import VectorClusteringEngine
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -127,6 +135,8 @@ class DocumentCluster:
     coherence_score: float = 0.0  # 0.0 - 1.0
     representative_doc_id: str = ""
     cluster_description: str = ""
+    # Mean similarity to the other clusters, by cluster ID (embedding strategy)
+    related_clusters: dict[str, float] = field(default_factory=dict)
 
     def get_cluster_summary(self) -> dict[str, Any]:
         """Get summary information about the cluster."""
@@ -270,6 +280,18 @@ class ConflictAnalysis:
         )[:3]
 
 
+# Weights for batch similarity, where semantic similarity comes from the stored
+# embeddings and is the most reliable signal
+_BATCH_METRIC_WEIGHTS = {
+    SimilarityMetric.SEMANTIC_SIMILARITY: 0.60,
+    SimilarityMetric.ENTITY_OVERLAP: 0.15,
+    SimilarityMetric.TOPIC_OVERLAP: 0.10,
+    SimilarityMetric.METADATA_SIMILARITY: 0.10,
+    SimilarityMetric.CONTENT_FEATURES: 0.05,
+    SimilarityMetric.HIERARCHICAL_DISTANCE: 0.05,
+}
+
+
 class DocumentSimilarityCalculator:
     """Calculates similarity between documents using multiple metrics."""
 
@@ -278,6 +300,23 @@ class DocumentSimilarityCalculator:
         self.spacy_analyzer = spacy_analyzer
         self.logger = LoggingConfig.get_logger(__name__)
 
+    def prepare_documents(
+        self,
+        documents: list[SearchResult],
+        metrics: list[SimilarityMetric] | None = None,
+    ) -> None:
+        """Parse the text of all documents in one batch before pairwise scoring.
+
+        Only needed when semantic similarity is among the metrics; the parsed
+        Docs are then served from the analyzer cache.
+        """
+        if not metrics or SimilarityMetric.SEMANTIC_SIMILARITY not in metrics:
+            return
+        try:
+            self.spacy_analyzer.parse_batch([doc.text[:500] for doc in documents])
+        except Exception as e:
+            self.logger.warning(f"Failed to batch parse documents: {e}")
+
     def calculate_similarity(
         self,
         doc1: SearchResult,
@@ -340,6 +379,186 @@ class DocumentSimilarityCalculator:
             relationship_type=relationship_type,
         )
 
+    def calculate_similarity_batch(
+        self,
+        target: SearchResult,
+        documents: list[SearchResult],
+        vector_scores: list[float],
+        metrics: list[SimilarityMetric] = None,
+    ) -> list[DocumentSimilarity]:
+        """Calculate the similarity of many documents to a target at once.
+
+        Semantic similarity is taken from the cosine similarity of the stored
+        embeddings instead of running spaCy on every pair, and the overlap and
+        metadata metrics are computed as arrays over all documents.
+
+        Args:
+            target: Document to compare against
+            documents: Documents to compare
+            vector_scores: Cosine similarity of each document to the target
+            metrics: Metrics to use; semantic similarity dominates the result
+
+        Returns:
+            Similarity of each document, in the order of ``documents``
+        """
+        if metrics is None:
+            metrics = [
+                SimilarityMetric.SEMANTIC_SIMILARITY,
+                SimilarityMetric.ENTITY_OVERLAP,
+                SimilarityMetric.METADATA_SIMILARITY,
+            ]
+        if not documents:
+            return []
+
+        metric_arrays: dict[SimilarityMetric, np.ndarray] = {}
+        for metric in metrics:
+            if metric == SimilarityMetric.SEMANTIC_SIMILARITY:
+                metric_arrays[metric] = np.clip(
+                    np.asarray(vector_scores, dtype=float), 0.0, 1.0
+                )
+            elif metric == SimilarityMetric.ENTITY_OVERLAP:
+                metric_arrays[metric] = self._jaccard_scores(
+                    self._extract_entity_texts(target.entities),
+                    [self._extract_entity_texts(doc.entities) for doc in documents],
+                )
+            elif metric == SimilarityMetric.TOPIC_OVERLAP:
+                metric_arrays[metric] = self._jaccard_scores(
+                    self._extract_topic_texts(target.topics),
+                    [self._extract_topic_texts(doc.topics) for doc in documents],
+                )
+            elif metric == SimilarityMetric.METADATA_SIMILARITY:
+                metric_arrays[metric] = self._metadata_similarity_scores(
+                    target, documents
+                )
+            elif metric == SimilarityMetric.CONTENT_FEATURES:
+                metric_arrays[metric] = np.array(
+                    [
+                        self._calculate_content_features_similarity(target, doc)
+                        for doc in documents
+                    ]
+                )
+            elif metric == SimilarityMetric.HIERARCHICAL_DISTANCE:
+                metric_arrays[metric] = np.array(
+                    [
+                        self._calculate_hierarchical_similarity(target, doc)
+                        for doc in documents
+                    ]
+                )
+
+        weights = np.array(
+            [_BATCH_METRIC_WEIGHTS.get(metric, 0.1) for metric in metric_arrays]
+        )
+        if metric_arrays:
+            scores = np.column_stack(list(metric_arrays.values()))
+            combined = scores @ weights / weights.sum()
+        else:
+            combined = np.zeros(len(documents))
+
+        target_entities = set(self._extract_entity_texts(target.entities))
+        target_topics = set(self._extract_topic_texts(target.topics))
+        similarities = []
+        for index, doc in enumerate(documents):
+            metric_scores = {
+                metric: float(values[index]) for metric, values in metric_arrays.items()
+            }
+            similarities.append(
+                DocumentSimilarity(
+                    doc1_id=f"{target.source_type}:{target.source_title}",
+                    doc2_id=f"{doc.source_type}:{doc.source_title}",
+                    similarity_score=float(combined[index]),
+                    metric_scores=metric_scores,
+                    shared_entities=list(
+                        target_entities & set(self._extract_entity_texts(doc.entities))
+                    ),
+                    shared_topics=list(
+                        target_topics & set(self._extract_topic_texts(doc.topics))
+                    ),
+                    relationship_type=self._determine_relationship_type(
+                        target, doc, metric_scores
+                    ),
+                )
+            )
+        return similarities
+
+    def _jaccard_scores(
+        self, target_texts: list[str], texts: list[list[str]]
+    ) -> np.ndarray:
+        """Jaccard similarity of a target set to many sets as one matrix product."""
+        vocabulary = {text: index for index, text in enumerate(set(target_texts))}
+        scores = np.zeros(len(texts))
+        if not vocabulary:
+            return scores
+
+        # Only terms of the target can contribute to an intersection
+        incidence = np.zeros((len(texts), len(vocabulary)), dtype=bool)
+        sizes = np.zeros(len(texts))
+        for row, doc_texts in enumerate(texts):
+            unique = set(doc_texts)
+            sizes[row] = len(unique)
+            incidence[row, [vocabulary[t] for t in unique if t in vocabulary]] = True
+
+        intersection = incidence.sum(axis=1)
+        union = sizes + len(vocabulary) - intersection
+        np.divide(intersection, union, out=scores, where=sizes > 0)
+        return scores
+
+    def _metadata_similarity_scores(
+        self, target: SearchResult, documents: list[SearchResult]
+    ) -> np.ndarray:
+        """Vectorized form of ``_calculate_metadata_similarity``."""
+        count = len(documents)
+        totals = np.zeros(count)
+        factors = np.zeros(count)
+
+        # Project similarity, only when both documents have a project
+        project_ids = np.array(
+            [doc.project_id or "" for doc in documents], dtype=object
+        )
+        if target.project_id:
+            has_project = project_ids != ""
+            totals += np.where(has_project, project_ids == target.project_id, 0.0)
+            factors += has_project
+
+        # Source type similarity
+        source_types = np.array([doc.source_type for doc in documents], dtype=object)
+        totals += np.where(source_types == target.source_type, 0.5, 0.0)
+        factors += 1
+
+        # Content features similarity
+        features = np.array(
+            [
+                [
+                    bool(doc.has_code_blocks),
+                    bool(doc.has_tables),
+                    bool(doc.has_images),
+                    bool(doc.has_links),
+                ]
+                for doc in documents
+            ]
+        )
+        target_features = np.array(
+            [
+                bool(target.has_code_blocks),
+                bool(target.has_tables),
+                bool(target.has_images),
+                bool(target.has_links),
+            ]
+        )
+        totals += (features == target_features).mean(axis=1)
+        factors += 1
+
+        # Word count similarity (normalized), only when both have a word count
+        if target.word_count:
+            word_counts = np.array([doc.word_count or 0 for doc in documents], float)
+            has_words = word_counts > 0
+            ratio = np.minimum(word_counts, target.word_count) / np.maximum(
+                word_counts, target.word_count
+            )
+            totals += np.where(has_words, ratio, 0.0)
+            factors += has_words
+
+        return totals / factors
+
     def _calculate_entity_overlap(
         self, doc1: SearchResult, doc2: SearchResult
     ) -> float:
@@ -496,10 +715,10 @@ class DocumentSimilarityCalculator:
         """Calculate semantic similarity using spaCy."""
         try:
             # Use spaCy to analyze text similarity
-            doc1_analyzed = self.spacy_analyzer.nlp(
+            doc1_analyzed = self.spacy_analyzer.parse(
                 doc1.text[:500]
             )  # First 500 chars for performance
-            doc2_analyzed = self.spacy_analyzer.nlp(doc2.text[:500])
+            doc2_analyzed = self.spacy_analyzer.parse(doc2.text[:500])
 
             return doc1_analyzed.similarity(doc2_analyzed)
         except Exception as e:
@@ -598,9 +817,14 @@ class DocumentSimilarityCalculator:
 class DocumentClusterAnalyzer:
     """Analyzes and creates clusters of related documents."""
 
-    def __init__(self, similarity_calculator: DocumentSimilarityCalculator):
+    def __init__(
+        self,
+        similarity_calculator: DocumentSimilarityCalculator,
+        vector_engine: VectorClusteringEngine | None = None,
+    ):
         """Initialize the cluster analyzer."""
         self.similarity_calculator = similarity_calculator
+        self.vector_engine = vector_engine or VectorClusteringEngine()
         self.logger = LoggingConfig.get_logger(__name__)
 
     def create_clusters(
@@ -609,10 +833,47 @@ class DocumentClusterAnalyzer:
         strategy: ClusteringStrategy = ClusteringStrategy.MIXED_FEATURES,
         max_clusters: int = 10,
         min_cluster_size: int = 2,
+        embeddings: dict[str, list[float]] | None = None,
+        incremental: bool = False,
+        cache_scope: str = "",
     ) -> list[DocumentCluster]:
-        """Create document clusters using specified strategy."""
+        """Create document clusters using specified strategy.
+
+        Args:
+            documents: Documents to cluster
+            strategy: Clustering strategy
+            max_clusters: Maximum number of clusters
+            min_cluster_size: Minimum number of documents per cluster
+            embeddings: Stored embedding of each document by document ID,
+                used by the semantic embedding strategy
+            incremental: Semantic embedding strategy only; assign documents
+                to the centroids cached by earlier requests when they fit
+            cache_scope: Identifies the result set, e.g. the query and
+                filters; centroids are only reused within the same scope
+        """
         start_time = time.time()
 
+        if strategy == ClusteringStrategy.SEMANTIC_EMBEDDING:
+            clusters = self._cluster_by_embeddings(
+                documents,
+                max_clusters,
+                min_cluster_size,
+                embeddings or {},
+                incremental,
+                cache_scope,
+            )
+            # Coherence and representatives come from the vectors
+            for cluster in clusters:
+                raise_if_cancelled()
+                cluster.cluster_description = self._generate_cluster_description(
+                    cluster, documents
+                )
+            processing_time = (time.time() - start_time) * 1000
+            self.logger.info(
+                f"Created {len(clusters)} clusters using {strategy.value} in {processing_time:.2f}ms"
+            )
+            return clusters
+
         if strategy == ClusteringStrategy.ENTITY_BASED:
             clusters = self._cluster_by_entities(
                 documents, max_clusters, min_cluster_size
@@ -640,6 +901,7 @@ class DocumentClusterAnalyzer:
 
         # Calculate coherence scores for clusters
         for cluster in clusters:
+            raise_if_cancelled()
             cluster.coherence_score = self._calculate_cluster_coherence(
                 cluster, documents
             )
@@ -858,6 +1120,66 @@ class DocumentClusterAnalyzer:
 
         return clusters
 
+    def _cluster_by_embeddings(
+        self,
+        documents: list[SearchResult],
+        max_clusters: int,
+        min_cluster_size: int,
+        embeddings: dict[str, list[float]],
+        incremental: bool = False,
+        cache_scope: str = "",
+    ) -> list[DocumentCluster]:
+        """Cluster documents on their embeddings and entity/topic features."""
+        if not documents:
+            return []
+
+        calculator = self.similarity_calculator
+        doc_ids = [f"{doc.source_type}:{doc.source_title}" for doc in documents]
+        cache_key = None
+        if incremental:
+            algorithm = self.vector_engine.algorithm.value
+            cache_key = f"{algorithm}:{max_clusters}:{min_cluster_size}:{cache_scope}"
+        result = self.vector_engine.cluster(
+            # Cache assignments by stable document ID where there is one
+            [
+                doc.document_id or doc_id
+                for doc, doc_id in zip(documents, doc_ids, strict=True)
+            ],
+            [embeddings.get(doc.document_id or "") for doc in documents],
+            [calculator._extract_entity_texts(doc.entities) for doc in documents],
+            [calculator._extract_topic_texts(doc.topics) for doc in documents],
+            max_clusters=max_clusters,
+            min_cluster_size=min_cluster_size,
+            cache_key=cache_key,
+        )
+
+        cluster_ids = [f"semantic_cluster_{i}" for i in range(result.cluster_count)]
+        clusters = []
+        for index, cluster_id in enumerate(cluster_ids):
+            members = np.flatnonzero(result.labels == index)
+            entities = result.shared_entities[index]
+            topics = result.shared_topics[index]
+            clusters.append(
+                DocumentCluster(
+                    cluster_id=cluster_id,
+                    name=self._generate_intelligent_cluster_name(
+                        entities[:2], topics[:2], "mixed", index
+                    ),
+                    documents=[doc_ids[member] for member in members],
+                    shared_entities=entities,
+                    shared_topics=topics,
+                    cluster_strategy=ClusteringStrategy.SEMANTIC_EMBEDDING,
+                    coherence_score=float(result.coherence[index]),
+                    representative_doc_id=doc_ids[result.representatives[index]],
+                    related_clusters={
+                        other_id: float(result.cluster_similarity[index, other])
+                        for other, other_id in enumerate(cluster_ids)
+                        if other != index
+                    },
+                )
+            )
+        return clusters
+
     def _generate_intelligent_cluster_name(
         self,
         entities: list[str],
@@ -1014,6 +1336,7 @@ class DocumentClusterAnalyzer:
         # Calculate pairwise similarities within cluster
         similarities = []
         for i in range(len(cluster_docs)):
+            raise_if_cancelled()
             for j in range(i + 1, len(cluster_docs)):
                 similarity = self.similarity_calculator.calculate_similarity(
                     cluster_docs[i], cluster_docs[j]
@@ -1469,6 +1792,7 @@ class ComplementaryContentFinder:
         self.logger.info(f"Analyzing {len(candidate_docs)} candidate documents")
 
         for candidate in candidate_docs:
+            raise_if_cancelled()
             candidate_id = f"{candidate.source_type}:{candidate.source_title}"
 
             if candidate_id == target_doc_id:
@@ -2251,6 +2575,18 @@ class ComplementaryContentFinder:
         return score
 
 
+def _new_llm_usage() -> dict[str, Any]:
+    """Counters of the LLM calls made by one conflict detection run."""
+    return {
+        "calls": 0,
+        "cache_hits": 0,
+        "latency_ms_total": 0.0,
+        "latency_ms_max": 0.0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+    }
+
+
 class ConflictDetector:
     """Enhanced conflict detector using vector similarity and LLM validation."""
 
@@ -2287,74 +2623,91 @@ class ConflictDetector:
 
         # LLM validation settings
         self.llm_enabled = qdrant_client is not None and openai_client is not None
+        self._verdict_cache: ConflictVerdictCache | None = None
+        self._verdict_cache_path: str | None = None
+        self._llm_usage = _new_llm_usage()
 
     async def _get_document_embeddings(
         self, document_ids: list[str]
     ) -> dict[str, list[float]]:
-        """Retrieve document embeddings from Qdrant."""
-        if not self.qdrant_client:
+        """Retrieve document embeddings from Qdrant in a single request."""
+        if not self.qdrant_client or not document_ids:
             return {}
 
         try:
             embeddings = {}
-            # Use bounded concurrency and configurable timeouts
             settings = getattr(self, "_settings", {}) if hasattr(self, "_settings") else {}
             timeout_s = settings.get("conflict_embeddings_timeout_s", 5.0)
-            max_cc = settings.get("conflict_embeddings_max_concurrency", 5)
-
-            sem = asyncio.Semaphore(max_cc)
-
-            async def fetch_one(doc_id: str):
-                try:
-                    async with sem:
-                        result = await asyncio.wait_for(
-                            self.qdrant_client.retrieve(
-                                collection_name=self.collection_name,
-                                ids=[doc_id],
-                                with_vectors=True,
-                                with_payload=False,
-                            ),
-                            timeout=timeout_s,
-                        )
-                        return doc_id, result
-                except TimeoutError:
-                    self.logger.warning(
-                        f"Timeout retrieving embedding for document {doc_id}"
-                    )
-                    return doc_id, None
-                except Exception as e:
-                    self.logger.warning(
-                        f"Error retrieving embedding for {doc_id}: {e}"
-                    )
-                    return doc_id, None
 
-            results = await asyncio.gather(*[fetch_one(d) for d in document_ids])
-            for doc_id, result in results:
-                if not result:
+            unique_ids = list(dict.fromkeys(document_ids))
+            try:
+                points = await asyncio.wait_for(
+                    self.qdrant_client.retrieve(
+                        collection_name=self.collection_name,
+                        ids=unique_ids,
+                        with_vectors=True,
+                        with_payload=False,
+                    ),
+                    timeout=timeout_s,
+                )
+            except TimeoutError:
+                self.logger.warning(
+                    f"Timeout retrieving embeddings for {len(unique_ids)} documents"
+                )
+                return {}
+
+            # Points are not returned in request order; match them by ID
+            requested = {str(doc_id): doc_id for doc_id in unique_ids}
+            for point in points or []:
+                doc_id = requested.get(str(getattr(point, "id", "")))
+                if doc_id is None:
                     continue
-                if result and len(result) > 0:
-                    point = result[0]
-                    vectors = getattr(point, "vectors", None)
-                    if isinstance(vectors, dict) and vectors:
-                        if (
-                            self.preferred_vector_name
-                            and self.preferred_vector_name in vectors
-                        ):
-                            embeddings[doc_id] = vectors[self.preferred_vector_name]
-                        else:
-                            first_vec = next(iter(vectors.values()), None)
-                            if isinstance(first_vec, list):
-                                embeddings[doc_id] = first_vec
+                vectors = getattr(point, "vectors", None)
+                if isinstance(vectors, dict) and vectors:
+                    if (
+                        self.preferred_vector_name
+                        and self.preferred_vector_name in vectors
+                    ):
+                        embeddings[doc_id] = vectors[self.preferred_vector_name]
                     else:
-                        single_vector = getattr(point, "vector", None)
-                        if isinstance(single_vector, list):
-                            embeddings[doc_id] = single_vector
+                        first_vec = next(iter(vectors.values()), None)
+                        if isinstance(first_vec, list):
+                            embeddings[doc_id] = first_vec
+                else:
+                    single_vector = getattr(point, "vector", None)
+                    if isinstance(single_vector, list):
+                        embeddings[doc_id] = single_vector
 
             return embeddings
         except Exception as e:
             self.logger.warning(f"Failed to retrieve embeddings: {e}")
             return {}
 
+    def _build_similarity_matrix(
+        self, documents: list[SearchResult], embeddings: dict[str, list[float]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the cosine similarity of all document pairs at once.
+
+        Returns:
+            Pairwise similarity matrix, and a mask of the documents that have
+            an embedding; rows of documents without one are zero
+        """
+        vectors = [
+            embeddings.get(doc.document_id) if doc.document_id else None
+            for doc in documents
+        ]
+        dimension = next((len(v) for v in vectors if v), 0)
+        has_embedding = np.array(
+            [bool(v) and len(v) == dimension for v in vectors], dtype=bool
+        )
+        matrix = np.zeros((len(documents), dimension))
+        for index in np.flatnonzero(has_embedding):
+            matrix[index] = vectors[index]
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix @ matrix.T, has_embedding
+
     def _calculate_vector_similarity(
         self, embedding1: list[float], embedding2: list[float]
     ) -> float:
@@ -2380,7 +2733,9 @@ class ConflictDetector:
             return 0.0
 
     async def _filter_by_vector_similarity(
-        self, documents: list[SearchResult]
+        self,
+        documents: list[SearchResult],
+        embeddings: dict[str, list[float]] | None = None,
     ) -> list[tuple[SearchResult, SearchResult, float]]:
         """Filter document pairs by vector similarity for conflict analysis."""
         if not self.qdrant_client:
@@ -2392,8 +2747,9 @@ class ConflictDetector:
             ]
 
         # Get embeddings for all documents
-        document_ids = [doc.document_id for doc in documents if doc.document_id]
-        embeddings = await self._get_document_embeddings(document_ids)
+        if embeddings is None:
+            document_ids = [doc.document_id for doc in documents if doc.document_id]
+            embeddings = await self._get_document_embeddings(document_ids)
 
         if not embeddings:
             self.logger.warning(
@@ -2405,42 +2761,37 @@ class ConflictDetector:
                 for j, doc2 in enumerate(documents[i + 1 :], i + 1)
             ]
 
-        # Calculate similarities and filter
-        candidate_pairs = []
-        for i, doc1 in enumerate(documents):
-            if not doc1.document_id or doc1.document_id not in embeddings:
-                continue
-
-            for _j, doc2 in enumerate(documents[i + 1 :], i + 1):
-                if not doc2.document_id or doc2.document_id not in embeddings:
-                    continue
-
-                similarity = self._calculate_vector_similarity(
-                    embeddings[doc1.document_id], embeddings[doc2.document_id]
-                )
-
-                # Filter by similarity range - similar enough to be related,
-                # but not so similar they're identical
-                if (
-                    self.MIN_VECTOR_SIMILARITY
-                    <= similarity
-                    <= self.MAX_VECTOR_SIMILARITY
-                ):
-                    candidate_pairs.append((doc1, doc2, similarity))
+        similarities, has_embedding = self._build_similarity_matrix(
+            documents, embeddings
+        )
+        rows, cols = np.triu_indices(len(documents), k=1)
+        pair_similarities = similarities[rows, cols]
+
+        # Filter by similarity range - similar enough to be related,
+        # but not so similar they're identical
+        keep = (
+            has_embedding[rows]
+            & has_embedding[cols]
+            & (pair_similarities >= self.MIN_VECTOR_SIMILARITY)
+            & (pair_similarities <= self.MAX_VECTOR_SIMILARITY)
+        )
+        rows, cols, pair_similarities = rows[keep], cols[keep], pair_similarities[keep]
 
-        # Sort by similarity (highest first) and limit to top candidates
-        candidate_pairs.sort(key=lambda x: x[2], reverse=True)
-        max_pairs = min(
-            10, len(candidate_pairs)
-        )  # Limit to 10 most similar pairs for performance
+        # Limit to the 10 most similar pairs for performance, highest first
+        top = np.argsort(-pair_similarities, kind="stable")[:10]
 
         self.logger.info(
-            f"Vector filtering: {len(candidate_pairs)} candidate pairs from {len(documents)} documents"
+            f"Vector filtering: {len(pair_similarities)} candidate pairs from {len(documents)} documents"
         )
-        return candidate_pairs[:max_pairs]
+        return [
+            (documents[rows[k]], documents[cols[k]], float(pair_similarities[k]))
+            for k in top
+        ]
 
     async def _get_tiered_analysis_pairs(
-        self, documents: list[SearchResult]
+        self,
+        documents: list[SearchResult],
+        embeddings: dict[str, list[float]] | None = None,
     ) -> list[tuple[SearchResult, SearchResult, str, float]]:
         """Get document pairs using tiered analysis strategy for broader coverage."""
         all_pairs = []
@@ -2450,14 +2801,18 @@ class ConflictDetector:
         fallback_pairs = []
 
         # Get document embeddings for semantic similarity if available
-        document_embeddings = {}
-        if self.qdrant_client:
-            document_ids = [doc.document_id for doc in documents if doc.document_id]
-            document_embeddings = await self._get_document_embeddings(document_ids)
+        if embeddings is None:
+            embeddings = {}
+            if self.qdrant_client:
+                document_ids = [doc.document_id for doc in documents if doc.document_id]
+                embeddings = await self._get_document_embeddings(document_ids)
+        similarities, has_embedding = self._build_similarity_matrix(
+            documents, embeddings
+        )
 
         # Generate all possible pairs and categorize them
         for i, doc1 in enumerate(documents):
-            for _j, doc2 in enumerate(documents[i + 1 :], i + 1):
+            for j, doc2 in enumerate(documents[i + 1 :], i + 1):
                 # Tier 1: Primary Analysis - Same project + shared entities/topics
                 if self._is_primary_analysis_candidate(doc1, doc2):
                     score = 1.0  # Highest priority
@@ -2465,9 +2820,10 @@ class ConflictDetector:
                     continue
 
                 # Tier 2: Secondary Analysis - Semantic similarity
-                semantic_score = self._calculate_semantic_similarity_score(
-                    doc1, doc2, document_embeddings
-                )
+                if has_embedding[i] and has_embedding[j]:
+                    semantic_score = float(similarities[i, j])
+                else:
+                    semantic_score = self._calculate_text_similarity(doc1, doc2)
                 if semantic_score > 0.7:
                     secondary_pairs.append((doc1, doc2, "secondary", semantic_score))
                     continue
@@ -2521,20 +2877,6 @@ class ConflictDetector:
 
         return all_pairs
 
-    def _calculate_semantic_similarity_score(
-        self, doc1: SearchResult, doc2: SearchResult, embeddings: dict[str, list[float]]
-    ) -> float:
-        """Calculate semantic similarity score between two documents."""
-        # Try vector similarity first if embeddings are available
-        if doc1.document_id in embeddings and doc2.document_id in embeddings:
-            vector_sim = self._calculate_vector_similarity(
-                embeddings[doc1.document_id], embeddings[doc2.document_id]
-            )
-            return vector_sim
-
-        # Fallback to text-based similarity
-        return self._calculate_text_similarity(doc1, doc2)
-
     def _calculate_text_similarity(
         self, doc1: SearchResult, doc2: SearchResult
     ) -> float:
@@ -2588,12 +2930,20 @@ class ConflictDetector:
 
         conflicts = ConflictAnalysis()
 
+        # Retrieve the embeddings once for both pair selection steps
+        embeddings: dict[str, list[float]] = {}
+        if self.qdrant_client:
+            document_ids = [doc.document_id for doc in documents if doc.document_id]
+            embeddings = await self._get_document_embeddings(document_ids)
+
         # Implement tiered conflict analysis strategy for broader coverage
-        candidate_pairs = await self._get_tiered_analysis_pairs(documents)
+        candidate_pairs = await self._get_tiered_analysis_pairs(documents, embeddings)
 
         # Optional vector-based prefilter to sharpen pairs before heavy analysis
         try:
-            vector_pairs = await self._filter_by_vector_similarity(documents)
+            vector_pairs = await self._filter_by_vector_similarity(
+                documents, embeddings
+            )
             # Keep only docs that appear in top vector pairs to reduce breadth
             doc_ids_from_vector = set()
             for d1, d2, _sim in vector_pairs:
@@ -2622,9 +2972,10 @@ class ConflictDetector:
         overall_timeout_s = settings.get("conflict_overall_timeout_s", 9.0)
         max_pairs_total = settings.get("conflict_max_pairs_total", 24)
         use_llm = settings.get("conflict_use_llm", True) and self.llm_enabled
-        max_llm_pairs = settings.get("conflict_max_llm_pairs", 2)
+        max_llm_pairs = settings.get("conflict_max_llm_pairs", 8)
         llm_timeout_s = settings.get("conflict_llm_timeout_s", 12.0)
         text_window_chars = settings.get("conflict_text_window_chars", 2000)
+        llm_max_concurrency = settings.get("conflict_llm_max_concurrency", 4)
 
         deadline = time.time() + float(overall_timeout_s)
         candidate_pairs = candidate_pairs[:max_pairs_total]
@@ -2634,73 +2985,112 @@ class ConflictDetector:
         conflicts_found = 0
         max_conflicts = 20  # Limit to prevent performance issues
 
-        llm_used = 0
-        for doc1, doc2, analysis_tier, tier_score in candidate_pairs:
-            # Check deadline
-            if time.time() >= deadline:
-                break
-            # Stop if we've found enough conflicts
-            if conflicts_found >= max_conflicts:
-                break
+        # Start the LLM checks of the eligible pairs up front so they run
+        # concurrently within the overall deadline instead of one at a time
+        self._llm_usage = _new_llm_usage()
+        llm_tasks: dict[int, asyncio.Task] = {}
+        if use_llm:
+            llm_slots = asyncio.Semaphore(max(1, int(llm_max_concurrency)))
+            for index, (doc1, doc2, analysis_tier, tier_score) in enumerate(
+                candidate_pairs
+            ):
+                if len(llm_tasks) >= max_llm_pairs:
+                    break
+                if analysis_tier in ["primary", "secondary"]:
+                    llm_tasks[index] = asyncio.create_task(
+                        self._bounded_llm_analysis(
+                            doc1, doc2, tier_score, llm_slots, llm_timeout_s, deadline
+                        )
+                    )
 
-            # Try LLM-based conflict detection first, with fallback
-            conflict_info = None
-            if (
-                use_llm
-                and llm_used < max_llm_pairs
-                and analysis_tier in ["primary", "secondary"]
+        llm_used = 0
+        try:
+            for index, (doc1, doc2, analysis_tier, tier_score) in enumerate(
+                candidate_pairs
             ):
-                try:
-                    conflict_info = await asyncio.wait_for(
-                        self._llm_analyze_conflicts(doc1, doc2, tier_score),
-                        timeout=float(llm_timeout_s),
+                # Check deadline
+                if time.time() >= deadline:
+                    break
+                # Stop if we've found enough conflicts
+                if conflicts_found >= max_conflicts:
+                    break
+
+                # Try LLM-based conflict detection first, with fallback
+                conflict_info = None
+                if index in llm_tasks:
+                    try:
+                        conflict_info = await llm_tasks[index]
+                        llm_used += 1
+                    except (TimeoutError, Exception) as e:
+                        self.logger.warning(
+                            f"LLM analysis failed or timed out: {e}, falling back to word-based analysis"
+                        )
+                        conflict_info = None
+
+                # Fallback to traditional analysis if LLM failed or not enabled for this tier
+                if conflict_info is None:
+                    # Truncate text windows for faster analysis without mutating objects
+                    t1 = (
+                        doc1.text[:text_window_chars]
+                        if isinstance(doc1.text, str)
+                        else ""
                     )
-                    llm_used += 1
-                except (TimeoutError, Exception) as e:
-                    self.logger.warning(
-                        f"LLM analysis failed or timed out: {e}, falling back to word-based analysis"
+                    t2 = (
+                        doc2.text[:text_window_chars]
+                        if isinstance(doc2.text, str)
+                        else ""
                     )
-                    conflict_info = None
-
-            # Fallback to traditional analysis if LLM failed or not enabled for this tier
-            if conflict_info is None:
-                # Truncate text windows for faster analysis without mutating objects
-                t1 = doc1.text[:text_window_chars] if isinstance(doc1.text, str) else ""
-                t2 = doc2.text[:text_window_chars] if isinstance(doc2.text, str) else ""
-
-                # Build lightweight shims with same attributes used by analyzers
-                class _DocShim:
-                    def __init__(self, base, text):
-                        self.text = text
-                        self.source_type = getattr(base, "source_type", None)
-                        self.source_title = getattr(base, "source_title", None)
-                        self.entities = getattr(base, "entities", [])
-                        self.topics = getattr(base, "topics", [])
-                        self.project_id = getattr(base, "project_id", None)
-
-                shim1 = _DocShim(doc1, t1)
-                shim2 = _DocShim(doc2, t2)
-                conflict_info = self._analyze_document_pair_for_conflicts(shim1, shim2)
-
-            if conflict_info:
-                # Use document_id if available, fallback to title-based ID for backward compatibility
-                doc1_id = doc1.document_id or f"{doc1.source_type}:{doc1.source_title}"
-                doc2_id = doc2.document_id or f"{doc2.source_type}:{doc2.source_title}"
-
-                # Enhance conflict info with analysis tier information
-                conflict_info["tier_score"] = tier_score
-                conflict_info["analysis_tier"] = analysis_tier
-                conflicts.conflicting_pairs.append((doc1_id, doc2_id, conflict_info))
-
-                # Categorize conflict
-                conflict_type = conflict_info.get("type", "general")
-                if conflict_type not in conflicts.conflict_categories:
-                    conflicts.conflict_categories[conflict_type] = []
-                conflicts.conflict_categories[conflict_type].append((doc1_id, doc2_id))
-
-                conflicts_found += 1
-
-            analyzed_count += 1
+
+                    # Build lightweight shims with same attributes used by analyzers
+                    class _DocShim:
+                        def __init__(self, base, text):
+                            self.text = text
+                            self.source_type = getattr(base, "source_type", None)
+                            self.source_title = getattr(base, "source_title", None)
+                            self.entities = getattr(base, "entities", [])
+                            self.topics = getattr(base, "topics", [])
+                            self.project_id = getattr(base, "project_id", None)
+
+                    shim1 = _DocShim(doc1, t1)
+                    shim2 = _DocShim(doc2, t2)
+                    conflict_info = self._analyze_document_pair_for_conflicts(
+                        shim1, shim2
+                    )
+
+                if conflict_info:
+                    # Use document_id if available, fallback to title-based ID for backward compatibility
+                    doc1_id = (
+                        doc1.document_id or f"{doc1.source_type}:{doc1.source_title}"
+                    )
+                    doc2_id = (
+                        doc2.document_id or f"{doc2.source_type}:{doc2.source_title}"
+                    )
+
+                    # Enhance conflict info with analysis tier information
+                    conflict_info["tier_score"] = tier_score
+                    conflict_info["analysis_tier"] = analysis_tier
+                    conflicts.conflicting_pairs.append(
+                        (doc1_id, doc2_id, conflict_info)
+                    )
+
+                    # Categorize conflict
+                    conflict_type = conflict_info.get("type", "general")
+                    if conflict_type not in conflicts.conflict_categories:
+                        conflicts.conflict_categories[conflict_type] = []
+                    conflicts.conflict_categories[conflict_type].append(
+                        (doc1_id, doc2_id)
+                    )
+
+                    conflicts_found += 1
+
+                analyzed_count += 1
+        finally:
+            # Stop the LLM checks that are no longer needed
+            pending = [task for task in llm_tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
         # Generate resolution suggestions
         conflicts.resolution_suggestions = self._generate_resolution_suggestions(
@@ -2731,12 +3121,37 @@ class ConflictDetector:
                 "partial_results": bool(partial),
                 "max_llm_pairs": int(max_llm_pairs),
                 "max_pairs_total": int(max_pairs_total),
+                "llm_calls": int(self._llm_usage["calls"]),
+                "llm_cache_hits": int(self._llm_usage["cache_hits"]),
+                "llm_latency_ms_total": float(self._llm_usage["latency_ms_total"]),
+                "llm_latency_ms_max": float(self._llm_usage["latency_ms_max"]),
+                "llm_prompt_tokens": int(self._llm_usage["prompt_tokens"]),
+                "llm_completion_tokens": int(self._llm_usage["completion_tokens"]),
             }
         except Exception:
             self._last_stats = {}
 
         return conflicts
 
+    async def _bounded_llm_analysis(
+        self,
+        doc1: SearchResult,
+        doc2: SearchResult,
+        vector_similarity: float,
+        slots: asyncio.Semaphore,
+        timeout_s: float,
+        deadline: float,
+    ) -> dict[str, Any] | None:
+        """Run an LLM pair check in a concurrency slot within the deadline."""
+        async with slots:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError("overall conflict detection deadline reached")
+            return await asyncio.wait_for(
+                self._llm_analyze_conflicts(doc1, doc2, vector_similarity),
+                timeout=min(float(timeout_s), remaining),
+            )
+
     async def _llm_analyze_conflicts(
         self, doc1: SearchResult, doc2: SearchResult, vector_similarity: float
     ) -> dict[str, Any] | None:
@@ -2744,31 +3159,44 @@ class ConflictDetector:
         if not self.openai_client:
             return None
 
-        # Simple per-process memoization to avoid repeated pair analyses
+        settings = getattr(self, "_settings", {}) if hasattr(self, "_settings") else {}
+        window = int(settings.get("conflict_text_window_chars", 2000))
+        model_name = settings.get("conflict_llm_model", "gpt-4o-mini")
+
+        # Verdicts only depend on what is sent to the model, so they are
+        # memoized per process and, when configured, persisted across runs
         if not hasattr(self, "_llm_cache"):
             self._llm_cache: dict[str, dict[str, Any] | None] = {}
+        hash1 = document_hash(doc1.source_title, (doc1.text or "")[:window])
+        hash2 = document_hash(doc2.source_title, (doc2.text or "")[:window])
+        # Pairs are cached in hash order, whichever document comes first
+        first_hash, second_hash = sorted((hash1, hash2))
+        cache_key = f"{first_hash}|{second_hash}|{model_name}"
+
+        def _oriented(verdict: dict[str, Any] | None) -> dict[str, Any] | None:
+            if verdict is None or hash1 == first_hash:
+                return verdict
+            return swap_documents(verdict)
 
-        def _make_cache_key() -> str:
-            id1 = getattr(doc1, "document_id", None) or f"{doc1.source_type}:{doc1.source_title}"
-            id2 = getattr(doc2, "document_id", None) or f"{doc2.source_type}:{doc2.source_title}"
-            # Hash small windows of text to keep key bounded
-            import hashlib
-            t1 = (doc1.text or "")[:1024]
-            t2 = (doc2.text or "")[:1024]
-            h1 = hashlib.sha256(t1.encode("utf-8")).hexdigest()[:12]
-            h2 = hashlib.sha256(t2.encode("utf-8")).hexdigest()[:12]
-            parts = sorted([f"{id1}:{h1}", f"{id2}:{h2}"])
-            return "|".join(parts)
-
-        cache_key = _make_cache_key()
         if cache_key in self._llm_cache:
-            return self._llm_cache[cache_key]
+            self._llm_usage["cache_hits"] += 1
+            return _oriented(self._llm_cache[cache_key])
+        verdict_cache = self._get_verdict_cache()
+        if verdict_cache is not None:
+            found, verdict = verdict_cache.get(hash1, hash2, model_name)
+            if found:
+                self._llm_usage["cache_hits"] += 1
+                self._llm_cache[cache_key] = _oriented(verdict)
+                return verdict
+
+        def _store(verdict: dict[str, Any] | None) -> dict[str, Any] | None:
+            self._llm_cache[cache_key] = _oriented(verdict)
+            if verdict_cache is not None:
+                verdict_cache.put(hash1, hash2, model_name, verdict)
+            return verdict
 
         try:
             # Prepare the prompt for conflict analysis
-            settings = getattr(self, "_settings", {}) if hasattr(self, "_settings") else {}
-            window = int(settings.get("conflict_text_window_chars", 2000))
-            model_name = settings.get("conflict_llm_model", "gpt-4o-mini")
             max_tokens = 600
             prompt = f"""
 Analyze these two documents for potential conflicts, contradictions, or inconsistencies:
@@ -2813,6 +3241,7 @@ If no significant conflicts are found, return {{"has_conflicts": false, "conflic
 """
 
             # Add timeout to prevent hanging
+            call_start = time.perf_counter()
             response = await asyncio.wait_for(
                 self.openai_client.chat.completions.create(
                     model=model_name,
@@ -2829,6 +3258,10 @@ If no significant conflicts are found, return {{"has_conflicts": false, "conflic
                 timeout=float(settings.get("conflict_llm_timeout_s", 12.0)),
             )
 
+            self._record_llm_call(
+                model_name, time.perf_counter() - call_start, response
+            )
+
             result_text = response.choices[0].message.content.strip()
 
             # Try to parse JSON response
@@ -2848,13 +3281,12 @@ If no significant conflicts are found, return {{"has_conflicts": false, "conflic
                     return None
 
             if not result.get("has_conflicts", False):
-                self._llm_cache[cache_key] = None
-                return None
+                return _store(None)
 
             # Convert LLM result to our conflict format
             conflicts = result.get("conflicts", [])
             if not conflicts:
-                return None
+                return _store(None)
 
             # Use the first/strongest conflict
             primary_conflict = conflicts[0]
@@ -2885,18 +3317,55 @@ If no significant conflicts are found, return {{"has_conflicts": false, "conflic
                 ),
                 "analysis_method": "llm_validation",
             }
-            self._llm_cache[cache_key] = final
-            return final
+            return _store(final)
 
+        # Failures are not cached so that the pair is analyzed again next time
         except TimeoutError:
             self.logger.warning("LLM conflict analysis timed out")
-            self._llm_cache[cache_key] = None
             return None
         except Exception as e:
             self.logger.warning(f"LLM conflict analysis failed: {e}")
-            self._llm_cache[cache_key] = None
             return None
 
+    def _get_verdict_cache(self) -> ConflictVerdictCache | None:
+        """Open the persistent verdict cache configured in the settings."""
+        settings = getattr(self, "_settings", {}) if hasattr(self, "_settings") else {}
+        path = settings.get("conflict_llm_cache_path")
+        if not path:
+            return None
+        if self._verdict_cache is None or self._verdict_cache_path != path:
+            try:
+                self._verdict_cache = ConflictVerdictCache(path)
+                self._verdict_cache_path = path
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(
+                    f"Failed to open conflict verdict cache at {path}: {e}"
+                )
+                return None
+        return self._verdict_cache
+
+    def _record_llm_call(self, model: str, latency_s: float, response: Any) -> None:
+        """Record the latency and token usage of an LLM call."""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        prompt_tokens = prompt_tokens if isinstance(prompt_tokens, int) else 0
+        completion_tokens = (
+            completion_tokens if isinstance(completion_tokens, int) else 0
+        )
+
+        self._llm_usage["calls"] += 1
+        self._llm_usage["latency_ms_total"] += latency_s * 1000
+        self._llm_usage["latency_ms_max"] = max(
+            self._llm_usage["latency_ms_max"], latency_s * 1000
+        )
+        self._llm_usage["prompt_tokens"] += prompt_tokens
+        self._llm_usage["completion_tokens"] += completion_tokens
+        self.logger.debug(
+            f"LLM conflict analysis with {model} took {latency_s * 1000:.0f}ms "
+            f"({prompt_tokens} prompt + {completion_tokens} completion tokens)"
+        )
+
     def _analyze_document_pair_for_conflicts(
         self, doc1: SearchResult, doc2: SearchResult
     ) -> dict[str, Any] | None:
@@ -3772,7 +4241,7 @@ class CrossDocumentIntelligenceEngine:
         # Safe defaults align with ConflictDetector fallbacks
         defaults: dict[str, Any] = {
             "conflict_use_llm": True,
-            "conflict_max_llm_pairs": 2,
+            "conflict_max_llm_pairs": 8,
             "conflict_llm_model": "gpt-4o-mini",
             "conflict_llm_timeout_s": 12.0,
             "conflict_overall_timeout_s": 9.0,
@@ -3780,6 +4249,8 @@ class CrossDocumentIntelligenceEngine:
             "conflict_max_pairs_total": 24,
             "conflict_embeddings_timeout_s": 5.0,
             "conflict_embeddings_max_concurrency": 5,
+            "conflict_llm_max_concurrency": 4,
+            "conflict_llm_cache_path": None,
             # Optional/unused in detector but supported upstream
             "conflict_limit_default": 10,
             "conflict_tier_caps": {"primary": 50, "secondary": 30, "tertiary": 20, "fallback": 10},
@@ -3819,6 +4290,17 @@ class CrossDocumentIntelligenceEngine:
             defaults["conflict_embeddings_max_concurrency"],
             "conflict_embeddings_max_concurrency",
         )
+        normalized["conflict_llm_max_concurrency"] = max(
+            1,
+            coerce_int_non_negative(
+                settings.get(
+                    "conflict_llm_max_concurrency",
+                    defaults["conflict_llm_max_concurrency"],
+                ),
+                defaults["conflict_llm_max_concurrency"],
+                "conflict_llm_max_concurrency",
+            ),
+        )
         normalized["conflict_limit_default"] = coerce_int_non_negative(
             settings.get("conflict_limit_default", defaults["conflict_limit_default"]),
             defaults["conflict_limit_default"],
@@ -3856,6 +4338,14 @@ class CrossDocumentIntelligenceEngine:
                 errors.append("conflict_llm_model: expected non-empty string")
             normalized["conflict_llm_model"] = defaults["conflict_llm_model"]
 
+        cache_path = settings.get("conflict_llm_cache_path")
+        if cache_path is None or (isinstance(cache_path, str) and cache_path.strip()):
+            normalized["conflict_llm_cache_path"] = (
+                cache_path.strip() if cache_path else None
+            )
+        else:
+            errors.append("conflict_llm_cache_path: expected non-empty string")
+
         # Nested mapping: conflict_tier_caps
         tier_caps_default = defaults["conflict_tier_caps"]
         tier_caps_value = settings.get("conflict_tier_caps", tier_caps_default)
@@ -3918,6 +4408,7 @@ class CrossDocumentIntelligenceEngine:
             doc_id_to_doc[doc_id] = doc
 
         for cluster in clusters:
+            raise_if_cancelled()
             cluster_summary = cluster.get_cluster_summary()
 
             # Add actual document objects for relationship extraction
@@ -4049,6 +4540,7 @@ class CrossDocumentIntelligenceEngine:
         matrix = {}
 
         for i, doc1 in enumerate(documents):
+            raise_if_cancelled()
             doc1_id = f"{doc1.source_type}:{doc1.source_title}"
             matrix[doc1_id] = {}
 
@@ -18,6 +18,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from ..components.analysis_executor import raise_if_cancelled
 from ..components.search_result_models import HybridSearchResult
 
 logger = logging.getLogger(__name__)
@@ -298,6 +299,7 @@ class DynamicFacetGenerator:
 
         # Generate each configured facet type
         for facet_type, config in self.facet_config.items():
+            raise_if_cancelled()
             facet = self._generate_facet(facet_type, search_results, config)
             if facet and len(facet.values) > 0:
                 facets.append(facet)
@@ -0,0 +1,203 @@
+"""Precomputed knowledge graph of the whole collection.
+
+The loader builds a graph of the documents, entities and topics of the
+collection after ingestion, with centrality scores already computed, and
+stores it as compressed sparse row (CSR) arrays in a NumPy ``.npz`` archive
+(see ``qdrant_loader.core.knowledge_graph``). The server loads it once at
+startup; queries only traverse it from their seed nodes instead of building
+a graph from their results.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ...utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+SUPPORTED_FORMAT_VERSION = 1
+
+
+class PrecomputedKnowledgeGraph:
+    """Read-only knowledge graph over CSR adjacency arrays."""
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        """Initialize the graph from the arrays of a graph archive."""
+        self.collection_name = str(arrays["collection_name"])
+        self.node_type_names: list[str] = arrays["node_type_names"].tolist()
+        self.node_keys = arrays["node_keys"]
+        self.node_types = arrays["node_types"]
+        self.node_titles = arrays["node_titles"]
+        self.centrality = arrays["centrality"]
+        self.indptr = arrays["indptr"]
+        self.indices = arrays["indices"]
+        self.weights = arrays["weights"]
+
+        document_type = self.node_type_names.index("document")
+        self._document_nodes: dict[str, int] = {}
+        self._concept_nodes: dict[str, list[int]] = defaultdict(list)
+        for node, (key, node_type) in enumerate(
+            zip(self.node_keys.tolist(), self.node_types.tolist(), strict=True)
+        ):
+            if node_type == document_type:
+                self._document_nodes[key] = node
+            else:
+                self._concept_nodes[key].append(node)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PrecomputedKnowledgeGraph":
+        """Load a graph archive written by the loader.
+
+        Raises:
+            ValueError: If the archive has an unsupported format version
+        """
+        with np.load(Path(path).expanduser(), allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != SUPPORTED_FORMAT_VERSION:
+                raise ValueError(f"Unsupported knowledge graph format: {version}")
+            return cls({name: data[name] for name in data.files})
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_keys)
+
+    def find_seed_nodes(self, terms: Iterable[str]) -> list[int]:
+        """Find the entity and topic nodes named by query terms."""
+        seeds = set()
+        for term in terms:
+            if isinstance(term, str):
+                seeds.update(self._concept_nodes.get(term.strip().lower(), ()))
+        return sorted(seeds)
+
+    def traverse(
+        self, seeds: list[int], max_hops: int = 2, min_weight: float = 0.1
+    ) -> np.ndarray:
+        """Spread relevance from seed nodes along weighted edges.
+
+        The score of a node is the strongest product of edge weights over
+        the paths of at most ``max_hops`` edges from a seed.
+
+        Returns:
+            Score of every node; 0 for nodes that were not reached
+        """
+        scores = np.zeros(self.node_count)
+        if not seeds:
+            return scores
+        frontier = np.asarray(seeds, dtype=np.int64)
+        scores[frontier] = 1.0
+
+        for _ in range(max_hops):
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # Positions of all edges leaving the frontier in the CSR arrays
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            positions = offsets + np.arange(total)
+            neighbors = self.indices[positions]
+            reached = np.repeat(scores[frontier], counts) * self.weights[positions]
+
+            keep = reached >= min_weight
+            neighbors, reached = neighbors[keep], reached[keep]
+            previous = scores[neighbors]
+            np.maximum.at(scores, neighbors, reached)
+            frontier = np.unique(neighbors[reached > previous])
+            if not len(frontier):
+                break
+
+        return scores
+
+    def score_documents(
+        self,
+        terms: Iterable[str],
+        document_ids: Iterable[str] | None = None,
+        max_hops: int = 2,
+        max_results: int = 20,
+    ) -> dict[str, float]:
+        """Score documents by their graph proximity to query terms.
+
+        Args:
+            terms: Query entities, concepts and keywords
+            document_ids: Documents to score; when omitted, the closest
+                ``max_results`` documents of the graph are returned
+            max_hops: Maximum number of edges from a seed node
+            max_results: Number of documents returned without ``document_ids``
+
+        Returns:
+            Mapping of document ID to proximity score (0-1)
+        """
+        seeds = self.find_seed_nodes(terms)
+        if not seeds:
+            return {}
+        scores = self.traverse(seeds, max_hops=max_hops)
+
+        if document_ids is not None:
+            nodes = {
+                document_id: self._document_nodes[document_id]
+                for document_id in document_ids
+                if document_id in self._document_nodes
+            }
+            return {
+                document_id: float(scores[node])
+                for document_id, node in nodes.items()
+                if scores[node] > 0
+            }
+
+        document_nodes = np.fromiter(self._document_nodes.values(), dtype=np.int64)
+        document_nodes = document_nodes[scores[document_nodes] > 0]
+        # Ties, common between documents reached the same way, go to the
+        # more central document
+        order = np.lexsort((-self.centrality[document_nodes], -scores[document_nodes]))
+        return {
+            str(self.node_keys[node]): float(scores[node])
+            for node in document_nodes[order[:max_results]]
+        }
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Count nodes per type and edges."""
+        node_counts = np.bincount(self.node_types, minlength=len(self.node_type_names))
+        return {
+            "total_nodes": self.node_count,
+            "total_edges": len(self.indices) // 2,
+            "node_types": dict(
+                zip(self.node_type_names, node_counts.tolist(), strict=True)
+            ),
+        }
+
+
+def load_knowledge_graph(
+    path: str | Path, collection_name: str | None = None
+) -> PrecomputedKnowledgeGraph | None:
+    """Load a precomputed knowledge graph, or None when it is unusable.
+
+    A graph that is missing, unreadable, or was built from another
+    collection is logged and ignored, so the server starts without it.
+    """
+    try:
+        graph = PrecomputedKnowledgeGraph.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(
+            "Failed to load precomputed knowledge graph", path=str(path), error=str(e)
+        )
+        return None
+
+    if collection_name and graph.collection_name != collection_name:
+        logger.warning(
+            "Ignoring knowledge graph built from another collection",
+            path=str(path),
+            graph_collection=graph.collection_name,
+            collection=collection_name,
+        )
+        return None
+
+    logger.info(
+        "Loaded precomputed knowledge graph",
+        path=str(path),
+        **graph.get_statistics(),
+    )
+    return graph
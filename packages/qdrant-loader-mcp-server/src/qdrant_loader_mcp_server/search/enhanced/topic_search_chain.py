@@ -231,7 +231,18 @@ class TopicRelationshipMap:
         """Find semantically related topics using spaCy similarity."""
         related = []
 
-        source_doc = self.spacy_analyzer.nlp(source_topic)
+        source_doc = self.spacy_analyzer.parse(source_topic)
+
+        # Parse all topics without a cached similarity in one batch
+        uncached = [
+            topic
+            for topic in self.topic_document_frequency
+            if topic != source_topic
+            and (source_topic, topic) not in self.topic_similarity_cache
+        ]
+        topic_docs = dict(
+            zip(uncached, self.spacy_analyzer.parse_batch(uncached), strict=True)
+        )
 
         for topic in self.topic_document_frequency.keys():
             if topic == source_topic:
@@ -243,8 +254,7 @@ class TopicRelationshipMap:
                 similarity = self.topic_similarity_cache[cache_key]
             else:
                 # Calculate similarity using spaCy
-                topic_doc = self.spacy_analyzer.nlp(topic)
-                similarity = source_doc.similarity(topic_doc)
+                similarity = source_doc.similarity(topic_docs[topic])
                 self.topic_similarity_cache[cache_key] = similarity
 
             if similarity > self.similarity_threshold:
@@ -566,8 +576,8 @@ class TopicSearchChainGenerator:
             )
             for topic, score, rel_type in related:
                 # Calculate relevance to original query using spaCy
-                query_doc = self.spacy_analyzer.nlp(original_query)
-                topic_doc = self.spacy_analyzer.nlp(topic)
+                query_doc = self.spacy_analyzer.parse(original_query)
+                topic_doc = self.spacy_analyzer.parse(topic)
                 query_relevance = query_doc.similarity(topic_doc)
 
                 combined_score = (score + query_relevance) / 2
@@ -0,0 +1,644 @@
+"""Vector-based document clustering.
+
+Documents are clustered on their stored embedding vectors, combined with
+sparse TF-IDF entity and topic features, using NumPy implementations of
+spherical k-means, average-linkage agglomerative clustering and HDBSCAN.
+All pairwise work is done as matrix products over the whole request.
+
+In incremental mode the embedding centroids of a clustering are cached under
+a caller-provided key; later requests keep the clusters of the documents seen
+before and assign new documents to the nearest cached centroid, clustering
+again only when too many documents do not fit any centroid.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+from scipy import sparse
+
+from ...utils.logging import LoggingConfig
+from ..components.analysis_executor import raise_if_cancelled
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+class ClusteringAlgorithm(Enum):
+    """Algorithms for vector-based document clustering."""
+
+    KMEANS = "kmeans"
+    AGGLOMERATIVE = "agglomerative"
+    HDBSCAN = "hdbscan"
+
+
+@dataclass
+class DocumentFeatures:
+    """Feature matrices of the documents of a clustering request."""
+
+    # Row-normalized embeddings and entity/topic features, side by side
+    matrix: sparse.csr_matrix
+    # Row-normalized embeddings; zero rows for documents without one
+    embeddings: np.ndarray
+    # Binary document x term incidence of entities and topics
+    terms: sparse.csr_matrix
+    # Term of each column of ``terms``, as ("entity" | "topic", text)
+    vocabulary: list[tuple[str, str]]
+
+    @property
+    def has_embedding(self) -> np.ndarray:
+        return np.abs(self.embeddings).sum(axis=1) > 0
+
+
+@dataclass
+class VectorClustering:
+    """Result of a vector-based clustering; clusters are numbered 0..k-1."""
+
+    labels: np.ndarray  # Cluster of each document, -1 when unclustered
+    coherence: np.ndarray  # Mean pairwise similarity within each cluster
+    representatives: np.ndarray  # Index of the medoid document of each cluster
+    cluster_similarity: np.ndarray  # Mean similarity between clusters (k x k)
+    shared_entities: list[list[str]] = field(default_factory=list)
+    shared_topics: list[list[str]] = field(default_factory=list)
+    incremental: bool = False  # Whether cached centroids were reused
+
+    @property
+    def cluster_count(self) -> int:
+        return len(self.coherence)
+
+
+@dataclass
+class _CachedCentroids:
+    centroids: np.ndarray  # Normalized mean embedding of each cluster
+    counts: np.ndarray  # Documents with an embedding in each cluster
+    assignments: dict[str, int]  # Cluster of every document seen so far
+
+
+def _dense(matrix) -> np.ndarray:
+    return matrix.toarray() if sparse.issparse(matrix) else np.asarray(matrix)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def build_document_features(
+    embeddings: Sequence[Sequence[float] | None],
+    entities: Sequence[Sequence[str]],
+    topics: Sequence[Sequence[str]],
+    embedding_weight: float = 0.7,
+) -> DocumentFeatures:
+    """Build the feature matrix clustering works on.
+
+    Embeddings and TF-IDF weighted entity/topic features are normalized
+    separately and scaled, so the dot product of two rows is
+    ``embedding_weight`` times their embedding cosine plus the rest times
+    their feature cosine. Rows are normalized again, so documents with only
+    one kind of feature compare on that kind alone.
+    """
+    count = len(embeddings)
+    dimension = next((len(v) for v in embeddings if v is not None and len(v)), 0)
+    dense = np.zeros((count, dimension))
+    for row, vector in enumerate(embeddings):
+        if vector is not None and len(vector) == dimension and dimension:
+            dense[row] = vector
+    dense = _normalize_rows(dense)
+
+    columns: dict[tuple[str, str], int] = {}
+    rows, cols = [], []
+    for row in range(count):
+        for kind, texts in (("entity", entities[row]), ("topic", topics[row])):
+            for text in set(texts):
+                column = columns.setdefault((kind, text), len(columns))
+                rows.append(row)
+                cols.append(column)
+    terms = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(count, len(columns))
+    )
+
+    # TF-IDF weighting with smoothed inverse document frequency
+    document_frequency = np.asarray(terms.sum(axis=0)).ravel()
+    idf = np.log((1 + count) / (1 + document_frequency)) + 1
+    weighted = terms @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    weighted = sparse.diags(inverse) @ weighted
+
+    blocks = [
+        sparse.csr_matrix(dense * np.sqrt(embedding_weight)),
+        weighted * np.sqrt(1.0 - embedding_weight),
+    ]
+    blocks = [block for block in blocks if block.shape[1]]
+    matrix = sparse.hstack(blocks or [sparse.csr_matrix((count, 0))], format="csr")
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    matrix = (sparse.diags(inverse) @ matrix).tocsr()
+
+    return DocumentFeatures(
+        matrix=matrix,
+        embeddings=dense,
+        terms=terms.tocsr(),
+        vocabulary=list(columns),
+    )
+
+
+def kmeans(
+    features: sparse.csr_matrix | np.ndarray,
+    n_clusters: int,
+    max_iter: int = 50,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means with k-means++ seeding on row-normalized vectors.
+
+    Returns:
+        Cluster of each row, and the normalized centroids
+    """
+    count = features.shape[0]
+    n_clusters = max(1, min(n_clusters, count))
+    rng = np.random.default_rng(seed)
+
+    centers = [int(rng.integers(count))]
+    distance = 1.0 - _dense(features @ features[centers[0]].T).ravel()
+    for _ in range(1, n_clusters):
+        weights = np.clip(distance, 0.0, None) ** 2
+        total = weights.sum()
+        if total <= 0:
+            break
+        center = int(rng.choice(count, p=weights / total))
+        centers.append(center)
+        distance = np.minimum(
+            distance, 1.0 - _dense(features @ features[center].T).ravel()
+        )
+
+    centroids = _normalize_rows(_dense(features[centers]).astype(float))
+    labels = np.full(count, -1)
+    for _ in range(max_iter):
+        updated = _dense(features @ centroids.T).argmax(axis=1)
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+        membership = sparse.csr_matrix(
+            (np.ones(count), (labels, np.arange(count))),
+            shape=(len(centroids), count),
+        )
+        sums = _dense(membership @ features)
+        # An emptied cluster keeps its previous centroid
+        empty = np.diff(membership.indptr) == 0
+        sums[empty] = centroids[empty]
+        centroids = _normalize_rows(sums)
+
+    return labels, centroids
+
+
+def silhouette_score(similarity: np.ndarray, labels: np.ndarray) -> float:
+    """Mean silhouette of a clustering, from a cosine similarity matrix."""
+    clusters = np.unique(labels)
+    if not 1 < len(clusters) < len(labels):
+        return -1.0
+    distance = 1.0 - similarity
+    onehot = labels[:, None] == clusters[None, :]
+    sizes = onehot.sum(axis=0)
+    # Mean distance of every point to every cluster, excluding itself
+    totals = distance @ onehot
+    own = onehot.argmax(axis=1)
+    own_sizes = sizes[own] - 1
+    mean = totals / sizes
+    mean[np.arange(len(labels)), own] = np.divide(
+        totals[np.arange(len(labels)), own],
+        own_sizes,
+        out=np.zeros(len(labels)),
+        where=own_sizes > 0,
+    )
+    a = mean[np.arange(len(labels)), own]
+    mean[np.arange(len(labels)), own] = np.inf
+    b = mean.min(axis=1)
+    scores = np.divide(
+        b - a, np.maximum(a, b), out=np.zeros(len(labels)), where=own_sizes > 0
+    )
+    return float(scores.mean())
+
+
+def agglomerative(
+    similarity: np.ndarray, n_clusters: int, distance_threshold: float = 0.5
+) -> np.ndarray:
+    """Average-linkage agglomerative clustering on cosine distance.
+
+    Clusters are merged while there are more than ``n_clusters`` or while the
+    closest pair is within ``distance_threshold``; each merge updates one row
+    of the distance matrix with the Lance-Williams formula.
+
+    Returns:
+        Cluster of each row
+    """
+    count = len(similarity)
+    distance = 1.0 - similarity.astype(float)
+    np.fill_diagonal(distance, np.inf)
+    sizes = np.ones(count)
+    labels = np.arange(count)
+    clusters = count
+
+    while clusters > 1:
+        i, j = divmod(int(distance.argmin()), count)
+        if clusters <= n_clusters and distance[i, j] > distance_threshold:
+            break
+        merged = (sizes[i] * distance[i] + sizes[j] * distance[j]) / (
+            sizes[i] + sizes[j]
+        )
+        distance[i, :] = merged
+        distance[:, i] = merged
+        distance[i, i] = np.inf
+        distance[j, :] = np.inf
+        distance[:, j] = np.inf
+        sizes[i] += sizes[j]
+        labels[labels == j] = i
+        clusters -= 1
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def hdbscan(
+    similarity: np.ndarray, min_cluster_size: int = 2, min_samples: int | None = None
+) -> np.ndarray:
+    """HDBSCAN on cosine distance.
+
+    Builds the minimum spanning tree of the mutual reachability distances
+    (Prim's algorithm, one vectorized row update per step), turns it into a
+    single-linkage hierarchy, condenses it with ``min_cluster_size`` and keeps
+    the clusters with the most stability (excess of mass).
+
+    Returns:
+        Cluster of each row, -1 for noise
+    """
+    count = len(similarity)
+    labels = np.full(count, -1)
+    min_cluster_size = max(2, min_cluster_size)
+    if count < min_cluster_size:
+        return labels
+    min_samples = min(min_samples or min_cluster_size, count - 1)
+
+    distance = np.clip(1.0 - similarity, 0.0, None)
+    np.fill_diagonal(distance, 0.0)
+    core = np.partition(distance, min_samples, axis=1)[:, min_samples]
+    reachability = np.maximum(distance, np.maximum.outer(core, core))
+
+    in_tree = np.zeros(count, dtype=bool)
+    in_tree[0] = True
+    best = reachability[0].copy()
+    parent = np.zeros(count, dtype=int)
+    edges = np.empty((count - 1, 3))
+    for step in range(count - 1):
+        best[in_tree] = np.inf
+        node = int(best.argmin())
+        edges[step] = (parent[node], node, best[node])
+        in_tree[node] = True
+        closer = reachability[node] < best
+        best[closer] = reachability[node][closer]
+        parent[closer] = node
+    edges = edges[np.argsort(edges[:, 2], kind="stable")]
+
+    # Single-linkage hierarchy: node count + i merges the two roots of edge i
+    root_of = np.arange(2 * count - 1)
+    sizes = np.ones(2 * count - 1, dtype=int)
+    children: list[tuple[int, int, float]] = []
+
+    def find(node: int) -> int:
+        while root_of[node] != node:
+            root_of[node] = root_of[root_of[node]]
+            node = root_of[node]
+        return node
+
+    for index, (a, b, merge_distance) in enumerate(edges):
+        left, right = find(int(a)), find(int(b))
+        node = count + index
+        root_of[left] = root_of[right] = node
+        sizes[node] = sizes[left] + sizes[right]
+        children.append((left, right, merge_distance))
+
+    def leaves(node: int) -> list[int]:
+        found, stack = [], [node]
+        while stack:
+            current = stack.pop()
+            if current < count:
+                found.append(current)
+            else:
+                stack.extend(children[current - count][:2])
+        return found
+
+    # Condensed tree: follow each cluster down until it splits into two
+    # clusters of at least min_cluster_size or falls apart
+    births = [0.0]
+    birth_nodes = [2 * count - 2]
+    stability = [0.0]
+    cluster_children: list[list[int]] = [[]]
+    stack = [0]
+    while stack:
+        cluster = stack.pop()
+        node = birth_nodes[cluster]
+        while node >= count:
+            left, right, merge_distance = children[node - count]
+            level = 1.0 / max(merge_distance, 1e-12)
+            gained = level - births[cluster]
+            big_left = sizes[left] >= min_cluster_size
+            big_right = sizes[right] >= min_cluster_size
+            if big_left and big_right:
+                stability[cluster] += sizes[node] * gained
+                for child in (left, right):
+                    births.append(level)
+                    birth_nodes.append(child)
+                    stability.append(0.0)
+                    cluster_children.append([])
+                    cluster_children[cluster].append(len(births) - 1)
+                    stack.append(len(births) - 1)
+                break
+            if not big_left and not big_right:
+                stability[cluster] += sizes[node] * gained
+                break
+            small = right if big_left else left
+            stability[cluster] += sizes[small] * gained
+            node = left if big_left else right
+
+    # Excess of mass: keep a cluster unless its children are more stable
+    subtree_stability = list(stability)
+    selected = [True] * len(births)
+    for cluster in reversed(range(len(births))):
+        child_total = sum(subtree_stability[c] for c in cluster_children[cluster])
+        if cluster_children[cluster] and child_total > stability[cluster]:
+            selected[cluster] = False
+            subtree_stability[cluster] = child_total
+
+    # The root is never a cluster; take the top-most selected clusters
+    stack = list(cluster_children[0])
+    label = 0
+    while stack:
+        cluster = stack.pop()
+        if selected[cluster]:
+            labels[leaves(birth_nodes[cluster])] = label
+            label += 1
+        else:
+            stack.extend(cluster_children[cluster])
+    return labels
+
+
+class VectorClusteringEngine:
+    """Cluster documents on their embedding vectors and entity/topic features."""
+
+    def __init__(
+        self,
+        algorithm: ClusteringAlgorithm = ClusteringAlgorithm.KMEANS,
+        embedding_weight: float = 0.7,
+        assignment_threshold: float = 0.5,
+        max_unassigned_share: float = 0.3,
+        max_cached_clusterings: int = 32,
+        seed: int = 0,
+    ):
+        """Initialize the clustering engine.
+
+        Args:
+            algorithm: Clustering algorithm
+            embedding_weight: Share of the embedding cosine in document
+                similarity; the rest comes from entity and topic features
+            assignment_threshold: Minimum cosine between a new document and a
+                cached centroid for the document to join that cluster
+            max_unassigned_share: Share of new documents that may fit no
+                cached centroid before the documents are clustered again
+            max_cached_clusterings: Number of cached centroid sets (LRU)
+            seed: Random seed of k-means
+        """
+        self.algorithm = algorithm
+        self.embedding_weight = embedding_weight
+        self.assignment_threshold = assignment_threshold
+        self.max_unassigned_share = max_unassigned_share
+        self.max_cached_clusterings = max_cached_clusterings
+        self.seed = seed
+        self._centroid_cache: OrderedDict[str, _CachedCentroids] = OrderedDict()
+
+    def cluster(
+        self,
+        document_ids: list[str],
+        embeddings: Sequence[Sequence[float] | None],
+        entities: Sequence[Sequence[str]],
+        topics: Sequence[Sequence[str]],
+        max_clusters: int = 10,
+        min_cluster_size: int = 2,
+        cache_key: str | None = None,
+    ) -> VectorClustering:
+        """Cluster documents.
+
+        Args:
+            document_ids: ID of each document
+            embeddings: Stored embedding of each document, None when missing
+            entities: Entity texts of each document
+            topics: Topic texts of each document
+            max_clusters: Maximum number of clusters
+            min_cluster_size: Minimum number of documents per cluster
+            cache_key: Enables incremental mode; documents are assigned to the
+                centroids cached under this key when they fit them
+        """
+        features = build_document_features(
+            embeddings, entities, topics, self.embedding_weight
+        )
+        similarity = _dense(features.matrix @ features.matrix.T)
+
+        labels = None
+        if cache_key is not None:
+            labels = self._assign_to_cached_centroids(cache_key, document_ids, features)
+        incremental = labels is not None
+        if labels is None:
+            labels = self._limit_clusters(
+                self._fit(features, similarity, max_clusters, min_cluster_size),
+                max_clusters,
+                min_cluster_size,
+            )
+            if cache_key is not None:
+                self._cache_centroids(cache_key, document_ids, features, labels)
+        else:
+            labels = self._limit_clusters(labels, max_clusters, min_cluster_size)
+
+        return self._describe(features, similarity, labels, incremental)
+
+    def clear_cache(self) -> None:
+        """Drop all cached centroids."""
+        self._centroid_cache.clear()
+
+    def _fit(
+        self,
+        features: DocumentFeatures,
+        similarity: np.ndarray,
+        max_clusters: int,
+        min_cluster_size: int,
+    ) -> np.ndarray:
+        count = features.matrix.shape[0]
+        if not features.matrix.nnz:
+            # Nothing to compare the documents on
+            return np.full(count, -1)
+        if count < 2:
+            return np.zeros(count, dtype=int)
+
+        if self.algorithm == ClusteringAlgorithm.HDBSCAN:
+            labels = hdbscan(similarity, min_cluster_size)
+        elif self.algorithm == ClusteringAlgorithm.AGGLOMERATIVE:
+            labels = agglomerative(similarity, max_clusters)
+        else:
+            # Pick the number of clusters with the best silhouette
+            largest = max(1, min(max_clusters, count // max(1, min_cluster_size)))
+            labels = np.zeros(count, dtype=int)
+            best_score = -1.0
+            for n_clusters in range(2, largest + 1):
+                raise_if_cancelled()
+                candidate, _ = kmeans(features.matrix, n_clusters, seed=self.seed)
+                score = silhouette_score(similarity, candidate)
+                if score > best_score:
+                    labels, best_score = candidate, score
+
+        return labels
+
+    @staticmethod
+    def _limit_clusters(
+        labels: np.ndarray, max_clusters: int, min_cluster_size: int
+    ) -> np.ndarray:
+        """Keep the largest clusters of at least ``min_cluster_size``, renumbered."""
+        clustered = labels >= 0
+        sizes = np.bincount(labels[clustered]) if clustered.any() else np.zeros(0)
+        order = np.argsort(-sizes, kind="stable")
+        kept = [c for c in order if sizes[c] >= min_cluster_size][:max_clusters]
+        mapping = np.full(len(sizes), -1)
+        mapping[kept] = np.arange(len(kept))
+        limited = np.full(len(labels), -1)
+        limited[clustered] = mapping[labels[clustered]]
+        return limited
+
+    def _assign_to_cached_centroids(
+        self, cache_key: str, document_ids: list[str], features: DocumentFeatures
+    ) -> np.ndarray | None:
+        """Labels from cached centroids, or None when clustering again is needed."""
+        cached = self._centroid_cache.get(cache_key)
+        if (
+            cached is None
+            or cached.centroids.shape[0] == 0
+            or features.embeddings.shape[1] != cached.centroids.shape[1]
+        ):
+            return None
+        self._centroid_cache.move_to_end(cache_key)
+
+        labels = np.array(
+            [cached.assignments.get(doc_id, -1) for doc_id in document_ids]
+        )
+        new = (labels < 0) & features.has_embedding
+        if new.any():
+            scores = features.embeddings[new] @ cached.centroids.T
+            nearest = scores.argmax(axis=1)
+            fits = scores[np.arange(len(nearest)), nearest] >= (
+                self.assignment_threshold
+            )
+            labels[np.flatnonzero(new)[fits]] = nearest[fits]
+
+        unassigned = int((labels < 0).sum())
+        unseen = sum(doc_id not in cached.assignments for doc_id in document_ids)
+        if unseen and unassigned > self.max_unassigned_share * len(document_ids):
+            logger.debug(
+                "Too many documents fit no cached centroid, clustering again",
+                unassigned=unassigned,
+                documents=len(document_ids),
+            )
+            return None
+
+        # Move centroids towards their new members
+        added = np.flatnonzero(new & (labels >= 0))
+        if len(added):
+            sums = cached.centroids * cached.counts[:, None]
+            np.add.at(sums, labels[added], features.embeddings[added])
+            cached.counts += np.bincount(labels[added], minlength=len(cached.counts))
+            cached.centroids = _normalize_rows(sums)
+        for index in np.flatnonzero(labels >= 0):
+            cached.assignments[document_ids[index]] = int(labels[index])
+        return labels
+
+    def _cache_centroids(
+        self,
+        cache_key: str,
+        document_ids: list[str],
+        features: DocumentFeatures,
+        labels: np.ndarray,
+    ) -> None:
+        cluster_count = int(labels.max()) + 1 if len(labels) else 0
+        members = (labels >= 0) & features.has_embedding
+        if cluster_count == 0 or not members.any():
+            # No centroid to assign documents to, so the next call clusters
+            # again instead of using an empty set
+            self._centroid_cache.pop(cache_key, None)
+            return
+        sums = np.zeros((cluster_count, features.embeddings.shape[1]))
+        np.add.at(sums, labels[members], features.embeddings[members])
+        self._centroid_cache[cache_key] = _CachedCentroids(
+            centroids=_normalize_rows(sums),
+            counts=np.bincount(labels[members], minlength=cluster_count).astype(float),
+            assignments={
+                document_ids[index]: int(labels[index])
+                for index in np.flatnonzero(labels >= 0)
+            },
+        )
+        self._centroid_cache.move_to_end(cache_key)
+        while len(self._centroid_cache) > self.max_cached_clusterings:
+            self._centroid_cache.popitem(last=False)
+
+    @staticmethod
+    def _describe(
+        features: DocumentFeatures,
+        similarity: np.ndarray,
+        labels: np.ndarray,
+        incremental: bool,
+    ) -> VectorClustering:
+        """Compute coherence, medoids and shared terms of all clusters at once."""
+        cluster_count = int(labels.max()) + 1 if (labels >= 0).any() else 0
+        clustered = np.flatnonzero(labels >= 0)
+        membership = sparse.csr_matrix(
+            (np.ones(len(clustered)), (labels[clustered], clustered)),
+            shape=(cluster_count, len(labels)),
+        )
+        sizes = np.diff(membership.indptr).astype(float)
+
+        # Sum of similarities between the members of every pair of clusters
+        to_clusters = _dense(membership @ similarity).T  # documents x clusters
+        pair_sums = _dense(membership @ to_clusters)
+        within = np.diag(pair_sums) - sizes  # Without self-similarity
+        pairs = sizes * (sizes - 1)
+        coherence = np.divide(
+            within, pairs, out=np.ones(cluster_count), where=pairs > 0
+        )
+        cluster_similarity = pair_sums / np.maximum(np.outer(sizes, sizes), 1)
+        np.fill_diagonal(cluster_similarity, coherence)
+
+        # Medoid: the member with the highest similarity to its own cluster
+        own = np.full(len(labels), -np.inf)
+        own[clustered] = to_clusters[clustered, labels[clustered]]
+        representatives = np.zeros(cluster_count, dtype=int)
+        for c in range(cluster_count):
+            members = np.flatnonzero(labels == c)
+            representatives[c] = members[own[members].argmax()]
+
+        # Terms found in at least half of the members, most frequent first
+        term_counts = _dense(membership @ features.terms)
+        shared_entities: list[list[str]] = []
+        shared_topics: list[list[str]] = []
+        for c in range(cluster_count):
+            frequent = np.flatnonzero(term_counts[c] >= max(2, sizes[c] / 2))
+            frequent = frequent[np.argsort(-term_counts[c][frequent], kind="stable")]
+            terms = [features.vocabulary[t] for t in frequent]
+            shared_entities.append(
+                [text for kind, text in terms if kind == "entity"][:5]
+            )
+            shared_topics.append([text for kind, text in terms if kind == "topic"][:5])
+
+        return VectorClustering(
+            labels=labels,
+            coherence=np.clip(coherence, 0.0, 1.0),
+            representatives=representatives,
+            cluster_similarity=np.clip(cluster_similarity, 0.0, 1.0),
+            shared_entities=shared_entities,
+            shared_topics=shared_topics,
+            incremental=incremental,
+        )
@@ -1,6 +1,8 @@
 """Refactored hybrid search implementation using modular components."""
 
+import threading
 import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -10,6 +12,8 @@ from qdrant_client import QdrantClient
 from ..config import SearchConfig
 from ..utils.logging import LoggingConfig
 from .components import (
+    AnalysisExecutor,
+    DocumentStore,
     HybridSearchResult,
     KeywordSearchService,
     MetadataExtractor,
@@ -17,6 +21,8 @@ from .components import (
     ResultCombiner,
     VectorSearchService,
 )
+from .components.analysis_executor import raise_if_cancelled
+from .components.search_result_models import create_hybrid_search_result
 from .enhanced.cross_document_intelligence import (
     ClusteringStrategy,
     CrossDocumentIntelligenceEngine,
@@ -29,11 +35,13 @@ from .enhanced.faceted_search import (
 )
 from .enhanced.intent_classifier import AdaptiveSearchStrategy, IntentClassifier
 from .enhanced.knowledge_graph import DocumentKnowledgeGraph
+from .enhanced.precomputed_graph import PrecomputedKnowledgeGraph
 from .enhanced.topic_search_chain import (
     ChainStrategy,
     TopicSearchChain,
     TopicSearchChainGenerator,
 )
+from .enhanced.vector_clustering import ClusteringAlgorithm, VectorClusteringEngine
 from .nlp.spacy_analyzer import SpaCyQueryAnalyzer
 
 logger = LoggingConfig.get_logger(__name__)
@@ -55,6 +63,7 @@ class HybridSearchEngine:
         knowledge_graph: DocumentKnowledgeGraph = None,
         enable_intent_adaptation: bool = True,
         search_config: SearchConfig | None = None,
+        precomputed_graph: PrecomputedKnowledgeGraph | None = None,
     ):
         """Initialize the hybrid search service.
 
@@ -70,6 +79,8 @@ class HybridSearchEngine:
             knowledge_graph: Optional knowledge graph for integration
             enable_intent_adaptation: Enable intent-aware adaptive search
             search_config: Optional search configuration for performance optimization
+            precomputed_graph: Optional corpus-wide knowledge graph built by the
+                loader, used to rerank results when the search intent calls for it
         """
         self.qdrant_client = qdrant_client
         self.openai_client = openai_client
@@ -80,8 +91,11 @@ class HybridSearchEngine:
         self.min_score = min_score
         self.logger = LoggingConfig.get_logger(__name__)
 
-        # Initialize spaCy query analyzer
-        self.spacy_analyzer = SpaCyQueryAnalyzer(spacy_model="en_core_web_md")
+        # Initialize spaCy query analyzer (the model loads on first use)
+        self.spacy_analyzer = SpaCyQueryAnalyzer(
+            spacy_model="en_core_web_md",
+            doc_cache_size=getattr(search_config, "spacy_doc_cache_size", 512),
+        )
 
         # Initialize modular components
         self.query_processor = QueryProcessor(self.spacy_analyzer)
@@ -122,35 +136,124 @@ class HybridSearchEngine:
 
         self.metadata_extractor = MetadataExtractor()
 
+        # Direct lookup of documents by ID, bypassing retrieval
+        self.document_store = DocumentStore(
+            qdrant_client=qdrant_client,
+            collection_name=collection_name,
+            result_combiner=self.result_combiner,
+            cache_size=getattr(search_config, "document_cache_size", 128),
+            cache_ttl=getattr(search_config, "cache_ttl", 300),
+        )
+
+        # CPU-bound analysis runs in worker threads to keep the event loop free
+        self.analysis_executor = self._build_analysis_executor(search_config)
+
         # Enhanced search components
         self.enable_intent_adaptation = enable_intent_adaptation
+        self.enable_intelligence_tools = getattr(
+            search_config, "enable_intelligence_tools", True
+        )
         self.knowledge_graph = knowledge_graph
+        self.precomputed_graph = precomputed_graph
+        self._search_config = search_config
+        self._topic_chains_initialized = False
 
-        if self.enable_intent_adaptation:
-            self.intent_classifier = IntentClassifier(self.spacy_analyzer)
-            self.adaptive_strategy = AdaptiveSearchStrategy(self.knowledge_graph)
-            logger.info("Intent-aware adaptive search ENABLED")
-        else:
-            self.intent_classifier = None
-            self.adaptive_strategy = None
-            logger.info("Intent-aware adaptive search DISABLED")
+        # Intent classification, topic chaining, faceted search and
+        # cross-document intelligence are built on first use (or by warm_up)
+        self._components: dict[str, Any] = {}
+        self._components_lock = threading.RLock()
+        logger.info(
+            "Hybrid search engine created",
+            intent_adaptation=enable_intent_adaptation,
+            intelligence_tools=self.enable_intelligence_tools,
+        )
 
-        # Topic-driven search chaining
-        self.topic_chain_generator = TopicSearchChainGenerator(
-            self.spacy_analyzer, self.knowledge_graph
+    def _component(self, name: str, build: Callable[[], Any]) -> Any:
+        """Get a lazily built component, building it once on first access."""
+        if name not in self._components:
+            with self._components_lock:
+                if name not in self._components:
+                    started = time.perf_counter()
+                    self._components[name] = build()
+                    self.logger.info(
+                        "Search component initialized",
+                        component=name,
+                        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+                    )
+        return self._components[name]
+
+    @property
+    def intent_classifier(self) -> IntentClassifier | None:
+        """Intent classifier, None when intent adaptation is disabled."""
+        return self._component(
+            "intent_classifier",
+            lambda: (
+                IntentClassifier(self.spacy_analyzer)
+                if self.enable_intent_adaptation
+                else None
+            ),
         )
-        self._topic_chains_initialized = False
-        logger.info("Topic-driven search chaining ENABLED")
 
-        # Dynamic faceted search interface
-        self.faceted_search_engine = FacetedSearchEngine()
-        logger.info("Dynamic faceted search interface ENABLED")
+    @intent_classifier.setter
+    def intent_classifier(self, value: IntentClassifier | None) -> None:
+        self._components["intent_classifier"] = value
+
+    @property
+    def adaptive_strategy(self) -> AdaptiveSearchStrategy | None:
+        """Adaptive search strategy, None when intent adaptation is disabled."""
+        return self._component(
+            "adaptive_strategy",
+            lambda: (
+                AdaptiveSearchStrategy(self.knowledge_graph)
+                if self.enable_intent_adaptation
+                else None
+            ),
+        )
 
-        # Cross-document intelligence
+    @adaptive_strategy.setter
+    def adaptive_strategy(self, value: AdaptiveSearchStrategy | None) -> None:
+        self._components["adaptive_strategy"] = value
+
+    @property
+    def topic_chain_generator(self) -> TopicSearchChainGenerator:
+        """Topic-driven search chain generator."""
+        return self._component(
+            "topic_chain_generator",
+            lambda: TopicSearchChainGenerator(
+                self.spacy_analyzer, self.knowledge_graph
+            ),
+        )
+
+    @topic_chain_generator.setter
+    def topic_chain_generator(self, value: TopicSearchChainGenerator) -> None:
+        self._components["topic_chain_generator"] = value
+
+    @property
+    def faceted_search_engine(self) -> FacetedSearchEngine:
+        """Dynamic faceted search interface."""
+        return self._component("faceted_search_engine", FacetedSearchEngine)
+
+    @faceted_search_engine.setter
+    def faceted_search_engine(self, value: FacetedSearchEngine) -> None:
+        self._components["faceted_search_engine"] = value
+
+    @property
+    def cross_document_engine(self) -> CrossDocumentIntelligenceEngine:
+        """Cross-document intelligence engine."""
+        return self._component(
+            "cross_document_engine", self._build_cross_document_engine
+        )
+
+    @cross_document_engine.setter
+    def cross_document_engine(self, value: CrossDocumentIntelligenceEngine) -> None:
+        self._components["cross_document_engine"] = value
+
+    def _build_cross_document_engine(self) -> CrossDocumentIntelligenceEngine:
+        """Build the cross-document intelligence engine from the search config."""
         # Build conflict settings from provided search_config (if any)
-        conflict_settings = self._build_conflict_settings(search_config)
+        conflict_settings = self._build_conflict_settings(self._search_config)
 
-        self.cross_document_engine = CrossDocumentIntelligenceEngine(
+        cross_document_engine = CrossDocumentIntelligenceEngine(
             self.spacy_analyzer,
             self.knowledge_graph,
             self.qdrant_client,
@@ -158,7 +261,32 @@ class HybridSearchEngine:
             self.collection_name,
             conflict_settings=conflict_settings,
         )
-        logger.info("Cross-document intelligence ENABLED")
+        cross_document_engine.cluster_analyzer.vector_engine = (
+            self._build_vector_clustering_engine(self._search_config)
+        )
+        return cross_document_engine
+
+    def warm_up(self) -> None:
+        """Load the spaCy model and build the components ahead of first use.
+
+        Blocking; the search engine runs it in a background thread after
+        startup. Components of disabled intelligence tools are skipped.
+        """
+        started = time.perf_counter()
+        components = ["intent_classifier", "adaptive_strategy"]
+        if self.enable_intelligence_tools:
+            components += [
+                "topic_chain_generator",
+                "faceted_search_engine",
+                "cross_document_engine",
+            ]
+        _ = self.spacy_analyzer.nlp
+        for name in components:
+            getattr(self, name)
+        self.logger.info(
+            "Search components warmed up",
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
 
     async def search(
         self,
@@ -196,8 +324,12 @@ class HybridSearchEngine:
 
             if self.enable_intent_adaptation and self.intent_classifier:
                 # Classify search intent
-                search_intent = self.intent_classifier.classify_intent(
-                    query, session_context, behavioral_context
+                search_intent = await self.analysis_executor.run(
+                    "classify_intent",
+                    self.intent_classifier.classify_intent,
+                    query,
+                    session_context,
+                    behavioral_context,
                 )
 
                 # Adapt search configuration based on classified intent
@@ -262,6 +394,18 @@ class HybridSearchEngine:
                 project_ids,
             )
 
+            if (
+                adaptive_config
+                and adaptive_config.use_knowledge_graph
+                and self.precomputed_graph is not None
+            ):
+                combined_results = self._rerank_with_knowledge_graph(
+                    combined_results,
+                    query_context,
+                    adaptive_config.kg_expansion_weight,
+                    adaptive_config.max_graph_hops,
+                )
+
             # Restore original search parameters if they were modified
             if adaptive_config:
                 self.result_combiner.vector_weight = original_vector_weight
@@ -275,6 +419,40 @@ class HybridSearchEngine:
             self.logger.error("Error in hybrid search", error=str(e), query=query)
             raise
 
+    def _rerank_with_knowledge_graph(
+        self,
+        results: list[HybridSearchResult],
+        query_context: dict[str, Any],
+        weight: float,
+        max_hops: int,
+    ) -> list[HybridSearchResult]:
+        """Boost results the precomputed knowledge graph links to the query.
+
+        The query's entities, concepts and keywords are the seed nodes; each
+        result gains ``weight`` times the graph proximity of its document.
+        """
+        terms = [
+            *query_context.get("entities", []),
+            *query_context.get("main_concepts", []),
+            *query_context.get("keywords", []),
+        ]
+        graph_scores = self.precomputed_graph.score_documents(
+            terms,
+            document_ids=[r.document_id for r in results if r.document_id],
+            max_hops=max_hops,
+        )
+        if not graph_scores:
+            return results
+
+        for result in results:
+            result.base.score += weight * graph_scores.get(result.document_id, 0.0)
+        results.sort(key=lambda r: r.score, reverse=True)
+        self.logger.debug(
+            "Reranked results with the knowledge graph",
+            boosted=len(graph_scores),
+        )
+        return results
+
     # ============================================================================
     # Topic Search Chain Methods
     # ============================================================================
@@ -300,8 +478,12 @@ class HybridSearchEngine:
                 await self._initialize_topic_relationships(query)
 
             # Generate the topic search chain
-            topic_chain = self.topic_chain_generator.generate_search_chain(
-                original_query=query, strategy=strategy, max_links=max_links
+            topic_chain = await self.analysis_executor.run(
+                "topic_chain",
+                self.topic_chain_generator.generate_search_chain,
+                original_query=query,
+                strategy=strategy,
+                max_links=max_links,
             )
 
             self.logger.info(
@@ -401,7 +583,11 @@ class HybridSearchEngine:
 
             if sample_results:
                 # Initialize topic relationships from the sample results
-                self.topic_chain_generator.initialize_from_results(sample_results)
+                await self.analysis_executor.run(
+                    "topic_chain",
+                    self.topic_chain_generator.initialize_from_results,
+                    sample_results,
+                )
                 self._topic_chains_initialized = True
 
                 self.logger.info(
@@ -454,8 +640,11 @@ class HybridSearchEngine:
             )
 
             # Generate faceted results
-            faceted_results = self.faceted_search_engine.generate_faceted_results(
-                results=search_results, applied_filters=facet_filters or []
+            faceted_results = await self.analysis_executor.run(
+                "search_with_facets",
+                self.faceted_search_engine.generate_faceted_results,
+                results=search_results,
+                applied_filters=facet_filters or [],
             )
 
             # Limit final results
@@ -489,7 +678,11 @@ class HybridSearchEngine:
     ) -> dict[str, Any]:
         """Perform comprehensive cross-document relationship analysis."""
         try:
-            return self.cross_document_engine.analyze_document_relationships(documents)
+            return await self.analysis_executor.run(
+                "analyze_relationships",
+                self.cross_document_engine.analyze_document_relationships,
+                documents,
+            )
         except Exception as e:
             self.logger.error("Error in cross-document analysis", error=str(e))
             raise
@@ -503,26 +696,13 @@ class HybridSearchEngine:
     ) -> list[dict[str, Any]]:
         """Find documents similar to a target document."""
         try:
-            similarity_calculator = self.cross_document_engine.similarity_calculator
-            similar_docs = []
-
-            for doc in documents:
-                if doc == target_document:
-                    continue
-
-                similarity = similarity_calculator.calculate_similarity(
-                    target_document, doc, similarity_metrics
-                )
-
-                similar_docs.append(
-                    {
-                        "document_id": doc.document_id,  # ✅ ADD document_id for lazy loading
-                        "document": doc,
-                        "similarity_score": similarity.similarity_score,
-                        "metric_scores": similarity.metric_scores,
-                        "similarity_reasons": [similarity.get_display_explanation()],
-                    }
-                )
+            similar_docs = await self.analysis_executor.run(
+                "find_similar_documents",
+                self._score_similar_documents,
+                target_document,
+                documents,
+                similarity_metrics,
+            )
 
             # ✅ Add debug logging before filtering
             self.logger.debug(
@@ -550,6 +730,118 @@ class HybridSearchEngine:
             self.logger.error("Error finding similar documents", error=str(e))
             raise
 
+    def _score_similar_documents(
+        self,
+        target_document: HybridSearchResult,
+        documents: list[HybridSearchResult],
+        similarity_metrics: list[SimilarityMetric] | None,
+    ) -> list[dict[str, Any]]:
+        """Score every document against the target, in an analysis worker."""
+        similarity_calculator = self.cross_document_engine.similarity_calculator
+        similarity_calculator.prepare_documents(
+            [target_document, *documents], similarity_metrics
+        )
+        similar_docs = []
+
+        for doc in documents:
+            if doc == target_document:
+                continue
+            raise_if_cancelled()
+
+            similarity = similarity_calculator.calculate_similarity(
+                target_document, doc, similarity_metrics
+            )
+
+            similar_docs.append(
+                {
+                    "document_id": doc.document_id,  # ✅ ADD document_id for lazy loading
+                    "document": doc,
+                    "similarity_score": similarity.similarity_score,
+                    "metric_scores": similarity.metric_scores,
+                    "similarity_reasons": [similarity.get_display_explanation()],
+                }
+            )
+
+        return similar_docs
+
+    async def find_similar_documents_by_vector(
+        self,
+        target_document: HybridSearchResult,
+        similarity_metrics: list[SimilarityMetric] = None,
+        max_similar: int = 5,
+        source_types: list[str] | None = None,
+        project_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find documents similar to a target document using its stored vectors.
+
+        Candidates come from the whole collection through a Qdrant
+        recommendation on the chunks of the target document, and are reranked
+        with the batch similarity metrics, so no spaCy processing is needed.
+        """
+        try:
+            if not target_document.document_id:
+                return []
+
+            hits = await self.vector_search_service.recommend_similar_documents(
+                document_id=target_document.document_id,
+                # Rerank a few more candidates than needed
+                limit=max(max_similar * 4, 20),
+                source_types=source_types,
+                project_ids=project_ids,
+            )
+            documents = [self._create_result_from_hit(hit) for hit in hits]
+
+            calculator = self.cross_document_engine.similarity_calculator
+            similarities = calculator.calculate_similarity_batch(
+                target_document,
+                documents,
+                [hit["score"] for hit in hits],
+                similarity_metrics,
+            )
+            similar_docs = [
+                {
+                    "document_id": doc.document_id,
+                    "document": doc,
+                    "similarity_score": similarity.similarity_score,
+                    "metric_scores": similarity.metric_scores,
+                    "similarity_reasons": [similarity.get_display_explanation()],
+                }
+                for doc, similarity in zip(documents, similarities, strict=True)
+            ]
+            similar_docs.sort(key=lambda x: x["similarity_score"], reverse=True)
+            return similar_docs[:max_similar]
+
+        except Exception as e:
+            self.logger.error("Error finding similar documents", error=str(e))
+            raise
+
+    def _create_result_from_hit(self, hit: dict[str, Any]) -> HybridSearchResult:
+        """Create a search result from a vector search hit without rescoring."""
+        metadata = hit["metadata"]
+        fields = {
+            "source_url": hit["url"],
+            "document_id": hit["document_id"],
+            "created_at": hit["created_at"],
+            "last_modified": hit["updated_at"],
+            "repo_name": hit["source"],
+        }
+        for component in self.metadata_extractor.extract_all_metadata(
+            metadata
+        ).values():
+            if component is not None:
+                fields.update(vars(component))
+        return create_hybrid_search_result(
+            score=hit["score"],
+            text=hit["text"],
+            source_type=hit["source_type"],
+            source_title=hit["title"]
+            or metadata.get("title")
+            or metadata.get("file_name")
+            or "Untitled",
+            vector_score=hit["score"],
+            **fields,
+        )
+
     async def detect_document_conflicts(
         self, documents: list[HybridSearchResult]
     ) -> dict[str, Any]:
@@ -577,8 +869,11 @@ class HybridSearchEngine:
     ) -> list[dict[str, Any]]:
         """Find content that complements the target document."""
         try:
-            complementary_content = self.cross_document_engine.complementary_finder.find_complementary_content(
-                target_document, documents
+            complementary_content = await self.analysis_executor.run(
+                "find_complementary_content",
+                self.cross_document_engine.complementary_finder.find_complementary_content,
+                target_document,
+                documents,
             )
             recommendations = complementary_content.get_top_recommendations(
                 max_recommendations
@@ -666,8 +961,16 @@ class HybridSearchEngine:
         strategy: ClusteringStrategy = ClusteringStrategy.MIXED_FEATURES,
         max_clusters: int = 10,
         min_cluster_size: int = 2,
+        incremental: bool = False,
+        cache_scope: str = "",
     ) -> dict[str, Any]:
-        """Cluster documents based on similarity and relationships."""
+        """Cluster documents based on similarity and relationships.
+
+        The semantic embedding strategy clusters the stored vectors of the
+        documents; with ``incremental``, documents are assigned to the
+        centroids cached by earlier requests with the same ``cache_scope``
+        (the query and filters the documents were found with) when they fit.
+        """
         start_time = time.time()
 
         try:
@@ -675,9 +978,31 @@ class HybridSearchEngine:
                 f"Starting clustering with {len(documents)} documents using {strategy.value}"
             )
 
-            clusters = self.cross_document_engine.cluster_analyzer.create_clusters(
-                documents, strategy, max_clusters, min_cluster_size
-            )
+            cluster_analyzer = self.cross_document_engine.cluster_analyzer
+            if strategy == ClusteringStrategy.SEMANTIC_EMBEDDING:
+                embeddings = await self.vector_search_service.get_document_vectors(
+                    [doc.document_id for doc in documents if doc.document_id]
+                )
+                clusters = await self.analysis_executor.run(
+                    "cluster_documents",
+                    cluster_analyzer.create_clusters,
+                    documents,
+                    strategy,
+                    max_clusters,
+                    min_cluster_size,
+                    embeddings=embeddings,
+                    incremental=incremental,
+                    cache_scope=cache_scope,
+                )
+            else:
+                clusters = await self.analysis_executor.run(
+                    "cluster_documents",
+                    cluster_analyzer.create_clusters,
+                    documents,
+                    strategy,
+                    max_clusters,
+                    min_cluster_size,
+                )
 
             # Build comprehensive document lookup with multiple strategies
             doc_lookup = self._build_document_lookup(documents, robust=True)
@@ -747,8 +1072,11 @@ class HybridSearchEngine:
             )
 
             # Analyze cluster relationships
-            cluster_relationships = self._analyze_cluster_relationships(
-                clusters, documents
+            cluster_relationships = await self.analysis_executor.run(
+                "cluster_documents",
+                self._analyze_cluster_relationships,
+                clusters,
+                documents,
             )
 
             self.logger.info(
@@ -1016,11 +1344,21 @@ class HybridSearchEngine:
         # Use unified robust document lookup for consistency
         doc_lookup = self._build_document_lookup(documents, robust=True)
 
+        # Resolve the documents of each cluster once, not once per pair
+        cluster_docs = []
+        for cluster in clusters:
+            docs = (
+                self._find_document_by_id(doc_id, doc_lookup)
+                for doc_id in cluster.documents
+            )
+            cluster_docs.append([doc for doc in docs if doc])
+
         # Analyze pairwise cluster relationships
         for i, cluster_a in enumerate(clusters):
-            for _, cluster_b in enumerate(clusters[i + 1 :], i + 1):
+            raise_if_cancelled()
+            for j, cluster_b in enumerate(clusters[i + 1 :], i + 1):
                 relationship = self._analyze_cluster_pair(
-                    cluster_a, cluster_b, doc_lookup
+                    cluster_a, cluster_b, cluster_docs[i], cluster_docs[j]
                 )
                 if (
                     relationship and relationship["strength"] > 0.1
@@ -1044,22 +1382,13 @@ class HybridSearchEngine:
         return relationships[:10]  # Return top 10 relationships
 
     def _analyze_cluster_pair(
-        self, cluster_a, cluster_b, doc_lookup: dict
+        self,
+        cluster_a,
+        cluster_b,
+        docs_a: list[HybridSearchResult],
+        docs_b: list[HybridSearchResult],
     ) -> dict[str, Any] | None:
         """Analyze the relationship between two clusters."""
-        # Get cluster documents using robust lookup helper
-        docs_a = []
-        for doc_id in cluster_a.documents:
-            doc = self._find_document_by_id(doc_id, doc_lookup)
-            if doc:
-                docs_a.append(doc)
-
-        docs_b = []
-        for doc_id in cluster_b.documents:
-            doc = self._find_document_by_id(doc_id, doc_lookup)
-            if doc:
-                docs_b.append(doc)
-
         if not docs_a or not docs_b:
             return None
 
@@ -1091,6 +1420,11 @@ class HybridSearchEngine:
         if content_relationship:
             relationships.append(content_relationship)
 
+        # 6. Embedding similarity, for clusters built from stored vectors
+        semantic_relationship = self._analyze_semantic_similarity(cluster_a, cluster_b)
+        if semantic_relationship:
+            relationships.append(semantic_relationship)
+
         # Return the strongest relationship
         if relationships:
             strongest = max(relationships, key=lambda x: x["strength"])
@@ -1144,6 +1478,24 @@ class HybridSearchEngine:
             "shared_elements": list(overlap),
         }
 
+    def _analyze_semantic_similarity(
+        self, cluster_a, cluster_b
+    ) -> dict[str, Any] | None:
+        """Relationship from the mean embedding similarity of two clusters."""
+        related = getattr(cluster_a, "related_clusters", None)
+        if not isinstance(related, dict):
+            return None
+        strength = related.get(cluster_b.cluster_id, 0.0)
+        if strength <= 0:
+            return None
+
+        return {
+            "type": "semantic_similarity",
+            "strength": strength,
+            "description": f"Documents are semantically close (mean similarity {strength:.2f})",
+            "shared_elements": [],
+        }
+
     def _analyze_source_similarity(
         self, docs_a: list, docs_b: list
     ) -> dict[str, Any] | None:
@@ -1328,7 +1680,7 @@ class HybridSearchEngine:
                 ),
                 "conflict_use_llm": getattr(search_config, "conflict_use_llm", True),
                 "conflict_max_llm_pairs": getattr(
-                    search_config, "conflict_max_llm_pairs", 2
+                    search_config, "conflict_max_llm_pairs", 8
                 ),
                 "conflict_llm_model": getattr(
                     search_config, "conflict_llm_model", "gpt-4o-mini"
@@ -1348,10 +1700,39 @@ class HybridSearchEngine:
                 "conflict_embeddings_max_concurrency": getattr(
                     search_config, "conflict_embeddings_max_concurrency", 5
                 ),
+                "conflict_llm_max_concurrency": getattr(
+                    search_config, "conflict_llm_max_concurrency", 4
+                ),
+                "conflict_llm_cache_path": getattr(
+                    search_config, "conflict_llm_cache_path", None
+                ),
             }
         except Exception:
             return None
 
+    def _build_analysis_executor(
+        self, search_config: SearchConfig | None
+    ) -> AnalysisExecutor:
+        """Construct the analysis executor from ``search_config``."""
+        timeout_s = getattr(search_config, "analysis_timeout_s", 0.0)
+        return AnalysisExecutor(
+            max_workers=getattr(search_config, "analysis_max_workers", 4),
+            tool_concurrency=getattr(search_config, "analysis_tool_concurrency", 2),
+            timeout_s=timeout_s or None,
+        )
+
+    def _build_vector_clustering_engine(
+        self, search_config: SearchConfig | None
+    ) -> VectorClusteringEngine:
+        """Create the engine of the semantic embedding clustering strategy."""
+        try:
+            algorithm = ClusteringAlgorithm(
+                getattr(search_config, "clustering_algorithm", "kmeans")
+            )
+        except ValueError:
+            algorithm = ClusteringAlgorithm.KMEANS
+        return VectorClusteringEngine(algorithm=algorithm)
+
     async def _get_embedding(self, text: str) -> list[float]:
         """Backward compatibility: Delegate to vector search service."""
         return await self.vector_search_service.get_embedding(text)
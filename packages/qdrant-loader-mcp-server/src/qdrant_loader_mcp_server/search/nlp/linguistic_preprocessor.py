@@ -133,7 +133,7 @@ class LinguisticPreprocessor:
             processing_steps.append("initial_cleaning")
 
             # Step 2: Process with spaCy
-            doc = self.spacy_analyzer.nlp(cleaned_query)
+            doc = self.spacy_analyzer.parse(cleaned_query)
             processing_steps.append("spacy_processing")
 
             # Step 3: Extract and process tokens
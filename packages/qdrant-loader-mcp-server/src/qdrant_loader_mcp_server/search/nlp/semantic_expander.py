@@ -296,7 +296,7 @@ class EntityQueryExpander:
         """Extract meaningful words from concept text."""
         # Use spaCy to process and extract meaningful terms
         try:
-            doc = self.spacy_analyzer.nlp(concept_text)
+            doc = self.spacy_analyzer.parse(concept_text)
             return [
                 token.lemma_.lower()
                 for token in doc
@@ -1,5 +1,10 @@
 """spaCy-powered query analysis for intelligent search."""
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,6 +16,29 @@ from ...utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Docs parsed during the current request, keyed by (model, text)
+_request_docs: ContextVar[dict[tuple[str, str], Doc] | None] = ContextVar(
+    "spacy_request_docs", default=None
+)
+
+
+@contextmanager
+def doc_cache_scope() -> Iterator[None]:
+    """Parse each text at most once until the scope exits.
+
+    Docs parsed inside the scope are kept even when the cross-request cache
+    of the analyzer is disabled or evicts them. Nested scopes share the
+    outermost one.
+    """
+    if _request_docs.get() is not None:
+        yield
+        return
+    token = _request_docs.set({})
+    try:
+        yield
+    finally:
+        _request_docs.reset(token)
+
 
 @dataclass
 class QueryAnalysis:
@@ -40,14 +68,19 @@ class QueryAnalysis:
 class SpaCyQueryAnalyzer:
     """Enhanced query analysis using spaCy NLP with en_core_web_md model."""
 
-    def __init__(self, spacy_model: str = "en_core_web_md"):
+    def __init__(self, spacy_model: str = "en_core_web_md", doc_cache_size: int = 512):
         """Initialize the spaCy query analyzer.
 
         Args:
             spacy_model: spaCy model to use (default: en_core_web_md with 20k word vectors)
+            doc_cache_size: Parsed Docs kept across requests (0 keeps them only
+                within a ``doc_cache_scope``)
         """
         self.spacy_model = spacy_model
-        self.nlp = self._load_spacy_model()
+        self.doc_cache_size = max(0, doc_cache_size)
+        # The model loads on first use, keeping server startup fast
+        self._nlp: spacy.Language | None = None
+        self._nlp_lock = threading.Lock()
         self.logger = LoggingConfig.get_logger(__name__)
 
         # Intent pattern definitions using POS tags and linguistic features
@@ -117,6 +150,31 @@ class SpaCyQueryAnalyzer:
         self._analysis_cache: dict[str, QueryAnalysis] = {}
         self._similarity_cache: dict[tuple[str, str], float] = {}
 
+        # Parsed Docs shared by every component using this analyzer
+        self._doc_cache: OrderedDict[str, Doc] = OrderedDict()
+        # Analysis worker threads share the cache
+        self._doc_cache_lock = threading.Lock()
+        self._doc_cache_hits = 0
+        self._doc_cache_misses = 0
+
+    @property
+    def nlp(self) -> spacy.Language:
+        """spaCy pipeline, loaded on first access."""
+        if self._nlp is None:
+            with self._nlp_lock:
+                if self._nlp is None:
+                    self._nlp = self._load_spacy_model()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp: spacy.Language) -> None:
+        self._nlp = nlp
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the spaCy model has been loaded."""
+        return self._nlp is not None
+
     def _load_spacy_model(self) -> spacy.Language:
         """Load spaCy model with error handling and auto-download."""
         try:
@@ -153,6 +211,80 @@ class SpaCyQueryAnalyzer:
                         f"Could not load any spaCy model. Please install {self.spacy_model} manually."
                     )
 
+    def parse(self, text: str) -> Doc:
+        """Parse text with spaCy, reusing a Doc already parsed for the same text.
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            Parsed spaCy Doc
+        """
+        doc = self._get_cached_doc(text)
+        if doc is None:
+            self._doc_cache_misses += 1
+            doc = self.nlp(text)
+            self._cache_doc(text, doc)
+        return doc
+
+    def parse_batch(self, texts: Sequence[str], batch_size: int = 64) -> list[Doc]:
+        """Parse several texts, running ``nlp.pipe`` once over the uncached ones.
+
+        Args:
+            texts: Texts to parse, duplicates are parsed once
+            batch_size: Number of texts spaCy processes per batch
+
+        Returns:
+            Parsed spaCy Docs in the order of ``texts``
+        """
+        docs: dict[str, Doc] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            doc = self._get_cached_doc(text)
+            if doc is None:
+                missing.append(text)
+            else:
+                docs[text] = doc
+
+        if missing:
+            self._doc_cache_misses += len(missing)
+            parsed = self.nlp.pipe(missing, batch_size=batch_size)
+            for text, doc in zip(missing, parsed, strict=True):
+                self._cache_doc(text, doc)
+                docs[text] = doc
+
+        return [docs[text] for text in texts]
+
+    def _get_cached_doc(self, text: str) -> Doc | None:
+        """Get a parsed Doc from the request scope or the shared cache."""
+        request_docs = _request_docs.get()
+        key = (self.spacy_model, text)
+        if request_docs is not None and key in request_docs:
+            self._doc_cache_hits += 1
+            return request_docs[key]
+
+        with self._doc_cache_lock:
+            doc = self._doc_cache.get(text)
+            if doc is None:
+                return None
+            self._doc_cache.move_to_end(text)
+        if request_docs is not None:
+            request_docs[key] = doc
+        self._doc_cache_hits += 1
+        return doc
+
+    def _cache_doc(self, text: str, doc: Doc) -> None:
+        """Remember a parsed Doc for the request and, if enabled, across requests."""
+        request_docs = _request_docs.get()
+        if request_docs is not None:
+            request_docs[(self.spacy_model, text)] = doc
+        if self.doc_cache_size:
+            with self._doc_cache_lock:
+                self._doc_cache[text] = doc
+                self._doc_cache.move_to_end(text)
+                while len(self._doc_cache) > self.doc_cache_size:
+                    self._doc_cache.popitem(last=False)
+
     def analyze_query_semantic(self, query: str) -> QueryAnalysis:
         """Enhanced query analysis using spaCy NLP.
 
@@ -173,7 +305,7 @@ class SpaCyQueryAnalyzer:
             return cached
 
         # Process query with spaCy
-        doc = self.nlp(query)
+        doc = self.parse(query)
 
         # Extract entities with confidence
         entities = [(ent.text, ent.label_) for ent in doc.ents]
@@ -261,7 +393,7 @@ class SpaCyQueryAnalyzer:
 
         try:
             # Process entity text
-            entity_doc = self.nlp(entity_text)
+            entity_doc = self.parse(entity_text)
 
             # Calculate similarity using spaCy vectors
             if query_analysis.query_vector.has_vector and entity_doc.has_vector:
@@ -533,9 +665,10 @@ class SpaCyQueryAnalyzer:
         return len(intersection) / len(union) if union else 0.0
 
     def clear_cache(self):
-        """Clear analysis and similarity caches."""
+        """Clear analysis, similarity and parsed Doc caches."""
         self._analysis_cache.clear()
         self._similarity_cache.clear()
+        self._doc_cache.clear()
         logger.debug("Cleared spaCy analyzer caches")
 
     def get_cache_stats(self) -> dict[str, int]:
@@ -543,4 +676,7 @@ class SpaCyQueryAnalyzer:
         return {
             "analysis_cache_size": len(self._analysis_cache),
             "similarity_cache_size": len(self._similarity_cache),
+            "doc_cache_size": len(self._doc_cache),
+            "doc_cache_hits": self._doc_cache_hits,
+            "doc_cache_misses": self._doc_cache_misses,
         }
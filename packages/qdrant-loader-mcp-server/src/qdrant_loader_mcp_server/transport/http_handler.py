@@ -17,6 +17,12 @@ logger = LoggingConfig.get_logger(__name__)
 class HTTPTransportHandler:
     """HTTP Transport Handler for MCP Protocol with SSE streaming support."""
 
+    # Responses with more text content than this are streamed over SSE to
+    # clients accepting text/event-stream
+    SSE_STREAM_THRESHOLD = 32_768
+    # Characters buffered before a data line of a streamed response is sent
+    SSE_CHUNK_SIZE = 4096
+
     def __init__(self, mcp_handler, host: str = "127.0.0.1", port: int = 8080):
         """Initialize HTTP transport handler.
 
@@ -111,14 +117,17 @@ class HTTPTransportHandler:
             """Health check endpoint."""
             return {"status": "healthy", "transport": "http", "protocol": "mcp"}
 
-    async def _handle_post_request(self, request: Request) -> dict[str, Any]:
+    async def _handle_post_request(
+        self, request: Request
+    ) -> dict[str, Any] | StreamingResponse:
         """Process MCP messages from HTTP POST requests.
 
         Args:
             request: FastAPI request object
 
         Returns:
-            MCP response dictionary
+            MCP response dictionary, or an SSE stream of it for large
+            responses to clients accepting text/event-stream
         """
         try:
             # Security: Validate Origin header (DNS rebinding protection)
@@ -147,7 +156,7 @@ class HTTPTransportHandler:
 
             # Add headers context to request processing
             response = await self.mcp_handler.handle_request(
-                mcp_request, headers=dict(request.headers)
+                mcp_request, headers=dict(request.headers), session_id=session_id
             )
 
             # Store response for SSE streaming if needed
@@ -157,6 +166,10 @@ class HTTPTransportHandler:
             # Store any server-initiated messages for this session
             # (for future elicitation support)
 
+            if self._should_stream(request, response):
+                logger.debug("Successfully processed MCP request, streaming response")
+                return self._stream_response(response)
+
             logger.debug("Successfully processed MCP request, returning response")
             return response
 
@@ -225,6 +238,74 @@ class HTTPTransportHandler:
             },
         )
 
+    def _should_stream(self, request: Request, response: Any) -> bool:
+        """Whether to stream a response over SSE instead of returning JSON.
+
+        Args:
+            request: FastAPI request object
+            response: MCP response dictionary
+
+        Returns:
+            True if the client accepts SSE and the response text is large
+        """
+        accept = request.headers.get("accept") or ""
+        if "text/event-stream" not in accept or not isinstance(response, dict):
+            return False
+
+        result = response.get("result")
+        content = result.get("content") if isinstance(result, dict) else None
+        if not isinstance(content, list):
+            return False
+
+        text_size = sum(
+            len(item.get("text", ""))
+            for item in content
+            if isinstance(item, dict) and isinstance(item.get("text"), str)
+        )
+        return text_size >= self.SSE_STREAM_THRESHOLD
+
+    def _stream_response(self, response: dict[str, Any]) -> StreamingResponse:
+        """Stream a JSON-RPC response as a single SSE message event.
+
+        The response is encoded incrementally, and a data line is sent once at
+        least SSE_CHUNK_SIZE characters are buffered. Lines break only between
+        JSON tokens, since a line break inside a string would make the
+        client's newline-joined data invalid JSON, so a long string value is
+        sent in one line.
+
+        Args:
+            response: MCP response dictionary
+
+        Returns:
+            StreamingResponse with one SSE event
+        """
+
+        async def event_stream():
+            """Generate the data lines of the response event."""
+            yield "event: message\n"
+            buffer: list[str] = []
+            buffered = 0
+            for chunk in json.JSONEncoder().iterencode(response):
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= self.SSE_CHUNK_SIZE:
+                    yield f"data: {''.join(buffer)}\n"
+                    buffer, buffered = [], 0
+                    # Let other requests run between chunks
+                    await asyncio.sleep(0)
+            if buffer:
+                yield f"data: {''.join(buffer)}\n"
+            yield "\n"
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Disable nginx buffering
+            },
+        )
+
     def get_inflight_request_counts(self) -> dict[str, int]:
         """Return current in-flight request counters.
 
@@ -431,6 +431,7 @@ async def test_cluster_documents_mcp_integration(integration_handler):
             limit=15,
             source_types=None,
             project_ids=None,
+            incremental=False,
         )
 
 
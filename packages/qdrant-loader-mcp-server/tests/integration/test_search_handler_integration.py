@@ -26,6 +26,7 @@ def integration_search_handler(real_protocol):
     """Create a SearchHandler with real protocol but mocked engine/processor."""
     mock_search_engine = Mock()
     mock_search_engine.search = AsyncMock()
+    mock_search_engine.get_document = AsyncMock()
 
     mock_query_processor = Mock()
     mock_query_processor.process_query = AsyncMock()
@@ -434,6 +435,98 @@ class TestAttachmentSearchIntegration:
             assert mock_extract.called
 
 
+class TestPaginationIntegration:
+    """Integration tests for cursor-based pagination of search results."""
+
+    @pytest.mark.asyncio
+    async def test_search_pages_through_cached_results(
+        self, integration_search_handler, realistic_search_results
+    ):
+        """Test that later pages are served from the cached result set."""
+        integration_search_handler.query_processor.process_query.return_value = {
+            "query": "API authentication"
+        }
+        integration_search_handler.search_engine.search.return_value = (
+            realistic_search_results
+        )
+
+        first = await integration_search_handler.handle_search(
+            "page-1", {"query": "API authentication", "limit": 10, "page_size": 3}
+        )
+        first_page = first["result"]["structuredContent"]
+        assert len(first_page["results"]) == 3
+        assert first_page["total_found"] == 4
+        assert "next_cursor" in first_page
+
+        second = await integration_search_handler.handle_search(
+            "page-2", {"query": "ignored", "cursor": first_page["next_cursor"]}
+        )
+        second_page = second["result"]["structuredContent"]
+        assert len(second_page["results"]) == 1
+        assert second_page["total_found"] == 4
+        assert "next_cursor" not in second_page
+        assert second_page["query_context"]["original_query"] == "API authentication"
+
+        # Retrieval ran only for the first page
+        integration_search_handler.search_engine.search.assert_awaited_once()
+        integration_search_handler.query_processor.process_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_search_without_page_size_is_not_cached(
+        self, integration_search_handler, realistic_search_results
+    ):
+        """Test that unpaged searches return everything and cache nothing."""
+        integration_search_handler.query_processor.process_query.return_value = {
+            "query": "API"
+        }
+        integration_search_handler.search_engine.search.return_value = (
+            realistic_search_results
+        )
+
+        result = await integration_search_handler.handle_search(
+            "unpaged", {"query": "API"}
+        )
+
+        structured = result["result"]["structuredContent"]
+        assert structured["total_found"] == 4
+        assert "next_cursor" not in structured
+        assert len(integration_search_handler.result_cache._sets) == 0
+
+    @pytest.mark.asyncio
+    async def test_search_with_unknown_cursor(self, integration_search_handler):
+        """Test that an unknown cursor is rejected without searching."""
+        result = await integration_search_handler.handle_search(
+            "bad-cursor", {"query": "API", "cursor": "expired:10"}
+        )
+
+        assert result["error"]["code"] == -32602
+        assert "expired:10" in result["error"]["data"]
+        integration_search_handler.search_engine.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_bound_to_its_tool(
+        self, integration_search_handler, realistic_search_results
+    ):
+        """Test that a search cursor cannot resume an attachment search."""
+        integration_search_handler.query_processor.process_query.return_value = {
+            "query": "API"
+        }
+        integration_search_handler.search_engine.search.return_value = (
+            realistic_search_results
+        )
+
+        first = await integration_search_handler.handle_search(
+            "page-1", {"query": "API", "page_size": 2}
+        )
+        cursor = first["result"]["structuredContent"]["next_cursor"]
+
+        result = await integration_search_handler.handle_attachment_search(
+            "page-2", {"query": "API", "cursor": cursor}
+        )
+
+        assert result["error"]["code"] == -32602
+
+
 class TestExpandDocumentIntegration:
     """Integration tests for document expansion functionality."""
 
@@ -444,8 +537,9 @@ class TestExpandDocumentIntegration:
         """Test document expansion with exact document ID match."""
         target_document = realistic_search_results[0]
 
-        # Setup search to return exact match first
-        integration_search_handler.search_engine.search.return_value = [target_document]
+        integration_search_handler.search_engine.get_document.return_value = (
+            target_document
+        )
 
         params = {"document_id": "confluence-doc-123"}
 
@@ -468,15 +562,14 @@ class TestExpandDocumentIntegration:
         )
 
     @pytest.mark.asyncio
-    async def test_expand_document_integration_fallback_search(
+    async def test_expand_document_integration_skips_search(
         self, integration_search_handler, realistic_search_results
     ):
-        """Test document expansion with fallback to general search."""
+        """Test that document expansion is a direct lookup, not a search."""
         target_document = realistic_search_results[1]
-
-        # Setup field search to fail, general search to succeed
-        search_results = [[], [target_document]]
-        integration_search_handler.search_engine.search.side_effect = search_results
+        integration_search_handler.search_engine.get_document.return_value = (
+            target_document
+        )
 
         params = {"document_id": "confluence-doc-456"}
 
@@ -484,8 +577,10 @@ class TestExpandDocumentIntegration:
             "expand-456", params
         )
 
-        # Verify fallback search was used
-        assert integration_search_handler.search_engine.search.call_count == 2
+        integration_search_handler.search_engine.get_document.assert_awaited_once_with(
+            "confluence-doc-456"
+        )
+        integration_search_handler.search_engine.search.assert_not_called()
         assert result["result"]["isError"] is False
 
     @pytest.mark.asyncio
@@ -493,7 +588,7 @@ class TestExpandDocumentIntegration:
         self, integration_search_handler
     ):
         """Test document expansion when document is not found."""
-        integration_search_handler.search_engine.search.side_effect = [[], []]
+        integration_search_handler.search_engine.get_document.return_value = None
 
         params = {"document_id": "nonexistent-doc"}
 
@@ -617,6 +712,9 @@ class TestRealWorldScenarios:
         assert result1["result"]["isError"] is False
 
         # Expand specific document for details
+        integration_search_handler.search_engine.get_document.return_value = (
+            realistic_search_results[1]
+        )
         params2 = {"document_id": "confluence-doc-456"}  # Authentication Methods doc
 
         result2 = await integration_search_handler.handle_expand_document(
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+MCP Server Startup Benchmark
+
+Starts the MCP server over stdio and measures how long a client waits, from
+process start, for the first tools/list response and the first search
+response. Run it against a real Qdrant collection, with the same environment
+variables the server uses (QDRANT_URL, OPENAI_API_KEY, ...).
+
+Compare runs with SEARCH_WARMUP_ENABLED and SEARCH_ENABLE_INTELLIGENCE_TOOLS
+set to true and false to see what lazy loading and warm-up buy.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def send(process: subprocess.Popen, request: dict) -> dict:
+    """Send a JSON-RPC request and wait for its response."""
+    process.stdin.write(json.dumps(request) + "\n")
+    process.stdin.flush()
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before responding")
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if response.get("id") == request["id"]:
+            return response
+
+
+def run_once(command: list[str], query: str, env: dict[str, str]) -> dict[str, float]:
+    """Start the server once and time the first requests."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env=env,
+    )
+    try:
+        send(
+            process,
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"protocolVersion": "2025-06-18", "capabilities": {}},
+            },
+        )
+        tools = send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools_list_s = time.perf_counter() - started
+
+        send(
+            process,
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {
+                    "name": "search",
+                    "arguments": {"query": query, "limit": 5},
+                },
+            },
+        )
+        search_s = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    return {
+        "tools_list_s": tools_list_s,
+        "search_s": search_s,
+        "tool_count": len(tools.get("result", {}).get("tools", [])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP server startup")
+    parser.add_argument(
+        "--command",
+        default="qdrant-loader-mcp-server",
+        help="Command starting the server (default: qdrant-loader-mcp-server)",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Number of cold starts")
+    parser.add_argument(
+        "--query", default="how to configure authentication", help="Search query"
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ, MCP_DISABLE_CONSOLE_LOGGING="true")
+    command = args.command.split()
+
+    results = []
+    for run in range(1, args.runs + 1):
+        result = run_once(command, args.query, env)
+        results.append(result)
+        print(
+            f"run {run}: tools/list {result['tools_list_s']:.2f}s, "
+            f"first search {result['search_s']:.2f}s, "
+            f"{result['tool_count']} tools"
+        )
+
+    if not results:
+        sys.exit(1)
+    print(
+        f"median: tools/list "
+        f"{statistics.median(r['tools_list_s'] for r in results):.2f}s, "
+        f"first search {statistics.median(r['search_s'] for r in results):.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
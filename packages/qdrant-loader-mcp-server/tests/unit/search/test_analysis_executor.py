@@ -0,0 +1,164 @@
+"""Tests for the analysis executor."""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from qdrant_loader_mcp_server.search.components.analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+    raise_if_cancelled,
+)
+
+request_value: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "request_value", default="unset"
+)
+
+
+@pytest.fixture
+def executor():
+    executor = AnalysisExecutor(max_workers=4, tool_concurrency=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_executes_in_worker_thread(executor):
+    """Test that work runs off the event loop with the caller's context."""
+    request_value.set("request-1")
+
+    def work(a, b=0):
+        return threading.current_thread().name, request_value.get(), a + b
+
+    thread_name, value, total = await executor.run("tool", work, 1, b=2)
+
+    assert thread_name.startswith("mcp-analysis")
+    assert value == "request-1"
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_errors(executor):
+    """Test that errors of the work reach the caller and are counted."""
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run("tool", fail)
+
+    assert executor.get_stats()["tools"]["tool"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_limits_concurrency_per_tool(executor):
+    """Test that each tool runs at most its limit of calls at once."""
+    lock = threading.Lock()
+    running = {"slow": 0, "other": 0}
+    peak = {"slow": 0, "other": 0}
+
+    def work(tool):
+        with lock:
+            running[tool] += 1
+            peak[tool] = max(peak[tool], running[tool])
+        time.sleep(0.05)
+        with lock:
+            running[tool] -= 1
+
+    await asyncio.gather(
+        *(executor.run("slow", work, "slow") for _ in range(5)),
+        executor.run("other", work, "other"),
+    )
+
+    assert peak["slow"] == 2
+    stats = executor.get_stats()["tools"]
+    assert stats["slow"]["calls"] == 5
+    # Calls beyond the limit waited for a slot
+    assert stats["slow"]["max_wait_ms"] >= 40
+    assert stats["slow"]["avg_run_ms"] >= 40
+    assert stats["other"]["max_wait_ms"] < 40
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_running_work(executor):
+    """Test that cancelling the caller stops the work at its next check."""
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def work():
+        started.set()
+        try:
+            while True:
+                raise_if_cancelled()
+                time.sleep(0.01)
+        except AnalysisCancelledError:
+            stopped.set()
+            raise
+
+    task = asyncio.create_task(executor.run("tool", work))
+    await asyncio.to_thread(started.wait, 1)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await asyncio.to_thread(stopped.wait, 1)
+    assert executor.get_stats()["tools"]["tool"]["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_work():
+    """Test that calls running longer than the timeout are stopped."""
+    executor = AnalysisExecutor(timeout_s=0.05)
+    stopped = threading.Event()
+
+    def work():
+        try:
+            while True:
+                raise_if_cancelled()
+                time.sleep(0.01)
+        except AnalysisCancelledError:
+            stopped.set()
+
+    try:
+        with pytest.raises(TimeoutError):
+            await executor.run("tool", work)
+        assert await asyncio.to_thread(stopped.wait, 1)
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_work_keeps_its_slot():
+    """Test that a slot is only freed when the worker thread is done."""
+    executor = AnalysisExecutor(tool_concurrency=1, timeout_s=0.05)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        # Ignores cancellation, like a loop without raise_if_cancelled checks
+        time.sleep(0.2)
+        with lock:
+            running -= 1
+
+    try:
+        with pytest.raises(TimeoutError):
+            await executor.run("tool", work)
+        with pytest.raises(TimeoutError):
+            await executor.run("tool", work)
+        await asyncio.sleep(0.3)
+    finally:
+        executor.shutdown()
+
+    assert peak == 1
+
+
+def test_raise_if_cancelled_outside_of_analysis():
+    """Test that the cancellation check is a no-op outside of the executor."""
+    raise_if_cancelled()
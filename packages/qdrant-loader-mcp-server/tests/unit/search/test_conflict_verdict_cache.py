@@ -0,0 +1,48 @@
+"""Tests for the persistent LLM conflict verdict cache."""
+
+from qdrant_loader_mcp_server.search.enhanced.conflict_verdict_cache import (
+    ConflictVerdictCache,
+    document_hash,
+)
+
+VERDICT = {
+    "type": "version_conflict",
+    "confidence": 0.9,
+    "structured_indicators": [
+        {"type": "version_conflict", "doc1_snippet": "v1", "doc2_snippet": "v2"}
+    ],
+}
+
+
+def test_verdicts_persist_across_instances(tmp_path):
+    path = tmp_path / "verdicts.sqlite3"
+    ConflictVerdictCache(path).put("a", "b", "gpt-4o-mini", VERDICT)
+
+    cache = ConflictVerdictCache(path)
+    assert cache.get("a", "b", "gpt-4o-mini") == (True, VERDICT)
+    assert cache.get("a", "c", "gpt-4o-mini") == (False, None)
+    assert cache.get("a", "b", "gpt-4o") == (False, None)
+
+
+def test_reversed_pair_swaps_snippets(tmp_path):
+    cache = ConflictVerdictCache(tmp_path / "verdicts.sqlite3")
+    cache.put("a", "b", "gpt-4o-mini", VERDICT)
+
+    found, verdict = cache.get("b", "a", "gpt-4o-mini")
+
+    assert found
+    assert verdict["structured_indicators"][0]["doc1_snippet"] == "v2"
+    assert verdict["structured_indicators"][0]["doc2_snippet"] == "v1"
+
+
+def test_no_conflict_verdicts_are_cached(tmp_path):
+    cache = ConflictVerdictCache(tmp_path / "verdicts.sqlite3")
+    cache.put("a", "b", "gpt-4o-mini", None)
+
+    assert cache.get("b", "a", "gpt-4o-mini") == (True, None)
+
+
+def test_document_hash_covers_title_and_text():
+    assert document_hash("Title", "Text") == document_hash("Title", "Text")
+    assert document_hash("Title", "Text") != document_hash("Other", "Text")
+    assert document_hash("Title", "Text") != document_hash("Title", "Other")
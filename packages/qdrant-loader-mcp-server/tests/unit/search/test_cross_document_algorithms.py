@@ -627,6 +627,7 @@ class TestConflictDetectorAlgorithms:
         mock_doc.similarity.return_value = 0.6
         mock_doc.ents = []
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -810,6 +811,7 @@ class TestCrossDocumentIntelligenceEnginePerformance:
         mock_doc = Mock()
         mock_doc.similarity.return_value = 0.6
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -25,6 +25,7 @@ class TestDocumentSimilarityCalculatorEdgeCases:
         mock_doc = Mock()
         mock_doc.similarity.return_value = 0.5
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -568,6 +569,7 @@ class TestConflictDetectorEdgeCases:
         mock_doc.similarity.return_value = 0.5
         mock_doc.ents = []
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -1,8 +1,11 @@
 """Unit tests for cross-document intelligence helper methods and private functions."""
 
+import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 from qdrant_loader_mcp_server.search.components.search_result_models import (
     create_hybrid_search_result,
@@ -26,6 +29,7 @@ class TestDocumentSimilarityCalculatorHelpers:
         mock_doc = Mock()
         mock_doc.similarity.return_value = 0.75
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -381,6 +385,7 @@ class TestConflictDetectorHelpers:
         mock_doc.similarity.return_value = 0.6
         mock_doc.ents = []
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -508,6 +513,7 @@ class TestConflictDetectorHelpers:
         """Test getting document embeddings with Qdrant client."""
         mock_client = AsyncMock()
         mock_point = Mock()
+        mock_point.id = "doc1"
         mock_point.vector = [0.1, 0.2, 0.3]
         mock_client.retrieve.return_value = [mock_point]
         conflict_detector.qdrant_client = mock_client
@@ -517,6 +523,240 @@ class TestConflictDetectorHelpers:
         assert "doc1" in embeddings
         assert embeddings["doc1"] == [0.1, 0.2, 0.3]
 
+    @pytest.mark.asyncio
+    async def test_get_document_embeddings_single_request(self, conflict_detector):
+        """Test that all embeddings are retrieved in one request."""
+        mock_client = AsyncMock()
+        points = []
+        for doc_id, vector in [("doc2", [0.0, 1.0]), ("doc1", [1.0, 0.0])]:
+            point = Mock()
+            point.id = doc_id
+            point.vector = vector
+            points.append(point)
+        mock_client.retrieve.return_value = points
+        conflict_detector.qdrant_client = mock_client
+
+        embeddings = await conflict_detector._get_document_embeddings(
+            ["doc1", "doc2", "doc1", "doc3"]
+        )
+
+        assert embeddings == {"doc1": [1.0, 0.0], "doc2": [0.0, 1.0]}
+        mock_client.retrieve.assert_called_once()
+        assert mock_client.retrieve.call_args.kwargs["ids"] == ["doc1", "doc2", "doc3"]
+
+    @pytest.mark.asyncio
+    async def test_filter_by_vector_similarity_matches_pairwise(
+        self, conflict_detector
+    ):
+        """Test that matrix pair scoring agrees with pairwise cosine similarity."""
+        rng = np.random.default_rng(7)
+        base = rng.normal(size=16)
+        embeddings = {
+            f"doc{i}": (base + rng.normal(scale=0.8, size=16)).tolist()
+            for i in range(12)
+        }
+        docs = [
+            create_hybrid_search_result(
+                score=0.5,
+                text=f"Document {i}",
+                source_type="confluence",
+                source_title=f"Doc {i}",
+                document_id=f"doc{i}",
+            )
+            for i in range(12)
+        ]
+        # Documents without an embedding are skipped
+        docs.append(
+            create_hybrid_search_result(
+                score=0.5, text="No vector", source_type="git", source_title="None"
+            )
+        )
+        conflict_detector.qdrant_client = AsyncMock()
+
+        pairs = await conflict_detector._filter_by_vector_similarity(docs, embeddings)
+
+        expected = []
+        for i, doc1 in enumerate(docs[:12]):
+            for doc2 in docs[i + 1 : 12]:
+                similarity = conflict_detector._calculate_vector_similarity(
+                    embeddings[doc1.document_id], embeddings[doc2.document_id]
+                )
+                if 0.6 <= similarity <= 0.95:
+                    expected.append((doc1, doc2, similarity))
+        expected.sort(key=lambda pair: pair[2], reverse=True)
+
+        assert expected
+        assert [(d1.document_id, d2.document_id) for d1, d2, _ in pairs] == [
+            (d1.document_id, d2.document_id) for d1, d2, _ in expected[:10]
+        ]
+        for (_, _, actual), (_, _, wanted) in zip(pairs, expected, strict=False):
+            assert actual == pytest.approx(wanted)
+        conflict_detector.qdrant_client.retrieve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_retrieves_embeddings_once(self, conflict_detector):
+        """Test that pair selection steps share one embedding retrieval."""
+        mock_client = AsyncMock()
+        mock_client.retrieve.return_value = []
+        conflict_detector.qdrant_client = mock_client
+        docs = [
+            create_hybrid_search_result(
+                score=0.5,
+                text=f"Use version {i}.0 of the client",
+                source_type="confluence",
+                source_title=f"Doc {i}",
+                document_id=f"doc{i}",
+            )
+            for i in range(3)
+        ]
+
+        await conflict_detector.detect_conflicts(docs)
+
+        mock_client.retrieve.assert_called_once()
+
+    def _llm_pairs(self, count):
+        docs = [
+            create_hybrid_search_result(
+                score=0.5,
+                text=f"Set the timeout to {i} seconds",
+                source_type="confluence",
+                source_title=f"Doc {i}",
+                document_id=f"doc{i}",
+            )
+            for i in range(count + 1)
+        ]
+        return docs, [(docs[i], docs[i + 1], "primary", 1.0) for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_runs_llm_checks_concurrently(
+        self, conflict_detector
+    ):
+        """Test that LLM pair checks share the deadline instead of queuing."""
+        docs, pairs = self._llm_pairs(4)
+        conflict_detector.llm_enabled = True
+        conflict_detector._settings = {
+            "conflict_max_llm_pairs": 4,
+            "conflict_llm_max_concurrency": 4,
+            "conflict_overall_timeout_s": 5.0,
+        }
+        conflict_detector._get_tiered_analysis_pairs = AsyncMock(return_value=pairs)
+
+        async def slow_verdict(doc1, doc2, similarity):
+            await asyncio.sleep(0.2)
+            return {"type": "llm_conflict", "confidence": 0.9}
+
+        conflict_detector._llm_analyze_conflicts = slow_verdict
+
+        start = time.perf_counter()
+        analysis = await conflict_detector.detect_conflicts(docs)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert len(analysis.conflicting_pairs) == 4
+        assert conflict_detector._last_stats["llm_pairs"] == 4
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_cancels_llm_checks_at_deadline(
+        self, conflict_detector
+    ):
+        """Test that pending LLM checks are cancelled when the budget is spent."""
+        docs, pairs = self._llm_pairs(3)
+        conflict_detector.llm_enabled = True
+        conflict_detector._settings = {
+            "conflict_max_llm_pairs": 3,
+            "conflict_llm_max_concurrency": 1,
+            "conflict_overall_timeout_s": 0.1,
+        }
+        conflict_detector._get_tiered_analysis_pairs = AsyncMock(return_value=pairs)
+        cancelled = []
+
+        async def hanging_verdict(doc1, doc2, similarity):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(doc1.document_id)
+                raise
+
+        conflict_detector._llm_analyze_conflicts = hanging_verdict
+
+        start = time.perf_counter()
+        await conflict_detector.detect_conflicts(docs)
+
+        assert time.perf_counter() - start < 1.0
+        assert conflict_detector._last_stats["partial_results"] is True
+        # The running check timed out; the queued ones never reached the LLM
+        assert cancelled == ["doc0"]
+
+    @pytest.mark.asyncio
+    async def test_llm_verdicts_are_persisted(self, conflict_detector, tmp_path):
+        """Test that verdicts are reused from the persistent cache."""
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps(
+            {
+                "has_conflicts": True,
+                "conflicts": [{"type": "version_conflict", "confidence": 0.8}],
+            }
+        )
+        response.usage = Mock(prompt_tokens=120, completion_tokens=30)
+        settings = {"conflict_llm_cache_path": str(tmp_path / "verdicts.sqlite3")}
+        docs, _ = self._llm_pairs(1)
+
+        conflict_detector.openai_client = AsyncMock()
+        conflict_detector.openai_client.chat.completions.create.return_value = response
+        conflict_detector._settings = settings
+        first = await conflict_detector._llm_analyze_conflicts(docs[0], docs[1], 0.8)
+
+        assert conflict_detector._llm_usage["calls"] == 1
+        assert conflict_detector._llm_usage["prompt_tokens"] == 120
+        assert conflict_detector._llm_usage["completion_tokens"] == 30
+
+        # A new detector, as after a restart, answers from the cache
+        other = ConflictDetector(conflict_detector.spacy_analyzer)
+        other.openai_client = AsyncMock()
+        other._settings = settings
+        second = await other._llm_analyze_conflicts(docs[0], docs[1], 0.8)
+
+        assert second == first
+        other.openai_client.chat.completions.create.assert_not_called()
+        assert other._llm_usage["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_verdicts_are_cached_for_either_order(self, conflict_detector):
+        """Test that a pair checked in reverse order is answered from the cache."""
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps(
+            {
+                "has_conflicts": True,
+                "conflicts": [
+                    {
+                        "type": "version_conflict",
+                        "confidence": 0.8,
+                        "doc1_snippet": "timeout is 0 seconds",
+                        "doc2_snippet": "timeout is 1 seconds",
+                    }
+                ],
+            }
+        )
+        response.usage = Mock(prompt_tokens=120, completion_tokens=30)
+        docs, _ = self._llm_pairs(1)
+
+        conflict_detector.openai_client = AsyncMock()
+        conflict_detector.openai_client.chat.completions.create.return_value = response
+        conflict_detector._settings = {}
+        first = await conflict_detector._llm_analyze_conflicts(docs[0], docs[1], 0.8)
+        second = await conflict_detector._llm_analyze_conflicts(docs[1], docs[0], 0.8)
+
+        conflict_detector.openai_client.chat.completions.create.assert_awaited_once()
+        assert conflict_detector._llm_usage["cache_hits"] == 1
+        indicator = second["structured_indicators"][0]
+        assert indicator["doc1_snippet"] == "timeout is 1 seconds"
+        assert indicator["doc2_snippet"] == "timeout is 0 seconds"
+        assert first["structured_indicators"][0]["doc1_snippet"] == (
+            "timeout is 0 seconds"
+        )
+
     def test_calculate_vector_similarity(self, conflict_detector):
         """Test vector similarity calculation."""
         vec1 = [1.0, 0.0, 0.0]
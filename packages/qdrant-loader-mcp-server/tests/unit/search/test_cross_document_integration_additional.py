@@ -28,6 +28,7 @@ class TestCrossDocumentIntelligenceAdditionalCoverage:
         mock_doc.similarity.return_value = 0.7
         mock_doc.ents = []
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
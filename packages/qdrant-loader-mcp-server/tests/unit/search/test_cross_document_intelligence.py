@@ -12,6 +12,7 @@ from qdrant_loader_mcp_server.search.enhanced.cross_document_intelligence import
     DocumentClusterAnalyzer,
     DocumentSimilarityCalculator,
     RelationshipType,
+    SimilarityMetric,
 )
 
 from tests.fixtures.cross_document_test_data import (
@@ -35,6 +36,7 @@ class TestDocumentSimilarityCalculator:
         mock_doc = Mock()
         mock_doc.similarity.return_value = 0.8
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
 
         return analyzer
 
@@ -134,6 +136,71 @@ class TestDocumentSimilarityCalculator:
             RelationshipType.CROSS_REFERENCE,
         ]
 
+    def test_prepare_documents_parses_in_one_batch(self, similarity_calculator):
+        """Test that document texts are parsed together for semantic similarity."""
+        docs = create_minimal_test_dataset()
+        analyzer = similarity_calculator.spacy_analyzer
+
+        similarity_calculator.prepare_documents(docs)
+        analyzer.parse_batch.assert_not_called()
+
+        similarity_calculator.prepare_documents(
+            docs, [SimilarityMetric.SEMANTIC_SIMILARITY]
+        )
+        analyzer.parse_batch.assert_called_once_with([doc.text[:500] for doc in docs])
+
+    def test_calculate_similarity_batch_matches_pairwise_metrics(
+        self, similarity_calculator
+    ):
+        """Test that batch metrics agree with the pairwise calculations."""
+        docs = create_comprehensive_test_dataset()
+        target, others = docs[0], docs[1:]
+
+        similarities = similarity_calculator.calculate_similarity_batch(
+            target,
+            others,
+            [0.9] * len(others),
+            [
+                SimilarityMetric.ENTITY_OVERLAP,
+                SimilarityMetric.TOPIC_OVERLAP,
+                SimilarityMetric.METADATA_SIMILARITY,
+            ],
+        )
+
+        assert len(similarities) == len(others)
+        for doc, similarity in zip(others, similarities, strict=True):
+            scores = similarity.metric_scores
+            assert scores[SimilarityMetric.ENTITY_OVERLAP] == pytest.approx(
+                similarity_calculator._calculate_entity_overlap(target, doc)
+            )
+            assert scores[SimilarityMetric.TOPIC_OVERLAP] == pytest.approx(
+                similarity_calculator._calculate_topic_overlap(target, doc)
+            )
+            assert scores[SimilarityMetric.METADATA_SIMILARITY] == pytest.approx(
+                similarity_calculator._calculate_metadata_similarity(target, doc)
+            )
+            assert sorted(similarity.shared_entities) == sorted(
+                similarity_calculator._get_shared_entities(target, doc)
+            )
+        similarity_calculator.spacy_analyzer.nlp.assert_not_called()
+
+    def test_calculate_similarity_batch_uses_vector_scores(
+        self, similarity_calculator
+    ):
+        """Test that semantic similarity comes from the clipped vector scores."""
+        docs = create_comprehensive_test_dataset()
+        target, others = docs[0], docs[1:3]
+
+        similarities = similarity_calculator.calculate_similarity_batch(
+            target, others, [0.2, 1.5]
+        )
+
+        semantic = [
+            s.metric_scores[SimilarityMetric.SEMANTIC_SIMILARITY] for s in similarities
+        ]
+        assert semantic == [0.2, 1.0]
+        assert similarity_calculator.calculate_similarity_batch(target, [], []) == []
+
 
 class TestDocumentClusterAnalyzer:
     """Test the DocumentClusterAnalyzer component."""
@@ -416,6 +483,7 @@ class TestConflictDetector:
             return mock_doc
 
         analyzer.nlp.side_effect = mock_nlp_side_effect
+        analyzer.parse.side_effect = analyzer.nlp
         return analyzer
 
     @pytest.fixture
@@ -471,6 +539,7 @@ class TestCrossDocumentIntelligenceEngine:
         mock_doc.similarity.return_value = 0.8
         mock_doc.ents = [Mock(text="OAuth", label_="TECHNOLOGY")]
         analyzer.nlp.return_value = mock_doc
+        analyzer.parse.side_effect = analyzer.nlp
 
         return analyzer
 
@@ -1291,6 +1291,120 @@ async def test_find_similar_documents(hybrid_search):
     assert similar_docs[1]["document_id"] == "different_id"
 
 
+@pytest.mark.asyncio
+async def test_find_similar_documents_by_vector(hybrid_search, mock_qdrant_client):
+    """Test finding similar documents with the stored vectors of the target."""
+    from qdrant_loader_mcp_server.search.enhanced.cross_document_intelligence import (
+        SimilarityMetric,
+    )
+
+    target_doc = create_hybrid_search_result(
+        score=0.8,
+        text="Target doc",
+        source_type="git",
+        source_title="Target",
+        document_id="target_id",
+        project_id="proj",
+        entities=["OAuth", "JWT"],
+    )
+
+    target_chunks = [MagicMock(id="chunk-1"), MagicMock(id="chunk-2")]
+    mock_qdrant_client.scroll.return_value = (target_chunks, None)
+
+    def group(document_id, score, entities, project_id):
+        hit = MagicMock()
+        hit.score = score
+        hit.payload = {
+            "content": f"Content of {document_id}",
+            "metadata": {"entities": entities, "project_id": project_id},
+            "source_type": "git",
+            "title": document_id,
+            "document_id": document_id,
+        }
+        return MagicMock(hits=[hit])
+
+    mock_qdrant_client.recommend_groups.return_value = MagicMock(
+        groups=[
+            group("close_id", 0.82, [], "other"),
+            group("shared_id", 0.80, ["oauth", "jwt"], "proj"),
+            group("far_id", 0.30, ["jwt"], "proj"),
+        ]
+    )
+
+    similar_docs = await hybrid_search.find_similar_documents_by_vector(
+        target_document=target_doc,
+        max_similar=2,
+        project_ids=["proj", "other"],
+    )
+
+    # Chunks of the target are the examples, the target itself is excluded
+    kwargs = mock_qdrant_client.recommend_groups.call_args.kwargs
+    assert kwargs["positive"] == ["chunk-1", "chunk-2"]
+    assert kwargs["group_by"] == "document_id"
+    assert kwargs["query_filter"].must_not[0].match.value == "target_id"
+    assert kwargs["query_filter"].must[0].key == "project_id"
+
+    # Entity and metadata overlap lift the second hit above the closest vector
+    assert [doc["document_id"] for doc in similar_docs] == ["shared_id", "close_id"]
+    assert similar_docs[0]["document"].text == "Content of shared_id"
+    assert similar_docs[0]["metric_scores"][
+        SimilarityMetric.SEMANTIC_SIMILARITY
+    ] == pytest.approx(0.8)
+    assert similar_docs[0]["metric_scores"][SimilarityMetric.ENTITY_OVERLAP] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_find_similar_documents_by_vector_unknown_target(
+    hybrid_search, mock_qdrant_client
+):
+    """Test that a target without stored chunks has no similar documents."""
+    target_doc = create_hybrid_search_result(
+        score=0.8,
+        text="Target doc",
+        source_type="git",
+        source_title="Target",
+        document_id="missing_id",
+    )
+    mock_qdrant_client.scroll.return_value = ([], None)
+
+    assert await hybrid_search.find_similar_documents_by_vector(target_doc) == []
+    mock_qdrant_client.recommend_groups.assert_not_called()
+
+
+def test_rerank_with_knowledge_graph(hybrid_search):
+    """Test that results linked to the query in the knowledge graph move up."""
+    results = [
+        create_hybrid_search_result(
+            score=0.8,
+            text="Unrelated",
+            source_type="git",
+            source_title="Doc 1",
+            document_id="doc1",
+        ),
+        create_hybrid_search_result(
+            score=0.7,
+            text="About OAuth",
+            source_type="git",
+            source_title="Doc 2",
+            document_id="doc2",
+        ),
+    ]
+    hybrid_search.precomputed_graph = MagicMock()
+    hybrid_search.precomputed_graph.score_documents.return_value = {"doc2": 0.7}
+    query_context = {"entities": ["OAuth"], "main_concepts": [], "keywords": ["login"]}
+
+    reranked = hybrid_search._rerank_with_knowledge_graph(
+        results, query_context, weight=0.3, max_hops=2
+    )
+
+    hybrid_search.precomputed_graph.score_documents.assert_called_once_with(
+        ["OAuth", "login"], document_ids=["doc1", "doc2"], max_hops=2
+    )
+    assert [r.document_id for r in reranked] == ["doc2", "doc1"]
+    assert reranked[0].score == pytest.approx(0.91)
+    assert reranked[1].score == 0.8
+
+
 @pytest.mark.asyncio
 async def test_detect_document_conflicts(hybrid_search):
     """Test document conflict detection."""
@@ -1509,6 +1623,136 @@ async def test_cluster_documents(hybrid_search):
     )
 
 
+@pytest.mark.asyncio
+async def test_cluster_documents_semantic_embedding(hybrid_search, mock_qdrant_client):
+    """Test clustering documents on the stored vectors of their chunks."""
+    from qdrant_loader_mcp_server.search.enhanced.cross_document_intelligence import (
+        ClusteringStrategy,
+    )
+
+    documents = [
+        create_hybrid_search_result(
+            score=0.8,
+            text=f"Content {name}",
+            source_type="git",
+            source_title=name,
+            document_id=f"{name}_id",
+            entities=[entity],
+        )
+        for name, entity in [
+            ("auth1", "OAuth"),
+            ("auth2", "OAuth"),
+            ("db1", "PostgreSQL"),
+            ("db2", "PostgreSQL"),
+        ]
+    ]
+
+    def chunk(document_id, vector):
+        return MagicMock(vector=vector, payload={"document_id": document_id})
+
+    mock_qdrant_client.scroll.return_value = (
+        [
+            chunk("auth1_id", [1.0, 0.1, 0.0]),
+            chunk("auth1_id", [0.9, 0.0, 0.1]),
+            chunk("auth2_id", [1.0, 0.0, 0.0]),
+            chunk("db1_id", [0.0, 1.0, 0.1]),
+            chunk("db2_id", [0.1, 0.9, 0.0]),
+        ],
+        None,
+    )
+
+    result = await hybrid_search.cluster_documents(
+        documents=documents,
+        strategy=ClusteringStrategy.SEMANTIC_EMBEDDING,
+        max_clusters=4,
+        min_cluster_size=2,
+    )
+
+    scroll_kwargs = mock_qdrant_client.scroll.call_args.kwargs
+    assert scroll_kwargs["with_vectors"] is True
+    assert scroll_kwargs["scroll_filter"].must[0].match.any == [
+        "auth1_id",
+        "auth2_id",
+        "db1_id",
+        "db2_id",
+    ]
+
+    groups = sorted(
+        sorted(doc.source_title for doc in cluster["documents"])
+        for cluster in result["clusters"]
+    )
+    assert groups == [["auth1", "auth2"], ["db1", "db2"]]
+    assert all(cluster["coherence_score"] > 0.8 for cluster in result["clusters"])
+    assert result["clustering_metadata"]["strategy"] == "semantic_embedding"
+
+
+@pytest.mark.asyncio
+async def test_incremental_clustering_is_scoped(hybrid_search, mock_qdrant_client):
+    """Test that centroids are only reused for the same result set."""
+    from qdrant_loader_mcp_server.search.enhanced.cross_document_intelligence import (
+        ClusteringStrategy,
+    )
+
+    documents = [
+        create_hybrid_search_result(
+            score=0.8,
+            text=f"Content {name}",
+            source_type="git",
+            source_title=name,
+            document_id=f"{name}_id",
+        )
+        for name in ["auth1", "auth2"]
+    ]
+    mock_qdrant_client.scroll.return_value = (
+        [
+            MagicMock(vector=[1.0, 0.0], payload={"document_id": "auth1_id"}),
+            MagicMock(vector=[0.9, 0.1], payload={"document_id": "auth2_id"}),
+        ],
+        None,
+    )
+
+    for scope in ["first query", "second query", "first query"]:
+        await hybrid_search.cluster_documents(
+            documents=documents,
+            strategy=ClusteringStrategy.SEMANTIC_EMBEDDING,
+            incremental=True,
+            cache_scope=scope,
+        )
+
+    vector_engine = hybrid_search.cross_document_engine.cluster_analyzer.vector_engine
+    assert [key.rsplit(":", 1)[-1] for key in vector_engine._centroid_cache] == [
+        "second query",
+        "first query",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_document_vectors_are_capped_per_document(
+    hybrid_search, mock_qdrant_client
+):
+    """Test that a large document does not use up the reads of the others."""
+
+    def chunk(document_id, vector):
+        return MagicMock(vector=vector, payload={"document_id": document_id})
+
+    mock_qdrant_client.scroll.side_effect = [
+        (
+            [chunk("large_id", [1.0, 0.0]), chunk("large_id", [1.0, 0.0])],
+            "next_offset",
+        ),
+        ([chunk("small_id", [0.0, 1.0])], None),
+    ]
+
+    vectors = await hybrid_search.vector_search_service.get_document_vectors(
+        ["large_id", "small_id"], page_size=2, max_chunks_per_document=2
+    )
+
+    assert set(vectors) == {"large_id", "small_id"}
+    last_call = mock_qdrant_client.scroll.call_args_list[-1].kwargs
+    assert last_call["offset"] == "next_offset"
+    assert last_call["scroll_filter"].must[0].match.any == ["small_id"]
+
+
 def test_build_document_lookup(hybrid_search):
     """Test building document lookup with multiple strategies."""
     documents = [
@@ -2307,3 +2551,158 @@ def test_extract_metadata_info_comprehensive(hybrid_search):
     assert info["original_file_type"] == "docx"
     assert info["is_excel_sheet"] is False
     assert info["chunk_index"] == 1
+
+
+def test_components_are_built_on_first_use(hybrid_search):
+    """Test that the spaCy model and intelligence components load lazily."""
+    assert not hybrid_search.spacy_analyzer.is_loaded
+    assert "cross_document_engine" not in hybrid_search._components
+
+    engine = hybrid_search.cross_document_engine
+
+    assert engine is hybrid_search.cross_document_engine
+    assert engine.cluster_analyzer.vector_engine is not None
+    assert "faceted_search_engine" not in hybrid_search._components
+
+
+def test_warm_up_builds_components(hybrid_search):
+    """Test that warming up loads spaCy and builds every component."""
+    with patch.object(hybrid_search.spacy_analyzer, "_load_spacy_model") as load:
+        hybrid_search.warm_up()
+
+    load.assert_called_once()
+    assert set(hybrid_search._components) == {
+        "intent_classifier",
+        "adaptive_strategy",
+        "topic_chain_generator",
+        "faceted_search_engine",
+        "cross_document_engine",
+    }
+
+
+def test_warm_up_skips_disabled_intelligence_tools(
+    mock_qdrant_client, mock_openai_client
+):
+    """Test that components of disabled intelligence tools are never built."""
+    from qdrant_loader_mcp_server.config import SearchConfig
+
+    engine = HybridSearchEngine(
+        qdrant_client=mock_qdrant_client,
+        openai_client=mock_openai_client,
+        collection_name="test_collection",
+        search_config=SearchConfig(enable_intelligence_tools=False),
+    )
+
+    with patch.object(engine.spacy_analyzer, "_load_spacy_model"):
+        engine.warm_up()
+
+    assert set(engine._components) == {"intent_classifier", "adaptive_strategy"}
+
+
+@pytest.mark.asyncio
+async def test_document_store_fetches_chunks_by_document_id(
+    hybrid_search, mock_qdrant_client
+):
+    """Test that a document is fetched with a document_id filter, without search."""
+    point = MagicMock()
+    point.payload = {
+        "content": "Document content",
+        "metadata": {"title": "Doc", "chunk_index": 0},
+        "source_type": "confluence",
+        "title": "Doc",
+        "document_id": "doc-1",
+    }
+    mock_qdrant_client.scroll.return_value = ([point], None)
+    mock_qdrant_client.search.reset_mock()
+
+    results = await hybrid_search.document_store.get_chunks("doc-1", limit=1)
+
+    assert len(results) == 1
+    assert results[0].document_id == "doc-1"
+    assert results[0].text == "Document content"
+    call = mock_qdrant_client.scroll.call_args.kwargs
+    condition = call["scroll_filter"].must[0]
+    assert condition.key == "document_id"
+    assert condition.match.value == "doc-1"
+    assert call["limit"] == 1
+    assert call["with_vectors"] is False
+    mock_qdrant_client.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_document_store_reassembles_and_caches_documents(
+    hybrid_search, mock_qdrant_client
+):
+    """Test that chunks are joined in order and expanded documents are cached."""
+
+    def chunk(document_id, index, content):
+        point = MagicMock()
+        point.payload = {
+            "content": content,
+            "metadata": {"chunk_index": index},
+            "source_type": "confluence",
+            "title": document_id,
+            "document_id": document_id,
+        }
+        return point
+
+    mock_qdrant_client.scroll.return_value = (
+        [
+            chunk("doc-1", 1, "overlapping sentence here. Second part."),
+            chunk("doc-2", 0, "Other document."),
+            chunk("doc-1", 0, "First part, then an overlapping sentence here."),
+        ],
+        None,
+    )
+    mock_qdrant_client.scroll.reset_mock()
+
+    documents = await hybrid_search.document_store.get_documents(
+        ["doc-1", "doc-2", "missing"]
+    )
+
+    assert list(documents) == ["doc-1", "doc-2"]
+    assert documents["doc-1"].text == (
+        "First part, then an overlapping sentence here. Second part."
+    )
+    match = mock_qdrant_client.scroll.call_args.kwargs["scroll_filter"].must[0].match
+    assert match.any == ["doc-1", "doc-2", "missing"]
+
+    document = await hybrid_search.document_store.get_document("doc-1")
+
+    assert document is documents["doc-1"]
+    mock_qdrant_client.scroll.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_document_store_refetches_expired_documents(
+    hybrid_search, mock_qdrant_client
+):
+    """Test that cached documents are fetched again after the time-to-live."""
+    point = MagicMock()
+    point.payload = {
+        "content": "Old content",
+        "metadata": {"chunk_index": 0},
+        "source_type": "confluence",
+        "title": "Doc",
+        "document_id": "doc-1",
+    }
+    mock_qdrant_client.scroll.return_value = ([point], None)
+    mock_qdrant_client.scroll.reset_mock()
+    store = hybrid_search.document_store
+    store.cache_ttl = 300
+
+    with patch(
+        "qdrant_loader_mcp_server.search.components.document_store.time.time",
+        return_value=1000.0,
+    ):
+        assert (await store.get_document("doc-1")).text == "Old content"
+
+    # The document was re-ingested after the cached copy expired
+    point.payload = {**point.payload, "content": "New content"}
+    with patch(
+        "qdrant_loader_mcp_server.search.components.document_store.time.time",
+        return_value=1301.0,
+    ):
+        assert (await store.get_document("doc-1")).text == "New content"
+
+    assert mock_qdrant_client.scroll.await_count == 2
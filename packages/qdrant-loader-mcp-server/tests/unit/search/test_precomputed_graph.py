@@ -0,0 +1,85 @@
+"""Tests for the precomputed knowledge graph loaded at startup."""
+
+import numpy as np
+import pytest
+from qdrant_loader.core.knowledge_graph import KnowledgeGraphBuilder
+from qdrant_loader_mcp_server.search.enhanced.precomputed_graph import (
+    PrecomputedKnowledgeGraph,
+    load_knowledge_graph,
+)
+
+
+def _payload(document_id: str, entities: list[str]) -> dict:
+    return {
+        "document_id": document_id,
+        "title": document_id.title(),
+        "metadata": {"entities": [[entity, "ORG"] for entity in entities]},
+    }
+
+
+@pytest.fixture
+def graph_path(tmp_path):
+    """Graph archive written by the loader."""
+    builder = KnowledgeGraphBuilder(similar_documents=0)
+    for payload in [
+        _payload("auth", ["OAuth", "Keycloak"]),
+        _payload("sso", ["OAuth", "Keycloak"]),
+        _payload("tokens", ["OAuth", "JWT"]),
+        _payload("jwt-guide", ["JWT", "Redis"]),
+        _payload("cache", ["Redis", "Postgres"]),
+        _payload("db", ["Postgres", "Redis"]),
+    ]:
+        builder.add_payload(payload)
+    path = tmp_path / "kg.npz"
+    builder.build("docs").save(path)
+    return path
+
+
+def test_score_documents_from_query_seeds(graph_path):
+    graph = PrecomputedKnowledgeGraph.load(graph_path)
+
+    scores = graph.score_documents(["oauth"], max_hops=1)
+
+    # Documents mentioning the seed entity, nothing further away
+    assert set(scores) == {"auth", "sso", "tokens"}
+    assert scores["auth"] == pytest.approx(0.7)
+
+
+def test_score_documents_follows_several_hops(graph_path):
+    graph = PrecomputedKnowledgeGraph.load(graph_path)
+
+    scores = graph.score_documents(
+        ["Keycloak"], document_ids=["auth", "tokens", "db", "unknown"], max_hops=3
+    )
+
+    # auth mentions Keycloak; tokens shares OAuth with it; db is too far
+    assert scores["auth"] > scores["tokens"] > 0
+    assert "db" not in scores and "unknown" not in scores
+
+
+def test_score_documents_without_seeds(graph_path):
+    graph = PrecomputedKnowledgeGraph.load(graph_path)
+
+    assert graph.score_documents(["kubernetes"]) == {}
+
+
+def test_traverse_keeps_strongest_path(graph_path):
+    graph = PrecomputedKnowledgeGraph.load(graph_path)
+    seeds = graph.find_seed_nodes(["oauth"])
+
+    scores = graph.traverse(seeds, max_hops=2)
+
+    assert scores[seeds[0]] == 1.0
+    assert np.all(scores <= 1.0)
+
+
+def test_load_knowledge_graph_rejects_unusable_graphs(graph_path, tmp_path):
+    assert load_knowledge_graph(graph_path, "docs").node_count > 0
+    assert load_knowledge_graph(graph_path, "other") is None
+    assert load_knowledge_graph(tmp_path / "missing.npz") is None
+
+    with np.load(graph_path) as data:
+        arrays = dict(data)
+    arrays["format_version"] = np.array(99)
+    np.savez(tmp_path / "future.npz", **arrays)
+    assert load_knowledge_graph(tmp_path / "future.npz") is None
@@ -203,6 +203,19 @@ async def test_search_engine_collection_exists(
         mock_qdrant_client.create_collection.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_search_engine_document_lookup_not_initialized():
+    """Test document lookup when not initialized."""
+    search_engine = SearchEngine()
+
+    with pytest.raises(RuntimeError, match="Search engine not initialized"):
+        await search_engine.get_document_chunks("doc-1")
+    with pytest.raises(RuntimeError, match="Search engine not initialized"):
+        await search_engine.get_document("doc-1")
+    with pytest.raises(RuntimeError, match="Search engine not initialized"):
+        await search_engine.get_documents(["doc-1"])
+
+
 @pytest.mark.asyncio
 async def test_search_engine_generate_topic_chain_not_initialized():
     """Test topic chain generation when not initialized."""
@@ -462,6 +475,77 @@ async def test_search_engine_initialization_with_search_config(
             openai_client=mock_openai_client,
             collection_name=qdrant_config.collection_name,
             search_config=search_config,
+            precomputed_graph=None,
         )
 
         assert search_engine.hybrid_search is not None
+
+
+@pytest.mark.asyncio
+async def test_search_engine_initialization_loads_knowledge_graph(
+    search_engine, qdrant_config, openai_config, mock_qdrant_client, mock_openai_client
+):
+    """Test that the precomputed knowledge graph is loaded at startup."""
+    from qdrant_loader_mcp_server.config import SearchConfig
+
+    search_config = SearchConfig(knowledge_graph_path="/graphs/kg.npz")
+    graph = MagicMock()
+
+    with (
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncQdrantClient",
+            return_value=mock_qdrant_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncOpenAI",
+            return_value=mock_openai_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.load_knowledge_graph",
+            return_value=graph,
+        ) as mock_load,
+        patch(
+            "qdrant_loader_mcp_server.search.engine.HybridSearchEngine"
+        ) as mock_hybrid,
+    ):
+        await search_engine.initialize(qdrant_config, openai_config, search_config)
+
+        mock_load.assert_called_once_with(
+            "/graphs/kg.npz", qdrant_config.collection_name
+        )
+        assert mock_hybrid.call_args.kwargs["precomputed_graph"] is graph
+
+
+@pytest.mark.asyncio
+async def test_search_engine_initialization_warms_up_in_background(
+    search_engine, qdrant_config, openai_config, mock_qdrant_client, mock_openai_client
+):
+    """Test that the search components are warmed up after startup."""
+    from qdrant_loader_mcp_server.config import SearchConfig
+
+    with (
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncQdrantClient",
+            return_value=mock_qdrant_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncOpenAI",
+            return_value=mock_openai_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.HybridSearchEngine"
+        ) as mock_hybrid,
+    ):
+        await search_engine.initialize(
+            qdrant_config, openai_config, SearchConfig(warmup_enabled=True)
+        )
+        await search_engine._warmup_task
+
+        mock_hybrid.return_value.warm_up.assert_called_once()
+
+        search_engine._warmup_task = None
+        await search_engine.initialize(
+            qdrant_config, openai_config, SearchConfig(warmup_enabled=False)
+        )
+
+        assert search_engine._warmup_task is None
@@ -709,6 +709,62 @@ async def test_find_similar_documents_no_target(
         assert result == []
 
 
+@pytest.mark.asyncio
+async def test_find_similar_documents_vector_mode(
+    search_engine,
+    qdrant_config,
+    openai_config,
+    mock_qdrant_client,
+    mock_openai_client,
+    sample_search_results,
+):
+    """Test that vector mode searches the collection with the target vectors."""
+    mock_hybrid_search = AsyncMock()
+    mock_hybrid_search.search.return_value = [sample_search_results[0]]
+    mock_similar_docs = [{"document": sample_search_results[1]}]
+    mock_hybrid_search.find_similar_documents_by_vector.return_value = (
+        mock_similar_docs
+    )
+
+    with (
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncQdrantClient",
+            return_value=mock_qdrant_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.AsyncOpenAI",
+            return_value=mock_openai_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.HybridSearchEngine",
+            return_value=mock_hybrid_search,
+        ),
+    ):
+        await search_engine.initialize(qdrant_config, openai_config)
+
+        result = await search_engine.find_similar_documents(
+            target_query="AI documentation",
+            max_similar=3,
+            project_ids=["proj1"],
+            similarity_mode="vector",
+        )
+
+        assert result == mock_similar_docs
+        # Only the target document is searched for
+        assert mock_hybrid_search.search.call_count == 1
+        mock_hybrid_search.find_similar_documents.assert_not_called()
+        mock_hybrid_search.find_similar_documents_by_vector.assert_called_once_with(
+            target_document=sample_search_results[0],
+            similarity_metrics=None,
+            max_similar=3,
+            source_types=None,
+            project_ids=["proj1"],
+        )
+
+        with pytest.raises(ValueError):
+            await search_engine.find_similar_documents(target_query="AI documentation")
+
+
 @pytest.mark.asyncio
 async def test_detect_document_conflicts_success(
     search_engine,
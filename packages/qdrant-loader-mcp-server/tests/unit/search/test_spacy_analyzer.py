@@ -6,6 +6,7 @@ import pytest
 from qdrant_loader_mcp_server.search.nlp.spacy_analyzer import (
     QueryAnalysis,
     SpaCyQueryAnalyzer,
+    doc_cache_scope,
 )
 
 
@@ -93,6 +94,24 @@ class TestSpaCyQueryAnalyzer:
             assert analyzer.nlp is not None
             mock_load.assert_called_once_with("en_core_web_md")
 
+    def test_model_loads_on_first_use(self, mock_spacy_nlp):
+        """Test that the spaCy model is loaded once, when first needed."""
+        with patch(
+            "qdrant_loader_mcp_server.search.nlp.spacy_analyzer.spacy.load"
+        ) as mock_load:
+            mock_load.return_value = mock_spacy_nlp
+
+            analyzer = SpaCyQueryAnalyzer()
+
+            mock_load.assert_not_called()
+            assert not analyzer.is_loaded
+
+            analyzer.parse("first query")
+            analyzer.parse("second query")
+
+            mock_load.assert_called_once_with("en_core_web_md")
+            assert analyzer.is_loaded
+
     def test_analyze_query_semantic_basic(self, spacy_analyzer):
         """Test basic query semantic analysis."""
         query = "How to implement authentication?"
@@ -243,3 +262,62 @@ class TestSpaCyQueryAnalyzer:
         assert hasattr(result, "processing_time_ms")
         assert isinstance(result.processing_time_ms, float)
         assert result.processing_time_ms >= 0
+
+    def test_parse_reuses_docs(self, spacy_analyzer):
+        """Test that each text is parsed once across analyzer calls."""
+        spacy_analyzer.nlp.reset_mock()
+
+        doc = spacy_analyzer.parse("database performance")
+        spacy_analyzer.analyze_query_semantic("database performance")
+
+        assert spacy_analyzer.parse("database performance") is doc
+        spacy_analyzer.nlp.assert_called_once_with("database performance")
+        stats = spacy_analyzer.get_cache_stats()
+        assert stats["doc_cache_hits"] == 2
+        assert stats["doc_cache_misses"] == 1
+
+    def test_parse_batch_pipes_uncached_texts_once(self, spacy_analyzer):
+        """Test that batch parsing runs nlp.pipe once over the unique new texts."""
+        cached = spacy_analyzer.parse("cached")
+        spacy_analyzer.nlp.pipe.side_effect = lambda texts, batch_size: [
+            MagicMock(text=text) for text in texts
+        ]
+
+        docs = spacy_analyzer.parse_batch(["first", "cached", "second", "first"])
+
+        spacy_analyzer.nlp.pipe.assert_called_once_with(
+            ["first", "second"], batch_size=64
+        )
+        assert docs[1] is cached
+        assert docs[0] is docs[3]
+        assert [doc.text for doc in (docs[0], docs[2])] == ["first", "second"]
+        assert spacy_analyzer.parse("second") is docs[2]
+
+    def test_doc_cache_evicts_least_recently_used(self, spacy_analyzer):
+        """Test that the cross-request Doc cache is bounded."""
+        spacy_analyzer.doc_cache_size = 2
+        spacy_analyzer.nlp.side_effect = lambda text: MagicMock(text=text)
+
+        first = spacy_analyzer.parse("first")
+        spacy_analyzer.parse("second")
+        spacy_analyzer.parse("first")
+        spacy_analyzer.parse("third")
+
+        assert spacy_analyzer.get_cache_stats()["doc_cache_size"] == 2
+        assert spacy_analyzer.parse("first") is first
+        assert spacy_analyzer.parse("second") is not None
+        assert spacy_analyzer.get_cache_stats()["doc_cache_misses"] == 4
+
+    def test_doc_cache_scope_without_shared_cache(self, spacy_analyzer):
+        """Test that docs are reused within a request when caching is disabled."""
+        spacy_analyzer.doc_cache_size = 0
+        spacy_analyzer.nlp.side_effect = lambda text: MagicMock(text=text)
+
+        with doc_cache_scope():
+            doc = spacy_analyzer.parse("query")
+            with doc_cache_scope():
+                assert spacy_analyzer.parse("query") is doc
+            assert spacy_analyzer.parse("query") is doc
+
+        assert spacy_analyzer.parse("query") is not doc
+        assert spacy_analyzer.get_cache_stats()["doc_cache_size"] == 0
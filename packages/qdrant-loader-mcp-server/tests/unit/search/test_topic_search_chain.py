@@ -33,6 +33,10 @@ class TestTopicRelationshipMap:
         mock_doc.similarity.return_value = 0.75
         mock_nlp.return_value = mock_doc
         analyzer.nlp = mock_nlp
+        analyzer.parse.side_effect = analyzer.nlp
+        analyzer.parse_batch.side_effect = lambda texts: [
+            analyzer.nlp(text) for text in texts
+        ]
 
         return analyzer
 
@@ -210,6 +214,10 @@ class TestTopicSearchChainGenerator:
         mock_doc.similarity.return_value = 0.6
         mock_nlp.return_value = mock_doc
         analyzer.nlp = mock_nlp
+        analyzer.parse.side_effect = analyzer.nlp
+        analyzer.parse_batch.side_effect = lambda texts: [
+            analyzer.nlp(text) for text in texts
+        ]
 
         return analyzer
 
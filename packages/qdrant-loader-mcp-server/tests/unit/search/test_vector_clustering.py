@@ -0,0 +1,185 @@
+"""Tests for vector-based document clustering."""
+
+import numpy as np
+import pytest
+from qdrant_loader_mcp_server.search.enhanced.vector_clustering import (
+    ClusteringAlgorithm,
+    VectorClusteringEngine,
+    agglomerative,
+    build_document_features,
+    hdbscan,
+    kmeans,
+    silhouette_score,
+)
+
+
+def _groups(sizes, prefix="doc", seed=0, dimension=16):
+    """Documents around well separated centers, with one entity per group."""
+    rng = np.random.default_rng(seed)
+    centers = np.eye(dimension)[: len(sizes)] * 3
+    ids, embeddings, entities, topics = [], [], [], []
+    for group, size in enumerate(sizes):
+        for index in range(size):
+            ids.append(f"{prefix}{group}_{index}")
+            embeddings.append(centers[group] + 0.2 * rng.normal(size=dimension))
+            entities.append([f"entity{group}"])
+            topics.append([f"topic{group}"])
+    return ids, embeddings, entities, topics
+
+
+def _same_partition(labels, expected):
+    """Whether two labelings group the documents the same way."""
+    pairs = {(a, b) for a, b in zip(labels, expected, strict=True)}
+    return len(pairs) == len(set(labels)) == len(set(expected))
+
+
+EXPECTED = [0] * 5 + [1] * 5 + [2] * 5
+
+
+def test_build_document_features_combines_embeddings_and_terms():
+    features = build_document_features(
+        [[1.0, 0.0], None, [0.0, 2.0]],
+        [["oauth"], ["oauth"], []],
+        [[], ["security"], ["security"]],
+        embedding_weight=0.5,
+    )
+
+    assert features.matrix.shape[0] == 3
+    norms = np.sqrt(np.asarray(features.matrix.multiply(features.matrix).sum(1)))
+    np.testing.assert_allclose(norms.ravel(), 1.0)
+    assert features.has_embedding.tolist() == [True, False, True]
+    assert set(features.vocabulary) == {("entity", "oauth"), ("topic", "security")}
+    assert features.terms.sum() == 4
+
+
+@pytest.mark.parametrize("algorithm", list(ClusteringAlgorithm))
+def test_algorithms_recover_separated_groups(algorithm):
+    ids, embeddings, entities, topics = _groups([5, 5, 5])
+
+    result = VectorClusteringEngine(algorithm=algorithm).cluster(
+        ids, embeddings, entities, topics, max_clusters=5, min_cluster_size=2
+    )
+
+    assert result.cluster_count == 3
+    assert _same_partition(result.labels.tolist(), EXPECTED)
+    assert np.all(result.coherence > 0.8)
+    assert np.all(result.cluster_similarity[~np.eye(3, dtype=bool)] < 0.3)
+    for cluster in range(3):
+        assert result.labels[result.representatives[cluster]] == cluster
+        group = EXPECTED[np.flatnonzero(result.labels == cluster)[0]]
+        assert result.shared_entities[cluster] == [f"entity{group}"]
+        assert result.shared_topics[cluster] == [f"topic{group}"]
+
+
+def test_kmeans_and_silhouette():
+    ids, embeddings, entities, topics = _groups([4, 4])
+    features = build_document_features(embeddings, entities, topics)
+    similarity = (features.matrix @ features.matrix.T).toarray()
+
+    labels, centroids = kmeans(features.matrix, 2)
+
+    assert _same_partition(labels.tolist(), [0] * 4 + [1] * 4)
+    np.testing.assert_allclose(np.linalg.norm(centroids, axis=1), 1.0)
+    assert silhouette_score(similarity, labels) > 0.5
+    assert silhouette_score(similarity, np.zeros(8, dtype=int)) == -1.0
+
+
+def test_agglomerative_respects_cluster_limit():
+    similarity = np.array(
+        [
+            [1.0, 0.9, 0.1, 0.0],
+            [0.9, 1.0, 0.0, 0.1],
+            [0.1, 0.0, 1.0, 0.8],
+            [0.0, 0.1, 0.8, 1.0],
+        ]
+    )
+
+    assert agglomerative(similarity, 4).tolist() == [0, 0, 1, 1]
+    assert agglomerative(similarity, 1, distance_threshold=0.0).tolist() == [0] * 4
+
+
+def test_hdbscan_marks_outliers_as_noise():
+    ids, embeddings, entities, topics = _groups([5, 5])
+    embeddings.append(np.ones(16) * -1)
+    features = build_document_features(embeddings, entities + [[]], topics + [[]])
+    similarity = (features.matrix @ features.matrix.T).toarray()
+
+    labels = hdbscan(similarity, min_cluster_size=3)
+
+    assert labels[-1] == -1
+    assert _same_partition(labels[:-1].tolist(), [0] * 5 + [1] * 5)
+
+
+def test_small_clusters_are_dropped():
+    ids, embeddings, entities, topics = _groups([5, 5, 1])
+
+    result = VectorClusteringEngine(
+        algorithm=ClusteringAlgorithm.AGGLOMERATIVE
+    ).cluster(ids, embeddings, entities, topics, max_clusters=3, min_cluster_size=2)
+
+    assert result.cluster_count == 2
+    assert result.labels[-1] == -1
+
+
+def test_documents_without_features_are_not_clustered():
+    result = VectorClusteringEngine().cluster(
+        ["a", "b", "c"], [None] * 3, [[], [], []], [[], [], []]
+    )
+
+    assert result.cluster_count == 0
+    assert result.labels.tolist() == [-1, -1, -1]
+
+
+def test_incremental_mode_assigns_new_documents_to_cached_centroids():
+    engine = VectorClusteringEngine()
+    first = _groups([5, 5, 5], prefix="a", seed=1)
+    engine.cluster(*first, cache_key="key")
+
+    second = _groups([2, 2, 2], prefix="b", seed=2)
+    ids = first[0][:5] + second[0]
+    embeddings = first[1][:5] + second[1]
+    entities = first[2][:5] + second[2]
+    topics = first[3][:5] + second[3]
+    result = engine.cluster(ids, embeddings, entities, topics, cache_key="key")
+
+    assert result.incremental
+    assert _same_partition(result.labels.tolist(), [0] * 7 + [1] * 2 + [2] * 2)
+
+
+def test_incremental_mode_clusters_again_when_documents_do_not_fit():
+    engine = VectorClusteringEngine()
+    engine.cluster(*_groups([5, 5]), cache_key="key")
+
+    # A third group fits none of the cached centroids
+    result = engine.cluster(*_groups([5, 5, 5], seed=3), cache_key="key")
+
+    assert not result.incremental
+    assert result.cluster_count == 3
+
+    engine.clear_cache()
+    assert not engine.cluster(*_groups([5, 5]), cache_key="key").incremental
+
+
+def test_incremental_mode_without_clusters_clusters_again():
+    engine = VectorClusteringEngine(algorithm=ClusteringAlgorithm.HDBSCAN)
+    ids = [f"doc{index}" for index in range(4)]
+    embeddings = list(np.eye(4))
+    empty = [[] for _ in ids]
+
+    # Orthogonal documents are all noise, so there is no centroid to cache
+    first = engine.cluster(
+        ids, embeddings, empty, empty, min_cluster_size=3, cache_key="key"
+    )
+    assert first.cluster_count == 0
+
+    result = engine.cluster(
+        ids[:2] + ["new0", "new1"],
+        embeddings[:2] + [np.eye(4)[2], np.eye(4)[3]],
+        empty,
+        empty,
+        min_cluster_size=3,
+        cache_key="key",
+    )
+
+    assert not result.incremental
+    assert result.cluster_count == 0
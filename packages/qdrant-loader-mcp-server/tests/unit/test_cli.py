@@ -1,5 +1,6 @@
 """Tests for CLI module."""
 
+import asyncio
 import json
 import os
 import sys
@@ -450,6 +451,57 @@ class TestStdioHandler:
             response = json.loads(written_response)
             assert response["result"] == "success"
 
+    @pytest.mark.asyncio
+    async def test_handle_stdio_reads_while_request_runs(self):
+        """Test that a running request does not block reading the next line."""
+        with (
+            patch("qdrant_loader_mcp_server.cli.LoggingConfig"),
+            patch(
+                "qdrant_loader_mcp_server.cli.SearchEngine"
+            ) as mock_search_engine_class,
+            patch("qdrant_loader_mcp_server.cli.QueryProcessor"),
+            patch("qdrant_loader_mcp_server.cli.MCPHandler") as mock_mcp_handler_class,
+            patch("qdrant_loader_mcp_server.cli.read_stdin") as mock_read_stdin,
+            patch("sys.stdout") as mock_stdout,
+            patch.dict(os.environ, {}, clear=True),
+        ):
+            mock_search_engine = MagicMock()
+            mock_search_engine.initialize = AsyncMock()
+            mock_search_engine.cleanup = AsyncMock()
+            mock_search_engine_class.return_value = mock_search_engine
+
+            # The slow request only finishes once the notification arrived
+            notified = asyncio.Event()
+
+            async def handle_request(request):
+                if request.get("id") is None:
+                    notified.set()
+                    return {}
+                await asyncio.wait_for(notified.wait(), 1)
+                return {"jsonrpc": "2.0", "id": request["id"], "result": "done"}
+
+            mock_mcp_handler = MagicMock()
+            mock_mcp_handler.handle_request = AsyncMock(side_effect=handle_request)
+            mock_mcp_handler_class.return_value = mock_mcp_handler
+
+            slow_request = {"jsonrpc": "2.0", "method": "tools/call", "id": 1}
+            notification = {"jsonrpc": "2.0", "method": "notifications/cancelled"}
+            mock_reader = MagicMock()
+            mock_reader.readline = AsyncMock(
+                side_effect=[
+                    json.dumps(slow_request).encode() + b"\n",
+                    json.dumps(notification).encode() + b"\n",
+                    b"",  # EOF
+                ]
+            )
+            mock_read_stdin.return_value = mock_reader
+
+            await handle_stdio(MagicMock(), "INFO")
+
+            written_response = mock_stdout.write.call_args[0][0]
+            assert json.loads(written_response)["result"] == "done"
+            mock_search_engine.cleanup.assert_awaited_once()
+
 
 class TestCLICommand:
     """Test CLI command functionality."""
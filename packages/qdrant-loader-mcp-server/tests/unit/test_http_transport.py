@@ -1,5 +1,6 @@
 """Unit tests for HTTP Transport Handler."""
 
+import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -246,6 +247,63 @@ class TestHTTPTransportEndpoints:
         assert call_args[0][0] == mcp_request  # First arg is the request
         assert "headers" in call_args[1]  # Second arg should have headers
 
+    def test_mcp_post_endpoint_streams_large_response(
+        self, test_client, mock_mcp_handler
+    ):
+        """Test that large responses are streamed to clients accepting SSE."""
+        expected_response = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "content": [{"type": "text", "text": "result line\n" * 5000}],
+                "isError": False,
+            },
+        }
+        mock_mcp_handler.handle_request = AsyncMock(return_value=expected_response)
+        mcp_request = {"jsonrpc": "2.0", "method": "tools/call", "id": 1}
+
+        response = test_client.post(
+            "/mcp",
+            json=mcp_request,
+            headers={
+                "Origin": "http://localhost",
+                "Accept": "application/json, text/event-stream",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        lines = response.text.split("\n")
+        assert lines[0] == "event: message"
+        data_lines = [
+            line[len("data: ") :] for line in lines if line.startswith("data: ")
+        ]
+        assert len(data_lines) > 1
+        assert json.loads("\n".join(data_lines)) == expected_response
+
+    def test_mcp_post_endpoint_returns_small_response_as_json(
+        self, test_client, mock_mcp_handler
+    ):
+        """Test that small responses are returned as JSON even if SSE is accepted."""
+        expected_response = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"content": [{"type": "text", "text": "short"}]},
+        }
+        mock_mcp_handler.handle_request = AsyncMock(return_value=expected_response)
+
+        response = test_client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "method": "tools/call", "id": 1},
+            headers={
+                "Origin": "http://localhost",
+                "Accept": "application/json, text/event-stream",
+            },
+        )
+
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json() == expected_response
+
     def test_mcp_post_endpoint_invalid_origin(self, test_client):
         """Test MCP POST endpoint with invalid origin."""
         mcp_request = {
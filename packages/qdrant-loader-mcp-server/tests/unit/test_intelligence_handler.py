@@ -207,6 +207,28 @@ class TestIntelligenceHandlerFindSimilar:
             source_types=None,
         )
 
+    @pytest.mark.asyncio
+    async def test_handle_find_similar_documents_vector_mode(
+        self, intelligence_handler, mock_search_engine, mock_protocol
+    ):
+        """Test that vector mode does not need a comparison query."""
+        mock_search_engine.find_similar_documents.return_value = []
+        mock_protocol.create_response.return_value = {"result": []}
+
+        params = {"target_query": "target", "similarity_mode": "vector"}
+
+        await intelligence_handler.handle_find_similar_documents(7, params)
+
+        mock_search_engine.find_similar_documents.assert_called_once_with(
+            target_query="target",
+            comparison_query=None,
+            max_similar=5,
+            similarity_metrics=None,
+            project_ids=None,
+            source_types=None,
+            similarity_mode="vector",
+        )
+
 
 class TestIntelligenceHandlerDetectConflicts:
     """Test document conflict detection functionality."""
@@ -308,6 +330,7 @@ class TestIntelligenceHandlerClusterDocuments:
             strategy="mixed_features",
             project_ids=None,
             source_types=None,
+            incremental=False,
         )
         assert result == {"result": mock_clusters}
 
@@ -332,6 +355,7 @@ class TestIntelligenceHandlerClusterDocuments:
             strategy="hierarchical",
             project_ids=None,
             source_types=None,
+            incremental=False,
         )
 
 
@@ -502,6 +526,96 @@ class TestIntelligenceHandlerExpandCluster:
         with pytest.raises(Exception, match="Unexpected error"):
             await intelligence_handler.handle_expand_cluster(18, params)
 
+    @pytest.mark.asyncio
+    async def test_handle_expand_cluster_fetches_clustered_documents(
+        self, intelligence_handler, mock_search_engine, mock_protocol
+    ):
+        """Test that a cluster from cluster_documents is expanded by document ID."""
+        docs = [MagicMock(document_id=f"doc{i}") for i in range(3)]
+        mock_search_engine.cluster_documents.return_value = {
+            "clusters": [{"id": "cluster_0", "name": "Auth", "documents": docs}],
+            "clustering_metadata": {},
+        }
+        mock_search_engine.get_documents.return_value = {
+            "doc1": docs[1],
+            "doc2": docs[2],
+        }
+
+        with (
+            patch.object(
+                intelligence_handler.formatters, "create_lightweight_cluster_results"
+            ) as mock_lightweight,
+            patch.object(intelligence_handler.formatters, "format_document_clusters"),
+            patch.object(
+                intelligence_handler.formatters,
+                "create_structured_search_results",
+                return_value=[{"document_id": "doc1"}, {"document_id": "doc2"}],
+            ),
+            patch.object(
+                intelligence_handler.formatters,
+                "format_search_result",
+                return_value="Formatted document",
+            ),
+        ):
+            await intelligence_handler.handle_cluster_documents(
+                19, {"query": "authentication"}
+            )
+            cluster_id = mock_lightweight.call_args.args[0]["clusters"][0]["id"]
+            await intelligence_handler.handle_expand_cluster(
+                20, {"cluster_id": cluster_id, "limit": 2, "offset": 1}
+            )
+
+        assert cluster_id.endswith(":cluster_0")
+        mock_search_engine.get_documents.assert_awaited_once_with(["doc1", "doc2"])
+        mock_search_engine.search.assert_not_called()
+        result = mock_protocol.create_response.call_args.kwargs["result"]
+        expansion = result["structuredContent"]
+        assert expansion["cluster_id"] == cluster_id
+        assert [d["document_id"] for d in expansion["documents"]] == ["doc1", "doc2"]
+        assert expansion["pagination"] == {
+            "offset": 1,
+            "limit": 2,
+            "total": 3,
+            "has_more": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_clusters_of_separate_calls_do_not_collide(
+        self, intelligence_handler, mock_search_engine, mock_protocol
+    ):
+        """Test that each clustering call gets its own cluster IDs and members."""
+        first = [MagicMock(document_id="doc1"), MagicMock(document_id="doc1")]
+        second = [MagicMock(document_id="doc2"), {"document_id": "", "title": "Notes"}]
+
+        cluster_ids = []
+        for call_id, docs in ((21, first), (22, second)):
+            mock_search_engine.cluster_documents.return_value = {
+                "clusters": [{"id": "cluster_0", "name": "Auth", "documents": docs}],
+                "clustering_metadata": {},
+            }
+            with (
+                patch.object(
+                    intelligence_handler.formatters,
+                    "create_lightweight_cluster_results",
+                ) as mock_lightweight,
+                patch.object(
+                    intelligence_handler.formatters, "format_document_clusters"
+                ),
+            ):
+                await intelligence_handler.handle_cluster_documents(
+                    call_id, {"query": "authentication"}
+                )
+            cluster_ids.append(mock_lightweight.call_args.args[0]["clusters"][0]["id"])
+
+        assert cluster_ids[0] != cluster_ids[1]
+        # Duplicate chunks of one document count once
+        assert intelligence_handler._clusters[cluster_ids[0]]["members"] == [
+            ("doc1", None)
+        ]
+        # Members without a document ID are kept as they are
+        members = intelligence_handler._clusters[cluster_ids[1]]["members"]
+        assert [result for _, result in members] == [None, second[1]]
+
 
 class TestIntelligenceHandlerComplexDataProcessing:
     """Test complex data processing logic in analyze document relationships."""
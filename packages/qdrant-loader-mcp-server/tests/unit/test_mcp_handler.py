@@ -1,5 +1,7 @@
 """Tests for MCP handler functionality."""
 
+import asyncio
+
 import pytest
 
 
@@ -333,3 +335,122 @@ async def test_tools_list_contains_all_three_tools(mcp_handler):
     )
     assert "attachment_filter" in attachment_tool["inputSchema"]["properties"]
     assert "include_parent_context" in attachment_tool["inputSchema"]["properties"]
+
+
+@pytest.mark.asyncio
+async def test_handle_cancelled_notification(mcp_handler, mock_search_engine):
+    """Test that a client can cancel a request in progress."""
+    started = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        started.set()
+        await asyncio.sleep(3600)
+
+    mock_search_engine.search.side_effect = slow_search
+    request = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "search", "arguments": {"query": "test query"}},
+        "id": 15,
+    }
+    task = asyncio.create_task(mcp_handler.handle_request(request))
+    await asyncio.wait_for(started.wait(), 1)
+
+    notification = await mcp_handler.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": 15},
+        }
+    )
+    response = await asyncio.wait_for(task, 1)
+
+    assert notification == {}
+    assert response["id"] == 15
+    assert response["error"]["code"] == -32800
+    assert not task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_notification_is_scoped_to_session(
+    mcp_handler, mock_search_engine
+):
+    """Test that a client cannot cancel another session's request."""
+    started = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        started.set()
+        await asyncio.sleep(0.1)
+        return []
+
+    mock_search_engine.search.side_effect = slow_search
+    request = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "search", "arguments": {"query": "test query"}},
+        "id": 1,
+    }
+    task = asyncio.create_task(
+        mcp_handler.handle_request(request, session_id="session_a")
+    )
+    await asyncio.wait_for(started.wait(), 1)
+
+    await mcp_handler.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": 1},
+        },
+        session_id="session_b",
+    )
+    response = await asyncio.wait_for(task, 1)
+
+    assert "error" not in response
+    assert response["id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_handle_cancelled_notification_unknown_request(mcp_handler):
+    """Test that cancelling a finished or unknown request is ignored."""
+    response = await mcp_handler.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": 99},
+        }
+    )
+
+    assert response == {}
+
+
+@pytest.mark.asyncio
+async def test_intelligence_tools_disabled(mock_search_engine, mock_query_processor):
+    """Test that disabled intelligence tools are neither listed nor callable."""
+    from qdrant_loader_mcp_server.mcp.handler import MCPHandler
+
+    handler = MCPHandler(
+        mock_search_engine, mock_query_processor, enable_intelligence_tools=False
+    )
+
+    response = await handler.handle_request(
+        {"jsonrpc": "2.0", "method": "tools/list", "params": {}, "id": 16}
+    )
+    tool_names = {tool["name"] for tool in response["result"]["tools"]}
+    assert tool_names == {
+        "search",
+        "hierarchy_search",
+        "attachment_search",
+        "expand_document",
+    }
+
+    response = await handler.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {"name": "cluster_documents", "arguments": {"query": "test"}},
+            "id": 17,
+        }
+    )
+    assert response["error"]["code"] == -32601
+    assert "disabled" in response["error"]["data"]
+    mock_search_engine.cluster_documents.assert_not_called()
@@ -0,0 +1,56 @@
+"""Tests for the search result set cache."""
+
+from unittest.mock import patch
+
+from qdrant_loader_mcp_server.mcp.result_cache import ResultSetCache
+
+
+class TestResultSetCache:
+    """Test ResultSetCache functionality."""
+
+    def test_store_and_resolve(self):
+        """Test that a cursor resolves to its result set and offset."""
+        cache = ResultSetCache()
+        result_set = cache.store(
+            "search", ["a", "b", "c"], {"query": "q", "page_size": 2, "cursor": "x"}
+        )
+
+        resolved = cache.resolve(cache.cursor(result_set, 2), "search")
+
+        assert resolved == (result_set, 2)
+        assert result_set.params == {"query": "q", "page_size": 2}
+
+    def test_resolve_rejects_invalid_cursors(self):
+        """Test that malformed, unknown and foreign cursors do not resolve."""
+        cache = ResultSetCache()
+        result_set = cache.store("search", ["a"], {})
+
+        assert cache.resolve(f"{result_set.set_id}:next", "search") is None
+        assert cache.resolve("unknown:1", "search") is None
+        assert cache.resolve(result_set.set_id, "search") is None
+        assert cache.resolve(cache.cursor(result_set, 1), "attachment_search") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently paged result set is evicted first."""
+        cache = ResultSetCache(max_size=2)
+        first = cache.store("search", ["a"], {})
+        second = cache.store("search", ["b"], {})
+
+        cache.resolve(cache.cursor(first, 1), "search")
+        cache.store("search", ["c"], {})
+
+        assert cache.resolve(cache.cursor(first, 1), "search") is not None
+        assert cache.resolve(cache.cursor(second, 1), "search") is None
+
+    def test_expires_result_sets(self):
+        """Test that result sets expire after the time-to-live."""
+        cache = ResultSetCache(ttl=60)
+        with patch("qdrant_loader_mcp_server.mcp.result_cache.time.time") as now:
+            now.return_value = 1000.0
+            result_set = cache.store("search", ["a"], {})
+
+            now.return_value = 1059.0
+            assert cache.resolve(cache.cursor(result_set, 1), "search") is not None
+
+            now.return_value = 1061.0
+            assert cache.resolve(cache.cursor(result_set, 1), "search") is None
@@ -14,6 +14,7 @@ def async_search_engine():
     """Create a mock search engine with async behavior."""
     engine = Mock()
     engine.search = AsyncMock()
+    engine.get_document = AsyncMock()
     return engine
 
 
@@ -388,22 +389,17 @@ class TestAsyncExpandDocumentBehavior:
     """Test async behavior in document expansion operations."""
 
     @pytest.mark.asyncio
-    async def test_expand_document_async_search_sequence(
+    async def test_expand_document_async_lookup(
         self, async_search_handler, sample_async_results
     ):
-        """Test async behavior with document expansion search sequence."""
+        """Test async behavior with a direct document lookup."""
         target_document = sample_async_results[0]
 
-        # Setup sequential async searches
-        async def sequential_search(query, **kwargs):
-            if "document_id:" in query:
-                await asyncio.sleep(0.02)  # First search delay
-                return []  # No exact match
-            else:
-                await asyncio.sleep(0.03)  # Second search delay
-                return [target_document]
+        async def delayed_lookup(document_id):
+            await asyncio.sleep(0.02)
+            return target_document
 
-        async_search_handler.search_engine.search = sequential_search
+        async_search_handler.search_engine.get_document = delayed_lookup
         async_search_handler.protocol.create_response.return_value = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -418,8 +414,9 @@ class TestAsyncExpandDocumentBehavior:
                 result = await async_search_handler.handle_expand_document(1, params)
                 end_time = time.time()
 
-                # Should wait for both search attempts
-                assert end_time - start_time >= 0.05
+                # Should wait for the lookup, without any search
+                assert end_time - start_time >= 0.02
+                async_search_handler.search_engine.search.assert_not_called()
                 assert result["jsonrpc"] == "2.0"
 
     @pytest.mark.asyncio
@@ -427,9 +424,9 @@ class TestAsyncExpandDocumentBehavior:
         self, async_search_handler, sample_async_results
     ):
         """Test concurrent document expansion requests."""
-        async_search_handler.search_engine.search.return_value = sample_async_results[
-            :1
-        ]
+        async_search_handler.search_engine.get_document.return_value = (
+            sample_async_results[0]
+        )
         async_search_handler.protocol.create_response.return_value = {"jsonrpc": "2.0"}
 
         with patch.object(async_search_handler.formatters, "format_search_result"):
@@ -12,6 +12,7 @@ def mock_search_engine():
     """Create a mock search engine."""
     engine = Mock()
     engine.search = AsyncMock()
+    engine.get_document = AsyncMock()
     return engine
 
 
@@ -435,7 +436,7 @@ class TestHandleExpandDocument:
     ):
         """Test successful document expansion."""
         target_result = sample_search_results[0]
-        search_handler.search_engine.search.return_value = [target_result]
+        search_handler.search_engine.get_document.return_value = target_result
         search_handler.protocol.create_response.return_value = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -454,15 +455,16 @@ class TestHandleExpandDocument:
 
                 await search_handler.handle_expand_document(1, params)
 
-                # Verify search was called with document_id field search
-                search_handler.search_engine.search.assert_called_with(
-                    query="document_id:doc1", limit=10
+                # Verify the document was fetched directly, without a search
+                search_handler.search_engine.get_document.assert_called_once_with(
+                    "doc1"
                 )
+                search_handler.search_engine.search.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handle_expand_document_not_found(self, search_handler):
         """Test document expansion when document is not found."""
-        search_handler.search_engine.search.return_value = []
+        search_handler.search_engine.get_document.return_value = None
         search_handler.protocol.create_response.return_value = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -504,31 +506,6 @@ class TestHandleExpandDocument:
             },
         )
 
-    @pytest.mark.asyncio
-    async def test_handle_expand_document_fallback_search(
-        self, search_handler, sample_search_results
-    ):
-        """Test document expansion with fallback to general search."""
-        target_result = sample_search_results[0]
-
-        # First search returns no exact matches, second search returns the document
-        search_handler.search_engine.search.side_effect = [[], [target_result]]
-        search_handler.protocol.create_response.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-
-        with patch.object(search_handler.formatters, "format_search_result"):
-            with patch.object(
-                search_handler.formatters, "create_structured_search_results"
-            ):
-                params = {"document_id": "doc1"}
-
-                await search_handler.handle_expand_document(1, params)
-
-                # Verify both searches were called
-                assert search_handler.search_engine.search.call_count == 2
-
 
 class TestHierarchyFilters:
     """Test hierarchy filtering methods."""
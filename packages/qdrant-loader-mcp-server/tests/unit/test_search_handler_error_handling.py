@@ -13,6 +13,7 @@ def mock_search_engine():
     """Create a mock search engine."""
     engine = Mock()
     engine.search = AsyncMock()
+    engine.get_document = AsyncMock()
     return engine
 
 
@@ -377,7 +378,7 @@ class TestExpandDocumentErrorHandling:
         self, search_handler_with_mocks
     ):
         """Test document expansion when search engine fails."""
-        search_handler_with_mocks.search_engine.search.side_effect = RuntimeError(
+        search_handler_with_mocks.search_engine.get_document.side_effect = RuntimeError(
             "Search index corrupted"
         )
         search_handler_with_mocks.protocol.create_response.return_value = {
@@ -398,37 +399,6 @@ class TestExpandDocumentErrorHandling:
             },
         )
 
-    @pytest.mark.asyncio
-    async def test_handle_expand_document_partial_match_error(
-        self, search_handler_with_mocks
-    ):
-        """Test document expansion when partial matching fails."""
-        # First search returns results but no exact match
-        partial_result = Mock()
-        partial_result.document_id = "different-doc"
-
-        search_handler_with_mocks.search_engine.search.side_effect = [
-            [partial_result],  # Field search with no exact match
-            RuntimeError("General search failed"),  # Fallback search fails
-        ]
-        search_handler_with_mocks.protocol.create_response.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {"code": -32603, "message": "Internal error"},
-        }
-
-        params = {"document_id": "target-doc"}
-        await search_handler_with_mocks.handle_expand_document(1, params)
-
-        search_handler_with_mocks.protocol.create_response.assert_called_once_with(
-            1,
-            error={
-                "code": -32603,
-                "message": "Internal error",
-                "data": "General search failed",
-            },
-        )
-
     @pytest.mark.asyncio
     async def test_handle_expand_document_invalid_document_id(
         self, search_handler_with_mocks
@@ -461,7 +431,7 @@ class TestExpandDocumentErrorHandling:
         mock_result = Mock()
         mock_result.document_id = "test-doc"
 
-        search_handler_with_mocks.search_engine.search.return_value = [mock_result]
+        search_handler_with_mocks.search_engine.get_document.return_value = mock_result
         search_handler_with_mocks.protocol.create_response.return_value = {
             "jsonrpc": "2.0",
             "id": 1,
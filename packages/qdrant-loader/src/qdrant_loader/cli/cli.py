@@ -695,6 +695,95 @@ def config(
         raise ClickException(f"Failed to display configuration: {str(e)!s}") from e
 
 
+@cli.command(name="migrate-ids")
+@option(
+    "--workspace",
+    type=ClickPath(path_type=Path),
+    help="Workspace directory containing config.yaml and .env files. All output will be stored here.",
+)
+@option(
+    "--config", type=ClickPath(exists=True, path_type=Path), help="Path to config file."
+)
+@option("--env", type=ClickPath(exists=True, path_type=Path), help="Path to .env file.")
+@option(
+    "--dry-run",
+    is_flag=True,
+    help="Report what would be migrated without changing anything.",
+)
+@option(
+    "--log-level",
+    type=Choice(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+    ),
+    default="INFO",
+    help="Set the logging level.",
+)
+@async_command
+async def migrate_ids(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    dry_run: bool,
+    log_level: str,
+):
+    """Migrate PublicDocs documents to stable document IDs.
+
+    Rewrites the state database and the QDrant collection in place, copying
+    the stored vectors, so existing pages do not need to be re-embedded.
+    """
+    try:
+        # Lazy import to avoid slow startup
+        from qdrant_loader.config.workspace import validate_workspace_flags
+
+        # Validate flag combinations
+        validate_workspace_flags(workspace, config, env)
+
+        # Setup workspace if provided
+        workspace_config = None
+        if workspace:
+            workspace_config = _setup_workspace(workspace)
+
+        # Setup logging with workspace support
+        _setup_logging(log_level, workspace_config)
+
+        # Load configuration
+        _load_config_with_workspace(workspace_config, config, env)
+        settings = _check_settings()
+
+        # Lazy import to avoid slow startup
+        from qdrant_loader.core.document_id_migration import PublicDocsIdMigration
+        from qdrant_loader.core.qdrant_manager import QdrantManager
+        from qdrant_loader.core.state.state_manager import StateManager
+
+        state_manager = StateManager(settings.global_config.state_management)
+        try:
+            migration = PublicDocsIdMigration(
+                state_manager, QdrantManager(settings), dry_run=dry_run
+            )
+            result = await migration.run()
+        finally:
+            await state_manager.dispose()
+
+        prefix = "Would migrate" if dry_run else "Migrated"
+        echo(
+            f"{prefix} {result.documents_migrated} documents "
+            f"({result.points_migrated} points); removed "
+            f"{result.state_records_removed} obsolete state records and "
+            f"{result.points_removed} obsolete points."
+        )
+
+    except ClickException as e:
+        from qdrant_loader.utils.logging import LoggingConfig
+
+        LoggingConfig.get_logger(__name__).error("migrate_ids_failed", error=str(e))
+        raise e from None
+    except Exception as e:
+        from qdrant_loader.utils.logging import LoggingConfig
+
+        LoggingConfig.get_logger(__name__).error("migrate_ids_failed", error=str(e))
+        raise ClickException(f"Failed to migrate document IDs: {str(e)!s}") from e
+
+
 # Add project management commands with lazy import
 def _add_project_commands():
     """Lazily add project commands to avoid slow startup."""
@@ -18,7 +18,7 @@ from ..utils.logging import LoggingConfig
 from .chunking import ChunkingConfig
 
 # Import consolidated configs
-from .global_config import GlobalConfig, SemanticAnalysisConfig
+from .global_config import GlobalConfig, KnowledgeGraphConfig, SemanticAnalysisConfig
 
 # Import multi-project support
 from .models import (
@@ -68,6 +68,7 @@ __all__ = [
     "GitRepoConfig",
     "GlobalConfig",
     "JiraProjectConfig",
+    "KnowledgeGraphConfig",
     "PublicDocsSourceConfig",
     "SelectorsConfig",
     "SemanticAnalysisConfig",
@@ -200,6 +200,15 @@ class ChunkingConfig(BaseModel):
         gt=0,
         title="Max Chunks Per Document",
     )
+    use_process_pool: bool = Field(
+        default=False,
+        description="Chunk documents in a pool of worker processes instead of threads",
+    )
+    process_pool_workers: int | None = Field(
+        default=None,
+        description="Number of chunking processes (defaults to the number of CPUs)",
+        gt=0,
+    )
 
     # Strategy-specific configurations
     strategies: StrategySpecificConfig = Field(
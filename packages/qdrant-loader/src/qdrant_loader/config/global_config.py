@@ -4,7 +4,7 @@ This module defines the global configuration settings that apply across the appl
 including chunking, embedding, and logging configurations.
 """
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field
 
@@ -31,6 +31,67 @@ class SemanticAnalysisConfig(BaseConfig):
         description="spaCy model to use for text processing. Options: en_core_web_sm (15MB, no vectors), en_core_web_md (50MB, 20k vectors), en_core_web_lg (750MB, 514k vectors)",
     )
 
+    batch_size: int = Field(
+        default=32,
+        gt=0,
+        description="Number of chunks spaCy processes per batch (nlp.pipe batch_size)",
+    )
+
+    n_process: int = Field(
+        default=1,
+        gt=0,
+        description="Number of processes spaCy uses for batched analysis (nlp.pipe n_process)",
+    )
+
+    pipeline_profile: Literal["full", "light"] = Field(
+        default="full",
+        description="spaCy pipeline profile: 'full' runs all components, 'light' disables the parser and lemmatizer (no dependency labels, noun-chunk key phrases or lemmas)",
+    )
+
+    topic_model_dir: str | None = Field(
+        default=None,
+        description="Directory to persist the per-source topic models in. Persisted models are loaded and refreshed with changed documents instead of being trained from scratch on every run",
+    )
+
+    min_topic_tokens: int = Field(
+        default=5,
+        gt=0,
+        description="Chunks with fewer tokens (after stop word removal) skip topic inference and get a generic topic",
+    )
+
+    analysis_cache_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Maximum number of analyzed chunks kept for caching and chunk similarity; the oldest are evicted first",
+    )
+
+    similarity_top_k: int | None = Field(
+        default=None,
+        gt=0,
+        description="Only report the most similar chunks in document_similarity (all cached chunks when unset)",
+    )
+
+
+class KnowledgeGraphConfig(BaseConfig):
+    """Configuration for the precomputed knowledge graph."""
+
+    path: str | None = Field(
+        default=None,
+        description="File to write the knowledge graph of the collection to after each ingestion run, for the MCP server to load at startup (disabled when unset)",
+    )
+
+    min_document_frequency: int = Field(
+        default=2,
+        gt=0,
+        description="Number of documents an entity or topic must appear in to become a graph node",
+    )
+
+    similar_documents: int = Field(
+        default=10,
+        ge=0,
+        description="Maximum number of similar documents linked to each document",
+    )
+
 
 class GlobalConfig(BaseConfig):
     """Global configuration settings."""
@@ -50,6 +111,10 @@ class GlobalConfig(BaseConfig):
         default_factory=FileConversionConfig,
         description="File conversion configuration",
     )
+    knowledge_graph: KnowledgeGraphConfig = Field(
+        default_factory=KnowledgeGraphConfig,
+        description="Knowledge graph configuration",
+    )
     qdrant: QdrantConfig | None = Field(
         default=None, description="Qdrant configuration"
     )
@@ -78,12 +143,23 @@ class GlobalConfig(BaseConfig):
                 "num_topics": self.semantic_analysis.num_topics,
                 "lda_passes": self.semantic_analysis.lda_passes,
                 "spacy_model": self.semantic_analysis.spacy_model,
+                "batch_size": self.semantic_analysis.batch_size,
+                "n_process": self.semantic_analysis.n_process,
+                "pipeline_profile": self.semantic_analysis.pipeline_profile,
+                "topic_model_dir": self.semantic_analysis.topic_model_dir,
+                "min_topic_tokens": self.semantic_analysis.min_topic_tokens,
+                "analysis_cache_size": self.semantic_analysis.analysis_cache_size,
+                "similarity_top_k": self.semantic_analysis.similarity_top_k,
             },
             "sources": self.sources.to_dict(),
             "state_management": self.state_management.to_dict(),
             "file_conversion": {
                 "max_file_size": self.file_conversion.max_file_size,
                 "conversion_timeout": self.file_conversion.conversion_timeout,
+                "max_workers": self.file_conversion.max_workers,
+                "worker_memory_limit": self.file_conversion.worker_memory_limit,
+                "cache_dir": self.file_conversion.cache_dir,
+                "cache_max_size": self.file_conversion.cache_max_size,
                 "markitdown": {
                     "enable_llm_descriptions": self.file_conversion.markitdown.enable_llm_descriptions,
                     "llm_model": self.file_conversion.markitdown.llm_model,
@@ -91,5 +167,10 @@ class GlobalConfig(BaseConfig):
                     "llm_api_key": self.file_conversion.markitdown.llm_api_key,
                 },
             },
+            "knowledge_graph": {
+                "path": self.knowledge_graph.path,
+                "min_document_frequency": self.knowledge_graph.min_document_frequency,
+                "similar_documents": self.knowledge_graph.similar_documents,
+            },
             "qdrant": self.qdrant.to_dict() if self.qdrant else None,
         }
@@ -81,6 +81,13 @@ class SemanticAnalysisConfigDict(TypedDict):
     num_topics: int
     lda_passes: int
     spacy_model: str
+    batch_size: int
+    n_process: int
+    pipeline_profile: str
+    topic_model_dir: str | None
+    min_topic_tokens: int
+    analysis_cache_size: int
+    similarity_top_k: int | None
 
 
 class MarkItDownConfigDict(TypedDict):
@@ -96,9 +103,21 @@ class FileConversionConfigDict(TypedDict):
 
     max_file_size: int
     conversion_timeout: int
+    max_workers: int
+    worker_memory_limit: int
+    cache_dir: str | None
+    cache_max_size: int
     markitdown: MarkItDownConfigDict
 
 
+class KnowledgeGraphConfigDict(TypedDict):
+    """Configuration for the precomputed knowledge graph."""
+
+    path: str | None
+    min_document_frequency: int
+    similar_documents: int
+
+
 class QdrantConfigDict(TypedDict):
     """Configuration for Qdrant vector database."""
 
@@ -116,4 +135,5 @@ class GlobalConfigDict(TypedDict):
     sources: dict[str, Any]
     state_management: dict[str, Any]
     file_conversion: FileConversionConfigDict
+    knowledge_graph: KnowledgeGraphConfigDict
     qdrant: QdrantConfigDict | None
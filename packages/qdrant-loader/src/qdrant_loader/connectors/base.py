@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import FileConversionConfig
 
+if TYPE_CHECKING:
+    from qdrant_loader.core.state.state_manager import StateManager
+
 
 class BaseConnector(ABC):
     """Base class for all connectors."""
@@ -11,6 +15,9 @@ class BaseConnector(ABC):
     def __init__(self, config: SourceConfig):
         self.config = config
         self._initialized = False
+        # URLs of documents skipped as unchanged since the last ingestion, so
+        # that they are not reported as deleted
+        self.unchanged_urls: set[str] = set()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -34,6 +41,18 @@ class BaseConnector(ABC):
         """
         pass
 
+    def set_state_manager(self, state_manager: "StateManager | None") -> None:
+        """Set the state manager holding the results of previous ingestions.
+
+        This is a default implementation that does nothing.
+        Subclasses that can skip unchanged items before fetching their content
+        should override this method.
+
+        Args:
+            state_manager: Initialized state manager, or None to disable skipping
+        """
+        return None
+
     @abstractmethod
     async def get_documents(self) -> list[Document]:
         """Get documents from the source."""
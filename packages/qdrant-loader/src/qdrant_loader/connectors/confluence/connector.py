@@ -146,6 +146,8 @@ class ConfluenceConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self.file_converter:
+            self.file_converter.close()
         self._initialized = False
 
     def _get_api_url(self, endpoint: str) -> str:
@@ -1117,6 +1119,9 @@ class ConfluenceConnector(BaseConnector):
                     )
                     raise
 
+        if self.attachment_downloader:
+            self.attachment_downloader.close()
+
         logger.info(
             f"📄 Confluence: {len(documents)} documents from space {self.config.space_key}"
         )
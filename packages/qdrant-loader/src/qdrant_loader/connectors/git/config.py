@@ -31,6 +31,9 @@ class GitRepoConfig(SourceConfig):
     max_file_size: int = Field(
         default=1048576, description="Maximum file size in bytes"
     )  # 1MB
+    max_concurrent_reads: int = Field(
+        default=8, ge=1, description="Maximum number of files processed in parallel"
+    )
     depth: int = Field(default=1, description="Depth of the repository to clone")
     token: str = Field(..., description="Authentication token for the repository")
 
@@ -1,8 +1,11 @@
 """Git repository connector implementation."""
 
+import asyncio
 import os
 import shutil
 import tempfile
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 
 from qdrant_loader.config.types import SourceType
 from qdrant_loader.connectors.base import BaseConnector
@@ -241,6 +244,8 @@ class GitConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self.file_converter:
+            self.file_converter.close()
         self._cleanup()
         self._initialized = False
 
@@ -257,6 +262,15 @@ class GitConnector(BaseConnector):
             except Exception as e:
                 self.logger.error(f"Failed to clean up temporary directory: {e}")
 
+    def _needs_conversion(self, file_path: str) -> bool:
+        """Check whether a file is converted to Markdown instead of read as text."""
+        return bool(
+            self.config.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(file_path)
+        )
+
     def _process_file(self, file_path: str) -> Document:
         """Process a single file.
 
@@ -291,12 +305,7 @@ class GitConnector(BaseConnector):
                     rel_path = os.path.basename(file_path)
 
             # Check if file needs conversion
-            needs_conversion = (
-                self.config.enable_file_conversion
-                and self.file_detector
-                and self.file_converter
-                and self.file_detector.is_supported_for_conversion(file_path)
-            )
+            needs_conversion = self._needs_conversion(file_path)
 
             if needs_conversion:
                 self.logger.debug("File needs conversion", file_path=rel_path)
@@ -396,33 +405,8 @@ class GitConnector(BaseConnector):
             Exception: If document retrieval fails
         """
         try:
-            self._ensure_initialized()
-            try:
-                files = (
-                    self.git_ops.list_files()
-                )  # This will raise ValueError if not initialized
-            except ValueError as e:
-                self.logger.error("Failed to list files", error=str(e))
-                raise ValueError("Repository not initialized") from e
-
-            documents = []
-
-            for file_path in files:
-                if not self.file_processor.should_process_file(file_path):  # type: ignore
-                    continue
-
-                try:
-                    document = self._process_file(file_path)
-                    documents.append(document)
-
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to process file", file_path=file_path, error=str(e)
-                    )
-                    continue
-
             # Return all documents that need to be processed
-            return documents
+            return [document async for document in self.iter_documents()]
 
         except ValueError as e:
             # Re-raise ValueError to maintain the error type
@@ -432,6 +416,87 @@ class GitConnector(BaseConnector):
             self.logger.error("Failed to get documents", error=str(e))
             raise
 
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documents from the repository as soon as they are processed.
+
+        The commit dates of all files are read with a single ``git log``, then
+        files are filtered and read on a bounded thread pool so that file I/O
+        and ``git`` subprocess calls overlap. Conversions started there run in
+        the worker processes of the file converter, which enforce the
+        conversion timeout.
+
+        Raises:
+            ValueError: If the repository is not initialized
+        """
+        self._ensure_initialized()
+        try:
+            files = (
+                self.git_ops.list_files()
+            )  # This will raise ValueError if not initialized
+        except ValueError as e:
+            self.logger.error("Failed to list files", error=str(e))
+            raise ValueError("Repository not initialized") from e
+
+        max_workers = max(1, self.config.max_concurrent_reads)
+        loop = asyncio.get_running_loop()
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="git-reader"
+        )
+        try:
+            # One history walk instead of two per file
+            await loop.run_in_executor(executor, self.git_ops.load_commit_dates)
+
+            # Keep a bounded window of in-flight files so memory stays flat
+            # regardless of the size of the repository.
+            pending: set[asyncio.Future] = set()
+            for file_path in files:
+                if len(pending) >= max_workers * 2:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        document = future.result()
+                        if document is not None:
+                            yield document
+                pending.add(
+                    loop.run_in_executor(
+                        executor, self._process_file_if_needed, file_path
+                    )
+                )
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    document = future.result()
+                    if document is not None:
+                        yield document
+        finally:
+            # Do not block the event loop when the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _process_file_if_needed(self, file_path: str) -> Document | None:
+        """Filter and process a single file, swallowing per-file failures.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Document instance, or None if the file is skipped or fails
+        """
+        if not self.file_processor.should_process_file(file_path):  # type: ignore
+            return None
+
+        try:
+            return self._process_file(file_path)
+        except Exception as e:
+            self.logger.error(
+                "Failed to process file", file_path=file_path, error=str(e)
+            )
+            return None
+
     def _ensure_initialized(self):
         """Ensure the repository is initialized before performing operations."""
         if not self._initialized:
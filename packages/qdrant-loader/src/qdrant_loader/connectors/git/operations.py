@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import threading
 import time
 from datetime import datetime
 
@@ -19,6 +20,12 @@ class GitOperations:
     def __init__(self):
         """Initialize Git operations."""
         self.repo = None
+        # First and last commit date by repository path, see load_commit_dates
+        self._commit_dates: dict[str, tuple[datetime, datetime]] | None = None
+        # GitPython reads commit objects through a single persistent
+        # ``git cat-file --batch`` process, which must not be shared by
+        # concurrent readers of files missing from the loaded commit dates.
+        self._history_lock = threading.Lock()
         self.logger = LoggingConfig.get_logger(__name__)
         self.logger.info("Initializing GitOperations")
 
@@ -43,6 +50,8 @@ class GitOperations:
             retry_delay (int, optional): Delay between retries in seconds. Defaults to 2.
             auth_token (Optional[str], optional): Authentication token. Defaults to None.
         """
+        self._commit_dates = None
+
         # Resolve the URL to an absolute path if it's a local path
         if os.path.exists(url):
             url = os.path.abspath(url)
@@ -179,6 +188,52 @@ class GitOperations:
             self.logger.error(f"Failed to read file {file_path}: {e}")
             raise
 
+    def load_commit_dates(self) -> None:
+        """Read the first and last commit date of every file with one ``git log``.
+
+        Afterwards, ``get_first_commit_date`` and ``get_last_commit_date`` look
+        the dates up instead of walking the history once per file, so
+        concurrent readers do not wait for each other.
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+
+        try:
+            output = self.repo.git.execute(
+                [
+                    "git",
+                    "-c",
+                    "core.quotePath=false",
+                    "log",
+                    "--format=%x00%cI",
+                    "--name-only",
+                ]
+            )
+        except GitCommandError as e:
+            self.logger.warning(
+                "Failed to read commit history, looking it up per file",
+                error=str(e),
+            )
+            return
+
+        commit_dates: dict[str, tuple[datetime, datetime]] = {}
+        committed = None
+        for line in output.splitlines():
+            if line.startswith("\x00"):
+                committed = datetime.fromisoformat(line[1:])
+            elif line and committed is not None:
+                # Commits are listed newest first
+                _, last = commit_dates.get(line, (committed, committed))
+                commit_dates[line] = (committed, last)
+        self._commit_dates = commit_dates
+        self.logger.debug("Loaded commit dates", file_count=len(commit_dates))
+
+    def _loaded_commit_dates(self, rel_path: str) -> tuple[datetime, datetime] | None:
+        """Get the loaded first and last commit date of a file, if known."""
+        if self._commit_dates is None:
+            return None
+        return self._commit_dates.get(rel_path.replace(os.sep, "/"))
+
     def get_last_commit_date(self, file_path: str) -> datetime | None:
         """Get the last commit date for a file.
 
@@ -196,20 +251,25 @@ class GitOperations:
             rel_path = os.path.relpath(file_path, self.repo.working_dir)
             self.logger.debug("Getting last commit date", file_path=rel_path)
 
+            loaded = self._loaded_commit_dates(rel_path)
+            if loaded is not None:
+                return loaded[1]
+
             # Get the last commit for the file
             try:
-                commits = list(self.repo.iter_commits(paths=rel_path, max_count=1))
-                if commits:
-                    last_commit = commits[0]
-                    self.logger.debug(
-                        "Found last commit",
-                        file_path=rel_path,
-                        commit_date=last_commit.committed_datetime,
-                        commit_hash=last_commit.hexsha,
-                    )
-                    return last_commit.committed_datetime
-                self.logger.debug("No commits found for file", file_path=rel_path)
-                return None
+                with self._history_lock:
+                    commits = list(self.repo.iter_commits(paths=rel_path, max_count=1))
+                    if commits:
+                        last_commit = commits[0]
+                        self.logger.debug(
+                            "Found last commit",
+                            file_path=rel_path,
+                            commit_date=last_commit.committed_datetime,
+                            commit_hash=last_commit.hexsha,
+                        )
+                        return last_commit.committed_datetime
+                    self.logger.debug("No commits found for file", file_path=rel_path)
+                    return None
             except GitCommandError as e:
                 self.logger.warning(
                     "Failed to get commits for file",
@@ -261,23 +321,30 @@ class GitOperations:
             rel_path = os.path.relpath(file_path, self.repo.working_dir)
             self.logger.debug("Getting creation date", file_path=rel_path)
 
+            loaded = self._loaded_commit_dates(rel_path)
+            if loaded is not None:
+                return loaded[0]
+
             # Get the first commit for the file
             try:
                 # Use git log with --reverse to get commits in chronological order
-                commits = list(
-                    self.repo.iter_commits(paths=rel_path, reverse=True, max_count=1)
-                )
-                if commits:
-                    first_commit = commits[0]
-                    self.logger.debug(
-                        "Found first commit",
-                        file_path=rel_path,
-                        commit_date=first_commit.committed_datetime,
-                        commit_hash=first_commit.hexsha,
+                with self._history_lock:
+                    commits = list(
+                        self.repo.iter_commits(
+                            paths=rel_path, reverse=True, max_count=1
+                        )
                     )
-                    return first_commit.committed_datetime
-                self.logger.debug("No commits found for file", file_path=rel_path)
-                return None
+                    if commits:
+                        first_commit = commits[0]
+                        self.logger.debug(
+                            "Found first commit",
+                            file_path=rel_path,
+                            commit_date=first_commit.committed_datetime,
+                            commit_hash=first_commit.hexsha,
+                        )
+                        return first_commit.committed_datetime
+                    self.logger.debug("No commits found for file", file_path=rel_path)
+                    return None
             except GitCommandError as e:
                 self.logger.warning(
                     "Failed to get commits for file",
@@ -153,6 +153,8 @@ class JiraConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self.file_converter:
+            self.file_converter.close()
         self._initialized = False
 
     def _get_api_url(self, endpoint: str) -> str:
@@ -682,4 +684,7 @@ class JiraConnector(BaseConnector):
                         processed_count=len(attachment_documents),
                     )
 
+        if self.attachment_downloader:
+            self.attachment_downloader.close()
+
         return documents
@@ -22,6 +22,13 @@ class LocalFileConfig(SourceConfig):
     max_file_size: int = Field(
         default=1048576, description="Maximum file size in bytes"
     )
+    max_concurrent_reads: int = Field(
+        default=8, ge=1, description="Maximum number of files read in parallel"
+    )
+    skip_unchanged_files: bool = Field(
+        default=True,
+        description="Skip files not modified since their last successful ingestion",
+    )
 
     @field_validator("base_url")
     @classmethod
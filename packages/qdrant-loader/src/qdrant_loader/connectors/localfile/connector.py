@@ -1,5 +1,9 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
 from qdrant_loader.connectors.base import BaseConnector
@@ -16,6 +20,9 @@ from .config import LocalFileConfig
 from .file_processor import LocalFileFileProcessor
 from .metadata_extractor import LocalFileMetadataExtractor
 
+if TYPE_CHECKING:
+    from qdrant_loader.core.state.state_manager import StateManager
+
 
 class LocalFileConnector(BaseConnector):
     """Connector for ingesting local files."""
@@ -29,6 +36,7 @@ class LocalFileConnector(BaseConnector):
         self.file_processor = LocalFileFileProcessor(config, self.base_path)
         self.metadata_extractor = LocalFileMetadataExtractor(self.base_path)
         self.logger = LoggingConfig.get_logger(__name__)
+        self.state_manager: StateManager | None = None
         self._initialized = True
 
         # Initialize file conversion components if enabled
@@ -68,6 +76,12 @@ class LocalFileConnector(BaseConnector):
 
         return path
 
+    async def __aexit__(self, exc_type, exc_val, _exc_tb):
+        """Async context manager exit."""
+        if self.file_converter:
+            self.file_converter.close()
+        await super().__aexit__(exc_type, exc_val, _exc_tb)
+
     def set_file_conversion_config(self, file_conversion_config: FileConversionConfig):
         """Set file conversion configuration from global config.
 
@@ -78,108 +92,260 @@ class LocalFileConnector(BaseConnector):
             self.file_converter = FileConverter(file_conversion_config)
             self.logger.debug("File converter initialized with global config")
 
+    def set_state_manager(self, state_manager: "StateManager | None") -> None:
+        """Set the state manager used to skip files unchanged since the last run.
+
+        Args:
+            state_manager: Initialized state manager, or None to disable pre-filtering
+        """
+        self.state_manager = state_manager
+
     async def get_documents(self) -> list[Document]:
         """Get all documents from the local file source."""
-        documents = []
-        for root, _, files in os.walk(self.base_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not self.file_processor.should_process_file(file_path):
-                    continue
-                try:
-                    # Get relative path from base directory
-                    rel_path = os.path.relpath(file_path, self.base_path)
-
-                    # Check if file needs conversion
-                    needs_conversion = (
-                        self.config.enable_file_conversion
-                        and self.file_detector
-                        and self.file_converter
-                        and self.file_detector.is_supported_for_conversion(file_path)
+        return [document async for document in self.iter_documents()]
+
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documents from the local file source as soon as they are read.
+
+        Files are discovered with ``os.scandir``, files whose modification time
+        is not newer than their recorded state are skipped before any content
+        is read, and the remaining files are read and processed on a bounded
+        thread pool. Conversions started there run in the worker processes of
+        the file converter, which enforce the conversion timeout.
+        """
+        self.unchanged_urls = set()
+        known_states = await self._load_known_states()
+        max_workers = max(1, self.config.max_concurrent_reads)
+        loop = asyncio.get_running_loop()
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="localfile-reader"
+        )
+        try:
+            file_paths = await loop.run_in_executor(
+                executor, self._scan_files, known_states
+            )
+            self.logger.debug(
+                "Scanned local files",
+                candidate_count=len(file_paths),
+                known_state_count=len(known_states),
+            )
+
+            # Keep a bounded window of in-flight reads so memory stays flat
+            # regardless of the number of files in the tree.
+            pending: set[asyncio.Future] = set()
+            for file_path in file_paths:
+                if len(pending) >= max_workers * 2:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
                     )
+                    for future in done:
+                        document = future.result()
+                        if document is not None:
+                            yield document
+                pending.add(
+                    loop.run_in_executor(executor, self._process_file, file_path)
+                )
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    document = future.result()
+                    if document is not None:
+                        yield document
+        finally:
+            # Do not block the event loop when the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _load_known_states(self) -> dict[str, float]:
+        """Load the last recorded update time of each document of this source.
+
+        Returns:
+            Mapping of document URL to the POSIX timestamp of its last state update
+        """
+        if self.state_manager is None or not self.config.skip_unchanged_files:
+            return {}
+        try:
+            records = await self.state_manager.get_document_state_records(self.config)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to load document states, reading all files",
+                error=str(e),
+            )
+            return {}
+        return {
+            str(record.url): record.updated_at.timestamp()
+            for record in records
+            if not record.is_deleted and record.updated_at is not None
+        }
+
+    def _scan_files(self, known_states: dict[str, float]) -> list[str]:
+        """Walk the base path and return the files that need to be read.
 
-                    if needs_conversion:
-                        self.logger.debug(
-                            "File needs conversion",
-                            file_path=rel_path.replace("\\", "/"),
-                        )
+        Args:
+            known_states: Mapping of document URL to last state update timestamp
+
+        Returns:
+            List of file paths that pass the include/exclude filters and are new
+            or modified since their last ingestion
+        """
+        file_paths: list[str] = []
+        skipped = 0
+        directories = [self.base_path]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
                         try:
-                            # Convert file to markdown
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.convert_file(file_path)
-                            content_type = "md"  # Converted files are markdown
-                            conversion_method = "markitdown"
-                            conversion_failed = False
-                            self.logger.info(
-                                "File conversion successful",
-                                file_path=rel_path.replace("\\", "/"),
-                            )
-                        except FileConversionError as e:
-                            self.logger.warning(
-                                "File conversion failed, creating fallback document",
-                                file_path=rel_path.replace("\\", "/"),
+                            if entry.is_dir(follow_symlinks=False):
+                                directories.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            # Filter first, so that files a configuration change
+                            # excludes are not reported as unchanged and get deleted
+                            if not self.file_processor.should_process_file(entry.path):
+                                continue
+                            if known_states and self._is_unchanged(entry, known_states):
+                                self.unchanged_urls.add(self._file_url(entry.path))
+                                skipped += 1
+                                continue
+                        except OSError as e:
+                            self.logger.debug(
+                                "Failed to stat file",
+                                file_path=entry.path.replace("\\", "/"),
                                 error=str(e),
                             )
-                            # Create fallback document
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.create_fallback_document(
-                                file_path, e
-                            )
-                            content_type = "md"  # Fallback is also markdown
-                            conversion_method = "markitdown_fallback"
-                            conversion_failed = True
-                    else:
-                        # Read file content normally
-                        with open(file_path, encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-                        # Get file extension without the dot
-                        content_type = os.path.splitext(file)[1].lower().lstrip(".")
-                        conversion_method = None
-                        conversion_failed = False
-
-                    # Get file modification time
-                    file_mtime = os.path.getmtime(file_path)
-                    updated_at = datetime.fromtimestamp(file_mtime, tz=UTC)
-
-                    metadata = self.metadata_extractor.extract_all_metadata(
-                        file_path, content
-                    )
+                            continue
+                        file_paths.append(entry.path)
+            except OSError as e:
+                self.logger.warning(
+                    "Failed to scan directory",
+                    directory=directory.replace("\\", "/"),
+                    error=str(e),
+                )
 
-                    # Add file conversion metadata if applicable
-                    if needs_conversion:
-                        metadata.update(
-                            {
-                                "conversion_method": conversion_method,
-                                "conversion_failed": conversion_failed,
-                                "original_file_type": os.path.splitext(file)[1]
-                                .lower()
-                                .lstrip("."),
-                            }
-                        )
-
-                    self.logger.debug(
-                        f"Processed local file: {rel_path.replace('\\', '/')}"
-                    )
+        if skipped:
+            self.logger.info(
+                f"Skipped {skipped} unchanged local files", source=self.config.source
+            )
+        return file_paths
+
+    def _is_unchanged(self, entry: os.DirEntry, known_states: dict[str, float]) -> bool:
+        """Check whether a file was not modified since its state was last recorded."""
+        last_update = known_states.get(self._file_url(entry.path))
+        if last_update is None:
+            return False
+        return entry.stat().st_mtime <= last_update
+
+    @staticmethod
+    def _file_url(file_path: str) -> str:
+        """Build the document URL of a file, with forward slashes on all platforms."""
+        normalized_path = os.path.realpath(file_path).replace("\\", "/")
+        return f"file://{normalized_path}"
+
+    def _needs_conversion(self, file_path: str) -> bool:
+        """Check whether a file is converted to Markdown instead of read as text."""
+        return bool(
+            self.config.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(file_path)
+        )
+
+    def _process_file(self, file_path: str) -> Document | None:
+        """Read and process a single file.
+
+        Args:
+            file_path: Path to the file
 
-                    # Create consistent URL with forward slashes for cross-platform compatibility
-                    normalized_path = os.path.realpath(file_path).replace("\\", "/")
-                    doc = Document(
-                        title=os.path.basename(file_path),
-                        content=content,
-                        content_type=content_type,
-                        metadata=metadata,
-                        source_type="localfile",
-                        source=self.config.source,
-                        url=f"file://{normalized_path}",
-                        is_deleted=False,
-                        updated_at=updated_at,
+        Returns:
+            Document for the file, or None if it fails
+        """
+        file = os.path.basename(file_path)
+        try:
+            # Get relative path from base directory
+            rel_path = os.path.relpath(file_path, self.base_path)
+
+            # Check if file needs conversion
+            needs_conversion = self._needs_conversion(file_path)
+
+            if needs_conversion:
+                self.logger.debug(
+                    "File needs conversion",
+                    file_path=rel_path.replace("\\", "/"),
+                )
+                try:
+                    # Convert file to markdown
+                    assert self.file_converter is not None  # Type checker hint
+                    content = self.file_converter.convert_file(file_path)
+                    content_type = "md"  # Converted files are markdown
+                    conversion_method = "markitdown"
+                    conversion_failed = False
+                    self.logger.info(
+                        "File conversion successful",
+                        file_path=rel_path.replace("\\", "/"),
                     )
-                    documents.append(doc)
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to process file",
-                        file_path=file_path.replace("\\", "/"),
+                except FileConversionError as e:
+                    self.logger.warning(
+                        "File conversion failed, creating fallback document",
+                        file_path=rel_path.replace("\\", "/"),
                         error=str(e),
                     )
-                    continue
-        return documents
+                    # Create fallback document
+                    assert self.file_converter is not None  # Type checker hint
+                    content = self.file_converter.create_fallback_document(file_path, e)
+                    content_type = "md"  # Fallback is also markdown
+                    conversion_method = "markitdown_fallback"
+                    conversion_failed = True
+            else:
+                # Read file content normally
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                # Get file extension without the dot
+                content_type = os.path.splitext(file)[1].lower().lstrip(".")
+                conversion_method = None
+                conversion_failed = False
+
+            # Get file modification time
+            file_mtime = os.path.getmtime(file_path)
+            updated_at = datetime.fromtimestamp(file_mtime, tz=UTC)
+
+            metadata = self.metadata_extractor.extract_all_metadata(file_path, content)
+
+            # Add file conversion metadata if applicable
+            if needs_conversion:
+                metadata.update(
+                    {
+                        "conversion_method": conversion_method,
+                        "conversion_failed": conversion_failed,
+                        "original_file_type": os.path.splitext(file)[1]
+                        .lower()
+                        .lstrip("."),
+                    }
+                )
+
+            self.logger.debug(f"Processed local file: {rel_path.replace('\\', '/')}")
+
+            doc = Document(
+                title=os.path.basename(file_path),
+                content=content,
+                content_type=content_type,
+                metadata=metadata,
+                source_type="localfile",
+                source=self.config.source,
+                url=self._file_url(file_path),
+                is_deleted=False,
+                updated_at=updated_at,
+            )
+            return doc
+        except Exception as e:
+            self.logger.error(
+                "Failed to process file",
+                file_path=file_path.replace("\\", "/"),
+                error=str(e),
+            )
+            return None
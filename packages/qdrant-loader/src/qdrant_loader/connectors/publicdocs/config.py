@@ -38,6 +38,30 @@ class PublicDocsSourceConfig(SourceConfig):
         description="CSS selectors for content extraction",
     )
 
+    # Crawling
+    max_concurrent_requests: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum number of concurrent HTTP requests per host",
+    )
+    crawl_depth: int = Field(
+        default=1,
+        ge=1,
+        description="Link depth to follow from the base URL (1 = pages linked from the base page)",
+    )
+    use_sitemap: bool = Field(
+        default=False,
+        description="Seed the crawl with the URLs listed in the sitemap",
+    )
+    sitemap_url: str | None = Field(
+        default=None,
+        description="Sitemap location (defaults to sitemap.xml under the base URL)",
+    )
+    conditional_requests: bool = Field(
+        default=True,
+        description="Send ETag/If-Modified-Since validators so unchanged pages are not re-fetched",
+    )
+
     # Attachment handling
     download_attachments: bool = Field(
         default=False,
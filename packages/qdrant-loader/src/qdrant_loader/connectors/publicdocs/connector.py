@@ -1,15 +1,19 @@
 """Public documentation connector implementation."""
 
+import asyncio
 import fnmatch
+import json
 import logging
 import warnings
 from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import cast
+from typing import TYPE_CHECKING, cast
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+from defusedxml import ElementTree
 
 from qdrant_loader.connectors.base import BaseConnector
 from qdrant_loader.connectors.exceptions import (
@@ -31,6 +35,9 @@ from qdrant_loader.core.file_conversion import (
 )
 from qdrant_loader.utils.logging import LoggingConfig
 
+if TYPE_CHECKING:
+    from qdrant_loader.core.state.state_manager import StateManager
+
 # Suppress XML parsing warning
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
@@ -38,6 +45,21 @@ warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 logger = LoggingConfig.get_logger(__name__)
 
 
+@dataclass
+class _FetchedPage:
+    """Result of a single HTTP fetch of a documentation page."""
+
+    url: str
+    status: int
+    html: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
 class PublicDocsConnector(BaseConnector):
     """Connector for public documentation sources."""
 
@@ -56,6 +78,23 @@ class PublicDocsConnector(BaseConnector):
         self.url_queue = deque()
         self.visited_urls = set()
         self.version = config.version
+        self.state_manager: StateManager | None = None
+        self._request_semaphore: asyncio.Semaphore | None = None
+        # Each URL is fetched at most once per run; concurrent callers share the task
+        self._fetch_tasks: dict[str, asyncio.Task[_FetchedPage]] = {}
+        # Results of pages already parsed during discovery, consumed once
+        self._processed_pages: dict[str, tuple[str | None, str | None]] = {}
+        self._page_attachments: dict[str, list[AttachmentMetadata]] = {}
+        # Validators sent with conditional requests / received from responses
+        self._known_validators: dict[str, tuple[str | None, str | None]] = {}
+        self._response_validators: dict[str, tuple[str | None, str | None]] = {}
+        self._not_modified_urls: set[str] = set()
+        # Links found on pages, stored so that the links of pages answered
+        # with 304 are still crawled
+        self._known_links: dict[str, list[str]] = {}
+        self._page_links: dict[str, list[str]] = {}
+        # URLs of the attachments ingested with each page
+        self._known_attachment_urls: dict[str, list[str]] = {}
         self.logger.debug(
             "Initialized PublicDocsConnector",
             base_url=self.base_url,
@@ -76,7 +115,14 @@ class PublicDocsConnector(BaseConnector):
     async def __aenter__(self):
         """Async context manager entry."""
         if not self._initialized:
-            self._client = aiohttp.ClientSession()
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.config.max_concurrent_requests
+                )
+            )
+            self._request_semaphore = asyncio.Semaphore(
+                self.config.max_concurrent_requests
+            )
             self._initialized = True
 
             # Initialize attachment downloader with aiohttp session if needed
@@ -91,10 +137,17 @@ class PublicDocsConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self.attachment_downloader:
+            self.attachment_downloader.close()
+        if self.file_converter:
+            self.file_converter.close()
         if self._initialized and self._client:
             await self._client.close()
             self._client = None
             self._initialized = False
+        self._fetch_tasks.clear()
+        self._processed_pages.clear()
+        self._page_attachments.clear()
 
     @property
     def client(self) -> aiohttp.ClientSession:
@@ -125,6 +178,15 @@ class PublicDocsConnector(BaseConnector):
                     max_attachment_size=config.max_file_size,
                 )
 
+    def set_state_manager(self, state_manager: "StateManager | None") -> None:
+        """Set the state manager used to store and send HTTP validators.
+
+        Args:
+            state_manager: Initialized state manager, or None to disable
+                conditional requests
+        """
+        self.state_manager = state_manager
+
     def _should_process_url(self, url: str) -> bool:
         """Check if a URL should be processed based on configuration."""
         self.logger.debug(f"Checking if URL should be processed: {url}")
@@ -164,12 +226,17 @@ class PublicDocsConnector(BaseConnector):
     async def get_documents(self) -> list[Document]:
         """Get documentation pages from the source.
 
+        Pages are crawled concurrently (bounded by ``max_concurrent_requests``)
+        and each URL is fetched and parsed at most once. When a state manager is
+        available, pages unchanged since the last successful ingestion are
+        answered with ``304 Not Modified`` and skipped; the links stored with
+        them are still crawled.
+
         Returns:
             List of documents
 
         Raises:
             RuntimeError: If connector is not initialized
-            RuntimeError: If change detector is not initialized
         """
         if not self._initialized:
             raise RuntimeError(
@@ -177,103 +244,38 @@ class PublicDocsConnector(BaseConnector):
             )
 
         try:
+            await self._load_http_validators()
+
             # Get all pages
             pages = await self._get_all_pages()
             self.logger.debug(f"Found {len(pages)} pages to process", pages=pages)
             documents = []
 
-            for page in pages:
-                try:
-                    if not self._should_process_url(page):
-                        self.logger.debug("Skipping URL", url=page)
-                        continue
-
-                    self.logger.debug("Processing URL", url=page)
-
-                    content, title = await self._process_page(page)
-                    if (
-                        content and content.strip()
-                    ):  # Only add documents with non-empty content
-                        # Generate a consistent document ID based on the URL
-                        doc_id = str(hash(page))  # Use URL hash as document ID
-                        doc = Document(
-                            id=doc_id,
-                            title=title,
-                            content=content,
-                            content_type="html",
-                            metadata={
-                                "title": title,
-                                "url": page,
-                                "version": self.version,
-                            },
-                            source_type=self.config.source_type,
-                            source=self.config.source,
-                            url=page,
-                            # For public docs, we don't have a created or updated date. So we use a very old date.
-                            # The content hash will be the same for the same page, so it will be update if the hash changes.
-                            created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                            updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                        )
-                        self.logger.debug(
-                            "Created document",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-                        documents.append(doc)
-                        self.logger.debug(
-                            "Document created",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-
-                        # Process attachments if enabled
-                        if (
-                            self.config.download_attachments
-                            and self.attachment_downloader
-                        ):
-                            # We need to get the HTML again to extract attachments
-                            try:
-                                response = await self.client.get(page)
-                                html = await response.text()
-                                attachment_metadata = self._extract_attachments(
-                                    html, page, doc_id
-                                )
-
-                                if attachment_metadata:
-                                    self.logger.info(
-                                        "Processing attachments for PublicDocs page",
-                                        page_url=page,
-                                        attachment_count=len(attachment_metadata),
-                                    )
-
-                                    attachment_documents = await self.attachment_downloader.download_and_process_attachments(
-                                        attachment_metadata, doc
-                                    )
-                                    documents.extend(attachment_documents)
-
-                                    self.logger.debug(
-                                        "Processed attachments for PublicDocs page",
-                                        page_url=page,
-                                        processed_count=len(attachment_documents),
-                                    )
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Failed to process attachments for page {page}: {e}"
-                                )
-                                # Continue processing even if attachment processing fails
-                    else:
-                        self.logger.warning(
-                            "Skipping page with empty content",
-                            url=page,
-                            title=title,
-                        )
-                except Exception as e:
-                    self.logger.error(f"Failed to process page {page}: {e}")
-                    continue
+            depth = 1
+            while pages:
+                self.visited_urls.update(pages)
+                results = await asyncio.gather(
+                    *(self._get_page_documents(page) for page in pages)
+                )
+                for page_documents in results:
+                    documents.extend(page_documents)
+
+                if depth >= self.config.crawl_depth:
+                    break
+                depth += 1
+                pages = self._drain_url_queue()
+
+            if self._not_modified_urls:
+                self.logger.info(
+                    f"Skipped {len(self._not_modified_urls)} unchanged pages",
+                    source=self.config.source,
+                )
+                # Skipped pages and their attachments are unchanged, not deleted
+                for url in self._not_modified_urls:
+                    self.unchanged_urls.add(url)
+                    self.unchanged_urls.update(self._known_attachment_urls.get(url, []))
+
+            await self._save_http_validators(documents)
 
             if not documents:
                 self.logger.warning("No valid documents found to process")
@@ -285,11 +287,272 @@ class PublicDocsConnector(BaseConnector):
             self.logger.error("Failed to get documentation", error=str(e))
             raise
 
+    def _drain_url_queue(self) -> list[str]:
+        """Return the unique, not yet visited crawlable URLs queued so far."""
+        pages: list[str] = []
+        seen: set[str] = set()
+        while self.url_queue:
+            url = self.url_queue.popleft()
+            if url in seen or url in self.visited_urls:
+                continue
+            seen.add(url)
+            if self._is_crawlable_url(url):
+                pages.append(url)
+        return pages
+
+    def _generate_document_id(self, url: str) -> str:
+        """Generate the document ID of a page or attachment.
+
+        The ID only depends on the source and the URL so that it is stable
+        across runs and processes.
+        """
+        return Document.generate_id(self.config.source_type, self.config.source, url)
+
+    async def _get_page_documents(self, page: str) -> list[Document]:
+        """Build the document of a page and of its attachments.
+
+        Failures are logged and result in an empty list so that one broken page
+        does not abort the crawl.
+        """
+        documents: list[Document] = []
+        try:
+            if not self._should_process_url(page):
+                self.logger.debug("Skipping URL", url=page)
+                return documents
+
+            self.logger.debug("Processing URL", url=page)
+
+            content, title = await self._process_page(page)
+            if page in self._not_modified_urls:
+                self.logger.debug("Page not modified since last ingestion", url=page)
+                return documents
+
+            if not (content and content.strip()):
+                self.logger.warning(
+                    "Skipping page with empty content",
+                    url=page,
+                    title=title,
+                )
+                return documents
+
+            # Generate a consistent document ID based on the URL
+            doc_id = self._generate_document_id(page)
+            doc = Document(
+                id=doc_id,
+                title=title,
+                content=content,
+                content_type="html",
+                metadata={
+                    "title": title,
+                    "url": page,
+                    "version": self.version,
+                },
+                source_type=self.config.source_type,
+                source=self.config.source,
+                url=page,
+                # For public docs, we don't have a created or updated date. So we use a very old date.
+                # The content hash will be the same for the same page, so it will be update if the hash changes.
+                created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+                updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+            )
+            self.logger.debug(
+                "Document created",
+                url=page,
+                content_length=len(content),
+                title=title,
+                doc_id=doc_id,
+            )
+            documents.append(doc)
+
+            # Process attachments found while parsing the page
+            attachment_metadata = self._page_attachments.pop(page, [])
+            if (
+                attachment_metadata
+                and self.config.download_attachments
+                and self.attachment_downloader
+            ):
+                try:
+                    self.logger.info(
+                        "Processing attachments for PublicDocs page",
+                        page_url=page,
+                        attachment_count=len(attachment_metadata),
+                    )
+
+                    attachment_documents = await self.attachment_downloader.download_and_process_attachments(
+                        attachment_metadata, doc
+                    )
+                    # Attachment URLs only differ from the page URL by their
+                    # fragment, which Document.generate_id ignores, so use the
+                    # ID derived from the download URL instead
+                    for attachment_doc in attachment_documents:
+                        attachment_doc.id = attachment_doc.metadata["attachment_id"]
+                    documents.extend(attachment_documents)
+
+                    self.logger.debug(
+                        "Processed attachments for PublicDocs page",
+                        page_url=page,
+                        processed_count=len(attachment_documents),
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to process attachments for page {page}: {e}"
+                    )
+                    # Continue processing even if attachment processing fails
+        except Exception as e:
+            self.logger.error(f"Failed to process page {page}: {e}")
+
+        return documents
+
+    async def _load_http_validators(self) -> None:
+        """Load the validators and links of pages whose fetched version was ingested."""
+        self._known_validators = {}
+        self._known_links = {}
+        self._known_attachment_urls = {}
+        if self.state_manager is None or not self.config.conditional_requests:
+            return
+        try:
+            document_states = await self.state_manager.get_document_state_records(
+                self.config
+            )
+            cache_records = await self.state_manager.get_http_cache_records(self.config)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to load HTTP validators, fetching all pages", error=str(e)
+            )
+            return
+
+        ingested_hashes = {
+            str(record.url): record.content_hash
+            for record in document_states
+            if not record.is_deleted
+        }
+        urls_by_document_id = {
+            record.document_id: str(record.url) for record in document_states
+        }
+        for record in document_states:
+            parent_url = urls_by_document_id.get(record.parent_document_id)
+            if record.is_attachment and not record.is_deleted and parent_url:
+                self._known_attachment_urls.setdefault(parent_url, []).append(
+                    str(record.url)
+                )
+        # Only trust validators whose response produced the document that is
+        # currently stored, so a failed ingestion is retried with a full fetch.
+        for record in cache_records:
+            url = str(record.url)
+            if ingested_hashes.get(url) == record.content_hash:
+                self._known_validators[url] = (
+                    cast(str | None, record.etag),
+                    cast(str | None, record.last_modified),
+                )
+                if isinstance(record.links, str):
+                    self._known_links[url] = json.loads(record.links)
+
+    async def _save_http_validators(self, documents: list[Document]) -> None:
+        """Store the validators of the pages fetched during this run."""
+        if self.state_manager is None or not self.config.conditional_requests:
+            return
+
+        entries: list[dict[str, str | None]] = []
+        for document in documents:
+            validators = self._response_validators.get(document.url)
+            if not validators or not any(validators):
+                continue
+            etag, last_modified = validators
+            entries.append(
+                {
+                    "url": document.url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_hash": document.content_hash,
+                    "links": json.dumps(self._page_links.get(document.url, [])),
+                }
+            )
+
+        try:
+            await self.state_manager.update_http_cache_records(self.config, entries)
+        except Exception as e:
+            self.logger.warning("Failed to store HTTP validators", error=str(e))
+
+    async def _fetch_page(self, url: str, conditional: bool = True) -> _FetchedPage:
+        """Fetch a page, sharing the request with concurrent callers.
+
+        Args:
+            url: URL of the page
+            conditional: Whether stored validators may be sent with the request
+
+        Raises:
+            HTTPRequestError: If the HTTP request fails
+        """
+        task = self._fetch_tasks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._do_fetch_page(url, conditional))
+            self._fetch_tasks[url] = task
+        try:
+            return await asyncio.shield(task)
+        except HTTPRequestError:
+            # Allow a later caller to retry a failed fetch
+            self._fetch_tasks.pop(url, None)
+            raise
+
+    async def _do_fetch_page(self, url: str, conditional: bool) -> _FetchedPage:
+        """Perform the HTTP request for a page."""
+        headers: dict[str, str] = {}
+        if conditional and url in self._known_validators:
+            etag, last_modified = self._known_validators[url]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        self.logger.debug("Making HTTP request", url=url, conditional=bool(headers))
+        semaphore = self._request_semaphore or asyncio.Semaphore(
+            self.config.max_concurrent_requests
+        )
+        async with semaphore:
+            try:
+                if headers:
+                    response = await self.client.get(url, headers=headers)
+                else:
+                    response = await self.client.get(url)
+                response.raise_for_status()  # This is a synchronous method, no need to await
+            except aiohttp.ClientError as e:
+                raise HTTPRequestError(url=url, message=str(e)) from e
+
+            self.logger.debug(
+                "HTTP request successful", url=url, status_code=response.status
+            )
+
+            if response.status == 304:
+                response.release()
+                return _FetchedPage(url=url, status=304)
+
+            html = await response.text()
+            return _FetchedPage(
+                url=url,
+                status=response.status,
+                html=html,
+                etag=self._get_header(response, "ETag"),
+                last_modified=self._get_header(response, "Last-Modified"),
+            )
+
+    @staticmethod
+    def _get_header(response: aiohttp.ClientResponse, name: str) -> str | None:
+        """Get a response header value, if present."""
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+        value = headers.get(name)
+        return value if isinstance(value, str) else None
+
     async def _process_page(self, url: str) -> tuple[str | None, str | None]:
         """Process a single documentation page.
 
+        The page is fetched once and parsed once; links, title, attachments and
+        content are all extracted from the same tree.
+
         Returns:
-            tuple[str | None, str | None]: A tuple containing (content, title)
+            tuple[str | None, str | None]: A tuple containing (content, title);
+            both are None when the page was not modified since the last run
 
         Raises:
             ConnectorNotInitializedError: If connector is not initialized
@@ -303,36 +566,44 @@ class PublicDocsConnector(BaseConnector):
                     "Connector not initialized. Use async context manager."
                 )
 
-            self.logger.debug("Making HTTP request", url=url)
-            try:
-                response = await self.client.get(url)
-                response.raise_for_status()  # This is a synchronous method, no need to await
-            except aiohttp.ClientError as e:
-                raise HTTPRequestError(url=url, message=str(e)) from e
+            if url in self._processed_pages:
+                return self._processed_pages.pop(url)
 
-            self.logger.debug(
-                "HTTP request successful", url=url, status_code=response.status
-            )
+            page = await self._fetch_page(url)
+            self._fetch_tasks.pop(url, None)
+            if page.not_modified:
+                self._not_modified_urls.add(url)
+                self._queue_links(self._known_links.get(url, []))
+                return None, None
+            self._response_validators[url] = (page.etag, page.last_modified)
 
             try:
+                html = page.html or ""
+                soup = BeautifulSoup(html, "html.parser")
+
                 # Extract links for crawling
                 self.logger.debug("Extracting links from page", url=url)
-                html = await response.text()
-                links = self._extract_links(html, url)
+                links = self._extract_links(soup, url)
                 self.logger.info(
                     "Adding new links to queue", url=url, new_links=len(links)
                 )
-                for link in links:
-                    if link not in self.visited_urls:
-                        self.url_queue.append(link)
+                self._page_links[url] = links
+                self._queue_links(links)
 
                 # Extract title from raw HTML
-                title = self._extract_title(html)
+                title = self._extract_title(soup)
                 self.logger.debug("Extracted title", url=url, title=title)
 
+                # Attachments are collected before content extraction strips
+                # navigation and other removable elements from the tree
+                if self.config.download_attachments:
+                    self._page_attachments[url] = self._extract_attachments(
+                        soup, url, self._generate_document_id(url)
+                    )
+
                 if self.config.content_type == "html":
                     self.logger.debug("Processing Page", url=url)
-                    content = self._extract_content(html)
+                    content = self._extract_content(soup)
                     self.logger.debug(
                         "HTML content processed",
                         url=url,
@@ -363,12 +634,23 @@ class PublicDocsConnector(BaseConnector):
                 f"Unexpected error processing page {url}: {e!s}"
             ) from e
 
-    def _extract_links(self, html: str, current_url: str) -> list[str]:
-        """Extract all links from the HTML content."""
-        self.logger.debug(
-            "Starting link extraction", current_url=current_url, html_length=len(html)
-        )
-        soup = BeautifulSoup(html, "html.parser")
+    def _queue_links(self, links: list[str]) -> None:
+        """Queue the links that were not visited yet for crawling."""
+        for link in links:
+            if link not in self.visited_urls:
+                self.url_queue.append(link)
+
+    @staticmethod
+    def _parse_html(html: str | BeautifulSoup) -> BeautifulSoup:
+        """Return a parsed tree, parsing only if a raw string is given."""
+        if isinstance(html, BeautifulSoup):
+            return html
+        return BeautifulSoup(html, "html.parser")
+
+    def _extract_links(self, html: str | BeautifulSoup, current_url: str) -> list[str]:
+        """Extract all links from the HTML content or an already parsed tree."""
+        self.logger.debug("Starting link extraction", current_url=current_url)
+        soup = self._parse_html(html)
         links = []
 
         for link in soup.find_all("a", href=True):
@@ -388,11 +670,14 @@ class PublicDocsConnector(BaseConnector):
         self.logger.debug("Link extraction completed", total_links=len(links))
         return links
 
-    def _extract_content(self, html: str) -> str:
-        """Extract the main content from HTML using configured selectors."""
-        self.logger.debug("Starting content extraction", html_length=len(html))
-        self.logger.debug("HTML content preview", preview=html[:1000])
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_content(self, html: str | BeautifulSoup) -> str:
+        """Extract the main content from HTML using configured selectors.
+
+        When a parsed tree is given, it is modified in place (removed elements
+        are decomposed), so this must be the last extraction run on it.
+        """
+        self.logger.debug("Starting content extraction")
+        soup = self._parse_html(html)
         self.logger.debug("HTML parsed successfully")
 
         # Log the selectors being used
@@ -423,8 +708,6 @@ class PublicDocsConnector(BaseConnector):
                 "Could not find main content using selector",
                 selector=self.config.selectors.content,
             )
-            # Log the first 1000 characters of the HTML to help debug
-            self.logger.debug("HTML content preview", preview=html[:1000])
             return ""
 
         self.logger.debug(
@@ -453,18 +736,16 @@ class PublicDocsConnector(BaseConnector):
         )
         return extracted_text
 
-    def _extract_title(self, html: str) -> str:
-        """Extract the title from HTML content."""
-        self.logger.debug("Starting title extraction", html_length=len(html))
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_title(self, html: str | BeautifulSoup) -> str:
+        """Extract the title from HTML content or an already parsed tree."""
+        self.logger.debug("Starting title extraction")
+        soup = self._parse_html(html)
 
         # Production logging: Log title extraction process without verbose HTML content
-        title_tags = soup.find_all("title")
         if logging.getLogger().isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 "Found title tags during HTML parsing",
-                count=len(title_tags),
-                html_length=len(html),
+                count=len(soup.find_all("title")),
             )
 
         # First try to find the title in head/title
@@ -499,12 +780,12 @@ class PublicDocsConnector(BaseConnector):
         return default_title
 
     def _extract_attachments(
-        self, html: str, page_url: str, document_id: str
+        self, html: str | BeautifulSoup, page_url: str, document_id: str
     ) -> list[AttachmentMetadata]:
         """Extract attachment links from HTML content.
 
         Args:
-            html: HTML content to parse
+            html: HTML content or an already parsed tree
             page_url: URL of the current page
             document_id: ID of the parent document
 
@@ -515,7 +796,7 @@ class PublicDocsConnector(BaseConnector):
             return []
 
         self.logger.debug("Starting attachment extraction", page_url=page_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse_html(html)
         attachments = []
 
         # Use configured selectors to find attachment links
@@ -543,7 +824,7 @@ class PublicDocsConnector(BaseConnector):
 
                 # Create attachment metadata
                 attachment = AttachmentMetadata(
-                    id=f"{document_id}_{len(attachments)}",  # Simple ID generation
+                    id=self._generate_document_id(absolute_url),
                     filename=filename,
                     size=0,  # We don't know the size until we download
                     mime_type=mime_type,
@@ -590,9 +871,24 @@ class PublicDocsConnector(BaseConnector):
         }
         return mime_types.get(extension, "application/octet-stream")
 
+    def _is_crawlable_url(self, url: str) -> bool:
+        """Check whether a discovered URL is within the crawl scope."""
+        return (
+            url.startswith(str(self.config.base_url))
+            and not any(exclude in url for exclude in self.config.exclude_paths)
+            and (
+                not self.config.path_pattern
+                or fnmatch.fnmatch(url, self.config.path_pattern)
+            )
+        )
+
     async def _get_all_pages(self) -> list[str]:
         """Get all pages from the source.
 
+        The base page is fetched and parsed once; its parsed result is kept for
+        ``get_documents``. Links found on it, and optionally the URLs listed in
+        the sitemap, make up the rest of the first crawl level.
+
         Returns:
             List of page URLs
 
@@ -607,91 +903,81 @@ class PublicDocsConnector(BaseConnector):
             )
 
         try:
+            base_url = str(self.config.base_url)
             self.logger.debug(
                 "Fetching pages from base URL",
-                base_url=str(self.config.base_url),
+                base_url=base_url,
                 path_pattern=self.config.path_pattern,
             )
 
-            async with aiohttp.ClientSession() as client:
-                try:
-                    response = await client.get(str(self.config.base_url))
-                    response.raise_for_status()
-                except aiohttp.ClientError as e:
-                    raise HTTPRequestError(
-                        url=str(self.config.base_url), message=str(e)
-                    ) from e
-
-                self.logger.debug(
-                    "HTTP request successful", status_code=response.status
+            # The base page is always fetched in full since its links seed the crawl
+            await self._fetch_page(base_url, conditional=False)
+            try:
+                self._processed_pages[base_url] = await self._process_page(base_url)
+            except DocumentProcessingError as e:
+                # Links are extracted before content, so discovery can go on;
+                # the page itself is retried and reported by get_documents
+                self.logger.warning(
+                    "Failed to process base page", url=base_url, error=str(e)
                 )
 
-                try:
-                    html = await response.text()
-                    self.logger.debug(
-                        "Received HTML response",
-                        status_code=response.status,
-                        content_length=len(html),
-                    )
+            if self.config.use_sitemap:
+                self.url_queue.extend(await self._get_sitemap_urls())
 
-                    soup = BeautifulSoup(html, "html.parser")
-                    pages = [str(self.config.base_url)]  # Start with the base URL
-
-                    for link in soup.find_all("a"):
-                        try:
-                            href = str(cast(BeautifulSoup, link)["href"])  # type: ignore
-                            if not href or not isinstance(href, str):
-                                continue
-
-                            # Skip anchor links
-                            if href.startswith("#"):
-                                continue
-
-                            # Convert relative URLs to absolute
-                            absolute_url = urljoin(str(self.config.base_url), href)
-
-                            # Remove any fragment identifiers
-                            absolute_url = absolute_url.split("#")[0]
-
-                            # Check if URL matches our criteria
-                            if (
-                                absolute_url.startswith(str(self.config.base_url))
-                                and absolute_url not in pages
-                                and not any(
-                                    exclude in absolute_url
-                                    for exclude in self.config.exclude_paths
-                                )
-                                and (
-                                    not self.config.path_pattern
-                                    or fnmatch.fnmatch(
-                                        absolute_url, self.config.path_pattern
-                                    )
-                                )
-                            ):
-                                self.logger.debug(
-                                    "Found valid page URL", url=absolute_url
-                                )
-                                pages.append(absolute_url)
-                        except Exception as e:
-                            self.logger.warning(
-                                "Failed to process link",
-                                href=str(link.get("href", "")),  # type: ignore
-                                error=str(e),
-                            )
-                            continue
+            pages = [base_url]  # Start with the base URL
+            self.visited_urls.add(base_url)
+            pages.extend(self._drain_url_queue())
 
-                    self.logger.debug(
-                        "Page discovery completed",
-                        total_pages=len(pages),
-                        pages=pages,
-                    )
-                    return pages
-                except Exception as e:
-                    raise ConnectorError(
-                        f"Failed to process page content: {e!s}"
-                    ) from e
+            self.logger.debug(
+                "Page discovery completed",
+                total_pages=len(pages),
+                pages=pages,
+            )
+            return pages
 
         except (ConnectorNotInitializedError, HTTPRequestError, ConnectorError):
             raise
         except Exception as e:
             raise ConnectorError(f"Unexpected error getting pages: {e!s}") from e
+
+    async def _get_sitemap_urls(self) -> list[str]:
+        """Get the page URLs listed in the sitemap, following sitemap indexes.
+
+        Sitemap failures are logged and yield no URLs; the crawl then relies
+        on link discovery alone.
+        """
+        sitemap_url = self.config.sitemap_url or urljoin(
+            str(self.config.base_url), "sitemap.xml"
+        )
+        sitemaps = deque([sitemap_url])
+        seen_sitemaps: set[str] = set()
+        urls: list[str] = []
+
+        while sitemaps:
+            current = sitemaps.popleft()
+            if current in seen_sitemaps:
+                continue
+            seen_sitemaps.add(current)
+            try:
+                page = await self._fetch_page(current, conditional=False)
+                root = ElementTree.fromstring(page.html or "")
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to read sitemap", sitemap_url=current, error=str(e)
+                )
+                continue
+
+            is_index = root.tag.endswith("sitemapindex")
+            for element in root.iter():
+                if not element.tag.endswith("loc") or not element.text:
+                    continue
+                location = element.text.strip()
+                if is_index:
+                    sitemaps.append(location)
+                else:
+                    urls.append(location.split("#")[0])
+
+        self.logger.debug(
+            "Sitemap discovery completed", sitemap_url=sitemap_url, total=len(urls)
+        )
+        return urls
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from qdrant_loader.config import Settings, SourcesConfig
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.knowledge_graph import build_knowledge_graph
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
 from qdrant_loader.core.project_manager import ProjectManager
@@ -227,6 +228,8 @@ class AsyncIngestionPipeline:
                 force=force,
             )
 
+            await self._update_knowledge_graph(documents)
+
             # Update metrics
             if documents:
                 self.monitor.start_batch(
@@ -262,6 +265,44 @@ class AsyncIngestionPipeline:
             self.monitor.end_operation("ingestion_process", error=str(e))
             raise
 
+    async def _update_knowledge_graph(self, documents: list[Document]) -> None:
+        """Rebuild the knowledge graph of the collection after ingestion.
+
+        The graph is rebuilt when documents changed or when no graph was
+        written yet. A failure is logged and does not fail the ingestion.
+        """
+        graph_config = self.settings.global_config.knowledge_graph
+        if not graph_config.path:
+            return
+
+        if not documents and Path(graph_config.path).expanduser().exists():
+            logger.debug("Knowledge graph is up to date")
+            return
+
+        self.monitor.start_operation("knowledge_graph_build")
+        try:
+            graph = await build_knowledge_graph(
+                self.qdrant_manager,
+                graph_config.path,
+                min_document_frequency=graph_config.min_document_frequency,
+                similar_documents=graph_config.similar_documents,
+            )
+            self.monitor.end_operation("knowledge_graph_build")
+            logger.info(
+                f"🕸️ Knowledge graph updated: {graph.node_count} nodes, "
+                f"{graph.edge_count} edges"
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to build the knowledge graph",
+                error=str(e),
+                path=graph_config.path,
+                exc_info=True,
+            )
+            self.monitor.end_operation(
+                "knowledge_graph_build", success=False, error=str(e)
+            )
+
     async def cleanup(self):
         """Clean up resources."""
         if self._cleanup_performed:
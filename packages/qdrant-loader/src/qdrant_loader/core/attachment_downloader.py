@@ -1,7 +1,12 @@
 """Generic attachment downloader for connectors that support file attachments."""
 
+import asyncio
+import hashlib
 import os
+import shutil
 import tempfile
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import requests
@@ -17,6 +22,9 @@ from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Size of the pieces attachments are streamed in
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class AttachmentMetadata:
     """Metadata for an attachment."""
@@ -57,6 +65,20 @@ class AttachmentMetadata:
         self.author = author
 
 
+@dataclass
+class DownloadStats:
+    """Download statistics of a source."""
+
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Downloaded bytes per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
 class AttachmentDownloader:
     """Generic attachment downloader for various connector types."""
 
@@ -66,6 +88,7 @@ class AttachmentDownloader:
         file_conversion_config: FileConversionConfig | None = None,
         enable_file_conversion: bool = False,
         max_attachment_size: int = 52428800,  # 50MB default
+        max_concurrent_downloads: int = 4,
     ):
         """Initialize the attachment downloader.
 
@@ -74,12 +97,20 @@ class AttachmentDownloader:
             file_conversion_config: File conversion configuration
             enable_file_conversion: Whether to enable file conversion
             max_attachment_size: Maximum attachment size to download (bytes)
+            max_concurrent_downloads: Maximum number of attachments downloaded
+                at the same time
         """
         self.session = session
         self.enable_file_conversion = enable_file_conversion
         self.max_attachment_size = max_attachment_size
         self.logger = logger
 
+        self._download_slots = asyncio.Semaphore(max_concurrent_downloads)
+        self._spool_dir: str | None = None
+        # SHA-256 and size of the downloaded files, by path
+        self._downloads: dict[str, tuple[str, int]] = {}
+        self.download_stats: dict[str, DownloadStats] = {}
+
         # Initialize file conversion components if enabled
         self.file_converter = None
         self.file_detector = None
@@ -134,6 +165,9 @@ class AttachmentDownloader:
     async def download_attachment(self, attachment: AttachmentMetadata) -> str | None:
         """Download an attachment to a temporary file.
 
+        The download runs in a worker thread, so several attachments are
+        downloaded concurrently, up to ``max_concurrent_downloads``.
+
         Args:
             attachment: Attachment metadata
 
@@ -143,6 +177,22 @@ class AttachmentDownloader:
         if not self.should_download_attachment(attachment):
             return None
 
+        async with self._download_slots:
+            return await asyncio.to_thread(self._download_to_spool, attachment)
+
+    def _download_to_spool(self, attachment: AttachmentMetadata) -> str | None:
+        """Stream an attachment into a file in the spool directory.
+
+        The content is hashed while it is written, and the download is
+        aborted as soon as it is known to exceed ``max_attachment_size``.
+
+        Args:
+            attachment: Attachment metadata
+
+        Returns:
+            str: Path to downloaded temporary file, or None if download failed
+        """
+        temp_file = None
         try:
             self.logger.info(
                 "Downloading attachment",
@@ -175,50 +225,65 @@ class AttachmentDownloader:
                 allow_redirects=True,  # Important for some Confluence setups
                 timeout=30,  # Reasonable timeout for downloads
             )
-            response.raise_for_status()
+            with response:
+                response.raise_for_status()
 
-            # Validate content type if possible
-            content_type = response.headers.get("content-type", "").lower()
-            if content_type and "text/html" in content_type:
-                # This might indicate an authentication error or redirect to login page
-                self.logger.warning(
-                    "Received HTML response for attachment download, possible authentication issue",
-                    filename=attachment.filename,
-                    url=attachment.download_url,
-                    content_type=content_type,
+                # Validate content type if possible
+                content_type = response.headers.get("content-type", "").lower()
+                if content_type and "text/html" in content_type:
+                    # This might indicate an authentication error or redirect to login page
+                    self.logger.warning(
+                        "Received HTML response for attachment download, possible authentication issue",
+                        filename=attachment.filename,
+                        url=attachment.download_url,
+                        content_type=content_type,
+                    )
+                    return None
+
+                # Validate content length if available
+                content_length = response.headers.get("content-length")
+                if content_length:
+                    try:
+                        actual_size = int(content_length)
+                    except ValueError:
+                        actual_size = None  # Invalid content-length header
+                    if actual_size is not None:
+                        if actual_size > self.max_attachment_size:
+                            # Abort before reading the body
+                            self.logger.warning(
+                                "Attachment exceeds size limit, skipping download",
+                                filename=attachment.filename,
+                                content_length=actual_size,
+                                max_size=self.max_attachment_size,
+                            )
+                            return None
+                        if (
+                            attachment.size > 0
+                            and abs(actual_size - attachment.size) > 1024
+                        ):
+                            # Size mismatch (allowing for small differences)
+                            self.logger.warning(
+                                "Content length mismatch for attachment",
+                                filename=attachment.filename,
+                                expected_size=attachment.size,
+                                actual_size=actual_size,
+                            )
+
+                # Create temporary file with original extension
+                file_ext = Path(attachment.filename).suffix
+                temp_file = tempfile.NamedTemporaryFile(
+                    delete=False,
+                    suffix=file_ext,
+                    prefix=f"attachment_{attachment.id}_",
+                    dir=self._get_spool_dir(),
                 )
-                return None
 
-            # Validate content length if available
-            content_length = response.headers.get("content-length")
-            if content_length:
-                try:
-                    actual_size = int(content_length)
-                    if (
-                        attachment.size > 0
-                        and abs(actual_size - attachment.size) > 1024
-                    ):
-                        # Size mismatch (allowing for small differences)
-                        self.logger.warning(
-                            "Content length mismatch for attachment",
-                            filename=attachment.filename,
-                            expected_size=attachment.size,
-                            actual_size=actual_size,
-                        )
-                except ValueError:
-                    pass  # Invalid content-length header
-
-            # Create temporary file with original extension
-            file_ext = Path(attachment.filename).suffix
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=file_ext, prefix=f"attachment_{attachment.id}_"
-            )
-
-            # Write content to temporary file with progress tracking
-            downloaded_size = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    temp_file.write(chunk)
+                # Write and hash the content in one pass
+                content_hash = hashlib.sha256()
+                downloaded_size = 0
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
                     downloaded_size += len(chunk)
 
                     # Check if we're exceeding expected size significantly
@@ -232,12 +297,24 @@ class AttachmentDownloader:
                         temp_file.close()
                         self.cleanup_temp_file(temp_file.name)
                         return None
+                    if downloaded_size > self.max_attachment_size:
+                        self.logger.warning(
+                            "Download size exceeding size limit, stopping",
+                            filename=attachment.filename,
+                            downloaded_size=downloaded_size,
+                            max_size=self.max_attachment_size,
+                        )
+                        temp_file.close()
+                        self.cleanup_temp_file(temp_file.name)
+                        return None
 
-            temp_file.close()
+                    temp_file.write(chunk)
+                    content_hash.update(chunk)
+
+                temp_file.close()
 
             # Final size validation
-            actual_file_size = os.path.getsize(temp_file.name)
-            if actual_file_size == 0:
+            if downloaded_size == 0:
                 self.logger.warning(
                     "Downloaded file is empty",
                     filename=attachment.filename,
@@ -246,12 +323,17 @@ class AttachmentDownloader:
                 self.cleanup_temp_file(temp_file.name)
                 return None
 
+            self._downloads[temp_file.name] = (
+                content_hash.hexdigest(),
+                downloaded_size,
+            )
+
             self.logger.debug(
                 "Attachment downloaded successfully",
                 filename=attachment.filename,
                 temp_path=temp_file.name,
                 expected_size=attachment.size,
-                actual_size=actual_file_size,
+                actual_size=downloaded_size,
             )
 
             return temp_file.name
@@ -262,7 +344,6 @@ class AttachmentDownloader:
                 filename=attachment.filename,
                 url=attachment.download_url,
             )
-            return None
         except requests.exceptions.HTTPError as e:
             self.logger.error(
                 "HTTP error downloading attachment",
@@ -271,7 +352,6 @@ class AttachmentDownloader:
                 status_code=e.response.status_code if e.response else None,
                 error=str(e),
             )
-            return None
         except Exception as e:
             self.logger.error(
                 "Failed to download attachment",
@@ -279,7 +359,11 @@ class AttachmentDownloader:
                 url=attachment.download_url,
                 error=str(e),
             )
-            return None
+        # Do not leave partial downloads behind
+        if temp_file is not None:
+            temp_file.close()
+            self.cleanup_temp_file(temp_file.name)
+        return None
 
     def process_attachment(
         self,
@@ -313,13 +397,19 @@ class AttachmentDownloader:
                 try:
                     # Convert file to markdown
                     assert self.file_converter is not None  # Type checker hint
-                    content = self.file_converter.convert_file(temp_file_path)
+                    content_hash = self._downloads.get(temp_file_path, (None, 0))[0]
+                    content = self.file_converter.convert_file(
+                        temp_file_path, content_hash=content_hash
+                    )
                     content_type = "md"  # Converted files are markdown
                     conversion_method = "markitdown"
                     conversion_failed = False
                     self.logger.info(
                         "Attachment conversion successful", filename=attachment.filename
                     )
+                    cache_key = self._attachment_cache_key(attachment)
+                    if cache_key is not None:
+                        self.file_converter.cache_conversion(cache_key, content)
                 except FileConversionError as e:
                     self.logger.warning(
                         "Attachment conversion failed, creating fallback document",
@@ -341,41 +431,13 @@ class AttachmentDownloader:
                 conversion_method = None
                 conversion_failed = False
 
-            # Create attachment metadata
-            attachment_metadata = {
-                "attachment_id": attachment.id,
-                "original_filename": attachment.filename,
-                "file_size": attachment.size,
-                "mime_type": attachment.mime_type,
-                "parent_document_id": attachment.parent_document_id,
-                "is_attachment": True,
-                "author": attachment.author,
-            }
-
-            # Add conversion metadata if applicable
-            if needs_conversion:
-                attachment_metadata.update(
-                    {
-                        "conversion_method": conversion_method,
-                        "conversion_failed": conversion_failed,
-                        "original_file_type": Path(attachment.filename)
-                        .suffix.lower()
-                        .lstrip("."),
-                    }
-                )
-
-            # Create attachment document
-            document = Document(
-                title=f"Attachment: {attachment.filename}",
-                content=content,
-                content_type=content_type,
-                metadata=attachment_metadata,
-                source_type=parent_document.source_type,
-                source=parent_document.source,
-                url=f"{parent_document.url}#attachment-{attachment.id}",
-                is_deleted=False,
-                updated_at=parent_document.updated_at,
-                created_at=parent_document.created_at,
+            document = self._create_attachment_document(
+                attachment,
+                parent_document,
+                content,
+                content_type,
+                conversion_method if needs_conversion else None,
+                conversion_failed,
             )
 
             self.logger.debug(
@@ -392,12 +454,125 @@ class AttachmentDownloader:
             )
             return None
 
+    def _create_attachment_document(
+        self,
+        attachment: AttachmentMetadata,
+        parent_document: Document,
+        content: str,
+        content_type: str,
+        conversion_method: str | None,
+        conversion_failed: bool,
+    ) -> Document:
+        """Create the Document of an attachment.
+
+        Args:
+            attachment: Attachment metadata
+            parent_document: Parent document this attachment belongs to
+            content: Content of the attachment
+            content_type: Content type of the content
+            conversion_method: Conversion method, None if it was not converted
+            conversion_failed: Whether the conversion failed
+
+        Returns:
+            Document: Attachment document
+        """
+        # Create attachment metadata
+        attachment_metadata = {
+            "attachment_id": attachment.id,
+            "original_filename": attachment.filename,
+            "file_size": attachment.size,
+            "mime_type": attachment.mime_type,
+            "parent_document_id": attachment.parent_document_id,
+            "is_attachment": True,
+            "author": attachment.author,
+        }
+
+        # Add conversion metadata if applicable
+        if conversion_method is not None:
+            attachment_metadata.update(
+                {
+                    "conversion_method": conversion_method,
+                    "conversion_failed": conversion_failed,
+                    "original_file_type": Path(attachment.filename)
+                    .suffix.lower()
+                    .lstrip("."),
+                }
+            )
+
+        # Create attachment document
+        return Document(
+            title=f"Attachment: {attachment.filename}",
+            content=content,
+            content_type=content_type,
+            metadata=attachment_metadata,
+            source_type=parent_document.source_type,
+            source=parent_document.source,
+            url=f"{parent_document.url}#attachment-{attachment.id}",
+            is_deleted=False,
+            updated_at=parent_document.updated_at,
+            created_at=parent_document.created_at,
+        )
+
+    @staticmethod
+    def _attachment_cache_key(attachment: AttachmentMetadata) -> str | None:
+        """Get a key identifying the version of an attachment without downloading it.
+
+        Args:
+            attachment: Attachment metadata
+
+        Returns:
+            The key, or None if the size or timestamp of the attachment is unknown
+        """
+        version = attachment.updated_at or attachment.created_at
+        if attachment.size <= 0 or not version:
+            return None
+        return f"{attachment.download_url}|{attachment.id}|{attachment.size}|{version}"
+
+    def _get_cached_attachment_document(
+        self, attachment: AttachmentMetadata, parent_document: Document
+    ) -> Document | None:
+        """Create the Document of an attachment converted in an earlier run.
+
+        Args:
+            attachment: Attachment metadata
+            parent_document: Parent document this attachment belongs to
+
+        Returns:
+            Document: Attachment document, or None if the attachment version
+            was not converted before
+        """
+        if not self.enable_file_conversion or self.file_converter is None:
+            return None
+        if attachment.size > self.max_attachment_size:
+            return None
+        cache_key = self._attachment_cache_key(attachment)
+        if cache_key is None:
+            return None
+        content = self.file_converter.get_cached_conversion(cache_key)
+        if content is None:
+            return None
+
+        self.logger.debug(
+            "Using cached conversion of unchanged attachment",
+            filename=attachment.filename,
+        )
+        return self._create_attachment_document(
+            attachment, parent_document, content, "md", "markitdown", False
+        )
+
+    def _get_spool_dir(self) -> str:
+        """Get the directory downloads are written to, creating it if needed."""
+        if self._spool_dir is None or not os.path.isdir(self._spool_dir):
+            self._spool_dir = tempfile.mkdtemp(prefix="qdrant_loader_attachments_")
+        return self._spool_dir
+
     def cleanup_temp_file(self, temp_file_path: str) -> None:
         """Clean up a temporary file.
 
         Args:
             temp_file_path: Path to temporary file to delete
         """
+        self._downloads.pop(temp_file_path, None)
         try:
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
@@ -416,6 +591,10 @@ class AttachmentDownloader:
     ) -> list[Document]:
         """Download and process multiple attachments.
 
+        Attachments are downloaded concurrently; each one is processed in a
+        worker thread as soon as its download completes and its temporary file
+        is deleted right after.
+
         Args:
             attachments: List of attachment metadata
             parent_document: Parent document
@@ -423,29 +602,49 @@ class AttachmentDownloader:
         Returns:
             List[Document]: List of processed attachment documents
         """
-        attachment_documents = []
-        temp_files = []
+        stats = self.download_stats.setdefault(parent_document.source, DownloadStats())
+        start = time.perf_counter()
+        last_download_end = start
+
+        async def download_and_process(
+            attachment: AttachmentMetadata,
+        ) -> Document | None:
+            nonlocal last_download_end
+
+            # Unchanged attachments skip both the download and the conversion
+            cached_document = self._get_cached_attachment_document(
+                attachment, parent_document
+            )
+            if cached_document is not None:
+                return cached_document
 
-        try:
-            for attachment in attachments:
-                # Download attachment
-                temp_file_path = await self.download_attachment(attachment)
-                if not temp_file_path:
-                    continue
+            # Download attachment
+            temp_file_path = await self.download_attachment(attachment)
+            if not temp_file_path:
+                return None
 
-                temp_files.append(temp_file_path)
+            try:
+                last_download_end = time.perf_counter()
+                _, size = self._downloads.get(temp_file_path, (None, 0))
+                stats.files += 1
+                stats.bytes += size
 
-                # Process attachment
-                attachment_doc = self.process_attachment(
-                    attachment, temp_file_path, parent_document
+                # Conversion is CPU-bound, so keep it off the event loop where
+                # it would stall the other downloads
+                return await asyncio.to_thread(
+                    self.process_attachment, attachment, temp_file_path, parent_document
                 )
-                if attachment_doc:
-                    attachment_documents.append(attachment_doc)
+            finally:
+                self.cleanup_temp_file(temp_file_path)
 
+        try:
+            results = await asyncio.gather(
+                *(download_and_process(attachment) for attachment in attachments)
+            )
         finally:
-            # Clean up all temporary files
-            for temp_file in temp_files:
-                self.cleanup_temp_file(temp_file)
+            # Time until the last download completed
+            stats.seconds += last_download_end - start
+        attachment_documents = [document for document in results if document]
 
         self.logger.debug(
             "Processed attachments",
@@ -455,3 +654,28 @@ class AttachmentDownloader:
         )
 
         return attachment_documents
+
+    def close(self) -> None:
+        """Report the download throughput and release the spool directory and workers.
+
+        The downloader can still be used afterwards; the spool directory and
+        the conversion worker processes are created again when needed.
+        """
+        if self.file_converter:
+            self.file_converter.close()
+
+        for source, stats in self.download_stats.items():
+            if stats.files:
+                self.logger.info(
+                    "Attachment download throughput",
+                    source=source,
+                    files=stats.files,
+                    bytes=stats.bytes,
+                    seconds=round(stats.seconds, 2),
+                    mb_per_second=round(stats.throughput / (1024 * 1024), 2),
+                )
+        self.download_stats.clear()
+
+        if self._spool_dir is not None:
+            shutil.rmtree(self._spool_dir, ignore_errors=True)
+            self._spool_dir = None
@@ -14,6 +14,10 @@ from qdrant_loader.core.chunking.strategy import (
 )
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
+from qdrant_loader.core.text_processing.topic_modeler import (
+    CorpusTopicModels,
+    TopicModeler,
+)
 from qdrant_loader.utils.logging import LoggingConfig
 
 
@@ -75,6 +79,86 @@ class ChunkingService:
         # Default strategy for unknown file types
         self.default_strategy = DefaultChunkingStrategy(settings=self.settings)
 
+        # Strategy instances reused across documents (see enable_strategy_reuse)
+        self._strategy_instances: (
+            dict[type[BaseChunkingStrategy], BaseChunkingStrategy] | None
+        ) = None
+
+        # Corpus-level topic models, created when first needed
+        self._topic_models: CorpusTopicModels | None = None
+
+    @property
+    def topic_models(self) -> CorpusTopicModels:
+        """Corpus-level topic models used by the markdown semantic analysis."""
+        if self._topic_models is None:
+            semantic_config = self.settings.global_config.semantic_analysis
+            self._topic_models = CorpusTopicModels(
+                num_topics=semantic_config.num_topics,
+                passes=semantic_config.lda_passes,
+                spacy_model=semantic_config.spacy_model,
+                model_dir=semantic_config.topic_model_dir,
+            )
+        return self._topic_models
+
+    def train_topic_models(self, documents: list[Document]) -> None:
+        """Train or refresh the topic models of the documents' sources.
+
+        This is the first phase of topic extraction: one model is trained per
+        source, so that chunking only has to run inference with it.
+
+        Args:
+            documents: Documents about to be chunked
+        """
+        documents = [
+            document for document in documents if self._uses_semantic_analysis(document)
+        ]
+        if not documents:
+            return
+        try:
+            self.topic_models.train(documents)
+        except Exception as e:
+            self.logger.warning(
+                "Topic model training failed, topics are extracted per chunk",
+                error=str(e),
+            )
+
+    def _uses_semantic_analysis(self, document: Document) -> bool:
+        """Check whether a document is chunked by the markdown strategy."""
+        return (
+            document.metadata.get("conversion_method")
+            in ("markitdown", "markitdown_fallback")
+            or self.strategies.get(document.content_type.lower())
+            is MarkdownChunkingStrategy
+        )
+
+    def _get_topic_model(self, document: Document) -> TopicModeler | None:
+        """Get the trained topic model of a document's source, if any."""
+        if self._topic_models is None:
+            return None
+        return self._topic_models.get(CorpusTopicModels.source_key(document))
+
+    def enable_strategy_reuse(self) -> None:
+        """Reuse strategy instances instead of creating one per document.
+
+        This avoids re-initializing parsers and NLP models for every document,
+        but is only safe when documents are chunked one at a time, as in the
+        process-pool chunking workers.
+        """
+        if self._strategy_instances is None:
+            self._strategy_instances = {}
+
+    def _create_strategy(
+        self, strategy_class: type[BaseChunkingStrategy]
+    ) -> BaseChunkingStrategy:
+        """Create a strategy, or return the shared instance when reuse is on."""
+        if self._strategy_instances is None:
+            return strategy_class(self.settings)
+        strategy = self._strategy_instances.get(strategy_class)
+        if strategy is None:
+            strategy = strategy_class(self.settings)
+            self._strategy_instances[strategy_class] = strategy
+        return strategy
+
     def validate_config(self) -> None:
         """Validate the configuration.
 
@@ -108,7 +192,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._create_strategy(MarkdownChunkingStrategy)
         elif conversion_method == "markitdown_fallback":
             # Fallback documents are also in markdown format
             self.logger.info(
@@ -119,7 +203,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._create_strategy(MarkdownChunkingStrategy)
 
         # Get file extension from the document content type
         file_type = document.content_type.lower()
@@ -145,7 +229,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return strategy_class(self.settings)
+            return self._create_strategy(strategy_class)
 
         self.logger.debug(
             "No specific strategy found for this file type, using default text chunking strategy",
@@ -187,6 +271,7 @@ class ChunkingService:
 
         # Get the appropriate strategy for the document type
         strategy = self._get_strategy(document)
+        strategy.set_topic_model(self._get_topic_model(document))
 
         # Optimized: Only log detailed chunking info when debug logging is enabled
         if logging.getLogger().isEnabledFor(logging.DEBUG):
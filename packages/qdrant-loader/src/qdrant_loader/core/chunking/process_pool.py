@@ -0,0 +1,98 @@
+"""Process-pool execution of the chunking service.
+
+The chunking strategies are CPU-bound pure Python, so chunking in threads is
+limited to about one core by the GIL. This module runs ``ChunkingService`` in
+worker processes instead. Each worker builds the service and its strategies
+once; documents and chunks cross the process boundary as plain tuples of
+field values, which are cheaper to pickle than pydantic models.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+
+if TYPE_CHECKING:
+    from qdrant_loader.config import Settings
+    from qdrant_loader.core.chunking.chunking_service import ChunkingService
+
+_DOCUMENT_FIELDS = tuple(Document.model_fields)
+
+# Chunking service of the current worker process
+_worker_service: "ChunkingService | None" = None
+
+
+def pack_document(document: Document) -> tuple[Any, ...]:
+    """Convert a document into a tuple of its field values."""
+    return tuple(getattr(document, field) for field in _DOCUMENT_FIELDS)
+
+
+def unpack_document(values: tuple[Any, ...]) -> Document:
+    """Rebuild a document from ``pack_document`` output without revalidation."""
+    return Document.model_construct(**dict(zip(_DOCUMENT_FIELDS, values, strict=True)))
+
+
+def _initialize_worker(
+    settings: "Settings",
+    logging_config: tuple | None,
+    topic_model_dir: Path | None = None,
+) -> None:
+    """Set up logging and the chunking service of a worker process."""
+    global _worker_service
+
+    # Imported here so the parent process does not pay for it at module import
+    from qdrant_loader.core.chunking.chunking_service import ChunkingService
+
+    if logging_config:
+        LoggingConfig.setup(*logging_config)
+
+    _worker_service = ChunkingService(config=settings.global_config, settings=settings)
+    _worker_service.enable_strategy_reuse()
+    if topic_model_dir is not None:
+        # Topic models are trained by the main process and loaded from disk
+        _worker_service.topic_models.model_dir = topic_model_dir
+
+
+def chunk_packed_document(values: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+    """Chunk a packed document in a worker process.
+
+    Args:
+        values: Document packed with ``pack_document``
+
+    Returns:
+        The chunks, packed with ``pack_document``
+    """
+    if _worker_service is None:
+        raise RuntimeError("Chunking worker process is not initialized")
+    chunks = _worker_service.chunk_document(unpack_document(values))
+    return [pack_document(chunk) for chunk in chunks]
+
+
+def create_chunking_process_pool(
+    settings: "Settings",
+    max_workers: int | None = None,
+    topic_model_dir: Path | None = None,
+) -> concurrent.futures.ProcessPoolExecutor:
+    """Create a process pool whose workers run the chunking service.
+
+    Workers are started with the ``spawn`` method: forking a process that
+    already runs an event loop and thread pools is not safe.
+
+    Args:
+        settings: Application settings, sent once to every worker
+        max_workers: Number of worker processes (defaults to the number of CPUs)
+        topic_model_dir: Directory the main process persists topic models in
+
+    Returns:
+        The process pool executor
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(settings, LoggingConfig.get_current_config(), topic_model_dir),
+    )
@@ -11,6 +11,7 @@ from qdrant_loader.utils.logging import LoggingConfig
 
 if TYPE_CHECKING:
     from qdrant_loader.config import Settings
+    from qdrant_loader.core.text_processing.topic_modeler import TopicModeler
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -73,6 +74,16 @@ class BaseChunkingStrategy(ABC):
             return len(text)
         return len(self.encoding.encode(text))
 
+    def set_topic_model(self, topic_model: "TopicModeler | None") -> None:
+        """Set the corpus-level topic model of the next document's source.
+
+        Strategies that extract topics override this; the default does nothing.
+
+        Args:
+            topic_model: Trained topic model, or None if the source has none
+        """
+        return None
+
     def _process_text(self, text: str) -> dict:
         """Process text using the text processor.
 
@@ -1,5 +1,6 @@
 """Code chunk processor for creating enhanced code chunk documents."""
 
+import re
 from typing import Any
 
 import structlog
@@ -7,8 +8,19 @@ import structlog
 from qdrant_loader.core.chunking.strategy.base.chunk_processor import BaseChunkProcessor
 from qdrant_loader.core.document import Document
 
+from .code_scan import CodeScan
+
 logger = structlog.get_logger(__name__)
 
+# Naming convention patterns
+_SNAKE_CASE_FUNCTION = re.compile(r"def [a-z_]+\(")
+_CAMEL_CASE_FUNCTION = re.compile(r"function [a-z][a-zA-Z]*\(")
+_PASCAL_CASE_CLASS = re.compile(r"class [A-Z][a-zA-Z]*")
+_NON_DESCRIPTIVE_NAME = re.compile(r"[a-z]{1,2}\d*")
+_FUNCTION_NAME = re.compile(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)")
+
+_KEYWORDS = frozenset(["def", "class", "for", "if", "else", "try", "except"])
+
 
 class CodeChunkProcessor(BaseChunkProcessor):
     """Chunk processor for code documents with programming language context."""
@@ -50,6 +62,7 @@ class CodeChunkProcessor(BaseChunkProcessor):
         total_chunks: int,
         chunk_metadata: dict[str, Any],
         skip_nlp: bool = False,
+        scan: CodeScan | None = None,
     ) -> Document:
         """Create a document for a code chunk with enhanced metadata.
 
@@ -60,10 +73,13 @@ class CodeChunkProcessor(BaseChunkProcessor):
             total_chunks: Total number of chunks
             chunk_metadata: Metadata specific to this chunk
             skip_nlp: Whether to skip semantic analysis for this chunk
+            scan: Scan of the chunk content, if already computed
 
         Returns:
             Document instance representing the code chunk
         """
+        scan = scan or CodeScan(chunk_content)
+
         # Generate unique chunk ID
         chunk_id = self.generate_chunk_id(original_doc, chunk_index)
 
@@ -74,14 +90,14 @@ class CodeChunkProcessor(BaseChunkProcessor):
 
         # Add code-specific metadata
         code_metadata = self._create_code_specific_metadata(
-            chunk_content, chunk_metadata, original_doc
+            chunk_content, chunk_metadata, original_doc, scan
         )
         base_metadata.update(code_metadata)
 
         # Determine if we should skip NLP for this chunk
         if not skip_nlp:
             skip_nlp, skip_reason = self.should_skip_semantic_analysis(
-                chunk_content, chunk_metadata
+                chunk_content, chunk_metadata, scan
             )
             if skip_nlp:
                 base_metadata["nlp_skip_reason"] = skip_reason
@@ -101,13 +117,17 @@ class CodeChunkProcessor(BaseChunkProcessor):
         return chunk_doc
 
     def should_skip_semantic_analysis(
-        self, chunk_content: str, chunk_metadata: dict[str, Any]
+        self,
+        chunk_content: str,
+        chunk_metadata: dict[str, Any],
+        scan: CodeScan | None = None,
     ) -> tuple[bool, str]:
         """Determine whether to skip semantic analysis for a code chunk.
 
         Args:
             chunk_content: Content of the chunk
             chunk_metadata: Metadata for the chunk
+            scan: Scan of the chunk content, if already computed
 
         Returns:
             Tuple of (should_skip, reason)
@@ -125,16 +145,18 @@ class CodeChunkProcessor(BaseChunkProcessor):
         ):
             return True, "binary_content"
 
+        scan = scan or CodeScan(chunk_content)
+
         # Skip if content appears to be minified
-        if self._is_minified_code(chunk_content):
+        if self._is_minified_code(scan):
             return True, "minified_code"
 
         # Skip if content appears to be auto-generated
-        if self._is_generated_code(chunk_content):
+        if self._is_generated_code(scan):
             return True, "generated_code"
 
         # Skip if it's mostly comments (low semantic value)
-        if self._is_mostly_comments(chunk_content):
+        if self._is_mostly_comments(scan):
             return True, "mostly_comments"
 
         # Skip test files with many assertions (low semantic complexity)
@@ -148,7 +170,11 @@ class CodeChunkProcessor(BaseChunkProcessor):
         return False, "suitable_for_nlp"
 
     def _create_code_specific_metadata(
-        self, content: str, chunk_metadata: dict[str, Any], original_doc: Document
+        self,
+        content: str,
+        chunk_metadata: dict[str, Any],
+        original_doc: Document,
+        scan: CodeScan | None = None,
     ) -> dict[str, Any]:
         """Create code-specific metadata for the chunk.
 
@@ -156,17 +182,17 @@ class CodeChunkProcessor(BaseChunkProcessor):
             content: Chunk content
             chunk_metadata: Existing chunk metadata
             original_doc: Original document
+            scan: Scan of the content, if already computed
 
         Returns:
             Code-specific metadata dictionary
         """
+        scan = scan or CodeScan(content)
         metadata = {
-            "content_analysis": self._analyze_code_content(content),
-            "language_context": self._extract_language_context(content, chunk_metadata),
-            "code_quality": self._assess_code_quality(content, chunk_metadata),
-            "educational_value": self._assess_educational_value(
-                content, chunk_metadata
-            ),
+            "content_analysis": self._analyze_code_content(scan),
+            "language_context": self._extract_language_context(scan, chunk_metadata),
+            "code_quality": self._assess_code_quality(scan, chunk_metadata),
+            "educational_value": self._assess_educational_value(scan, chunk_metadata),
             "reusability_score": self._calculate_reusability_score(
                 content, chunk_metadata
             ),
@@ -182,57 +208,56 @@ class CodeChunkProcessor(BaseChunkProcessor):
 
         return metadata
 
-    def _analyze_code_content(self, content: str) -> dict[str, Any]:
+    def _analyze_code_content(self, scan: CodeScan) -> dict[str, Any]:
         """Analyze the code content characteristics.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             Content analysis metrics
         """
-        lines = content.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
-        comment_lines = [
-            line for line in lines if line.strip().startswith(("#", "//", "/*", "--"))
-        ]
+        content = scan.content
+        non_empty_lines = scan.non_empty_lines
+        comment_lines = scan.comment_lines + scan.dash_comment_lines
 
         return {
-            "total_lines": len(lines),
-            "code_lines": len(non_empty_lines) - len(comment_lines),
-            "comment_lines": len(comment_lines),
-            "blank_lines": len(lines) - len(non_empty_lines),
+            "total_lines": scan.line_count,
+            "code_lines": non_empty_lines - comment_lines,
+            "comment_lines": comment_lines,
+            "blank_lines": scan.line_count - non_empty_lines,
             "comment_ratio": (
-                len(comment_lines) / len(non_empty_lines) if non_empty_lines else 0
+                comment_lines / non_empty_lines if non_empty_lines else 0
             ),
-            "avg_line_length": (
-                sum(len(line) for line in lines) / len(lines) if lines else 0
+            "avg_line_length": scan.avg_line_length,
+            "max_line_length": scan.max_line_length,
+            "indentation_consistency": self._check_indentation_consistency(
+                scan.indentations
             ),
-            "max_line_length": max(len(line) for line in lines) if lines else 0,
-            "indentation_consistency": self._check_indentation_consistency(lines),
             "has_documentation": '"""' in content
             or "'''" in content
             or "/*" in content,
         }
 
     def _extract_language_context(
-        self, content: str, chunk_metadata: dict[str, Any]
+        self, scan: CodeScan, chunk_metadata: dict[str, Any]
     ) -> dict[str, Any]:
         """Extract programming language context.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
             chunk_metadata: Chunk metadata
 
         Returns:
             Language context information
         """
+        content = scan.content
         language = chunk_metadata.get("language", "unknown")
 
         context = {
             "language": language,
             "paradigm": self._identify_programming_paradigm(content, language),
-            "framework_indicators": self._identify_frameworks(content, language),
+            "framework_indicators": self._identify_frameworks(scan, language),
             "version_indicators": self._identify_language_version(content, language),
             "style_conventions": self._analyze_style_conventions(content, language),
         }
@@ -240,17 +265,19 @@ class CodeChunkProcessor(BaseChunkProcessor):
         return context
 
     def _assess_code_quality(
-        self, content: str, chunk_metadata: dict[str, Any]
+        self, scan: CodeScan, chunk_metadata: dict[str, Any]
     ) -> dict[str, Any]:
         """Assess code quality indicators.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
             chunk_metadata: Chunk metadata
 
         Returns:
             Code quality assessment
         """
+        content = scan.content
+
         # Get complexity from metadata if available
         complexity = chunk_metadata.get("complexity", 0)
 
@@ -263,9 +290,8 @@ class CodeChunkProcessor(BaseChunkProcessor):
             quality_score -= 10
 
         # Check for long lines
-        lines = content.split("\n")
-        long_lines = [line for line in lines if len(line) > 120]
-        if len(long_lines) > len(lines) * 0.3:
+        long_lines = scan.long_lines
+        if long_lines > scan.line_count * 0.3:
             quality_score -= 15
 
         # Check for documentation
@@ -274,7 +300,8 @@ class CodeChunkProcessor(BaseChunkProcessor):
             quality_score -= 10
 
         # Check for meaningful naming
-        if self._has_meaningful_names(content):
+        meaningful_names = self._has_meaningful_names(scan)
+        if meaningful_names:
             quality_score += 5
         else:
             quality_score -= 10
@@ -286,29 +313,28 @@ class CodeChunkProcessor(BaseChunkProcessor):
             ),
             "readability_indicators": {
                 "has_documentation": has_docs,
-                "reasonable_line_length": (
-                    len(long_lines) / len(lines) < 0.1 if lines else True
-                ),
-                "meaningful_names": self._has_meaningful_names(content),
+                "reasonable_line_length": long_lines / scan.line_count < 0.1,
+                "meaningful_names": meaningful_names,
             },
         }
 
     def _assess_educational_value(
-        self, content: str, chunk_metadata: dict[str, Any]
+        self, scan: CodeScan, chunk_metadata: dict[str, Any]
     ) -> dict[str, Any]:
         """Assess educational value of the code chunk.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
             chunk_metadata: Chunk metadata
 
         Returns:
             Educational value assessment
         """
+        content = scan.content
         educational_indicators = []
 
         # Check for common educational patterns
-        if "example" in content.lower() or "demo" in content.lower():
+        if "example" in scan.lower or "demo" in scan.lower:
             educational_indicators.append("example_code")
 
         if '"""' in content or "'''" in content:
@@ -329,8 +355,8 @@ class CodeChunkProcessor(BaseChunkProcessor):
 
         return {
             "educational_indicators": educational_indicators,
-            "learning_level": self._determine_learning_level(content, chunk_metadata),
-            "concepts_demonstrated": self._identify_programming_concepts(content),
+            "learning_level": self._determine_learning_level(scan, chunk_metadata),
+            "concepts_demonstrated": self._identify_programming_concepts(scan),
         }
 
     def _calculate_reusability_score(
@@ -414,27 +440,24 @@ class CodeChunkProcessor(BaseChunkProcessor):
         else:
             return f"{base_title} - Code Chunk {chunk_index + 1}"
 
-    def _is_minified_code(self, content: str) -> bool:
+    def _is_minified_code(self, scan: CodeScan) -> bool:
         """Check if code appears to be minified.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             True if code appears minified
         """
-        lines = content.split("\n")
-        if not lines:
-            return False
-
         # Check for very long lines (typical of minified code)
-        avg_line_length = sum(len(line) for line in lines) / len(lines)
-        max_line_length = max(len(line) for line in lines)
+        avg_line_length = scan.avg_line_length
+        max_line_length = scan.max_line_length
 
         # Check ratio of meaningful characters
-        meaningful_chars = sum(1 for char in content if char.isalnum() or char in "_$")
-        total_chars = len(content)
-        meaningful_ratio = meaningful_chars / total_chars if total_chars > 0 else 0
+        total_chars = len(scan.content)
+        meaningful_ratio = (
+            scan.meaningful_char_count / total_chars if total_chars > 0 else 0
+        )
 
         return (
             avg_line_length > 200
@@ -442,54 +465,43 @@ class CodeChunkProcessor(BaseChunkProcessor):
             or meaningful_ratio < self.skip_conditions["minified_code_threshold"]
         )
 
-    def _is_generated_code(self, content: str) -> bool:
+    def _is_generated_code(self, scan: CodeScan) -> bool:
         """Check if code appears to be auto-generated.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             True if code appears auto-generated
         """
-        content_lower = content.lower()
         return any(
-            pattern in content_lower
+            pattern in scan.lower
             for pattern in self.skip_conditions["generated_code_patterns"]
         )
 
-    def _is_mostly_comments(self, content: str) -> bool:
+    def _is_mostly_comments(self, scan: CodeScan) -> bool:
         """Check if content is mostly comments.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             True if content is mostly comments
         """
-        lines = content.split("\n")
-        comment_lines = sum(
-            1 for line in lines if line.strip().startswith(("#", "//", "/*", "--"))
-        )
-        non_empty_lines = sum(1 for line in lines if line.strip())
+        comment_lines = scan.comment_lines + scan.dash_comment_lines
+        non_empty_lines = scan.non_empty_lines
 
         return comment_lines / non_empty_lines > 0.8 if non_empty_lines > 0 else False
 
-    def _check_indentation_consistency(self, lines: list) -> bool:
+    def _check_indentation_consistency(self, indentations: list[int]) -> bool:
         """Check if indentation is consistent.
 
         Args:
-            lines: List of code lines
+            indentations: Indentation of the indented non-empty lines
 
         Returns:
             True if indentation is consistent
         """
-        indentations = []
-        for line in lines:
-            if line.strip():  # Only check non-empty lines
-                leading_spaces = len(line) - len(line.lstrip())
-                if leading_spaces > 0:
-                    indentations.append(leading_spaces)
-
         if not indentations:
             return True
 
@@ -525,18 +537,18 @@ class CodeChunkProcessor(BaseChunkProcessor):
 
         return paradigms[0] if paradigms else "unknown"
 
-    def _identify_frameworks(self, content: str, language: str) -> list:
+    def _identify_frameworks(self, scan: CodeScan, language: str) -> list:
         """Identify frameworks used in the code.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
             language: Programming language
 
         Returns:
             List of identified frameworks
         """
         frameworks = []
-        content_lower = content.lower()
+        content_lower = scan.lower
 
         # Python frameworks
         if language == "python":
@@ -608,48 +620,40 @@ class CodeChunkProcessor(BaseChunkProcessor):
         if language == "python":
             # Check naming conventions
             conventions["snake_case_functions"] = bool(
-                re.search(r"def [a-z_]+\(", content)
+                _SNAKE_CASE_FUNCTION.search(content)
             )
             conventions["pascal_case_classes"] = bool(
-                re.search(r"class [A-Z][a-zA-Z]*", content)
+                _PASCAL_CASE_CLASS.search(content)
             )
 
         elif language in ["javascript", "typescript"]:
             # Check naming conventions
             conventions["camel_case_functions"] = bool(
-                re.search(r"function [a-z][a-zA-Z]*\(", content)
+                _CAMEL_CASE_FUNCTION.search(content)
             )
             conventions["pascal_case_classes"] = bool(
-                re.search(r"class [A-Z][a-zA-Z]*", content)
+                _PASCAL_CASE_CLASS.search(content)
             )
 
         return conventions
 
-    def _has_meaningful_names(self, content: str) -> bool:
+    def _has_meaningful_names(self, scan: CodeScan) -> bool:
         """Check if the code uses meaningful variable/function names.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             True if names appear meaningful
         """
-        # Extract identifiers
-        import re
-
-        identifiers = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", content)
-
         # Filter out keywords and single character names
         meaningful_names = [
-            name
-            for name in identifiers
-            if len(name) > 2
-            and name not in ["def", "class", "for", "if", "else", "try", "except"]
+            name for name in scan.identifiers if len(name) > 2 and name not in _KEYWORDS
         ]
 
         # Check for non-descriptive patterns
         non_descriptive = [
-            name for name in meaningful_names if re.match(r"^[a-z]{1,2}\d*$", name)
+            name for name in meaningful_names if _NON_DESCRIPTIVE_NAME.fullmatch(name)
         ]
 
         if not meaningful_names:
@@ -658,12 +662,12 @@ class CodeChunkProcessor(BaseChunkProcessor):
         return len(non_descriptive) / len(meaningful_names) < 0.3
 
     def _determine_learning_level(
-        self, content: str, chunk_metadata: dict[str, Any]
+        self, scan: CodeScan, chunk_metadata: dict[str, Any]
     ) -> str:
         """Determine the learning level of the code.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
             chunk_metadata: Chunk metadata
 
         Returns:
@@ -681,7 +685,7 @@ class CodeChunkProcessor(BaseChunkProcessor):
             "threading",
             "multiprocessing",
         ]
-        if any(pattern in content.lower() for pattern in advanced_patterns):
+        if any(pattern in scan.lower for pattern in advanced_patterns):
             return "advanced"
 
         # Intermediate indicators
@@ -689,22 +693,23 @@ class CodeChunkProcessor(BaseChunkProcessor):
             return "intermediate"
 
         # Simple function or straightforward code
-        if complexity <= 3 and len(content.split("\n")) < 20:
+        if complexity <= 3 and scan.line_count < 20:
             return "beginner"
 
         return "intermediate"
 
-    def _identify_programming_concepts(self, content: str) -> list:
+    def _identify_programming_concepts(self, scan: CodeScan) -> list:
         """Identify programming concepts demonstrated in the code.
 
         Args:
-            content: Code content
+            scan: Scan of the code content
 
         Returns:
             List of programming concepts
         """
         concepts = []
-        content_lower = content.lower()
+        content = scan.content
+        content_lower = scan.lower
 
         # Basic concepts
         if "if " in content_lower:
@@ -777,7 +782,5 @@ class CodeChunkProcessor(BaseChunkProcessor):
         Returns:
             Function name or empty string
         """
-        import re
-
-        match = re.search(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)", content)
+        match = _FUNCTION_NAME.search(content)
         return match.group(1) if match else ""
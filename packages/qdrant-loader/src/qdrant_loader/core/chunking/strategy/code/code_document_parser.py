@@ -1,6 +1,7 @@
 """Code document parser for AST analysis and language detection."""
 
 import ast
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
@@ -9,11 +10,12 @@ import structlog
 
 # Tree-sitter imports with error handling
 try:
-    from tree_sitter_languages import get_parser
+    from tree_sitter_languages import get_language, get_parser
 
     TREE_SITTER_AVAILABLE = True
 except ImportError:
     TREE_SITTER_AVAILABLE = False
+    get_language = None
     get_parser = None
 
 from qdrant_loader.core.chunking.strategy.base.document_parser import BaseDocumentParser
@@ -77,6 +79,81 @@ class CodeElement:
         child.parent = self
 
 
+# Tree-sitter node types of code elements
+TREE_SITTER_ELEMENT_TYPES = {
+    "function_definition": CodeElementType.FUNCTION,
+    "method_definition": CodeElementType.METHOD,
+    "class_definition": CodeElementType.CLASS,
+    "interface_declaration": CodeElementType.INTERFACE,
+    "enum_declaration": CodeElementType.ENUM,
+    "struct_declaration": CodeElementType.STRUCT,
+    "variable_declaration": CodeElementType.VARIABLE,
+    "import_statement": CodeElementType.IMPORT,
+    "comment": CodeElementType.COMMENT,
+}
+
+# Process-wide Tree-sitter caches. Element queries are shared by all
+# threads; parsers are not thread-safe and are kept per thread.
+_element_queries: dict[str, Any] = {}
+_thread_local = threading.local()
+
+
+def get_tree_sitter_parser(language: str):
+    """Get the Tree-sitter parser of a language for the current thread.
+
+    Args:
+        language: Tree-sitter language name
+
+    Returns:
+        Tree-sitter parser or None if not available
+    """
+    if not TREE_SITTER_AVAILABLE or get_parser is None:
+        return None
+
+    parsers = getattr(_thread_local, "parsers", None)
+    if parsers is None:
+        parsers = _thread_local.parsers = {}
+    if language not in parsers:
+        try:
+            parsers[language] = get_parser(language)
+        except Exception as e:
+            logger.warning(f"Failed to get Tree-sitter parser for {language}: {e}")
+            parsers[language] = None
+    return parsers[language]
+
+
+def get_element_query(language: str):
+    """Get the query capturing the code elements of a language.
+
+    The query matches the element node types that exist in the grammar of the
+    language; it is compiled once per process.
+
+    Args:
+        language: Tree-sitter language name
+
+    Returns:
+        Tree-sitter query or None if the language has no element node types
+    """
+    if language in _element_queries:
+        return _element_queries[language]
+
+    ts_language = get_language(language)
+    node_types = []
+    for node_type in TREE_SITTER_ELEMENT_TYPES:
+        try:
+            ts_language.query(f"({node_type}) @element")
+        except NameError:
+            # Node type does not exist in this grammar
+            continue
+        node_types.append(f"({node_type})")
+
+    query = (
+        ts_language.query(f"[{' '.join(node_types)}] @element") if node_types else None
+    )
+    _element_queries[language] = query
+    return query
+
+
 class CodeDocumentParser(BaseDocumentParser):
     """Parser for code documents with AST analysis and language detection."""
 
@@ -116,9 +193,6 @@ class CodeDocumentParser(BaseDocumentParser):
             ".dart": "dart",
         }
 
-        # Cache for Tree-sitter parsers
-        self._parsers = {}
-
         # Check tree-sitter availability
         if not TREE_SITTER_AVAILABLE:
             self.logger.warning("Tree-sitter not available, will use fallback parsing")
@@ -254,29 +328,6 @@ class CodeDocumentParser(BaseDocumentParser):
 
         return elements
 
-    def _get_tree_sitter_parser(self, language: str):
-        """Get or create a Tree-sitter parser for the given language.
-
-        Args:
-            language: Tree-sitter language name
-
-        Returns:
-            Tree-sitter parser or None if not available
-        """
-        if not TREE_SITTER_AVAILABLE or get_parser is None:
-            return None
-
-        if language in self._parsers:
-            return self._parsers[language]
-
-        try:
-            parser = get_parser(language)
-            self._parsers[language] = parser
-            return parser
-        except Exception as e:
-            self.logger.warning(f"Failed to get Tree-sitter parser for {language}: {e}")
-            return None
-
     def _parse_with_tree_sitter(self, content: str, language: str) -> list[CodeElement]:
         """Parse code using Tree-sitter AST.
 
@@ -287,17 +338,19 @@ class CodeDocumentParser(BaseDocumentParser):
         Returns:
             List of code elements
         """
-        parser = self._get_tree_sitter_parser(language)
+        parser = get_tree_sitter_parser(language)
         if not parser:
             return []
 
         try:
-            tree = parser.parse(content.encode("utf-8"))
-            root_node = tree.root_node
-
-            elements = []
-            self._extract_tree_sitter_elements(
-                root_node, content.encode("utf-8"), elements, language, level=0
+            query = get_element_query(language)
+            if query is None:
+                return []
+
+            content_bytes = content.encode("utf-8")
+            tree = parser.parse(content_bytes)
+            elements = self._extract_tree_sitter_elements(
+                tree.root_node, content_bytes, language, query
             )
 
             # Limit elements to prevent timeouts
@@ -314,61 +367,64 @@ class CodeDocumentParser(BaseDocumentParser):
             return []
 
     def _extract_tree_sitter_elements(
-        self,
-        node,
-        content_bytes: bytes,
-        elements: list[CodeElement],
-        language: str,
-        level: int = 0,
-    ):
-        """Extract elements from Tree-sitter AST node.
+        self, root_node, content_bytes: bytes, language: str, query
+    ) -> list[CodeElement]:
+        """Extract elements from a Tree-sitter tree with the element query.
+
+        Elements are returned in document order, parents before their
+        children. Elements nested deeper than ``MAX_RECURSION_DEPTH`` are
+        skipped, as are elements larger than ``MAX_ELEMENT_SIZE`` together with
+        everything nested in them.
 
         Args:
-            node: Tree-sitter node
-            content_bytes: Source code as bytes
-            elements: List to append elements to
+            root_node: Root node of the tree
+            content_bytes: Source code as UTF-8 bytes
             language: Programming language
-            level: Current nesting level
-        """
-        if level > MAX_RECURSION_DEPTH:
-            return
+            query: Element query of the language
 
-        # Define element type mapping based on node type
-        element_type_map = {
-            "function_definition": CodeElementType.FUNCTION,
-            "method_definition": CodeElementType.METHOD,
-            "class_definition": CodeElementType.CLASS,
-            "interface_declaration": CodeElementType.INTERFACE,
-            "enum_declaration": CodeElementType.ENUM,
-            "struct_declaration": CodeElementType.STRUCT,
-            "variable_declaration": CodeElementType.VARIABLE,
-            "import_statement": CodeElementType.IMPORT,
-            "comment": CodeElementType.COMMENT,
-        }
+        Returns:
+            List of code elements
+        """
+        depths = {root_node.id: 0}
+
+        def depth(node) -> int:
+            # Depth of a node below the root, memoized along its ancestors
+            ancestors = []
+            while node.id not in depths:
+                ancestors.append(node)
+                node = node.parent
+            level = depths[node.id]
+            for ancestor in reversed(ancestors):
+                level += 1
+                depths[ancestor.id] = level
+            return level
+
+        nodes = [(node, depth(node)) for node, _ in query.captures(root_node)]
+        nodes.sort(key=lambda item: (item[0].start_byte, item[1]))
 
-        # Map node type to code element type
-        element_type = element_type_map.get(node.type)
+        elements = []
+        skipped_end = -1
+        for node, level in nodes:
+            if level > MAX_RECURSION_DEPTH or node.start_byte < skipped_end:
+                continue
 
-        if element_type:
             # Extract element content
             element_content = content_bytes[node.start_byte : node.end_byte].decode(
                 "utf-8"
             )
 
-            # Skip overly large elements
+            # Skip overly large elements and their children
             if len(element_content) > MAX_ELEMENT_SIZE:
                 self.logger.debug(
                     f"Skipping large {node.type} element ({len(element_content)} chars)"
                 )
-                return
-
-            # Extract element name
-            element_name = self._extract_element_name(node, content_bytes, language)
+                skipped_end = node.end_byte
+                continue
 
             # Create code element
             element = CodeElement(
-                name=element_name,
-                element_type=element_type,
+                name=self._extract_element_name(node, content_bytes, language),
+                element_type=TREE_SITTER_ELEMENT_TYPES[node.type],
                 content=element_content,
                 start_line=node.start_point[0] + 1,
                 end_line=node.end_point[0] + 1,
@@ -380,11 +436,7 @@ class CodeDocumentParser(BaseDocumentParser):
 
             elements.append(element)
 
-        # Recursively process child nodes
-        for child in node.children:
-            self._extract_tree_sitter_elements(
-                child, content_bytes, elements, language, level + 1
-            )
+        return elements
 
     def _extract_element_name(self, node, content_bytes: bytes, language: str) -> str:
         """Extract element name from Tree-sitter node.
@@ -458,7 +510,7 @@ class CodeDocumentParser(BaseDocumentParser):
         try:
             tree = ast.parse(content)
             elements = []
-            self._extract_ast_elements(tree, content, elements, level=0)
+            self._extract_ast_elements(tree, content.split("\n"), elements, level=0)
             return elements
 
         except SyntaxError as e:
@@ -469,21 +521,23 @@ class CodeDocumentParser(BaseDocumentParser):
             return []
 
     def _extract_ast_elements(
-        self, node: ast.AST, content: str, elements: list[CodeElement], level: int = 0
+        self,
+        node: ast.AST,
+        lines: list[str],
+        elements: list[CodeElement],
+        level: int = 0,
     ):
         """Extract elements from Python AST node.
 
         Args:
             node: AST node
-            content: Source code content
+            lines: Lines of the source code
             elements: List to append elements to
             level: Current nesting level
         """
         if level > MAX_RECURSION_DEPTH:
             return
 
-        lines = content.split("\n")
-
         if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
             element_type = (
                 CodeElementType.METHOD if level > 0 else CodeElementType.FUNCTION
@@ -545,7 +599,7 @@ class CodeDocumentParser(BaseDocumentParser):
 
         # Recursively process child nodes
         for child in ast.iter_child_nodes(node):
-            self._extract_ast_elements(child, content, elements, level + 1)
+            self._extract_ast_elements(child, lines, elements, level + 1)
 
     def _get_decorator_name(self, decorator: ast.AST) -> str:
         """Extract decorator name from AST node.
@@ -1,5 +1,6 @@
 """Code metadata extractor for enhanced programming language analysis."""
 
+import math
 import re
 from typing import Any
 
@@ -10,8 +11,52 @@ from qdrant_loader.core.chunking.strategy.base.metadata_extractor import (
 )
 from qdrant_loader.core.document import Document
 
+from .code_scan import CodeScan
+
 logger = structlog.get_logger(__name__)
 
+# Entity patterns
+_CLASS_NAME = re.compile(r"\b(?:class|interface|struct|enum)\s+([A-Z][a-zA-Z0-9_]*)")
+_FUNCTION_NAMES = (
+    re.compile(r"\bdef\s+([a-zA-Z_][a-zA-Z0-9_]*)"),  # Python
+    re.compile(r"\bfunction\s+([a-zA-Z_][a-zA-Z0-9_]*)"),  # JavaScript
+    re.compile(
+        r"\b(?:public|private|protected)?\s*(?:static\s+)?[a-zA-Z_][a-zA-Z0-9_<>]*\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\("
+    ),  # Java/C#
+)
+_CONSTANT_NAME = re.compile(r"\b([A-Z][A-Z0-9_]{2,})\b")
+
+# Import statement patterns
+_IMPORTS = (
+    re.compile(r"import\s+([a-zA-Z_][a-zA-Z0-9_.]*)"),  # Python: import module
+    re.compile(
+        r"from\s+([a-zA-Z_][a-zA-Z0-9_.]*)\s+import"
+    ),  # Python: from module import
+    re.compile(r'#include\s*[<"]([^>"]+)[>"]'),  # C/C++
+    re.compile(r'require\s*\([\'"]([^\'"]+)[\'"]\)'),  # Node.js
+    re.compile(r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]'),  # ES6
+)
+
+# Cyclomatic complexity indicators
+_BRANCH_INDICATORS = (
+    "if ",
+    "elif ",
+    "else:",
+    "while ",
+    "for ",
+    "try:",
+    "except:",
+    "case ",
+)
+_COMPLEXITY_INDICATORS = _BRANCH_INDICATORS + (
+    "&&",
+    "||",
+    "?",
+    "and ",
+    "or ",
+    "switch",
+)
+
 
 class CodeMetadataExtractor(BaseMetadataExtractor):
     """Enhanced metadata extractor for code documents."""
@@ -31,7 +76,11 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
         )
 
     def extract_hierarchical_metadata(
-        self, content: str, chunk_metadata: dict[str, Any], document: Document
+        self,
+        content: str,
+        chunk_metadata: dict[str, Any],
+        document: Document,
+        scan: CodeScan | None = None,
     ) -> dict[str, Any]:
         """Extract comprehensive code metadata from chunk content.
 
@@ -39,24 +88,28 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             content: Code chunk content
             chunk_metadata: Existing chunk metadata
             document: Original document
+            scan: Scan of the content, if already computed
 
         Returns:
             Enhanced metadata dictionary
         """
         metadata = chunk_metadata.copy()
+        scan = scan or CodeScan(content)
 
         # Add enhanced code analysis
         metadata.update(
             {
                 "dependency_graph": self._build_dependency_graph(content),
-                "complexity_metrics": self._calculate_complexity_metrics(content),
-                "code_patterns": self._identify_code_patterns(content),
-                "documentation_coverage": self._calculate_doc_coverage(content),
-                "test_indicators": self._identify_test_code(content),
-                "security_indicators": self._analyze_security_patterns(content),
-                "performance_indicators": self._analyze_performance_patterns(content),
+                "complexity_metrics": self._calculate_complexity_metrics(content, scan),
+                "code_patterns": self._identify_code_patterns(content, scan),
+                "documentation_coverage": self._calculate_doc_coverage(content, scan),
+                "test_indicators": self._identify_test_code(content, scan),
+                "security_indicators": self._analyze_security_patterns(content, scan),
+                "performance_indicators": self._analyze_performance_patterns(
+                    content, scan
+                ),
                 "maintainability_metrics": self._calculate_maintainability_metrics(
-                    content
+                    content, scan
                 ),
                 "content_type": "code",
             }
@@ -81,22 +134,14 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
         entities = []
 
         # Extract class names
-        class_pattern = r"\b(?:class|interface|struct|enum)\s+([A-Z][a-zA-Z0-9_]*)"
-        entities.extend(re.findall(class_pattern, text))
+        entities.extend(_CLASS_NAME.findall(text))
 
         # Extract function/method names
-        function_patterns = [
-            r"\bdef\s+([a-zA-Z_][a-zA-Z0-9_]*)",  # Python
-            r"\bfunction\s+([a-zA-Z_][a-zA-Z0-9_]*)",  # JavaScript
-            r"\b(?:public|private|protected)?\s*(?:static\s+)?[a-zA-Z_][a-zA-Z0-9_<>]*\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(",  # Java/C#
-        ]
-
-        for pattern in function_patterns:
-            entities.extend(re.findall(pattern, text))
+        for pattern in _FUNCTION_NAMES:
+            entities.extend(pattern.findall(text))
 
         # Extract constant names (usually uppercase)
-        constant_pattern = r"\b([A-Z][A-Z0-9_]{2,})\b"
-        entities.extend(re.findall(constant_pattern, text))
+        entities.extend(_CONSTANT_NAME.findall(text))
 
         # Remove duplicates and return
         return list(set(entities))
@@ -118,17 +163,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
         }
 
         # Extract import statements
-        import_patterns = [
-            r"import\s+([a-zA-Z_][a-zA-Z0-9_.]*)",  # Python: import module
-            r"from\s+([a-zA-Z_][a-zA-Z0-9_.]*)\s+import",  # Python: from module import
-            r'#include\s*[<"]([^>"]+)[>"]',  # C/C++
-            r'require\s*\([\'"]([^\'"]+)[\'"]\)',  # Node.js
-            r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]',  # ES6
-        ]
-
-        for pattern in import_patterns:
-            imports = re.findall(pattern, content)
-            dependencies["imports"].extend(imports)
+        for pattern in _IMPORTS:
+            dependencies["imports"].extend(pattern.findall(content))
 
         # Python standard library modules (common ones)
         python_stdlib = {
@@ -255,106 +291,67 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return False
 
-    def _calculate_complexity_metrics(self, content: str) -> dict[str, Any]:
+    def _calculate_complexity_metrics(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Calculate code complexity metrics.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of complexity metrics
         """
-        lines = content.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
+        scan = scan or CodeScan(content)
 
         # Cyclomatic complexity indicators
-        complexity_indicators = [
-            "if ",
-            "elif ",
-            "else:",
-            "while ",
-            "for ",
-            "try:",
-            "except:",
-            "case ",
-            "&&",
-            "||",
-            "?",
-            "and ",
-            "or ",
-            "switch",
-        ]
-
         cyclomatic_complexity = 1  # Base complexity
-        for indicator in complexity_indicators:
-            cyclomatic_complexity += content.lower().count(indicator.lower())
-
-        # Nesting depth
-        max_nesting = 0
-        current_nesting = 0
-
-        for line in lines:
-            stripped = line.strip()
-            if any(
-                keyword in stripped
-                for keyword in ["if", "for", "while", "try", "def", "class"]
-            ):
-                current_nesting += 1
-                max_nesting = max(max_nesting, current_nesting)
-            elif stripped in ["end", "}"] or (
-                stripped.startswith("except") or stripped.startswith("finally")
-            ):
-                current_nesting = max(0, current_nesting - 1)
+        for indicator in _COMPLEXITY_INDICATORS:
+            cyclomatic_complexity += scan.lower.count(indicator)
 
         return {
             "cyclomatic_complexity": cyclomatic_complexity,
-            "lines_of_code": len(non_empty_lines),
-            "total_lines": len(lines),
-            "nesting_depth": max_nesting,
-            "complexity_density": cyclomatic_complexity / max(len(non_empty_lines), 1),
-            "maintainability_index": self._calculate_maintainability_index(content),
+            "lines_of_code": scan.non_empty_lines,
+            "total_lines": scan.line_count,
+            "nesting_depth": scan.nesting_depth,
+            "complexity_density": cyclomatic_complexity / max(scan.non_empty_lines, 1),
+            "maintainability_index": self._calculate_maintainability_index(
+                content, scan
+            ),
         }
 
-    def _calculate_maintainability_index(self, content: str) -> float:
+    def _calculate_maintainability_index(
+        self, content: str, scan: CodeScan | None = None
+    ) -> float:
         """Calculate maintainability index (0-100 scale).
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Maintainability index score
         """
-        import math
-
         if not content.strip():
             return 50  # Default for empty content
 
+        scan = scan or CodeScan(content)
+
         # Calculate lines of code and complexity
-        lines = content.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
-        loc = len(non_empty_lines)
+        loc = scan.non_empty_lines
 
         # Simple cyclomatic complexity
-        complexity_indicators = [
-            "if ",
-            "elif ",
-            "else:",
-            "while ",
-            "for ",
-            "try:",
-            "except:",
-            "case ",
-        ]
         complexity = 1  # Base complexity
-        for indicator in complexity_indicators:
-            complexity += content.lower().count(indicator.lower())
+        for indicator in _BRANCH_INDICATORS:
+            complexity += scan.lower.count(indicator)
 
         # Simplified maintainability index calculation
         # Based on Halstead metrics and cyclomatic complexity
 
         # Count operators and operands (simplified)
-        operators = len(re.findall(r"[+\-*/=<>!&|%^~]", content))
-        operands = len(re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", content))
+        operators = scan.operator_count
+        operands = len(scan.identifiers)
 
         # Avoid division by zero
         if operands == 0:
@@ -376,11 +373,14 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return 50  # Default moderate maintainability
 
-    def _identify_code_patterns(self, content: str) -> dict[str, Any]:
+    def _identify_code_patterns(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Identify common code patterns and design elements.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of identified patterns
@@ -392,7 +392,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "code_smells": [],
         }
 
-        content_lower = content.lower()
+        scan = scan or CodeScan(content)
+        content_lower = scan.lower
 
         # Design patterns
         if "singleton" in content_lower or "__new__" in content:
@@ -409,7 +410,7 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
         # Anti-patterns and code smells
         if content.count("if ") > 5:
             patterns["code_smells"].append("too_many_conditionals")
-        if len(content.split("\n")) > 100:
+        if scan.line_count > 100:
             patterns["code_smells"].append("long_method")
         if content.count("def ") > 20 or content.count("function ") > 20:
             patterns["code_smells"].append("large_class")
@@ -426,36 +427,29 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return patterns
 
-    def _calculate_doc_coverage(self, content: str) -> dict[str, Any]:
+    def _calculate_doc_coverage(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Calculate documentation coverage metrics.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of documentation metrics
         """
-        # Count functions and classes using more precise regex patterns
-        import re
-
-        # Match function definitions (def at start of line with optional whitespace)
-        function_count = len(re.findall(r"^\s*def\s+\w+", content, re.MULTILINE))
-        function_count += len(re.findall(r"^\s*function\s+\w+", content, re.MULTILINE))
+        scan = scan or CodeScan(content)
 
-        # Match class definitions (class at start of line with optional whitespace)
-        class_count = len(re.findall(r"^\s*class\s+\w+", content, re.MULTILINE))
+        # Functions and classes defined at the start of a line
+        function_count = scan.function_definitions
+        class_count = scan.class_definitions
 
         # Count docstrings
         docstring_count = content.count('"""') // 2 + content.count("'''") // 2
 
         # Count comments
-        comment_lines = len(
-            [
-                line
-                for line in content.split("\n")
-                if line.strip().startswith(("#", "//", "/*"))
-            ]
-        )
+        comment_lines = scan.comment_lines
 
         total_elements = function_count + class_count
         doc_coverage = (
@@ -470,16 +464,17 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "documentation_coverage_percent": doc_coverage,
             "has_module_docstring": content.strip().startswith('"""')
             or content.strip().startswith("'''"),
-            "avg_comment_density": (
-                comment_lines / len(content.split("\n")) if content else 0
-            ),
+            "avg_comment_density": (comment_lines / scan.line_count if content else 0),
         }
 
-    def _identify_test_code(self, content: str) -> dict[str, Any]:
+    def _identify_test_code(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Identify test-related code indicators.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of test indicators
@@ -493,7 +488,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "fixture_usage": False,
         }
 
-        content_lower = content.lower()
+        scan = scan or CodeScan(content)
+        content_lower = scan.lower
 
         # Check if it's a test file
         test_keywords = ["test_", "test", "spec", "unittest", "pytest"]
@@ -542,11 +538,14 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return test_indicators
 
-    def _analyze_security_patterns(self, content: str) -> dict[str, Any]:
+    def _analyze_security_patterns(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Analyze security-related patterns in code.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of security indicators
@@ -557,7 +556,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "sensitive_data_handling": [],
         }
 
-        content_lower = content.lower()
+        scan = scan or CodeScan(content)
+        content_lower = scan.lower
 
         # Potential vulnerabilities
         if "eval(" in content_lower:
@@ -598,11 +598,14 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return security_indicators
 
-    def _analyze_performance_patterns(self, content: str) -> dict[str, Any]:
+    def _analyze_performance_patterns(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Analyze performance-related patterns in code.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of performance indicators
@@ -613,7 +616,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "resource_usage": [],
         }
 
-        content_lower = content.lower()
+        scan = scan or CodeScan(content)
+        content_lower = scan.lower
 
         # Optimization patterns
         if any(keyword in content_lower for keyword in ["cache", "memoize", "lazy"]):
@@ -633,29 +637,8 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             performance_indicators["potential_bottlenecks"].append("nested_loops")
 
         # Detect recursion patterns (exclude the definition line itself)
-        lines = content.split("\n")
-        def_pattern = re.compile(
-            r"^\s*(?:async\s+)?def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\("
-        )
-        for idx, line in enumerate(lines):
-            match = def_pattern.match(line)
-            if not match:
-                continue
-            func_name = match.group(1)
-            # Count calls to the function name on lines other than the definition line
-            bare_call_regex = re.compile(r"\b" + re.escape(func_name) + r"\s*\(")
-            method_call_regex = re.compile(r"\." + re.escape(func_name) + r"\s*\(")
-            call_count = 0
-            for j, other_line in enumerate(lines):
-                if j == idx:
-                    continue
-                if bare_call_regex.search(other_line) or method_call_regex.search(
-                    other_line
-                ):
-                    call_count += 1
-            if call_count > 0:
-                performance_indicators["potential_bottlenecks"].append("recursion")
-                break
+        if scan.has_recursive_call():
+            performance_indicators["potential_bottlenecks"].append("recursion")
 
         if content.count("database") > 5 or content.count("query") > 5:
             performance_indicators["potential_bottlenecks"].append("database_heavy")
@@ -674,27 +657,30 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
 
         return performance_indicators
 
-    def _calculate_maintainability_metrics(self, content: str) -> dict[str, Any]:
+    def _calculate_maintainability_metrics(
+        self, content: str, scan: CodeScan | None = None
+    ) -> dict[str, Any]:
         """Calculate maintainability-related metrics.
 
         Args:
             content: Code content
+            scan: Scan of the content, if already computed
 
         Returns:
             Dictionary of maintainability metrics
         """
-        lines = content.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
+        scan = scan or CodeScan(content)
+        line_count = scan.line_count
 
         # Calculate various metrics
-        avg_line_length = sum(len(line) for line in lines) / len(lines) if lines else 0
-        max_line_length = max(len(line) for line in lines) if lines else 0
+        avg_line_length = scan.avg_line_length
+        max_line_length = scan.max_line_length
 
         # Count long lines (> 120 characters)
-        long_lines = len([line for line in lines if len(line) > 120])
+        long_lines = scan.long_lines
 
         # Calculate code density (non-empty lines / total lines)
-        code_density = len(non_empty_lines) / len(lines) if lines else 0
+        code_density = scan.non_empty_lines / line_count
 
         # Estimate readability score based on various factors
         readability_score = 100
@@ -702,7 +688,7 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             readability_score -= 20
         if max_line_length > 200:
             readability_score -= 15
-        if long_lines > len(lines) * 0.3:
+        if long_lines > line_count * 0.3:
             readability_score -= 25
         if code_density < 0.5:
             readability_score -= 10
@@ -713,7 +699,7 @@ class CodeMetadataExtractor(BaseMetadataExtractor):
             "long_lines_count": long_lines,
             "code_density": code_density,
             "readability_score": max(0, readability_score),
-            "estimated_read_time_minutes": len(non_empty_lines)
+            "estimated_read_time_minutes": scan.non_empty_lines
             / 50,  # ~50 lines per minute
         }
 
@@ -0,0 +1,151 @@
+"""Shared text analysis of code chunks for the code chunking components.
+
+The metadata extractor and the chunk processor derive many metrics from the
+same chunk content. ``CodeScan`` computes them once per chunk: the line
+statistics in a single pass over the lines, and identifiers, operators and
+calls in single tokenizing passes with precompiled patterns.
+"""
+
+import re
+from functools import cached_property
+
+# Identifiers (group 1) and operators, matched in one pass
+_TOKEN = re.compile(r"(\b[a-zA-Z_][a-zA-Z0-9_]*\b)|[+\-*/=<>!&|%^~]")
+# Function and method calls: an identifier followed by "("
+_CALL = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+_PYTHON_FUNCTION = re.compile(r"\s*(?:async\s+)?def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+_DEFINITION = re.compile(r"\s*(def|function|class)\s+\w")
+_MEANINGFUL_CHAR = re.compile(r"[\w$]")
+
+_COMMENT_PREFIXES = ("#", "//", "/*")
+# Keywords anywhere in a line that open a nesting level
+_NESTING_KEYWORD = re.compile(r"if|for|while|try|def|class")
+
+
+class CodeScan:
+    """Metrics of a code chunk, computed once and shared by all analyses."""
+
+    def __init__(self, content: str):
+        """Scan the lines of code content.
+
+        Args:
+            content: Code content
+        """
+        self.content = content
+        self.lines = content.split("\n")
+
+        self.non_empty_lines = 0
+        # Lines starting with "#", "//" or "/*"
+        self.comment_lines = 0
+        # Lines starting with "--" (SQL and Lua comments)
+        self.dash_comment_lines = 0
+        self.total_line_length = 0
+        self.max_line_length = 0
+        self.long_lines = 0  # Lines longer than 120 characters
+        # Indentation of the indented non-empty lines
+        self.indentations: list[int] = []
+        # Function ("def" and "function") and class definitions at line start
+        self.function_definitions = 0
+        self.class_definitions = 0
+        # Line index and name of every Python function definition
+        self.python_functions: list[tuple[int, str]] = []
+        self.nesting_depth = 0
+
+        nesting = 0
+        for index, line in enumerate(self.lines):
+            length = len(line)
+            self.total_line_length += length
+            if length > self.max_line_length:
+                self.max_line_length = length
+            if length > 120:
+                self.long_lines += 1
+
+            stripped = line.strip()
+
+            # Nesting heuristic: keywords open a level, closing lines end one
+            if _NESTING_KEYWORD.search(stripped):
+                nesting += 1
+                self.nesting_depth = max(self.nesting_depth, nesting)
+            elif stripped in ("end", "}") or stripped.startswith(("except", "finally")):
+                nesting = max(0, nesting - 1)
+
+            if not stripped:
+                continue
+            self.non_empty_lines += 1
+            if stripped.startswith(_COMMENT_PREFIXES):
+                self.comment_lines += 1
+            elif stripped.startswith("--"):
+                self.dash_comment_lines += 1
+
+            indentation = length - len(line.lstrip())
+            if indentation > 0:
+                self.indentations.append(indentation)
+
+            definition = _DEFINITION.match(line)
+            if definition:
+                if definition.group(1) == "class":
+                    self.class_definitions += 1
+                else:
+                    self.function_definitions += 1
+            if "def" in line:
+                function = _PYTHON_FUNCTION.match(line)
+                if function:
+                    self.python_functions.append((index, function.group(1)))
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    @property
+    def avg_line_length(self) -> float:
+        return self.total_line_length / len(self.lines)
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased content."""
+        return self.content.lower()
+
+    @cached_property
+    def _tokens(self) -> tuple[list[str], int]:
+        identifiers = []
+        operator_count = 0
+        for identifier in _TOKEN.findall(self.content):
+            if identifier:
+                identifiers.append(identifier)
+            else:
+                operator_count += 1
+        return identifiers, operator_count
+
+    @property
+    def identifiers(self) -> list[str]:
+        """Identifiers in the content, in order of appearance."""
+        return self._tokens[0]
+
+    @property
+    def operator_count(self) -> int:
+        """Number of operator characters in the content."""
+        return self._tokens[1]
+
+    @cached_property
+    def meaningful_char_count(self) -> int:
+        """Number of alphanumeric, "_" and "$" characters."""
+        return len(_MEANINGFUL_CHAR.findall(self.content))
+
+    @cached_property
+    def call_lines(self) -> dict[str, set[int]]:
+        """Indexes of the lines calling each function or method name."""
+        calls: dict[str, set[int]] = {}
+        for index, line in enumerate(self.lines):
+            if "(" not in line:
+                continue
+            for name in _CALL.findall(line):
+                calls.setdefault(name, set()).add(index)
+        return calls
+
+    def has_recursive_call(self) -> bool:
+        """Check whether a Python function is called outside its definition line."""
+        call_lines = self.call_lines if self.python_functions else {}
+        return any(
+            call_lines.get(name, set()) - {index}
+            for index, name in self.python_functions
+        )
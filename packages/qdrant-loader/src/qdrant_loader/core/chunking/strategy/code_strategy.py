@@ -13,6 +13,7 @@ from .code import (
     CodeMetadataExtractor,
     CodeSectionSplitter,
 )
+from .code.code_scan import CodeScan
 
 logger = structlog.get_logger(__name__)
 
@@ -144,10 +145,13 @@ class CodeChunkingStrategy(BaseChunkingStrategy):
                     }
                 )
 
+                # Scan the chunk once for all code metrics
+                scan = CodeScan(chunk_content)
+
                 # Enhanced: Use hierarchical metadata extraction
                 enriched_metadata = (
                     self.metadata_extractor.extract_hierarchical_metadata(
-                        chunk_content, chunk_meta, document
+                        chunk_content, chunk_meta, document, scan
                     )
                 )
 
@@ -155,7 +159,7 @@ class CodeChunkingStrategy(BaseChunkingStrategy):
                 # Skip NLP for large code chunks or generated code
                 skip_nlp, skip_reason = (
                     self.chunk_processor.should_skip_semantic_analysis(
-                        chunk_content, enriched_metadata
+                        chunk_content, enriched_metadata, scan
                     )
                 )
 
@@ -166,6 +170,7 @@ class CodeChunkingStrategy(BaseChunkingStrategy):
                     total_chunks=len(chunks_metadata),
                     chunk_metadata=enriched_metadata,
                     skip_nlp=skip_nlp,
+                    scan=scan,
                 )
 
                 chunked_docs.append(chunk_doc)
@@ -249,9 +254,6 @@ class CodeChunkingStrategy(BaseChunkingStrategy):
         """Clean up resources used by the code chunking strategy."""
         logger.debug("Shutting down CodeChunkingStrategy")
 
-        # Clean up document parser resources
-        if hasattr(self.document_parser, "_parsers"):
-            self.document_parser._parsers.clear()
-
-        # No additional cleanup needed for other components
+        # Tree-sitter parsers and queries are cached process-wide and shared
+        # with other strategy instances, so there is nothing to clean up
         logger.debug("CodeChunkingStrategy shutdown complete")
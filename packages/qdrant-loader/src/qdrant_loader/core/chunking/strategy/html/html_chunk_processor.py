@@ -7,6 +7,7 @@ from qdrant_loader.core.chunking.strategy.base.chunk_processor import BaseChunkP
 from qdrant_loader.core.document import Document
 
 from .html_metadata_extractor import HTMLMetadataExtractor
+from .html_tree import SECTION_NODES_KEY, HTMLElementScan
 
 
 class HTMLChunkProcessor(BaseChunkProcessor):
@@ -37,9 +38,22 @@ class HTMLChunkProcessor(BaseChunkProcessor):
         # Generate unique chunk ID
         chunk_id = Document.generate_chunk_id(original_doc.id, chunk_index)
 
+        # Scan the section elements of the parsed document when the splitter
+        # kept them; the chunk content is only parsed otherwise
+        nodes = chunk_metadata.get(SECTION_NODES_KEY)
+        if nodes is not None:
+            chunk_metadata = {
+                key: value
+                for key, value in chunk_metadata.items()
+                if key != SECTION_NODES_KEY
+            }
+            scan = HTMLElementScan(nodes)
+        else:
+            scan = HTMLElementScan.from_content(chunk_content)
+
         # Extract HTML-specific hierarchical metadata
         enriched_metadata = self.metadata_extractor.extract_hierarchical_metadata(
-            chunk_content, chunk_metadata, original_doc
+            chunk_content, chunk_metadata, original_doc, scan
         )
 
         # Add chunk-specific metadata
@@ -61,7 +75,7 @@ class HTMLChunkProcessor(BaseChunkProcessor):
         # Extract entities if NLP is enabled
         entities = []
         if not should_skip_nlp:
-            entities = self.metadata_extractor.extract_entities(chunk_content)
+            entities = self.metadata_extractor.extract_entities(chunk_content, scan)
             enriched_metadata["entities"] = entities
             enriched_metadata["nlp_skipped"] = False
         else:
@@ -80,7 +94,9 @@ class HTMLChunkProcessor(BaseChunkProcessor):
             source_type=original_doc.source_type,
             url=original_doc.url,
             content_type=original_doc.content_type,
-            title=self._generate_chunk_title(chunk_content, chunk_index, original_doc),
+            title=self._generate_chunk_title(
+                chunk_content, chunk_index, original_doc, scan
+            ),
         )
 
         return chunk_doc
@@ -127,13 +143,19 @@ class HTMLChunkProcessor(BaseChunkProcessor):
         return False
 
     def _generate_chunk_title(
-        self, content: str, chunk_index: int, original_doc: Document
+        self,
+        content: str,
+        chunk_index: int,
+        original_doc: Document,
+        scan: HTMLElementScan | None = None,
     ) -> str:
         """Generate a descriptive title for the HTML chunk."""
         try:
             # Try to extract title from HTML content using metadata extractor
             section_title = (
-                self.metadata_extractor.document_parser.extract_section_title(content)
+                self.metadata_extractor.document_parser.extract_section_title(
+                    content, scan
+                )
             )
 
             if section_title and section_title != "Untitled Section":
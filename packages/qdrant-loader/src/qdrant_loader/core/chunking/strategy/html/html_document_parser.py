@@ -8,6 +8,8 @@ from bs4 import BeautifulSoup, Tag
 
 from qdrant_loader.core.chunking.strategy.base.document_parser import BaseDocumentParser
 
+from .html_tree import HTMLElementScan, parse_html, remove_scripts
+
 
 class SectionType(Enum):
     """Types of sections in an HTML document."""
@@ -60,20 +62,27 @@ class HTMLDocumentParser(BaseDocumentParser):
             "form",
         }
 
-    def parse_document_structure(self, content: str) -> dict[str, Any]:
-        """Parse HTML DOM structure and extract semantic information."""
-        try:
-            soup = BeautifulSoup(content, "html.parser")
+    def parse_document_structure(self, content: str | BeautifulSoup) -> dict[str, Any]:
+        """Parse HTML DOM structure and extract semantic information.
 
-            # Remove script and style elements for cleaner analysis
-            for script in soup(["script", "style"]):
-                script.decompose()
+        Args:
+            content: HTML content, or a document already parsed with
+                ``parse_html`` and stripped of scripts and styles
+        """
+        try:
+            if isinstance(content, BeautifulSoup):
+                soup = content
+            else:
+                soup = parse_html(content)
+                # Remove script and style elements for cleaner analysis
+                remove_scripts(soup)
+            scan = HTMLElementScan([soup])
 
             # Extract document outline
-            headings = self._extract_heading_hierarchy(soup)
-            semantic_elements = self._identify_semantic_elements(soup)
-            links = self._extract_links(soup)
-            accessibility = self._analyze_accessibility(soup)
+            headings = self._extract_heading_hierarchy(scan)
+            semantic_elements = self._identify_semantic_elements(scan)
+            links = self._extract_links(scan)
+            accessibility = self._analyze_accessibility(scan, links)
 
             return {
                 "heading_hierarchy": headings,
@@ -82,18 +91,18 @@ class HTMLDocumentParser(BaseDocumentParser):
                 "external_links": len(
                     [l for l in links if not l.get("internal", False)]
                 ),
-                "has_navigation": bool(soup.find("nav")),
-                "has_main_content": bool(soup.find("main")),
-                "has_header": bool(soup.find("header")),
-                "has_footer": bool(soup.find("footer")),
-                "has_aside": bool(soup.find("aside")),
+                "has_navigation": bool(scan.find("nav")),
+                "has_main_content": bool(scan.find("main")),
+                "has_header": bool(scan.find("header")),
+                "has_footer": bool(scan.find("footer")),
+                "has_aside": bool(scan.find("aside")),
                 "structure_type": "html",
                 "accessibility_features": accessibility,
-                "form_count": len(soup.find_all("form")),
-                "table_count": len(soup.find_all("table")),
-                "image_count": len(soup.find_all("img")),
-                "list_count": len(soup.find_all(["ul", "ol"])),
-                "content_sections": len(soup.find_all(list(self.section_elements))),
+                "form_count": len(scan.find_all("form")),
+                "table_count": len(scan.find_all("table")),
+                "image_count": len(scan.find_all("img")),
+                "list_count": len(scan.find_all("ul", "ol")),
+                "content_sections": len(scan.find_all(*self.section_elements)),
             }
         except Exception as e:
             # Fallback structure for malformed HTML
@@ -136,11 +145,11 @@ class HTMLDocumentParser(BaseDocumentParser):
             "has_images": bool(re.search(r"<img\s+[^>]*src", str(section))),
         }
 
-    def _extract_heading_hierarchy(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+    def _extract_heading_hierarchy(self, scan: HTMLElementScan) -> list[dict[str, Any]]:
         """Extract document heading hierarchy."""
         headings = []
 
-        for heading in soup.find_all(list(self.heading_elements)):
+        for heading in scan.find_all(*self.heading_elements):
             level = int(heading.name[1])  # Extract number from h1, h2, etc.
             text = heading.get_text(strip=True)
 
@@ -156,11 +165,13 @@ class HTMLDocumentParser(BaseDocumentParser):
 
         return headings
 
-    def _identify_semantic_elements(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+    def _identify_semantic_elements(
+        self, scan: HTMLElementScan
+    ) -> list[dict[str, Any]]:
         """Identify semantic HTML elements and their roles."""
         semantic_elements = []
 
-        for element in soup.find_all(list(self.section_elements)):
+        for element in scan.find_all(*self.section_elements):
             semantic_elements.append(
                 {
                     "tag": element.name,
@@ -168,17 +179,19 @@ class HTMLDocumentParser(BaseDocumentParser):
                     "id": element.get("id"),
                     "classes": element.get("class", []),
                     "text_length": len(element.get_text(strip=True)),
-                    "has_children": bool(element.find_all()),
+                    "has_children": element.find() is not None,
                 }
             )
 
         return semantic_elements
 
-    def _extract_links(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+    def _extract_links(self, scan: HTMLElementScan) -> list[dict[str, Any]]:
         """Extract and categorize links."""
         links = []
 
-        for link in soup.find_all("a", href=True):
+        for link in scan.find_all("a"):
+            if link.get("href") is None:
+                continue
             href = link["href"]
             text = link.get_text(strip=True)
 
@@ -203,42 +216,35 @@ class HTMLDocumentParser(BaseDocumentParser):
 
         return links
 
-    def _analyze_accessibility(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _analyze_accessibility(
+        self, scan: HTMLElementScan, links: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         """Analyze accessibility features of the HTML document."""
+        images = scan.find_all("img")
+        images_with_alt = sum(1 for img in images if img.get("alt") is not None)
         accessibility = {
-            "has_lang_attribute": bool(soup.find("html", lang=True)),
-            "has_title": bool(soup.find("title")),
-            "images_with_alt": 0,
-            "images_without_alt": 0,
+            "has_lang_attribute": any(
+                html.get("lang") is not None for html in scan.find_all("html")
+            ),
+            "has_title": bool(scan.find("title")),
+            "images_with_alt": images_with_alt,
+            "images_without_alt": len(images) - images_with_alt,
             "headings_properly_nested": True,
             "has_skip_links": False,
-            "form_labels": 0,
-            "form_inputs": 0,
+            "form_labels": len(scan.find_all("label")),
+            "form_inputs": len(scan.find_all("input", "textarea", "select")),
         }
 
-        # Analyze images
-        for img in soup.find_all("img"):
-            if img.get("alt") is not None:
-                accessibility["images_with_alt"] += 1
-            else:
-                accessibility["images_without_alt"] += 1
-
         # Check for skip links
         skip_link_indicators = ["skip", "jump", "goto"]
-        for link in soup.find_all("a", href=True):
-            link_text = link.get_text(strip=True).lower()
+        for link in links:
+            link_text = link["text"].lower()
             if any(indicator in link_text for indicator in skip_link_indicators):
                 accessibility["has_skip_links"] = True
                 break
 
-        # Analyze forms
-        accessibility["form_inputs"] = len(
-            soup.find_all(["input", "textarea", "select"])
-        )
-        accessibility["form_labels"] = len(soup.find_all("label"))
-
         # Check heading nesting (simplified)
-        headings = soup.find_all(list(self.heading_elements))
+        headings = scan.find_all(*self.heading_elements)
         if len(headings) > 1:
             prev_level = 0
             for heading in headings:
@@ -281,8 +287,8 @@ class HTMLDocumentParser(BaseDocumentParser):
             "word_count": len(text_content.split()),
             "char_count": len(text_content),
             "has_code": section_type == SectionType.CODE_BLOCK,
-            "has_links": bool(tag.find_all("a")),
-            "has_images": bool(tag.find_all("img")),
+            "has_links": tag.find("a") is not None,
+            "has_images": tag.find("img") is not None,
             "is_semantic": tag_name in self.section_elements,
             "is_heading": tag_name in self.heading_elements,
             "child_count": len(tag.find_all()),
@@ -325,14 +331,22 @@ class HTMLDocumentParser(BaseDocumentParser):
             return int(tag.name[1])  # Extract number from h1, h2, etc.
         return 0
 
-    def extract_section_title(self, content: str) -> str:
-        """Extract a title from HTML content."""
+    def extract_section_title(
+        self, content: str, scan: HTMLElementScan | None = None
+    ) -> str:
+        """Extract a title from HTML content.
+
+        Args:
+            content: HTML content
+            scan: Scan of the content, to avoid parsing it again
+        """
         try:
-            soup = BeautifulSoup(content, "html.parser")
+            if scan is None:
+                scan = HTMLElementScan.from_content(content)
 
             # Try to find title in various elements
             for tag in ["h1", "h2", "h3", "h4", "h5", "h6", "title"]:
-                element = soup.find(tag)
+                element = scan.find(tag)
                 if element:
                     title = element.get_text(strip=True)
                     if title:
@@ -340,14 +354,14 @@ class HTMLDocumentParser(BaseDocumentParser):
 
             # Try to find text in semantic elements
             for tag in ["article", "section", "main"]:
-                element = soup.find(tag)
+                element = scan.find(tag)
                 if element:
                     text = element.get_text(strip=True)
                     if text:
                         return self._extract_title_from_content(text)
 
             # Fallback to first text content
-            text = soup.get_text(strip=True)
+            text = scan.get_text(strip=True)
             if text:
                 return self._extract_title_from_content(text)
 
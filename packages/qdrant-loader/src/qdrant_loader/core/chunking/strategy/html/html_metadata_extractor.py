@@ -1,6 +1,5 @@
 """HTML-specific metadata extractor for enhanced HTML document analysis."""
 
-import re
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -11,37 +10,55 @@ from qdrant_loader.core.chunking.strategy.base.metadata_extractor import (
 from qdrant_loader.core.document import Document
 
 from .html_document_parser import HTMLDocumentParser
+from .html_tree import HTMLElementScan
 
 
 class HTMLMetadataExtractor(BaseMetadataExtractor):
-    """Metadata extractor for HTML documents with semantic and accessibility analysis."""
+    """Metadata extractor for HTML documents with semantic and accessibility analysis.
+
+    All metadata is computed from an ``HTMLElementScan`` of the chunk, which is
+    built from the section elements of the already parsed document when they
+    are available, and by parsing the chunk content otherwise.
+    """
 
     def __init__(self):
         """Initialize the HTML metadata extractor."""
         self.document_parser = HTMLDocumentParser()
 
     def extract_hierarchical_metadata(
-        self, content: str, chunk_metadata: dict[str, Any], document: Document
+        self,
+        content: str,
+        chunk_metadata: dict[str, Any],
+        document: Document,
+        scan: HTMLElementScan | None = None,
     ) -> dict[str, Any]:
-        """Extract HTML-specific hierarchical metadata."""
+        """Extract HTML-specific hierarchical metadata.
+
+        Args:
+            content: Chunk content
+            chunk_metadata: Metadata of the chunk section
+            document: Source document
+            scan: Scan of the chunk content, to avoid parsing it again
+        """
         try:
-            soup = BeautifulSoup(content, "html.parser")
+            if scan is None:
+                scan = HTMLElementScan.from_content(content)
 
             metadata = chunk_metadata.copy()
 
             # Add HTML-specific metadata
             metadata.update(
                 {
-                    "dom_path": self._build_dom_path_breadcrumb(soup),
-                    "semantic_tags": self._extract_semantic_tags(soup),
-                    "accessibility_score": self._calculate_accessibility_score(soup),
-                    "has_structured_data": self._has_structured_data(soup),
-                    "interactive_elements": self._analyze_interactive_elements(soup),
-                    "media_elements": self._analyze_media_elements(soup),
+                    "dom_path": self._build_dom_path_breadcrumb(scan),
+                    "semantic_tags": self._extract_semantic_tags(scan),
+                    "accessibility_score": self._calculate_accessibility_score(scan),
+                    "has_structured_data": self._has_structured_data(scan),
+                    "interactive_elements": self._analyze_interactive_elements(scan),
+                    "media_elements": self._analyze_media_elements(scan),
                     "content_type": "html",
-                    "html_features": self._analyze_html_features(soup),
-                    "seo_indicators": self._analyze_seo_indicators(soup),
-                    "markup_quality": self._assess_markup_quality(soup),
+                    "html_features": self._analyze_html_features(scan),
+                    "seo_indicators": self._analyze_seo_indicators(scan),
+                    "markup_quality": self._assess_markup_quality(scan),
                 }
             )
 
@@ -62,30 +79,31 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
             )
             return metadata
 
-    def extract_entities(self, text: str) -> list[str]:
-        """Extract HTML-specific entities including semantic elements and IDs."""
-        try:
-            soup = BeautifulSoup(text, "html.parser")
-            entities = []
+    def extract_entities(
+        self, text: str, scan: HTMLElementScan | None = None
+    ) -> list[str]:
+        """Extract HTML-specific entities including semantic elements and IDs.
 
-            # Extract IDs as entities
-            for element in soup.find_all(id=True):
-                entities.append(f"#{element.get('id')}")
+        Args:
+            text: Chunk content
+            scan: Scan of the chunk content, to avoid parsing it again
+        """
+        try:
+            if scan is None:
+                scan = HTMLElementScan.from_content(text)
 
-            # Extract class names as entities
-            for element in soup.find_all(class_=True):
-                classes = element.get("class", [])
-                entities.extend([f".{cls}" for cls in classes])
+            # IDs and class names
+            entities = [f"#{element_id}" for element_id in scan.ids]
+            entities.extend(f".{cls}" for cls in scan.classes)
 
-            # Extract semantic element types
-            semantic_elements = soup.find_all(
-                list(self.document_parser.section_elements)
+            # Semantic element types
+            entities.extend(
+                element.name
+                for element in scan.find_all(*self.document_parser.section_elements)
             )
-            entities.extend([elem.name for elem in semantic_elements])
 
-            # Extract link destinations
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
+            # Link destinations
+            for href in self._hrefs(scan):
                 if href.startswith("#"):
                     entities.append(href)  # Internal link
                 elif href.startswith("http"):
@@ -97,13 +115,20 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
         except Exception:
             return []
 
-    def _build_dom_path_breadcrumb(self, soup: BeautifulSoup) -> str:
+    @staticmethod
+    def _hrefs(scan: HTMLElementScan) -> list[str]:
+        """Get the targets of the links in the scanned content."""
+        return [
+            link["href"] for link in scan.find_all("a") if link.get("href") is not None
+        ]
+
+    def _build_dom_path_breadcrumb(self, scan: HTMLElementScan) -> str:
         """Build a DOM path breadcrumb for context."""
         try:
             # Find the deepest meaningful element
             meaningful_elements = []
 
-            for element in soup.find_all():
+            for element in scan.elements:
                 if (
                     element.name in self.document_parser.section_elements
                     or element.name in self.document_parser.heading_elements
@@ -119,7 +144,12 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
             element = meaningful_elements[0]
             path_parts = []
 
-            while element and len(path_parts) < 5:  # Limit depth
+            # Limit depth and stay within the chunk
+            while (
+                element is not None
+                and not isinstance(element, BeautifulSoup)
+                and len(path_parts) < 5
+            ):
                 part = element.name
                 if element.get("id"):
                     part += f"#{element.get('id')}"
@@ -128,6 +158,8 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
                     part += f".{'.'.join(classes)}"
 
                 path_parts.append(part)
+                if any(element is root for root in scan.roots):
+                    break
                 element = element.parent
 
                 # Stop at body or html
@@ -139,40 +171,40 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
         except Exception:
             return "unknown"
 
-    def _extract_semantic_tags(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+    def _extract_semantic_tags(self, scan: HTMLElementScan) -> list[dict[str, Any]]:
         """Extract semantic HTML tags and their properties."""
         semantic_tags = []
 
         try:
-            for element in soup.find_all():
-                if element.name in self.document_parser.section_elements:
-                    tag_info = {
-                        "tag": element.name,
-                        "role": element.get("role"),
-                        "id": element.get("id"),
-                        "classes": element.get("class", [])[:3],  # Limit classes
-                        "has_content": bool(element.get_text(strip=True)),
-                        "child_count": len(element.find_all()),
-                    }
-                    semantic_tags.append(tag_info)
-
-            return semantic_tags[:10]  # Limit results
+            elements = scan.find_all(*self.document_parser.section_elements)
+            for element in elements[:10]:  # Limit results
+                tag_info = {
+                    "tag": element.name,
+                    "role": element.get("role"),
+                    "id": element.get("id"),
+                    "classes": element.get("class", [])[:3],  # Limit classes
+                    "has_content": bool(element.get_text(strip=True)),
+                    "child_count": len(element.find_all()),
+                }
+                semantic_tags.append(tag_info)
+
+            return semantic_tags
 
         except Exception:
             return []
 
-    def _calculate_accessibility_score(self, soup: BeautifulSoup) -> float:
+    def _calculate_accessibility_score(self, scan: HTMLElementScan) -> float:
         """Calculate an accessibility score for the HTML content."""
         try:
             score = 0.0
             max_score = 10.0
 
             # Check for lang attribute
-            if soup.find("html", lang=True):
+            if any(html.get("lang") is not None for html in scan.find_all("html")):
                 score += 1.0
 
             # Check image alt texts
-            images = soup.find_all("img")
+            images = scan.find_all("img")
             if images:
                 images_with_alt = len(
                     [img for img in images if img.get("alt") is not None]
@@ -182,7 +214,7 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
                 score += 2.0  # No images, full score
 
             # Check heading hierarchy
-            headings = soup.find_all(list(self.document_parser.heading_elements))
+            headings = scan.find_all(*self.document_parser.heading_elements)
             if headings:
                 # Simple check: first heading should be h1
                 if headings[0].name == "h1":
@@ -201,17 +233,18 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
 
             # Check for skip links
             skip_indicators = ["skip", "jump", "goto"]
-            for link in soup.find_all("a", href=True):
+            for link in scan.find_all("a"):
+                if link.get("href") is None:
+                    continue
                 link_text = link.get_text(strip=True).lower()
                 if any(indicator in link_text for indicator in skip_indicators):
                     score += 1.0
                     break
 
             # Check form labels
-            forms = soup.find_all("form")
-            if forms:
-                inputs = soup.find_all(["input", "textarea", "select"])
-                labels = soup.find_all("label")
+            if scan.find("form"):
+                inputs = scan.find_all("input", "textarea", "select")
+                labels = scan.find_all("label")
                 if inputs:
                     label_ratio = len(labels) / len(inputs)
                     score += min(label_ratio, 1.0) * 2.0
@@ -219,15 +252,11 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
                 score += 2.0  # No forms, full score
 
             # Check for ARIA attributes
-            aria_elements = soup.find_all(attrs={"role": True})
-            aria_elements.extend(soup.find_all(attrs=re.compile(r"^aria-")))
-            if aria_elements:
+            if scan.role_elements or scan.aria_elements:
                 score += 1.0
 
             # Check for semantic HTML5 elements
-            semantic_count = len(
-                soup.find_all(list(self.document_parser.section_elements))
-            )
+            semantic_count = len(scan.find_all(*self.document_parser.section_elements))
             if semantic_count > 0:
                 score += min(
                     semantic_count / 3.0, 1.0
@@ -238,84 +267,71 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
         except Exception:
             return 0.0
 
-    def _has_structured_data(self, soup: BeautifulSoup) -> bool:
+    def _has_structured_data(self, scan: HTMLElementScan) -> bool:
         """Check if the HTML contains structured data."""
         try:
             # Check for JSON-LD
-            json_ld = soup.find("script", type="application/ld+json")
-            if json_ld:
+            if any(
+                script.get("type") == "application/ld+json"
+                for script in scan.find_all("script")
+            ):
                 return True
 
             # Check for microdata
-            microdata = soup.find_all(attrs={"itemscope": True})
-            if microdata:
+            if scan.itemscope_elements:
                 return True
 
-            # Check for RDFa
-            rdfa = soup.find_all(attrs={"property": True})
-            if rdfa:
-                return True
-
-            # Check for Open Graph
-            og_tags = soup.find_all("meta", property=re.compile(r"^og:"))
-            if og_tags:
+            # Check for RDFa, which includes Open Graph tags
+            if scan.property_elements:
                 return True
 
             # Check for Twitter Cards
-            twitter_tags = soup.find_all(
-                "meta", attrs={"name": re.compile(r"^twitter:")}
+            return any(
+                (meta.get("name") or "").startswith("twitter:")
+                for meta in scan.find_all("meta")
             )
-            if twitter_tags:
-                return True
-
-            return False
 
         except Exception:
             return False
 
-    def _analyze_interactive_elements(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _analyze_interactive_elements(self, scan: HTMLElementScan) -> dict[str, Any]:
         """Analyze interactive elements in the HTML."""
         try:
-            interactive = {
-                "forms": len(soup.find_all("form")),
-                "buttons": len(
-                    soup.find_all(
-                        ["button", "input[type='button']", "input[type='submit']"]
-                    )
+            inputs = scan.find_all("input")
+            return {
+                "forms": len(scan.find_all("form")),
+                "buttons": len(scan.find_all("button"))
+                + len(
+                    [
+                        element
+                        for element in inputs
+                        if element.get("type") in ("button", "submit")
+                    ]
                 ),
-                "links": len(soup.find_all("a", href=True)),
-                "inputs": len(soup.find_all(["input", "textarea", "select"])),
-                "clickable_elements": 0,
-                "has_javascript_events": False,
+                "links": len(self._hrefs(scan)),
+                "inputs": len(scan.find_all("input", "textarea", "select")),
+                # Elements with click, touch or mouse event handlers
+                "clickable_elements": scan.pointer_handler_elements,
+                "has_javascript_events": scan.event_handler_elements > 0,
             }
 
-            # Count elements with click events
-            clickable = soup.find_all(attrs=re.compile(r"^on(click|touch|mouse)"))
-            interactive["clickable_elements"] = len(clickable)
-
-            # Check for JavaScript event handlers
-            js_events = soup.find_all(attrs=re.compile(r"^on[a-z]+"))
-            interactive["has_javascript_events"] = len(js_events) > 0
-
-            return interactive
-
         except Exception:
             return {}
 
-    def _analyze_media_elements(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _analyze_media_elements(self, scan: HTMLElementScan) -> dict[str, Any]:
         """Analyze media elements in the HTML."""
         try:
             media = {
-                "images": len(soup.find_all("img")),
-                "videos": len(soup.find_all("video")),
-                "audio": len(soup.find_all("audio")),
-                "iframes": len(soup.find_all("iframe")),
-                "canvas": len(soup.find_all("canvas")),
-                "svg": len(soup.find_all("svg")),
+                "images": len(scan.find_all("img")),
+                "videos": len(scan.find_all("video")),
+                "audio": len(scan.find_all("audio")),
+                "iframes": len(scan.find_all("iframe")),
+                "canvas": len(scan.find_all("canvas")),
+                "svg": len(scan.find_all("svg")),
             }
 
             # Analyze image properties
-            images = soup.find_all("img")
+            images = scan.find_all("img")
             if images:
                 media["images_with_alt"] = len(
                     [img for img in images if img.get("alt")]
@@ -332,45 +348,24 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
         except Exception:
             return {}
 
-    def _analyze_html_features(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _analyze_html_features(self, scan: HTMLElementScan) -> dict[str, Any]:
         """Analyze HTML5 and modern web features."""
         try:
-            features = {
-                "html5_semantic_tags": 0,
-                "custom_elements": 0,
-                "data_attributes": 0,
-                "css_classes": 0,
-                "inline_styles": 0,
+            return {
+                "html5_semantic_tags": len(
+                    scan.find_all(*self.document_parser.section_elements)
+                ),
+                # Custom elements have a hyphen in their tag name
+                "custom_elements": scan.custom_elements,
+                "data_attributes": scan.data_attribute_elements,
+                "css_classes": len(scan.classes),
+                "inline_styles": scan.styled_elements,
             }
 
-            # Count HTML5 semantic tags
-            features["html5_semantic_tags"] = len(
-                soup.find_all(list(self.document_parser.section_elements))
-            )
-
-            # Count custom elements (tags with hyphens)
-            custom_elements = soup.find_all(lambda tag: tag.name and "-" in tag.name)
-            features["custom_elements"] = len(custom_elements)
-
-            # Count data attributes
-            data_attrs = soup.find_all(attrs=re.compile(r"^data-"))
-            features["data_attributes"] = len(data_attrs)
-
-            # Count CSS classes
-            elements_with_class = soup.find_all(class_=True)
-            features["css_classes"] = sum(
-                len(elem.get("class", [])) for elem in elements_with_class
-            )
-
-            # Count inline styles
-            features["inline_styles"] = len(soup.find_all(style=True))
-
-            return features
-
         except Exception:
             return {}
 
-    def _analyze_seo_indicators(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _analyze_seo_indicators(self, scan: HTMLElementScan) -> dict[str, Any]:
         """Analyze SEO-related indicators."""
         try:
             seo = {
@@ -385,83 +380,74 @@ class HTMLMetadataExtractor(BaseMetadataExtractor):
             }
 
             # Check for title
-            title = soup.find("title")
+            title = scan.find("title")
             seo["has_title"] = bool(title and title.get_text(strip=True))
 
-            # Check for meta description
-            meta_desc = soup.find("meta", attrs={"name": "description"})
+            # Check for meta description and robots meta
+            meta_by_name = {}
+            for meta in scan.find_all("meta"):
+                meta_by_name.setdefault(meta.get("name"), meta)
+            meta_desc = meta_by_name.get("description")
             seo["has_meta_description"] = bool(meta_desc and meta_desc.get("content"))
+            seo["has_robots_meta"] = "robots" in meta_by_name
 
             # Check for H1
-            h1 = soup.find("h1")
+            h1 = scan.find("h1")
             seo["has_h1"] = bool(h1 and h1.get_text(strip=True))
 
             # Count headings
-            headings = soup.find_all(list(self.document_parser.heading_elements))
+            headings = scan.find_all(*self.document_parser.heading_elements)
             seo["heading_count"] = len(headings)
 
             # Analyze links
-            links = soup.find_all("a", href=True)
-            for link in links:
-                href = link["href"]
+            for href in self._hrefs(scan):
                 if href.startswith(("http://", "https://")) and "://" in href:
                     seo["external_links"] += 1
                 else:
                     seo["internal_links"] += 1
 
             # Check for canonical link
-            canonical = soup.find("link", rel="canonical")
-            seo["has_canonical"] = bool(canonical)
-
-            # Check for robots meta
-            robots = soup.find("meta", attrs={"name": "robots"})
-            seo["has_robots_meta"] = bool(robots)
+            seo["has_canonical"] = any(
+                "canonical" in (link.get("rel") or []) for link in scan.find_all("link")
+            )
 
             return seo
 
         except Exception:
             return {}
 
-    def _assess_markup_quality(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _assess_markup_quality(self, scan: HTMLElementScan) -> dict[str, Any]:
         """Assess the quality of HTML markup."""
         try:
             quality = {
                 "semantic_ratio": 0.0,
                 "accessibility_features": 0,
                 "deprecated_tags": 0,
-                "inline_styles": 0,
+                "inline_styles": scan.styled_elements,
                 "proper_nesting": True,
                 "valid_attributes": True,
             }
 
             # Calculate semantic ratio
-            all_elements = soup.find_all()
-            semantic_elements = soup.find_all(
-                list(self.document_parser.section_elements)
-            )
-            if all_elements:
-                quality["semantic_ratio"] = len(semantic_elements) / len(all_elements)
+            if scan.elements:
+                semantic_elements = scan.find_all(
+                    *self.document_parser.section_elements
+                )
+                quality["semantic_ratio"] = len(semantic_elements) / len(scan.elements)
 
             # Count accessibility features
-            accessibility_features = 0
-            if soup.find_all(alt=True):
-                accessibility_features += 1
-            if soup.find_all(attrs={"role": True}):
-                accessibility_features += 1
-            if soup.find_all(attrs=re.compile(r"^aria-")):
-                accessibility_features += 1
-            if soup.find_all("label"):
-                accessibility_features += 1
-            quality["accessibility_features"] = accessibility_features
+            quality["accessibility_features"] = sum(
+                [
+                    scan.alt_elements > 0,
+                    scan.role_elements > 0,
+                    scan.aria_elements > 0,
+                    scan.find("label") is not None,
+                ]
+            )
 
             # Count deprecated tags (simplified list)
             deprecated_tags = ["font", "center", "big", "small", "strike", "tt"]
-            quality["deprecated_tags"] = sum(
-                len(soup.find_all(tag)) for tag in deprecated_tags
-            )
-
-            # Count inline styles
-            quality["inline_styles"] = len(soup.find_all(style=True))
+            quality["deprecated_tags"] = len(scan.find_all(*deprecated_tags))
 
             return quality
 
@@ -12,6 +12,12 @@ from qdrant_loader.core.chunking.strategy.base.section_splitter import (
 from qdrant_loader.core.document import Document
 
 from .html_document_parser import HTMLDocumentParser, SectionType
+from .html_tree import (
+    SECTION_NODES_KEY,
+    parse_html,
+    parse_html_fragment,
+    remove_scripts,
+)
 
 
 class HTMLSectionSplitter(BaseSectionSplitter):
@@ -34,15 +40,29 @@ class HTMLSectionSplitter(BaseSectionSplitter):
         self.max_recursion_depth = 10
 
     def split_sections(
-        self, content: str, document: Document | None = None
+        self,
+        content: str,
+        document: Document | None = None,
+        soup: BeautifulSoup | None = None,
     ) -> list[dict[str, Any]]:
-        """Split HTML content into semantic sections."""
+        """Split HTML content into semantic sections.
+
+        Sections found in the DOM keep references to their elements under
+        ``SECTION_NODES_KEY`` so that chunk metadata can be computed without
+        parsing the section content again.
+
+        Args:
+            content: HTML content
+            document: Document the content belongs to
+            soup: The content parsed with ``parse_html`` and stripped of
+                scripts and styles, to avoid parsing it again
+        """
         if not content.strip():
             return []
 
         # Performance check: use simple parsing for very large files
         if len(content) > self.max_html_size_for_parsing:
-            return self._simple_html_split(content)
+            return self._simple_html_split(content, soup)
 
         try:
             # Use semantic parsing for manageable files
@@ -50,9 +70,9 @@ class HTMLSectionSplitter(BaseSectionSplitter):
                 len(content) <= self.simple_parsing_threshold
                 and self.preserve_semantic_structure
             ):
-                sections = self._semantic_html_split(content)
+                sections = self._semantic_html_split(content, soup)
             else:
-                sections = self._simple_html_split(content)
+                sections = self._simple_html_split(content, soup)
 
             if not sections:
                 return self._fallback_split(content)
@@ -67,14 +87,15 @@ class HTMLSectionSplitter(BaseSectionSplitter):
             # Fallback to simple text-based splitting
             return self._fallback_split(content)
 
-    def _semantic_html_split(self, content: str) -> list[dict[str, Any]]:
+    def _semantic_html_split(
+        self, content: str, soup: BeautifulSoup | None = None
+    ) -> list[dict[str, Any]]:
         """Split HTML using semantic structure analysis."""
         try:
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Remove script and style elements for cleaner processing
-            for script in soup(["script", "style"]):
-                script.decompose()
+            if soup is None:
+                soup = parse_html(content)
+                # Remove script and style elements for cleaner processing
+                remove_scripts(soup)
 
             sections = []
             section_count = 0
@@ -123,6 +144,7 @@ class HTMLSectionSplitter(BaseSectionSplitter):
                                 "parent_path": parent_path,
                                 "text_content": text_content,
                                 "element_position": section_count,
+                                SECTION_NODES_KEY: [element],
                             }
                         )
 
@@ -153,16 +175,17 @@ class HTMLSectionSplitter(BaseSectionSplitter):
 
         except Exception:
             # Fallback to simple parsing
-            return self._simple_html_split(content)
+            return self._simple_html_split(content, soup)
 
-    def _simple_html_split(self, content: str) -> list[dict[str, Any]]:
+    def _simple_html_split(
+        self, content: str, soup: BeautifulSoup | None = None
+    ) -> list[dict[str, Any]]:
         """Simple HTML splitting for large files or when semantic parsing fails."""
         try:
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            if soup is None:
+                soup = parse_html(content)
+                # Remove script and style elements
+                remove_scripts(soup)
 
             # Get clean text
             text = soup.get_text(separator="\n", strip=True)
@@ -326,6 +349,12 @@ class HTMLSectionSplitter(BaseSectionSplitter):
                 "is_merged": True,
             }
         )
+        if all(SECTION_NODES_KEY in section for section in sections):
+            merged_section[SECTION_NODES_KEY] = [
+                node for section in sections for node in section[SECTION_NODES_KEY]
+            ]
+        else:
+            merged_section.pop(SECTION_NODES_KEY, None)
 
         return merged_section
 
@@ -346,6 +375,8 @@ class HTMLSectionSplitter(BaseSectionSplitter):
 
                 for i, part in enumerate(split_parts):
                     split_section = section.copy()
+                    # Parts are new markup rather than whole elements
+                    split_section.pop(SECTION_NODES_KEY, None)
                     split_section.update(
                         {
                             "content": part,
@@ -371,7 +402,7 @@ class HTMLSectionSplitter(BaseSectionSplitter):
 
         try:
             # Try to split by HTML structure first
-            soup = BeautifulSoup(content, "html.parser")
+            soup = parse_html_fragment(content)
             parts = []
             current_part = ""
 
@@ -450,7 +481,7 @@ class HTMLSectionSplitter(BaseSectionSplitter):
     def _extract_text_from_html(self, html_content: str) -> str:
         """Extract clean text from HTML content."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = parse_html_fragment(html_content)
             return soup.get_text(separator=" ", strip=True)
         except Exception:
             # Fallback: remove HTML tags with regex
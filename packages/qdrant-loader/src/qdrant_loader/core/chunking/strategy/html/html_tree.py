@@ -0,0 +1,140 @@
+"""Shared HTML parsing helpers for the HTML chunking components.
+
+An HTML document is parsed once per chunking run. The section splitter keeps
+references to the elements of every section, and chunk metadata is computed
+from an ``HTMLElementScan``: a single traversal of those elements that indexes
+tags by name and counts the attributes the metadata extractor looks at.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
+
+# lxml builds the tree several times faster than the pure Python parser
+HTML_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
+# Key of the section elements in section metadata; removed before the
+# metadata is stored on chunks
+SECTION_NODES_KEY = "_nodes"
+
+
+def parse_html(content: str) -> BeautifulSoup:
+    """Parse a complete HTML document with the fastest available parser."""
+    return BeautifulSoup(content, HTML_PARSER)
+
+
+def parse_html_fragment(content: str) -> BeautifulSoup:
+    """Parse an HTML fragment.
+
+    ``html.parser`` keeps the top-level elements of a fragment as children of
+    the soup, while lxml wraps them into ``<html><body>``.
+    """
+    return BeautifulSoup(content, "html.parser")
+
+
+def remove_scripts(soup: BeautifulSoup) -> None:
+    """Remove script and style elements from a parsed document."""
+    for element in soup(["script", "style"]):
+        element.decompose()
+
+
+class HTMLElementScan:
+    """Tags and attribute statistics of HTML content, gathered in one traversal.
+
+    The scanned elements are the given root elements and all their
+    descendants, in document order.
+    """
+
+    def __init__(self, roots: Iterable[Tag]):
+        """Scan the elements below the given roots.
+
+        Args:
+            roots: Root elements; a ``BeautifulSoup`` root itself is not
+                counted as an element
+        """
+        self.roots = list(roots)
+        self.elements: list[Tag] = []
+        self.by_name: dict[str, list[Tag]] = defaultdict(list)
+
+        self.ids: list[str] = []
+        self.classes: list[str] = []
+        self.role_elements = 0
+        self.aria_elements = 0
+        self.data_attribute_elements = 0
+        self.event_handler_elements = 0
+        self.pointer_handler_elements = 0
+        self.styled_elements = 0
+        self.alt_elements = 0
+        self.itemscope_elements = 0
+        self.property_elements = 0
+        self.custom_elements = 0
+
+        for root in self.roots:
+            if not isinstance(root, BeautifulSoup):
+                self._add(root)
+            for element in root.descendants:
+                if isinstance(element, Tag):
+                    self._add(element)
+
+    @classmethod
+    def from_content(cls, content: str) -> "HTMLElementScan":
+        """Scan HTML content that has not been parsed yet."""
+        return cls([parse_html_fragment(content)])
+
+    def _add(self, element: Tag) -> None:
+        self.elements.append(element)
+        name = element.name
+        self.by_name[name].append(element)
+        if "-" in name:
+            self.custom_elements += 1
+
+        attrs = element.attrs
+        if not attrs:
+            return
+        if "id" in attrs:
+            self.ids.append(attrs["id"])
+        if "class" in attrs:
+            self.classes.extend(attrs["class"])
+        if "role" in attrs:
+            self.role_elements += 1
+        if "style" in attrs:
+            self.styled_elements += 1
+        if "alt" in attrs:
+            self.alt_elements += 1
+        if "itemscope" in attrs:
+            self.itemscope_elements += 1
+        if "property" in attrs:
+            self.property_elements += 1
+
+        aria = data = events = pointer = False
+        for attr in attrs:
+            if attr.startswith("aria-"):
+                aria = True
+            elif attr.startswith("data-"):
+                data = True
+            elif attr.startswith("on") and attr[2:3].isalpha():
+                events = True
+                if attr.startswith(("onclick", "ontouch", "onmouse")):
+                    pointer = True
+        self.aria_elements += aria
+        self.data_attribute_elements += data
+        self.event_handler_elements += events
+        self.pointer_handler_elements += pointer
+
+    def find_all(self, *names: str) -> list[Tag]:
+        """Get the scanned elements with any of the given tag names."""
+        if len(names) == 1:
+            return list(self.by_name.get(names[0], ()))
+        wanted = set(names)
+        return [element for element in self.elements if element.name in wanted]
+
+    def find(self, name: str) -> Tag | None:
+        """Get the first scanned element with the given tag name."""
+        elements = self.by_name.get(name)
+        return elements[0] if elements else None
+
+    def get_text(self, strip: bool = False) -> str:
+        """Get the text of the scanned content."""
+        return "".join(root.get_text(strip=strip) for root in self.roots)
@@ -13,6 +13,7 @@ from .html import (
     HTMLMetadataExtractor,
     HTMLSectionSplitter,
 )
+from .html.html_tree import parse_html, remove_scripts
 
 logger = structlog.get_logger(__name__)
 
@@ -96,15 +97,20 @@ class HTMLChunkingStrategy(BaseChunkingStrategy):
                 )
                 return self._fallback_chunking(document)
 
+            # Parse the document once; the parser, splitter and chunk
+            # processor all work on this tree
+            soup = parse_html(document.content)
+            remove_scripts(soup)
+
             # Parse document structure for analysis
             self.logger.debug("Analyzing HTML document structure")
-            document_structure = self.document_parser.parse_document_structure(
-                document.content
-            )
+            document_structure = self.document_parser.parse_document_structure(soup)
 
             # Split content into semantic sections
             self.logger.debug("Splitting HTML content into sections")
-            sections = self.section_splitter.split_sections(document.content, document)
+            sections = self.section_splitter.split_sections(
+                document.content, document, soup
+            )
 
             if not sections:
                 self.progress_tracker.finish_chunking(document.id, 0, "html_modular")
@@ -56,17 +56,22 @@ class JSONDocumentParser(BaseDocumentParser):
         self.json_config = settings.global_config.chunking.strategies.json_strategy
         self.chunk_size = settings.global_config.chunking.chunk_size
 
-    def parse_document_structure(self, content: str) -> dict[str, Any]:
+    def parse_document_structure(
+        self, content: str, data: Any = None
+    ) -> dict[str, Any]:
         """Parse JSON document structure and analyze composition.
 
         Args:
             content: JSON content to analyze
+            data: Already decoded content; the content is parsed when it is
+                not given
 
         Returns:
             Dictionary containing structure analysis
         """
         try:
-            data = json.loads(content)
+            if data is None:
+                data = json.loads(content)
 
             structure = {
                 "valid_json": True,
@@ -130,17 +135,22 @@ class JSONDocumentParser(BaseDocumentParser):
 
         return metadata
 
-    def parse_json_structure(self, content: str) -> JSONElement | None:
+    def parse_json_structure(
+        self, content: str, data: Any = None
+    ) -> JSONElement | None:
         """Parse JSON content into a structured element tree.
 
         Args:
             content: JSON content to parse
+            data: Already decoded content; the content is parsed when it is
+                not given
 
         Returns:
             Root JSONElement or None if parsing fails
         """
         try:
-            data = json.loads(content)
+            if data is None:
+                data = json.loads(content)
 
             # Create root element
             root_type = (
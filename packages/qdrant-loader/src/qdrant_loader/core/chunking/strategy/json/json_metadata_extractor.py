@@ -31,7 +31,11 @@ class JSONMetadataExtractor(BaseMetadataExtractor):
         self.json_config = settings.global_config.chunking.strategies.json_strategy
 
     def extract_hierarchical_metadata(
-        self, content: str, chunk_metadata: dict[str, Any], document: Document
+        self,
+        content: str,
+        chunk_metadata: dict[str, Any],
+        document: Document,
+        data: Any = None,
     ) -> dict[str, Any]:
         """Extract comprehensive JSON metadata including schema inference.
 
@@ -39,6 +43,8 @@ class JSONMetadataExtractor(BaseMetadataExtractor):
             content: JSON chunk content
             chunk_metadata: Existing chunk metadata
             document: Source document
+            data: Already decoded chunk content; the content is parsed when
+                it is not given
 
         Returns:
             Enhanced metadata dictionary
@@ -47,7 +53,8 @@ class JSONMetadataExtractor(BaseMetadataExtractor):
 
         try:
             # Parse JSON content for analysis
-            data = json.loads(content)
+            if data is None:
+                data = json.loads(content)
 
             # Core JSON metadata
             metadata.update(
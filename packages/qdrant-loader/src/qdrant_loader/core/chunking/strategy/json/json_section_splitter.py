@@ -1,6 +1,7 @@
 """JSON section splitter for intelligent element grouping and splitting."""
 
 import json
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import structlog
@@ -13,6 +14,7 @@ from qdrant_loader.core.chunking.strategy.json.json_document_parser import (
     JSONElement,
     JSONElementType,
 )
+from qdrant_loader.core.chunking.strategy.json.json_stream import JSONRecord
 from qdrant_loader.core.document import Document
 
 logger = structlog.get_logger(__name__)
@@ -76,6 +78,120 @@ class JSONSectionSplitter(BaseSectionSplitter):
 
         return final_elements
 
+    def split_json_records(
+        self, records: Iterable[JSONRecord]
+    ) -> Iterator[JSONElement]:
+        """Group streamed JSON records into elements of bounded size.
+
+        Consecutive records of the same array or object are grouped while the
+        content of the group stays within the chunk size. Records are consumed
+        lazily, so only one group is held in memory at a time.
+
+        Args:
+            records: Records from a ``JSONStreamReader``
+
+        Yields:
+            Elements whose content is at most the chunk size, except for
+            records that cannot be split further
+        """
+        group: list[tuple[JSONRecord, str]] = []
+        group_size = 0
+
+        for record in records:
+            item = self._record_item_content(record)
+            # Items are indented by two spaces and separated by ",\n"
+            item_size = len(item) + 2 * (item.count("\n") + 1)
+
+            if group and (
+                record.parent_path != group[0][0].parent_path
+                or group_size + 2 + item_size > self.chunk_size
+                or len(group) >= self.json_config.max_array_items_per_chunk
+            ):
+                yield self._create_record_group(group)
+                group = []
+
+            if not group and 4 + item_size > self.chunk_size:
+                element = self._create_record_group([(record, item)])
+                yield from self._split_large_element(element)
+                continue
+
+            # An empty group holds "[\n" and "\n]"
+            group_size = group_size + 2 + item_size if group else 4 + item_size
+            group.append((record, item))
+
+        if group:
+            yield self._create_record_group(group)
+
+    def _record_item_content(self, record: JSONRecord) -> str:
+        """Render a record as an item of its array or object, without indent."""
+        content = json.dumps(record.value, indent=2, ensure_ascii=False)
+        if record.in_array or not record.parent_path:
+            return content
+        return f"{json.dumps(record.name, ensure_ascii=False)}: {content}"
+
+    def _create_record_group(self, group: list[tuple[JSONRecord, str]]) -> JSONElement:
+        """Create an element from consecutive records of the same parent.
+
+        The content is assembled from the rendered items and is identical to
+        ``json.dumps(value, indent=2)`` of the grouped value.
+        """
+        first = group[0][0]
+
+        if len(group) == 1:
+            content = json.dumps(first.value, indent=2, ensure_ascii=False)
+            if isinstance(first.value, dict):
+                element_type = JSONElementType.OBJECT
+            elif isinstance(first.value, list):
+                element_type = JSONElementType.ARRAY
+            elif not first.parent_path:
+                element_type = JSONElementType.VALUE
+            elif first.in_array:
+                element_type = JSONElementType.ARRAY_ITEM
+            else:
+                element_type = JSONElementType.PROPERTY
+            value = first.value
+            item_count = len(value) if isinstance(value, dict | list) else 0
+            return JSONElement(
+                name=first.name,
+                element_type=element_type,
+                content=content,
+                value=value,
+                path=first.path,
+                level=first.level,
+                size=len(content),
+                item_count=item_count,
+            )
+
+        body = ",\n".join(
+            "\n".join(f"  {line}" for line in item.split("\n")) for _, item in group
+        )
+        if first.in_array:
+            last = group[-1][0]
+            start = first.path[len(first.parent_path) + 1 : -1]
+            stop = int(last.path[len(last.parent_path) + 1 : -1]) + 1
+            content = f"[\n{body}\n]"
+            element_type = JSONElementType.ARRAY
+            value = [record.value for record, _ in group]
+            name = f"grouped_items_{len(group)}"
+            path = f"{first.parent_path}[{start}:{stop}]"
+        else:
+            content = f"{{\n{body}\n}}"
+            element_type = JSONElementType.OBJECT
+            value = {record.name: record.value for record, _ in group}
+            name = f"grouped_elements_{len(group)}"
+            path = first.parent_path
+
+        return JSONElement(
+            name=name,
+            element_type=element_type,
+            content=content,
+            value=value,
+            path=path,
+            level=first.level,
+            size=len(content),
+            item_count=len(group),
+        )
+
     def _group_small_elements(self, elements: list[JSONElement]) -> list[JSONElement]:
         """Group small JSON elements into larger chunks.
 
@@ -0,0 +1,147 @@
+"""Incremental reader for large JSON documents.
+
+``JSONStreamReader`` walks the arrays and objects of a JSON document and
+yields its values one record at a time. Values that are small enough are
+decoded on their own; larger arrays and objects are descended into, so the
+document is never decoded as a whole and memory use is bounded by the
+largest record rather than by the document.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# Strings (which may contain brackets) and brackets
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass
+class JSONRecord:
+    """A decoded value of a JSON document with its position in the tree."""
+
+    name: str
+    path: str
+    parent_path: str
+    in_array: bool
+    value: Any
+    level: int
+    size: int
+
+
+class JSONStreamReader:
+    """Reader yielding the values of a JSON document as bounded records."""
+
+    def __init__(self, content: str, max_record_size: int, max_depth: int):
+        """Initialize the reader.
+
+        Args:
+            content: JSON document
+            max_record_size: Arrays and objects larger than this (in characters
+                of the document) are descended into instead of being decoded
+            max_depth: Maximum depth to descend to; values at this depth are
+                decoded whatever their size
+        """
+        self.content = content
+        self.max_record_size = max_record_size
+        self.max_depth = max_depth
+        self._decoder = json.JSONDecoder()
+
+    def records(self) -> Iterator[JSONRecord]:
+        """Yield the records of the document in document order.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+        """
+        start = self._skip_whitespace(0)
+        end = self._value_end(start, self.max_record_size)
+        if end is None and self._is_container(start):
+            end = yield from self._container_records(start, "$", 0)
+        else:
+            value, end = self._decode(start)
+            yield JSONRecord("root", "$", "", False, value, 0, end - start)
+
+        if self._skip_whitespace(end) != len(self.content):
+            raise json.JSONDecodeError("Extra data", self.content, end)
+
+    def _container_records(
+        self, start: int, path: str, level: int
+    ) -> Iterator[JSONRecord]:
+        """Yield the records of the array or object starting at ``start``.
+
+        Returns:
+            The position after the container
+        """
+        content = self.content
+        in_array = content[start] == "["
+        closing = "]" if in_array else "}"
+        pos = self._skip_whitespace(start + 1)
+        if content[pos : pos + 1] == closing:
+            return pos + 1
+
+        index = 0
+        while True:
+            if in_array:
+                name = f"item_{index}"
+                child_path = f"{path}[{index}]"
+            else:
+                name, pos = self._decode(pos)
+                if not isinstance(name, str):
+                    raise json.JSONDecodeError("Expecting property name", content, pos)
+                pos = self._expect(pos, ":")
+                child_path = f"{path}.{name}"
+
+            end = self._value_end(pos, self.max_record_size)
+            if end is None and level + 1 < self.max_depth and self._is_container(pos):
+                end = yield from self._container_records(pos, child_path, level + 1)
+            else:
+                value, end = self._decode(pos)
+                yield JSONRecord(
+                    name, child_path, path, in_array, value, level + 1, end - pos
+                )
+
+            pos = self._skip_whitespace(end)
+            if content[pos : pos + 1] == closing:
+                return pos + 1
+            pos = self._expect(pos, ",")
+            index += 1
+
+    def _value_end(self, start: int, limit: int) -> int | None:
+        """Find the end of an array or object if it is at most ``limit`` long.
+
+        Returns:
+            The position after the value, or ``None`` if the value is longer
+            than ``limit`` or is not an array or object
+        """
+        if not self._is_container(start):
+            return None
+        depth = 0
+        for match in _TOKEN.finditer(self.content, start):
+            if match.start() - start > limit:
+                return None
+            token = match.group()
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    end = match.end()
+                    return end if end - start <= limit else None
+        return None
+
+    def _is_container(self, pos: int) -> bool:
+        return self.content[pos : pos + 1] in ("[", "{")
+
+    def _decode(self, pos: int) -> tuple[Any, int]:
+        return self._decoder.raw_decode(self.content, pos)
+
+    def _skip_whitespace(self, pos: int) -> int:
+        return _WHITESPACE.match(self.content, pos).end()
+
+    def _expect(self, pos: int, char: str) -> int:
+        pos = self._skip_whitespace(pos)
+        if self.content[pos : pos + 1] != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.content, pos)
+        return self._skip_whitespace(pos + 1)
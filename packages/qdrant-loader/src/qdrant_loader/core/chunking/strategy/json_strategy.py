@@ -1,6 +1,7 @@
 """JSON-specific chunking strategy for structured data using modular architecture."""
 
 import json
+from itertools import islice
 
 import structlog
 
@@ -12,6 +13,8 @@ from qdrant_loader.core.chunking.strategy.json.json_chunk_processor import (
 )
 from qdrant_loader.core.chunking.strategy.json.json_document_parser import (
     JSONDocumentParser,
+    JSONElement,
+    JSONElementType,
 )
 from qdrant_loader.core.chunking.strategy.json.json_metadata_extractor import (
     JSONMetadataExtractor,
@@ -19,6 +22,7 @@ from qdrant_loader.core.chunking.strategy.json.json_metadata_extractor import (
 from qdrant_loader.core.chunking.strategy.json.json_section_splitter import (
     JSONSectionSplitter,
 )
+from qdrant_loader.core.chunking.strategy.json.json_stream import JSONStreamReader
 from qdrant_loader.core.document import Document
 
 logger = structlog.get_logger(__name__)
@@ -53,7 +57,7 @@ class JSONChunkingStrategy(BaseChunkingStrategy):
         # JSON-specific configuration
         self.json_config = settings.global_config.chunking.strategies.json_strategy
         self.simple_chunking_threshold = (
-            500_000  # Use simple chunking for files larger than 500KB
+            500_000  # Use streaming chunking for files larger than 500KB
         )
 
     def chunk_document(self, document: Document) -> list[Document]:
@@ -82,26 +86,24 @@ class JSONChunkingStrategy(BaseChunkingStrategy):
         )
 
         try:
-            # Performance check: for very large files, use simple chunking
+            # Performance check: stream very large files instead of decoding
+            # them as a whole
             if len(document.content) > self.simple_chunking_threshold:
-                self.progress_tracker.log_fallback(
-                    document.id, f"Large JSON file ({len(document.content)} bytes)"
-                )
-                return self._fallback_chunking(document)
+                return self._streaming_chunking(document)
 
-            # Step 1: Parse document structure using JSONDocumentParser
-            document_structure = self.document_parser.parse_document_structure(
-                document.content
-            )
-
-            if not document_structure.get("valid_json", False):
+            # Step 1: Parse the document once
+            try:
+                data = json.loads(document.content)
+            except json.JSONDecodeError:
                 self.progress_tracker.log_fallback(
                     document.id, "Invalid JSON structure"
                 )
                 return self._fallback_chunking(document)
 
-            # Step 2: Parse JSON into element tree
-            root_element = self.document_parser.parse_json_structure(document.content)
+            # Step 2: Build the element tree
+            root_element = self.document_parser.parse_json_structure(
+                document.content, data
+            )
 
             if not root_element:
                 self.progress_tracker.log_fallback(document.id, "JSON parsing failed")
@@ -126,39 +128,10 @@ class JSONChunkingStrategy(BaseChunkingStrategy):
                 return []
 
             # Step 5: Create chunked documents using chunk processor
-            chunked_docs = []
-            for i, element in enumerate(final_elements):
-                self.logger.debug(
-                    f"Processing element {i+1}/{len(final_elements)}",
-                    extra={
-                        "element_name": element.name,
-                        "element_type": element.element_type.value,
-                        "content_size": element.size,
-                    },
-                )
-
-                # Extract element-specific metadata
-                element_metadata = (
-                    self.metadata_extractor.extract_json_element_metadata(element)
-                )
-
-                # Extract hierarchical metadata from content
-                hierarchical_metadata = (
-                    self.metadata_extractor.extract_hierarchical_metadata(
-                        element.content, element_metadata, document
-                    )
-                )
-
-                # Create chunk document using processor
-                chunk_doc = self.chunk_processor.create_json_element_chunk_document(
-                    original_doc=document,
-                    element=element,
-                    chunk_index=i,
-                    total_chunks=len(final_elements),
-                    element_metadata=hierarchical_metadata,
-                )
-
-                chunked_docs.append(chunk_doc)
+            chunked_docs = [
+                self._create_element_chunk(document, element, i, len(final_elements))
+                for i, element in enumerate(final_elements)
+            ]
 
             # Log completion
             self.progress_tracker.finish_chunking(
@@ -185,6 +158,107 @@ class JSONChunkingStrategy(BaseChunkingStrategy):
             self.progress_tracker.log_fallback(document.id, f"Error: {e}")
             return self._fallback_chunking(document)
 
+    def _streaming_chunking(self, document: Document) -> list[Document]:
+        """Chunk a large JSON document without decoding it as a whole.
+
+        Records are read incrementally and grouped into bounded chunks; each
+        record is decoded once and its value is reused for the chunk metadata.
+        As in the regular path, at most ``max_objects_to_process`` chunks are
+        created, and the stream is not read any further.
+
+        Args:
+            document: Document to chunk
+
+        Returns:
+            List of chunked documents
+        """
+        reader = JSONStreamReader(
+            document.content,
+            max_record_size=self.chunk_size,
+            max_depth=self.json_config.max_recursion_depth,
+        )
+        chunked_docs = [
+            self._create_element_chunk(document, element, i, -1)
+            for i, element in enumerate(
+                islice(
+                    self.section_splitter.split_json_records(reader.records()),
+                    self.json_config.max_objects_to_process,
+                )
+            )
+        ]
+
+        # The number of chunks is only known at the end of the stream
+        for chunk in chunked_docs:
+            chunk.metadata["total_chunks"] = len(chunked_docs)
+
+        self.progress_tracker.finish_chunking(
+            document.id, len(chunked_docs), "json_streaming"
+        )
+        self.logger.info(
+            f"Chunked large JSON document into {len(chunked_docs)} chunks by streaming",
+            extra={
+                "document_id": document.id,
+                "original_size": len(document.content),
+                "chunks_created": len(chunked_docs),
+            },
+        )
+        return chunked_docs
+
+    def _create_element_chunk(
+        self,
+        document: Document,
+        element: JSONElement,
+        chunk_index: int,
+        total_chunks: int,
+    ) -> Document:
+        """Create the chunk document of a JSON element.
+
+        Args:
+            document: Source document
+            element: JSON element of the chunk
+            chunk_index: Index of the chunk
+            total_chunks: Total number of chunks
+
+        Returns:
+            Chunk document
+        """
+        self.logger.debug(
+            f"Processing element {chunk_index + 1}",
+            extra={
+                "element_name": element.name,
+                "element_type": element.element_type.value,
+                "content_size": element.size,
+            },
+        )
+
+        # Extract element-specific metadata
+        element_metadata = self.metadata_extractor.extract_json_element_metadata(
+            element
+        )
+
+        # Extract hierarchical metadata; the content of arrays and objects is
+        # their decoded value, which is reused instead of parsing it again
+        hierarchical_metadata = self.metadata_extractor.extract_hierarchical_metadata(
+            element.content,
+            element_metadata,
+            document,
+            (
+                element.value
+                if element.element_type
+                in (JSONElementType.OBJECT, JSONElementType.ARRAY)
+                else None
+            ),
+        )
+
+        # Create chunk document using processor
+        return self.chunk_processor.create_json_element_chunk_document(
+            original_doc=document,
+            element=element,
+            chunk_index=chunk_index,
+            total_chunks=total_chunks,
+            element_metadata=hierarchical_metadata,
+        )
+
     def _fallback_chunking(self, document: Document) -> list[Document]:
         """Fallback to simple text-based chunking for problematic JSON.
 
@@ -6,7 +6,10 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from qdrant_loader.core.document import Document
-from qdrant_loader.core.text_processing.semantic_analyzer import SemanticAnalyzer
+from qdrant_loader.core.text_processing.semantic_analyzer import (
+    SemanticAnalysisResult,
+    SemanticAnalyzer,
+)
 
 if TYPE_CHECKING:
     from qdrant_loader.config import Settings
@@ -26,10 +29,17 @@ class ChunkProcessor:
         self.settings = settings
 
         # Initialize semantic analyzer
+        semantic_config = settings.global_config.semantic_analysis
         self.semantic_analyzer = SemanticAnalyzer(
-            spacy_model=settings.global_config.semantic_analysis.spacy_model,
-            num_topics=settings.global_config.semantic_analysis.num_topics,
-            passes=settings.global_config.semantic_analysis.lda_passes,
+            spacy_model=semantic_config.spacy_model,
+            num_topics=semantic_config.num_topics,
+            passes=semantic_config.lda_passes,
+            batch_size=semantic_config.batch_size,
+            n_process=semantic_config.n_process,
+            pipeline_profile=semantic_config.pipeline_profile,
+            min_topic_tokens=semantic_config.min_topic_tokens,
+            cache_size=semantic_config.analysis_cache_size,
+            similarity_top_k=semantic_config.similarity_top_k,
         )
 
         # Cache for processed chunks to avoid recomputation
@@ -39,6 +49,41 @@ class ChunkProcessor:
         max_workers = settings.global_config.chunking.strategies.markdown.max_workers
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
+    def start_document(self) -> None:
+        """Reset per-document analysis state before chunking a new document.
+
+        Chunk IDs given to the semantic analyzer are only unique within a
+        document, and chunk similarities are computed within one document, so
+        results must not leak when the strategy is reused across documents.
+        """
+        self._processed_chunks.clear()
+        self.semantic_analyzer.clear_document_cache()
+
+    def analyze_chunks(self, chunks: dict[int, str]) -> None:
+        """Run semantic analysis on several chunks of a document in one batch.
+
+        The results are cached, so ``process_chunk`` and
+        ``create_chunk_document`` return them without running spaCy again.
+
+        Args:
+            chunks: Chunk contents by chunk index
+        """
+        # Identical chunks are analyzed once, like in process_chunk; keyed by
+        # content, with the index of their first occurrence
+        pending: dict[str, int] = {}
+        for index, chunk in chunks.items():
+            if chunk not in self._processed_chunks:
+                pending.setdefault(chunk, index)
+        if not pending:
+            return
+
+        logger.debug("Starting batched semantic analysis", chunk_count=len(pending))
+        analysis_results = self.semantic_analyzer.analyze_texts(
+            list(pending), [f"chunk_{index}" for index in pending.values()]
+        )
+        for chunk, analysis_result in zip(pending, analysis_results, strict=True):
+            self._processed_chunks[chunk] = self._to_metadata(analysis_result)
+
     def process_chunk(
         self, chunk: str, chunk_index: int, total_chunks: int
     ) -> dict[str, Any]:
@@ -70,7 +115,16 @@ class ChunkProcessor:
         )
 
         # Cache results
-        results = {
+        results = self._to_metadata(analysis_result)
+        self._processed_chunks[chunk] = results
+
+        logger.debug("Completed semantic analysis for chunk", chunk_index=chunk_index)
+        return results
+
+    @staticmethod
+    def _to_metadata(analysis_result: SemanticAnalysisResult) -> dict[str, Any]:
+        """Convert a semantic analysis result into chunk metadata."""
+        return {
             "entities": analysis_result.entities,
             "pos_tags": analysis_result.pos_tags,
             "dependencies": analysis_result.dependencies,
@@ -78,10 +132,6 @@ class ChunkProcessor:
             "key_phrases": analysis_result.key_phrases,
             "document_similarity": analysis_result.document_similarity,
         }
-        self._processed_chunks[chunk] = results
-
-        logger.debug("Completed semantic analysis for chunk", chunk_index=chunk_index)
-        return results
 
     def create_chunk_document(
         self,
@@ -1,6 +1,7 @@
 """Document parsing for markdown chunking strategy."""
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
@@ -10,6 +11,48 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
+def compile_line_patterns(line_pattern: str) -> tuple[re.Pattern, re.Pattern]:
+    """Compile a pattern matching at line starts for use with iter_line_matches.
+
+    Searching for the newline before a line is much faster than anchoring the
+    pattern with ``^``, which makes the regex engine try every position.
+
+    Args:
+        line_pattern: Pattern matching at the start of a line
+
+    Returns:
+        Patterns for the first line and for the following lines
+    """
+    return (
+        re.compile(line_pattern, re.MULTILINE),
+        re.compile(r"\n" + line_pattern, re.MULTILINE),
+    )
+
+
+def iter_line_matches(
+    patterns: tuple[re.Pattern, re.Pattern], text: str
+) -> Iterator[tuple[int, re.Match]]:
+    """Find the lines of a text starting with a pattern.
+
+    Args:
+        patterns: Patterns compiled with compile_line_patterns
+        text: Text to search
+
+    Yields:
+        Start offset of each matching line and its match
+    """
+    first_line_pattern, line_pattern = patterns
+    match = first_line_pattern.match(text)
+    if match:
+        yield 0, match
+    for match in line_pattern.finditer(text):
+        yield match.start() + 1, match
+
+
+# Lines starting a code fence (group 1 unset) or header lines (level, title)
+_STRUCTURE_LINE_PATTERNS = compile_line_patterns(r"(?:```|(#{1,6})[^\S\n]+(.*)$)")
+
+
 class SectionType(Enum):
     """Types of sections in a markdown document."""
 
@@ -153,6 +196,9 @@ class DocumentParser:
     def parse_document_structure(self, text: str) -> list[dict[str, Any]]:
         """Parse document into a structured representation.
 
+        The text is scanned once for code fences and headers; the lines
+        between headers are sliced from the text as content blocks.
+
         Args:
             text: The document text
 
@@ -160,54 +206,43 @@ class DocumentParser:
             List of dictionaries representing document elements
         """
         elements = []
-        lines = text.split("\n")
-        current_block = []
+        block_start = 0  # Start of the first line after the previous header
         in_code_block = False
 
-        for line in lines:
+        for line_start, match in iter_line_matches(_STRUCTURE_LINE_PATTERNS, text):
             # Check for code block markers
-            if line.startswith("```"):
+            if match.group(1) is None:
                 in_code_block = not in_code_block
-                current_block.append(line)
                 continue
 
-            # Inside code block, just accumulate lines
+            # Headers inside code blocks are content
             if in_code_block:
-                current_block.append(line)
                 continue
 
-            # Check for headers
-            header_match = re.match(r"^(#{1,6})\s+(.*?)$", line)
-            if header_match and not in_code_block:
-                # If we have a current block, save it
-                if current_block:
-                    elements.append(
-                        {
-                            "type": "content",
-                            "text": "\n".join(current_block),
-                            "level": 0,
-                        }
-                    )
-                    current_block = []
-
-                # Save the header
-                level = len(header_match.group(1))
+            # Save the lines before the header as a content block
+            if line_start > block_start:
                 elements.append(
                     {
-                        "type": "header",
-                        "text": line,
-                        "level": level,
-                        "title": header_match.group(2).strip(),
+                        "type": "content",
+                        "text": text[block_start : line_start - 1],
+                        "level": 0,
                     }
                 )
-            else:
-                current_block.append(line)
 
-        # Save the last block if not empty
-        if current_block:
+            # Save the header
             elements.append(
-                {"type": "content", "text": "\n".join(current_block), "level": 0}
+                {
+                    "type": "header",
+                    "text": text[line_start : match.end()],
+                    "level": len(match.group(1)),
+                    "title": match.group(2).strip(),
+                }
             )
+            block_start = match.end() + 1
+
+        # Save the last block, including an empty last line
+        if block_start <= len(text):
+            elements.append({"type": "content", "text": text[block_start:], "level": 0})
 
         return elements
 
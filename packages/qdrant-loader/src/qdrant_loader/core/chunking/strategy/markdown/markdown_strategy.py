@@ -15,6 +15,7 @@ from .section_splitter import SectionSplitter
 
 if TYPE_CHECKING:
     from qdrant_loader.config import Settings
+    from qdrant_loader.core.text_processing.topic_modeler import TopicModeler
 
 logger = structlog.get_logger(__name__)
 
@@ -71,6 +72,8 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
             or f"{document.source_type}:{document.source}"
         )
 
+        self.chunk_processor.start_document()
+
         # Start progress tracking
         self.progress_tracker.start_chunking(
             document.id,
@@ -112,6 +115,15 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
                 )
                 chunks_metadata = chunks_metadata[:max_chunks]
 
+            # Analyze all chunks that need NLP in one batch before building
+            # the chunk documents
+            nlp_chunks = {
+                i: chunk_meta["content"]
+                for i, chunk_meta in enumerate(chunks_metadata)
+                if not self._should_skip_nlp(chunk_meta["content"])
+            }
+            self.chunk_processor.analyze_chunks(nlp_chunks)
+
             # Create chunk documents
             chunked_docs = []
             for i, chunk_meta in enumerate(chunks_metadata):
@@ -141,24 +153,13 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
                 )
 
                 # Create chunk document using the chunk processor
-                # 🔥 FIX: Skip NLP for small documents or documents that might cause LDA issues
-                markdown_config = (
-                    self.settings.global_config.chunking.strategies.markdown
-                )
-                skip_nlp = (
-                    len(chunk_content) < markdown_config.min_content_length_for_nlp
-                    or len(chunk_content.split())
-                    < markdown_config.min_word_count_for_nlp
-                    or chunk_content.count("\n")
-                    < markdown_config.min_line_count_for_nlp
-                )
                 chunk_doc = self.chunk_processor.create_chunk_document(
                     original_doc=document,
                     chunk_content=chunk_content,
                     chunk_index=i,
                     total_chunks=len(chunks_metadata),
                     chunk_metadata=enriched_metadata,
-                    skip_nlp=skip_nlp,
+                    skip_nlp=i not in nlp_chunks,
                 )
 
                 logger.debug(
@@ -201,6 +202,22 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
             )
             return self._fallback_chunking(document)
 
+    def set_topic_model(self, topic_model: "TopicModeler | None") -> None:
+        """Infer chunk topics with the corpus-level model of the source."""
+        self.chunk_processor.semantic_analyzer.topic_model = topic_model
+
+    def _should_skip_nlp(self, chunk_content: str) -> bool:
+        """Check whether a chunk is too small for semantic analysis.
+
+        NLP is skipped for small chunks, which might also cause LDA issues.
+        """
+        markdown_config = self.settings.global_config.chunking.strategies.markdown
+        return (
+            len(chunk_content) < markdown_config.min_content_length_for_nlp
+            or len(chunk_content.split()) < markdown_config.min_word_count_for_nlp
+            or chunk_content.count("\n") < markdown_config.min_line_count_for_nlp
+        )
+
     def _fallback_chunking(self, document: Document) -> list[Document]:
         """Simple fallback chunking when the main strategy fails.
 
@@ -13,7 +13,19 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 # Re-export classes for easier patching in tests
-from .document_parser import DocumentParser, HierarchyBuilder  # noqa: E402,F401
+from .document_parser import (  # noqa: E402,F401
+    DocumentParser,
+    HierarchyBuilder,
+    compile_line_patterns,
+    iter_line_matches,
+)
+
+_PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?])\s+")
+# Header lines, ignoring surrounding whitespace; group 1 is the level
+_HEADER_LINE_PATTERNS = compile_line_patterns(r"[^\S\n]*(#{1,6})[^\S\n]+\S")
+_TABLE_ROW_PATTERN = re.compile(r"^\|.*\|$")
+_TABLE_SEPARATOR_PATTERN = re.compile(r"^[|\-\s:]+$")
 
 
 # Markdown configuration placeholder - can be imported from settings if needed
@@ -136,8 +148,11 @@ class StandardSplitter(BaseSplitter):
             self.settings.global_config.chunking.max_chunks_per_document // 2,
         )
 
+        markdown_config = self.settings.global_config.chunking.strategies.markdown
+        max_overlap_percent = markdown_config.max_overlap_percentage
+
         # Split by paragraphs first
-        paragraphs = re.split(r"\n\s*\n", content)
+        paragraphs = _PARAGRAPH_BREAK_PATTERN.split(content)
 
         # Flatten paragraphs into manageable text units
         text_units = []
@@ -148,75 +163,59 @@ class StandardSplitter(BaseSplitter):
 
             # If paragraph is too large, split by sentences
             if len(para) > max_size:
-                sentences = re.split(r"(?<=[.!?])\s+", para)
-                text_units.extend([s.strip() for s in sentences if s.strip()])
+                sentences = _SENTENCE_BREAK_PATTERN.split(para)
+                text_units.extend([s for s in map(str.strip, sentences) if s])
             else:
                 text_units.append(para)
+        unit_sizes = list(map(len, text_units))
 
-        # Build chunks with overlap
+        # Build chunks with overlap. Chunks are tracked as ranges of units
+        # with their joined size, and only joined once complete.
         i = 0
         while i < len(text_units) and len(chunks) < max_chunks_per_section:
-            current_chunk = ""
-            units_in_chunk = 0
-
-            # Build the current chunk
-            j = i
+            # Build the current chunk; the first unit is always added
+            chunk_size = unit_sizes[i]
+            j = i + 1
             while j < len(text_units):
-                unit = text_units[j]
-
                 # Check if adding this unit would exceed max_size
-                if current_chunk and len(current_chunk) + len(unit) + 2 > max_size:
+                if chunk_size + unit_sizes[j] + 2 > max_size:
                     break
-
-                # Add unit to chunk
-                if current_chunk:
-                    current_chunk += "\n\n" + unit
-                else:
-                    current_chunk = unit
-
-                units_in_chunk += 1
+                chunk_size += unit_sizes[j] + 2
                 j += 1
+            units_in_chunk = j - i
 
-            # Add chunk if it has content
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
+            # Units are stripped and not empty, so the chunk is too
+            chunks.append("\n\n".join(text_units[i:j]))
 
             # Calculate overlap and advance position
-            if units_in_chunk > 0:
-                if self.chunk_overlap == 0:
-                    advance = units_in_chunk
+            if self.chunk_overlap == 0:
+                advance = units_in_chunk
+            else:
+                # Calculate how many characters of overlap we want
+                # Use configured maximum overlap percentage
+                max_overlap_chars = int(chunk_size * max_overlap_percent)
+                overlap_chars = min(self.chunk_overlap, max_overlap_chars)
+
+                # Find a good overlap point by counting back from the end
+                if overlap_chars > 0 and chunk_size > overlap_chars:
+                    # Count how many text units should be included in overlap
+                    overlap_units = 0
+                    overlap_size = 0
+                    for k in range(j - 1, i - 1, -1):  # Go backwards
+                        unit_size = unit_sizes[k]
+                        if overlap_size + unit_size <= overlap_chars:
+                            overlap_size += unit_size
+                            overlap_units += 1
+                        else:
+                            break
+
+                    # Advance by total units minus overlap units, ensuring progress
+                    advance = max(1, units_in_chunk - overlap_units)
                 else:
-                    # Calculate how many characters of overlap we want
-                    # Use configured maximum overlap percentage
-                    max_overlap_percent = (
-                        self.settings.global_config.chunking.strategies.markdown.max_overlap_percentage
-                    )
-                    max_overlap_chars = int(len(current_chunk) * max_overlap_percent)
-                    overlap_chars = min(self.chunk_overlap, max_overlap_chars)
-
-                    # Find a good overlap point by counting back from the end
-                    if overlap_chars > 0 and len(current_chunk) > overlap_chars:
-                        # Count how many text units should be included in overlap
-                        overlap_units = 0
-                        overlap_size = 0
-                        for k in range(j - 1, i - 1, -1):  # Go backwards
-                            unit_size = len(text_units[k])
-                            if overlap_size + unit_size <= overlap_chars:
-                                overlap_size += unit_size
-                                overlap_units += 1
-                            else:
-                                break
-
-                        # Advance by total units minus overlap units, ensuring progress
-                        advance = max(1, units_in_chunk - overlap_units)
-                    else:
-                        # No overlap possible, advance by all units
-                        advance = max(1, units_in_chunk)
+                    # No overlap possible, advance by all units
+                    advance = max(1, units_in_chunk)
 
-                i += advance
-            else:
-                # Safety: ensure we make progress even if no units were added
-                i += 1
+            i += advance
 
         # Handle remaining units if we hit the chunk limit
         if i < len(text_units) and len(chunks) >= max_chunks_per_section:
@@ -262,8 +261,8 @@ class ExcelSplitter(BaseSplitter):
             line = line.strip()
 
             # Detect table boundaries
-            is_table_line = bool(re.match(r"^\|.*\|$", line)) or bool(
-                re.match(r"^[|\-\s:]+$", line)
+            is_table_line = bool(_TABLE_ROW_PATTERN.match(line)) or bool(
+                _TABLE_SEPARATOR_PATTERN.match(line)
             )
 
             if is_table_line and not in_table:
@@ -297,16 +296,20 @@ class ExcelSplitter(BaseSplitter):
                 # Split large unit by lines to preserve table structure
                 lines = unit.split("\n")
                 current_sub_unit = []
+                sub_unit_size = 0
 
                 for line in lines:
                     # Check if adding this line would exceed max_size
-                    test_unit = "\n".join(current_sub_unit + [line])
-                    if current_sub_unit and len(test_unit) > max_size:
+                    if current_sub_unit and sub_unit_size + 1 + len(line) > max_size:
                         # Save current sub-unit and start new one
                         split_logical_units.append("\n".join(current_sub_unit))
                         current_sub_unit = [line]
+                        sub_unit_size = len(line)
                     else:
+                        if current_sub_unit:
+                            sub_unit_size += 1
                         current_sub_unit.append(line)
+                        sub_unit_size += len(line)
 
                 # Add the last sub-unit
                 if current_sub_unit:
@@ -433,24 +436,20 @@ class SectionSplitter:
         analysis = HeaderAnalysis()
         analysis.content_length = len(text)
 
-        lines = text.split("\n")
-        for line in lines:
-            line = line.strip()
-            header_match = re.match(r"^(#{1,6})\s+(.+)", line)
-            if header_match:
-                level = len(header_match.group(1))
-                if level == 1:
-                    analysis.h1 += 1
-                elif level == 2:
-                    analysis.h2 += 1
-                elif level == 3:
-                    analysis.h3 += 1
-                elif level == 4:
-                    analysis.h4 += 1
-                elif level == 5:
-                    analysis.h5 += 1
-                elif level == 6:
-                    analysis.h6 += 1
+        for _, header_match in iter_line_matches(_HEADER_LINE_PATTERNS, text):
+            level = len(header_match.group(1))
+            if level == 1:
+                analysis.h1 += 1
+            elif level == 2:
+                analysis.h2 += 1
+            elif level == 3:
+                analysis.h3 += 1
+            elif level == 4:
+                analysis.h4 += 1
+            elif level == 5:
+                analysis.h5 += 1
+            elif level == 6:
+                analysis.h6 += 1
 
         # Let __post_init__ calculate derived metrics
         analysis.__post_init__()
@@ -667,14 +666,20 @@ class SectionSplitter:
         """
 
         parser = DocumentParser()
-        hierarchy_builder = HierarchyBuilder()
 
         structure = parser.parse_document_structure(text)
         sections = []
-        current_section = None
+        current_parts = None  # Texts of the elements of the current section
         current_level = None
         current_title = None
         current_path = []
+        is_excel = document and document.metadata.get("original_file_type") == "xlsx"
+
+        # Headers that can be parents of the next header: the previous header,
+        # the closest header before it with a lower level, and so on
+        header_stack: list[tuple[int, str]] = []
+        # Repeated headers get the path of their first occurrence
+        header_paths: dict[tuple[str, int, str], list[str]] = {}
 
         # 🔥 ENHANCED: Use intelligent split level determination
         split_levels = self.determine_optimal_split_levels(text, document)
@@ -683,72 +688,62 @@ class SectionSplitter:
             "Determined optimal split levels",
             extra={
                 "split_levels": list(split_levels),
-                "document_type": (
-                    "excel"
-                    if document
-                    and document.metadata.get("original_file_type") == "xlsx"
-                    else "markdown"
-                ),
+                "document_type": "excel" if is_excel else "markdown",
             },
         )
 
         for item in structure:
             if item["type"] == "header":
                 level = item["level"]
+                while header_stack and header_stack[-1][0] >= level:
+                    header_stack.pop()
+                path = header_paths.setdefault(
+                    (item["text"], level, item["title"]),
+                    [title for _, title in header_stack],
+                )
+                header_stack.append((level, item["title"]))
 
                 # Create new section for split levels or first header (level 0)
                 if level in split_levels or (level == 0 and not sections):
                     # Save previous section if exists
-                    if current_section is not None:
+                    if current_parts is not None:
                         sections.append(
                             {
-                                "content": current_section,
+                                "content": "\n".join(current_parts) + "\n",
                                 "level": current_level,
                                 "title": current_title,
                                 "path": list(current_path),
-                                "is_excel_sheet": document
-                                and document.metadata.get("original_file_type")
-                                == "xlsx"
-                                and level == 2,
+                                "is_excel_sheet": is_excel and level == 2,
                             }
                         )
                     # Start new section
-                    current_section = item["text"] + "\n"
+                    current_parts = [item["text"]]
                     current_level = level
                     current_title = item["title"]
-                    current_path = hierarchy_builder.get_section_path(item, structure)
+                    current_path = path
                 else:
                     # For deeper headers, just add to current section
-                    if current_section is not None:
-                        current_section += item["text"] + "\n"
+                    if current_parts is not None:
+                        current_parts.append(item["text"])
             else:
-                if current_section is not None:
-                    current_section += item["text"] + "\n"
+                if current_parts is not None:
+                    current_parts.append(item["text"])
                 else:
                     # If no section started yet, treat as preamble
-                    current_section = item["text"] + "\n"
+                    current_parts = [item["text"]]
                     current_level = 0
-                    current_title = (
-                        "Preamble"
-                        if not (
-                            document
-                            and document.metadata.get("original_file_type") == "xlsx"
-                        )
-                        else "Sheet Data"
-                    )
+                    current_title = "Preamble" if not is_excel else "Sheet Data"
                     current_path = []
 
         # Add the last section
-        if current_section is not None:
+        if current_parts is not None:
             sections.append(
                 {
-                    "content": current_section,
+                    "content": "\n".join(current_parts) + "\n",
                     "level": current_level,
                     "title": current_title,
                     "path": list(current_path),
-                    "is_excel_sheet": document
-                    and document.metadata.get("original_file_type") == "xlsx"
-                    and current_level == 2,
+                    "is_excel_sheet": is_excel and current_level == 2,
                 }
             )
 
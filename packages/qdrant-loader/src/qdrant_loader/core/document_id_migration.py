@@ -0,0 +1,248 @@
+"""Migration of PublicDocs documents to stable document IDs.
+
+Earlier versions derived PublicDocs document IDs from Python's ``hash()``,
+which is randomized per process. This module rewrites the state database and
+the Qdrant collection to the IDs produced by ``Document.generate_id``. Stored
+vectors are copied to the new point IDs, so pages do not need to be
+re-embedded.
+"""
+
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from qdrant_client.http import models
+from sqlalchemy import select
+
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.qdrant_manager import QdrantManager
+from qdrant_loader.core.state.models import DocumentStateRecord
+from qdrant_loader.core.state.state_manager import StateManager
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+@dataclass
+class DocumentIdMigrationResult:
+    """Summary of a document ID migration."""
+
+    documents_migrated: int = 0
+    state_records_removed: int = 0
+    points_migrated: int = 0
+    points_removed: int = 0
+
+
+def _legacy_chunk_id(document_id: str, chunk_index: int) -> str:
+    """Chunk ID scheme of the chunk processors (see BaseChunkProcessor)."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{document_id}_chunk_{chunk_index}"))
+
+
+_CHUNK_ID_SCHEMES = (Document.generate_chunk_id, _legacy_chunk_id)
+
+
+def migrate_point_id(
+    point_id: str, old_document_id: str, new_document_id: str, chunk_index: int
+) -> str:
+    """Compute the point ID a chunk gets under its new document ID.
+
+    Chunk IDs are derived from the document ID by one of the chunking
+    strategies' schemes. The scheme that produced ``point_id`` is applied to
+    the new document ID; IDs produced by an unknown scheme are kept.
+    """
+    for scheme in _CHUNK_ID_SCHEMES:
+        if scheme(old_document_id, chunk_index) == point_id:
+            return scheme(new_document_id, chunk_index)
+    return point_id
+
+
+class PublicDocsIdMigration:
+    """Rewrite PublicDocs state records and points to stable document IDs.
+
+    For every page URL the most recent state record is kept and moved to the
+    stable ID; records left behind by earlier runs are removed together with
+    their points. Attachment records and points are removed as well: their
+    content hash embeds the old IDs, so they are re-ingested on the next run.
+
+    The Qdrant collection is migrated before the state changes are committed,
+    so an interrupted migration can simply be run again.
+    """
+
+    def __init__(
+        self,
+        state_manager: StateManager,
+        qdrant_manager: QdrantManager,
+        batch_size: int = 256,
+        dry_run: bool = False,
+    ):
+        self.state_manager = state_manager
+        self.qdrant_manager = qdrant_manager
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+
+    async def run(self) -> DocumentIdMigrationResult:
+        """Run the migration.
+
+        Returns:
+            Counts of migrated and removed records and points
+        """
+        result = DocumentIdMigrationResult()
+        async with await self.state_manager.get_session() as session:
+            query = select(DocumentStateRecord).filter(
+                DocumentStateRecord.source_type == SourceType.PUBLICDOCS.value
+            )
+            records = list((await session.execute(query)).scalars().all())
+
+            id_map, removed_records = self._plan_state_changes(records)
+            # Attachment records share their ID with the page they belong to,
+            # their points are recognized by their metadata instead
+            removed_ids = {
+                str(record.document_id)
+                for record in removed_records
+                if not record.is_attachment
+            }
+            result.documents_migrated = len(id_map)
+            result.state_records_removed = len(removed_records)
+
+            await self._migrate_points(id_map, removed_ids, result)
+
+            if self.dry_run:
+                await session.rollback()
+            else:
+                # Flush deletions first so that a removed record never
+                # conflicts with the new ID of a kept one
+                for record in removed_records:
+                    await session.delete(record)
+                await session.flush()
+                for record in records:
+                    if record.document_id in id_map:
+                        record.document_id = id_map[record.document_id]  # type: ignore
+                await session.commit()
+
+        logger.info(
+            "PublicDocs document ID migration completed",
+            dry_run=self.dry_run,
+            documents_migrated=result.documents_migrated,
+            state_records_removed=result.state_records_removed,
+            points_migrated=result.points_migrated,
+            points_removed=result.points_removed,
+        )
+        return result
+
+    def _plan_state_changes(
+        self, records: list[DocumentStateRecord]
+    ) -> tuple[dict[str, str], list[DocumentStateRecord]]:
+        """Map current page IDs to stable IDs and collect obsolete records."""
+        removed: list[DocumentStateRecord] = []
+        pages: dict[tuple, list[DocumentStateRecord]] = defaultdict(list)
+        for record in records:
+            if record.is_attachment:
+                removed.append(record)
+            else:
+                pages[(record.project_id, record.source, record.url)].append(record)
+
+        id_map: dict[str, str] = {}
+        for (_, source, url), page_records in pages.items():
+            page_records.sort(key=lambda record: record.updated_at, reverse=True)
+            current, *obsolete = page_records
+            removed.extend(obsolete)
+            new_id = Document.generate_id(SourceType.PUBLICDOCS.value, source, url)
+            if current.document_id != new_id:
+                id_map[str(current.document_id)] = new_id
+        return id_map, removed
+
+    async def _migrate_points(
+        self,
+        id_map: dict[str, str],
+        removed_ids: set[str],
+        result: DocumentIdMigrationResult,
+    ) -> None:
+        """Remove obsolete points, then copy the others to their new IDs.
+
+        Attachment chunks may occupy the point IDs that page chunks move to,
+        so all removals happen before any point is written.
+        """
+        source_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="source_type",
+                    match=models.MatchValue(value=SourceType.PUBLICDOCS.value),
+                )
+            ]
+        )
+
+        obsolete_points = []
+        async for points in self._scroll(source_filter, with_vectors=False):
+            obsolete_points.extend(
+                point.id
+                for point in points
+                if point.payload.get("document_id") in removed_ids
+                or point.payload.get("metadata", {}).get("is_attachment")
+            )
+        result.points_removed = len(obsolete_points)
+        if not self.dry_run:
+            for start in range(0, len(obsolete_points), self.batch_size):
+                await self.qdrant_manager.delete_points(
+                    obsolete_points[start : start + self.batch_size]
+                )
+
+        if not id_map:
+            return
+
+        async for points in self._scroll(source_filter, with_vectors=True):
+            migrated = [
+                (point.id, self._migrate_point(point, id_map))
+                for point in points
+                if point.payload.get("document_id") in id_map
+            ]
+            if not migrated:
+                continue
+            result.points_migrated += len(migrated)
+            if self.dry_run:
+                continue
+            await self.qdrant_manager.upsert_points([new for _, new in migrated])
+            await self.qdrant_manager.delete_points(
+                [old_id for old_id, new in migrated if str(new.id) != str(old_id)]
+            )
+
+    async def _scroll(self, scroll_filter: models.Filter, with_vectors: bool):
+        """Iterate over the points matching a filter, one page at a time."""
+        offset = None
+        while True:
+            points, offset = await self.qdrant_manager.scroll_points(
+                scroll_filter=scroll_filter,
+                limit=self.batch_size,
+                offset=offset,
+                with_vectors=with_vectors,
+            )
+            if points:
+                yield points
+            if offset is None:
+                break
+
+    def _migrate_point(
+        self, point: models.Record, id_map: dict[str, str]
+    ) -> models.PointStruct:
+        """Copy a point, vector included, to its new document ID."""
+        old_document_id = point.payload["document_id"]
+        new_document_id = id_map[old_document_id]
+
+        payload: dict[str, Any] = dict(point.payload)
+        payload["document_id"] = new_document_id
+        metadata = dict(payload.get("metadata") or {})
+        if metadata.get("parent_document_id") == old_document_id:
+            metadata["parent_document_id"] = new_document_id
+        payload["metadata"] = metadata
+
+        return models.PointStruct(
+            id=migrate_point_id(
+                str(point.id),
+                old_document_id,
+                new_document_id,
+                int(metadata.get("chunk_index", 0)),
+            ),
+            vector=point.vector,
+            payload=payload,
+        )
@@ -12,13 +12,16 @@ warnings.filterwarnings(
     "ignore", message="Couldn't find ffmpeg or avconv", category=RuntimeWarning
 )
 
+from .conversion_cache import ConversionCache
 from .conversion_config import (
     ConnectorFileConversionConfig,
     FileConversionConfig,
     MarkItDownConfig,
 )
+from .conversion_pool import ConversionWorkerPool
 from .exceptions import (
     ConversionTimeoutError,
+    ConversionWorkerError,
     FileAccessError,
     FileConversionError,
     FileSizeExceededError,
@@ -36,11 +39,14 @@ __all__ = [
     # Core services
     "FileConverter",
     "FileDetector",
+    "ConversionWorkerPool",
+    "ConversionCache",
     # Exceptions
     "FileConversionError",
     "UnsupportedFileTypeError",
     "FileSizeExceededError",
     "ConversionTimeoutError",
+    "ConversionWorkerError",
     "MarkItDownError",
     "FileAccessError",
 ]
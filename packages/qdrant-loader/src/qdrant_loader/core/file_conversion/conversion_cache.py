@@ -0,0 +1,143 @@
+"""Content-addressed on-disk cache of converted Markdown.
+
+Converting a document with MarkItDown is far more expensive than hashing it,
+and most documents do not change between ingestion runs. Converted Markdown
+is stored under a key derived from the SHA-256 of the file content, the
+converter version and the conversion options, so a changed file, an upgraded
+converter or different options never return a stale conversion.
+
+Conversions can also be stored under a source key, for example the URL,
+size and version of an attachment, so unchanged attachments are found
+without downloading them.
+
+The cache is bounded in size; the least recently used entries are evicted
+first, based on the modification time of the entry files, which is refreshed
+on every hit.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+ENTRY_SUFFIX = ".md"
+
+
+class ConversionCache:
+    """Size-bounded on-disk cache of converted Markdown."""
+
+    def __init__(self, directory: str | Path, max_size: int, namespace: str):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store the entries in
+            max_size: Maximum total size of the entries in bytes
+            namespace: Converter version and options; entries of other
+                namespaces are never returned
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._total_size: int | None = None  # Computed on first write
+
+    def _key(self, kind: str, value: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{kind}\0{value}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def get_by_content(self, content_hash: str) -> str | None:
+        """Get the conversion of a file by the SHA-256 of its content."""
+        return self._get(self._key("content", content_hash))
+
+    def put_by_content(self, content_hash: str, markdown: str) -> None:
+        """Store the conversion of a file by the SHA-256 of its content."""
+        self._put(self._key("content", content_hash), markdown)
+
+    def get_by_source(self, source_key: str) -> str | None:
+        """Get the conversion of a file by a key identifying its version."""
+        return self._get(self._key("source", source_key))
+
+    def put_by_source(self, source_key: str, markdown: str) -> None:
+        """Store the conversion of a file by a key identifying its version."""
+        self._put(self._key("source", source_key), markdown)
+
+    def _get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            markdown = path.read_text(encoding="utf-8")
+            # Mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(
+                "Failed to read cached conversion", path=str(path), error=str(e)
+            )
+            return None
+        return markdown
+
+    def _put(self, key: str, markdown: str) -> None:
+        path = self._path(key)
+        data = markdown.encode("utf-8")
+        if len(data) > self.max_size:
+            return
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial entries
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            previous_size = path.stat().st_size if path.exists() else 0
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Failed to cache conversion", path=str(path), error=str(e))
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            return
+
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = self._scan_size()
+            else:
+                self._total_size += len(data) - previous_size
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.directory.glob(f"*/*{ENTRY_SUFFIX}"):
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total_size = sum(stat.st_size for _, stat in entries)
+        evicted = 0
+        for path, stat in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= stat.st_size
+            evicted += 1
+        self._total_size = total_size
+        logger.debug(
+            "Evicted cached conversions", evicted=evicted, cache_size=total_size
+        )
@@ -41,6 +41,37 @@ class FileConversionConfig(BaseModel):
         le=3600,  # 1 hour
     )
 
+    max_workers: int = Field(
+        default=0,
+        description=(
+            "Number of worker processes for conversion; conversions in workers "
+            "are killed when they time out (0 converts in the calling process, "
+            "or in a single worker when called outside the main thread)"
+        ),
+        ge=0,
+        le=32,
+    )
+
+    worker_memory_limit: int = Field(
+        default=2147483648,  # 2GB
+        description="Address space limit of each conversion worker (in bytes)",
+        gt=0,
+    )
+
+    cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "Directory to persist converted Markdown in; unchanged files and "
+            "attachments are not converted again on later runs"
+        ),
+    )
+
+    cache_max_size: int = Field(
+        default=1073741824,  # 1GB
+        description="Maximum size of the conversion cache (in bytes)",
+        gt=0,
+    )
+
     markitdown: MarkItDownConfig = Field(
         default_factory=MarkItDownConfig, description="MarkItDown specific settings"
     )
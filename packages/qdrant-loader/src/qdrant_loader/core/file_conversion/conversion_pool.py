@@ -0,0 +1,235 @@
+"""Pool of worker processes for file conversion with hard timeouts.
+
+Converting a file in the calling thread cannot be interrupted reliably:
+``signal.alarm`` only works in the main thread, and conversions usually run on
+thread pools. The pool runs conversions in long-lived worker processes
+instead. A worker that exceeds the timeout is killed and replaced, and each
+worker runs with a limited address space so a single large document cannot
+exhaust the memory of the host.
+"""
+
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+
+from qdrant_loader.core.file_conversion.exceptions import (
+    ConversionTimeoutError,
+    ConversionWorkerError,
+    MarkItDownError,
+)
+from qdrant_loader.utils.logging import LoggingConfig
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Creates the conversion function of a worker, called once in each worker process
+WorkerFactory = Callable[[], Callable[[str], str]]
+
+# Seconds a new worker may take to import and set up its converter
+WORKER_START_TIMEOUT = 120
+
+
+def _limit_memory(memory_limit: int | None) -> None:
+    """Limit the address space of the current process where supported."""
+    if memory_limit is None or resource is None:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    except (ValueError, OSError) as e:
+        logger.warning("Failed to limit conversion worker memory", error=str(e))
+
+
+def _worker_main(
+    connection: Connection, worker_factory: WorkerFactory, memory_limit: int | None
+) -> None:
+    """Convert the files received on the connection until it is closed."""
+    # Workers only report problems, conversions are logged by the parent
+    LoggingConfig.setup(level="WARNING")
+    _limit_memory(memory_limit)
+    convert = worker_factory()
+    connection.send(True)  # Ready, start-up is not part of any timeout
+
+    while True:
+        try:
+            file_path = connection.recv()
+        except (EOFError, OSError):
+            break
+        if file_path is None:
+            break
+        try:
+            connection.send((True, convert(file_path)))
+        except BaseException as e:  # MemoryError must not end the worker
+            connection.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _ConversionWorker:
+    """A worker process and the connection used to send it files."""
+
+    def __init__(
+        self,
+        context: multiprocessing.context.BaseContext,
+        worker_factory: WorkerFactory,
+        memory_limit: int | None,
+    ):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_connection, worker_factory, memory_limit),
+            name="file-conversion-worker",
+            daemon=True,
+        )
+        self.process.start()
+        # Only the worker holds its end, so the parent sees EOF if it dies
+        child_connection.close()
+        self.ready = False
+
+    def wait_until_ready(self) -> None:
+        """Wait until the worker has set up its converter.
+
+        Raises:
+            EOFError: If the worker exited or did not start in time
+        """
+        if self.ready:
+            return
+        if not self.connection.poll(WORKER_START_TIMEOUT):
+            raise EOFError("Conversion worker did not start")
+        self.ready = self.connection.recv()
+
+    def convert(self, file_path: str, timeout: float) -> tuple[bool, str]:
+        """Send a file to the worker and wait for its result.
+
+        Raises:
+            TimeoutError: If the worker does not answer within the timeout
+            EOFError: If the worker exited
+        """
+        self.connection.send(file_path)
+        if not self.connection.poll(timeout):
+            raise TimeoutError
+        return self.connection.recv()
+
+    def kill(self) -> None:
+        """Kill the worker process immediately."""
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class ConversionWorkerPool:
+    """Convert files in worker processes with per-file hard timeouts.
+
+    The pool is thread-safe: up to ``max_workers`` calls of :meth:`convert`
+    from different threads run in parallel, further calls wait for a free
+    worker. Workers are started on demand and reused across files.
+    """
+
+    def __init__(
+        self,
+        worker_factory: WorkerFactory,
+        max_workers: int,
+        timeout: float,
+        memory_limit: int | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            worker_factory: Picklable callable returning the conversion function
+                of a worker, called once in each worker process
+            max_workers: Maximum number of worker processes
+            timeout: Seconds after which a conversion is aborted
+            memory_limit: Address space limit of each worker in bytes
+        """
+        self.worker_factory = worker_factory
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        # Forking a process with running threads is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.SimpleQueue[_ConversionWorker] = queue.SimpleQueue()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._workers: set[_ConversionWorker] = set()
+        self._closed = False
+
+    def convert(self, file_path: str) -> str:
+        """Convert a file in a worker process.
+
+        Args:
+            file_path: Path of the file to convert
+
+        Returns:
+            Converted Markdown content
+
+        Raises:
+            ConversionTimeoutError: If the conversion exceeded the timeout
+            ConversionWorkerError: If the worker process died during the conversion
+            MarkItDownError: If the conversion failed in the worker
+        """
+        with self._slots:
+            worker = self._acquire_worker()
+            try:
+                worker.wait_until_ready()
+                succeeded, result = worker.convert(file_path, self.timeout)
+            except TimeoutError:
+                self._discard(worker)
+                logger.warning(
+                    "Killed conversion worker after timeout",
+                    file_path=file_path.replace("\\", "/"),
+                    timeout=self.timeout,
+                )
+                raise ConversionTimeoutError(self.timeout, file_path) from None
+            except (EOFError, OSError) as e:
+                self._discard(worker)
+                raise ConversionWorkerError(worker.process.exitcode, file_path) from e
+
+            self._idle.put(worker)
+            if not succeeded:
+                raise MarkItDownError(Exception(result), file_path)
+            return result
+
+    def _acquire_worker(self) -> _ConversionWorker:
+        """Return an idle worker, starting one if none is available."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Conversion worker pool is closed")
+            worker = _ConversionWorker(
+                self._context, self.worker_factory, self.memory_limit
+            )
+            self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker: _ConversionWorker) -> None:
+        """Kill a worker and forget it; a new one is started on demand."""
+        with self._lock:
+            self._workers.discard(worker)
+        worker.kill()
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
@@ -70,6 +70,21 @@ class ConversionTimeoutError(FileConversionError):
         self.timeout = timeout
 
 
+class ConversionWorkerError(FileConversionError):
+    """Exception raised when a conversion worker process dies during a conversion."""
+
+    def __init__(self, exit_code: int | None, file_path: str | None = None):
+        """Initialize the exception.
+
+        Args:
+            exit_code: Exit code of the worker process, negative if it was killed
+            file_path: Path to the file being converted
+        """
+        message = f"Conversion worker exited with code {exit_code}"
+        super().__init__(message, file_path)
+        self.exit_code = exit_code
+
+
 class MarkItDownError(FileConversionError):
     """Exception raised when MarkItDown library fails."""
 
@@ -1,10 +1,17 @@
 """Main file conversion service using MarkItDown."""
 
+import hashlib
+import importlib.metadata
+import json
 import os
 import signal
 import sys
+import threading
 import warnings
+from collections import OrderedDict
+from collections.abc import Callable
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
 # Windows compatibility fix: Monkey patch signal module for MarkItDown
@@ -13,9 +20,12 @@ if sys.platform == "win32" and not hasattr(signal, "SIGALRM"):
     signal.SIGALRM = 14  # Standard SIGALRM signal number on Unix
     signal.alarm = lambda _: None  # No-op function for Windows
 
+from qdrant_loader.core.file_conversion.conversion_cache import ConversionCache
 from qdrant_loader.core.file_conversion.conversion_config import FileConversionConfig
+from qdrant_loader.core.file_conversion.conversion_pool import ConversionWorkerPool
 from qdrant_loader.core.file_conversion.exceptions import (
     ConversionTimeoutError,
+    ConversionWorkerError,
     FileAccessError,
     FileSizeExceededError,
     MarkItDownError,
@@ -26,6 +36,9 @@ from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Converted files kept in memory by each converter, keyed by content hash
+MAX_CACHED_CONVERSIONS = 128
+
 
 @contextmanager
 def capture_openpyxl_warnings(logger_instance, file_path: str):
@@ -96,6 +109,7 @@ class TimeoutHandler:
         self.file_path = file_path
         self.old_handler = None
         self.timer = None
+        self.alarm_set = False
 
     def _timeout_handler(self, _signum=None, _frame=None):
         """Signal handler for timeout."""
@@ -112,15 +126,21 @@ class TimeoutHandler:
         """Set up timeout handler (Unix signals or Windows threading)."""
         if sys.platform == "win32":
             # Windows doesn't support SIGALRM, use threading instead
-            import threading
-
             self.timer = threading.Thread(target=self._timeout_thread, daemon=True)
             self.timer.start()
+        elif threading.current_thread() is not threading.main_thread():
+            # Signal handlers can only be installed in the main thread; use
+            # conversion workers (max_workers) for timeouts in other threads
+            logger.debug(
+                "Conversion timeout not enforced outside the main thread",
+                file_path=self.file_path.replace("\\", "/"),
+            )
         else:
             # Unix/Linux/macOS: use signal-based timeout
             if hasattr(signal, "SIGALRM"):
                 self.old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
                 signal.alarm(self.timeout_seconds)
+                self.alarm_set = True
         return self
 
     def __exit__(self, exc_type, exc_val, _exc_tb):
@@ -132,7 +152,7 @@ class TimeoutHandler:
             pass
         else:
             # Unix/Linux/macOS: clean up signal handler
-            if hasattr(signal, "SIGALRM"):
+            if self.alarm_set:
                 signal.alarm(0)  # Cancel the alarm
                 if self.old_handler is not None:
                     signal.signal(signal.SIGALRM, self.old_handler)
@@ -147,6 +167,28 @@ class FileConverter:
         self.file_detector = FileDetector()
         self.logger = LoggingConfig.get_logger(__name__)
         self._markitdown = None
+        self._worker_pool: ConversionWorkerPool | None = None
+        self._pool_lock = threading.Lock()
+        # Markdown of converted files by content hash, least recently used first
+        self._conversion_cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Converted Markdown persisted across runs
+        self._disk_cache = (
+            ConversionCache(
+                config.cache_dir, config.cache_max_size, self._cache_namespace()
+            )
+            if config.cache_dir
+            else None
+        )
+
+    def _cache_namespace(self) -> str:
+        """Identify the converter version and the options affecting its output."""
+        try:
+            version = importlib.metadata.version("markitdown")
+        except importlib.metadata.PackageNotFoundError:
+            version = "unknown"
+        options = self.config.markitdown.model_dump(exclude={"llm_api_key"})
+        return f"markitdown-{version}:{json.dumps(options, sort_keys=True)}"
 
     def _get_markitdown(self):
         """Get MarkItDown instance with lazy loading and LLM configuration."""
@@ -218,25 +260,47 @@ class FileConverter:
                 Exception("OpenAI library required for LLM integration")
             ) from e
 
-    def convert_file(self, file_path: str) -> str:
-        """Convert a file to Markdown format with timeout support."""
+    def convert_file(self, file_path: str, content_hash: str | None = None) -> str:
+        """Convert a file to Markdown format with timeout support.
+
+        Files with the same content are converted once per converter. With
+        ``max_workers`` configured, the conversion runs in a worker process
+        that is killed when it exceeds the timeout; otherwise it runs in the
+        calling thread. The signal-based timeout of the calling thread only
+        works in the main thread, so conversions called from other threads
+        always run in a worker process.
+
+        Args:
+            file_path: Path to the file to convert
+            content_hash: SHA-256 hex digest of the file content, if already
+                known, so the file is not read again to hash it
+        """
         # Normalize path for consistent logging (Windows compatibility)
         normalized_path = file_path.replace("\\", "/")
         self.logger.info("Starting file conversion", file_path=normalized_path)
 
         try:
             self._validate_file(file_path)
-            markitdown = self._get_markitdown()
 
-            # Apply timeout wrapper and warning capture for conversion
-            with TimeoutHandler(self.config.conversion_timeout, file_path):
-                with capture_openpyxl_warnings(self.logger, file_path):
-                    result = markitdown.convert(file_path)
+            if content_hash is None:
+                content_hash = self._hash_file(file_path)
+            cached_content = self._get_cached_conversion(content_hash)
+            if cached_content is not None:
+                self.logger.info(
+                    "Reusing conversion of identical file content",
+                    file_path=normalized_path,
+                    content_length=len(cached_content),
+                )
+                return cached_content
 
-            if hasattr(result, "text_content"):
-                markdown_content = result.text_content
+            if (
+                self.config.max_workers > 0
+                or threading.current_thread() is not threading.main_thread()
+            ):
+                markdown_content = self._get_worker_pool().convert(file_path)
             else:
-                markdown_content = str(result)
+                markdown_content = self._convert_in_process(file_path)
+            self._cache_conversion(content_hash, markdown_content)
 
             self.logger.info(
                 "File conversion completed",
@@ -254,12 +318,117 @@ class FileConverter:
                 timeout=self.config.conversion_timeout,
             )
             raise
+        except (ConversionWorkerError, MarkItDownError) as e:
+            # Raised by the worker pool, already describing the failure
+            self.logger.error(
+                "File conversion failed", file_path=normalized_path, error=str(e)
+            )
+            raise
         except Exception as e:
             self.logger.error(
                 "File conversion failed", file_path=normalized_path, error=str(e)
             )
             raise MarkItDownError(e, file_path) from e
 
+    def _convert_in_process(self, file_path: str) -> str:
+        """Convert a file in the calling thread."""
+        with TimeoutHandler(self.config.conversion_timeout, file_path):
+            return self._convert_with_markitdown(file_path)
+
+    def _convert_with_markitdown(self, file_path: str) -> str:
+        """Convert a file with MarkItDown, without timeout."""
+        markitdown = self._get_markitdown()
+        with capture_openpyxl_warnings(self.logger, file_path):
+            result = markitdown.convert(file_path)
+
+        if hasattr(result, "text_content"):
+            return result.text_content
+        return str(result)
+
+    def _get_worker_pool(self) -> ConversionWorkerPool:
+        """Get the conversion worker pool, creating it on first use."""
+        with self._pool_lock:
+            if self._worker_pool is None:
+                self._worker_pool = ConversionWorkerPool(
+                    partial(create_worker_converter, self.config.model_dump()),
+                    max_workers=max(1, self.config.max_workers),
+                    timeout=self.config.conversion_timeout,
+                    memory_limit=self.config.worker_memory_limit,
+                )
+            return self._worker_pool
+
+    def close(self) -> None:
+        """Stop the conversion worker processes, if any were started."""
+        with self._pool_lock:
+            if self._worker_pool is not None:
+                self._worker_pool.close()
+                self._worker_pool = None
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str | None:
+        """Compute the SHA-256 hash of a file, or None if it cannot be read."""
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            return None
+
+    def _get_cached_conversion(self, content_hash: str | None) -> str | None:
+        """Return the cached conversion of a content hash, if any."""
+        if content_hash is None:
+            return None
+        with self._cache_lock:
+            content = self._conversion_cache.get(content_hash)
+            if content is not None:
+                self._conversion_cache.move_to_end(content_hash)
+                return content
+        if self._disk_cache is not None:
+            content = self._disk_cache.get_by_content(content_hash)
+            if content is not None:
+                self._remember_conversion(content_hash, content)
+        return content
+
+    def _cache_conversion(self, content_hash: str | None, content: str) -> None:
+        """Cache a conversion in memory and, if configured, on disk."""
+        if content_hash is None:
+            return
+        self._remember_conversion(content_hash, content)
+        if self._disk_cache is not None:
+            self._disk_cache.put_by_content(content_hash, content)
+
+    def _remember_conversion(self, content_hash: str, content: str) -> None:
+        """Cache a conversion in memory, evicting the least recently used one."""
+        with self._cache_lock:
+            self._conversion_cache[content_hash] = content
+            self._conversion_cache.move_to_end(content_hash)
+            if len(self._conversion_cache) > MAX_CACHED_CONVERSIONS:
+                self._conversion_cache.popitem(last=False)
+
+    def get_cached_conversion(self, source_key: str) -> str | None:
+        """Get the persisted conversion of a file version without reading the file.
+
+        Args:
+            source_key: Key identifying the file and its version, for example
+                the download URL, size and modification time of an attachment
+
+        Returns:
+            The converted Markdown, or None if the file version was not
+            converted before or no cache directory is configured
+        """
+        if self._disk_cache is None:
+            return None
+        return self._disk_cache.get_by_source(source_key)
+
+    def cache_conversion(self, source_key: str, markdown: str) -> None:
+        """Persist the conversion of a file version, see ``get_cached_conversion``.
+
+        Args:
+            source_key: Key identifying the file and its version
+            markdown: Converted Markdown
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.put_by_source(source_key, markdown)
+
     def _validate_file(self, file_path: str) -> None:
         """Validate file for conversion."""
         if not os.path.exists(file_path):
@@ -295,3 +464,16 @@ class FileConverter:
 
 *This document was created as a fallback when the original file could not be converted.*
 """
+
+
+def create_worker_converter(config_data: dict) -> Callable[[str], str]:
+    """Create the conversion function of a conversion worker process.
+
+    Args:
+        config_data: Serialized file conversion configuration
+
+    Returns:
+        Function converting a file to Markdown with MarkItDown
+    """
+    converter = FileConverter(FileConversionConfig.model_validate(config_data))
+    return converter._convert_with_markitdown
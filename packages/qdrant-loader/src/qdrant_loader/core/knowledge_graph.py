@@ -0,0 +1,525 @@
+"""Corpus-wide knowledge graph built as an ingestion stage.
+
+The graph links every document of the collection to the entities and topics
+its chunks mention, links entities that co-occur, and links documents that
+share entities and topics. Node centralities are computed once here, and the
+graph is stored as compressed sparse row (CSR) arrays in a NumPy ``.npz``
+archive that the MCP server loads at startup.
+
+Archive layout:
+
+- ``format_version``, ``collection_name``
+- ``node_type_names``, ``relationship_names``: Names of the type codes
+- ``node_keys``: Document ID, or lower-cased entity or topic name
+- ``node_types``: Index into ``node_type_names``
+- ``node_titles``: Document title, or entity or topic name as first seen
+- ``centrality``, ``hub``, ``authority``: Precomputed node scores
+- ``indptr``, ``indices``, ``weights``, ``relationships``: Adjacency in CSR
+  form; every edge is stored in both directions
+"""
+
+import asyncio
+import os
+import tempfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from qdrant_loader.core.qdrant_manager import QdrantManager
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+FORMAT_VERSION = 1
+NODE_TYPES = ("document", "entity", "topic")
+RELATIONSHIPS = ("mentions", "discusses", "co_occurs", "similar_to")
+
+DOCUMENT, ENTITY, TOPIC = range(len(NODE_TYPES))
+MENTIONS, DISCUSSES, CO_OCCURS, SIMILAR_TO = range(len(RELATIONSHIPS))
+
+# Same edge weights as the MCP server's per-request graph builder
+MENTIONS_WEIGHT = 0.7
+DISCUSSES_WEIGHT = 0.6
+
+# Payload fields the graph is built from
+GRAPH_PAYLOAD_FIELDS = [
+    "document_id",
+    "title",
+    "metadata.title",
+    "metadata.entities",
+    "metadata.topics",
+]
+
+_MAX_NAME_LENGTH = 200
+_GENERIC_TOPICS = {"general"}
+
+
+def _name(value: Any) -> str | None:
+    """Normalize an entity or topic name; None when it is not usable."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()[:_MAX_NAME_LENGTH]
+    return value if len(value) > 1 else None
+
+
+def entity_names(raw_entities: Any) -> list[str]:
+    """Extract entity names from chunk metadata.
+
+    Entities are stored as ``[text, label]`` pairs by the spaCy text
+    processor, or as ``{"text": ..., "label": ...}`` dictionaries.
+    """
+    names = []
+    for entity in raw_entities or []:
+        if isinstance(entity, dict):
+            entity = entity.get("text")
+        elif isinstance(entity, list | tuple):
+            entity = entity[0] if entity else None
+        name = _name(entity)
+        if name:
+            names.append(name)
+    return names
+
+
+def topic_names(raw_topics: Any) -> list[str]:
+    """Extract topic names from chunk metadata.
+
+    LDA topics (``{"id": ..., "terms": [...]}``) are named by their highest
+    weighted term; the generic fallback topic is skipped.
+    """
+    names = []
+    for topic in raw_topics or []:
+        if isinstance(topic, dict):
+            terms = topic.get("terms")
+            if terms and isinstance(terms[0], dict):
+                topic = terms[0].get("term")
+            else:
+                topic = topic.get("text")
+        elif isinstance(topic, list | tuple):
+            topic = topic[0] if topic else None
+        name = _name(topic)
+        if name and name.lower() not in _GENERIC_TOPICS:
+            names.append(name)
+    return names
+
+
+@dataclass
+class CorpusKnowledgeGraph:
+    """Knowledge graph of a collection, held as CSR arrays."""
+
+    collection_name: str
+    node_keys: np.ndarray
+    node_types: np.ndarray
+    node_titles: np.ndarray
+    centrality: np.ndarray
+    hub: np.ndarray
+    authority: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    relationships: np.ndarray
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_keys)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges, each counted once."""
+        return len(self.indices) // 2
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Count nodes per type and edges per relationship."""
+        node_counts = np.bincount(self.node_types, minlength=len(NODE_TYPES))
+        edge_counts = np.bincount(self.relationships, minlength=len(RELATIONSHIPS))
+        return {
+            "total_nodes": self.node_count,
+            "total_edges": self.edge_count,
+            "node_types": dict(zip(NODE_TYPES, node_counts.tolist(), strict=True)),
+            "relationship_types": dict(
+                zip(RELATIONSHIPS, (edge_counts // 2).tolist(), strict=True)
+            ),
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Write the graph atomically to an ``.npz`` archive."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    format_version=np.array(FORMAT_VERSION),
+                    collection_name=np.array(self.collection_name),
+                    node_type_names=np.array(NODE_TYPES),
+                    relationship_names=np.array(RELATIONSHIPS),
+                    node_keys=self.node_keys,
+                    node_types=self.node_types,
+                    node_titles=self.node_titles,
+                    centrality=self.centrality,
+                    hub=self.hub,
+                    authority=self.authority,
+                    indptr=self.indptr,
+                    indices=self.indices,
+                    weights=self.weights,
+                    relationships=self.relationships,
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CorpusKnowledgeGraph":
+        """Read a graph written by :meth:`save`."""
+        with np.load(Path(path).expanduser(), allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported knowledge graph format: {version}")
+            return cls(
+                collection_name=str(data["collection_name"]),
+                **{
+                    name: data[name]
+                    for name in (
+                        "node_keys",
+                        "node_types",
+                        "node_titles",
+                        "centrality",
+                        "hub",
+                        "authority",
+                        "indptr",
+                        "indices",
+                        "weights",
+                        "relationships",
+                    )
+                },
+            )
+
+
+class KnowledgeGraphBuilder:
+    """Build a corpus knowledge graph from the payloads of a collection."""
+
+    def __init__(
+        self,
+        min_document_frequency: int = 2,
+        similar_documents: int = 10,
+        similarity_threshold: float = 0.3,
+        max_feature_share: float = 0.5,
+    ):
+        """Initialize the builder.
+
+        Args:
+            min_document_frequency: Documents an entity or topic must appear
+                in to become a node
+            similar_documents: Maximum number of similar_to edges per document
+            similarity_threshold: Minimum Jaccard similarity of the entity and
+                topic sets of two similar documents
+            max_feature_share: Entities and topics found in a larger share of
+                the documents are ignored for document similarity
+        """
+        self.min_document_frequency = min_document_frequency
+        self.similar_documents = similar_documents
+        self.similarity_threshold = similarity_threshold
+        self.max_feature_share = max_feature_share
+
+        self._titles: dict[str, str] = {}
+        self._entities: dict[str, Counter] = defaultdict(Counter)
+        self._topics: dict[str, Counter] = defaultdict(Counter)
+        self._display_names: dict[tuple[int, str], str] = {}
+
+    def add_payload(self, payload: dict[str, Any]) -> None:
+        """Add the entities and topics of one chunk to its document."""
+        document_id = payload.get("document_id")
+        if not document_id:
+            return
+        document_id = str(document_id)
+        metadata = payload.get("metadata") or {}
+        if document_id not in self._titles:
+            title = payload.get("title") or metadata.get("title") or document_id
+            self._titles[document_id] = str(title)[:_MAX_NAME_LENGTH]
+
+        for node_type, names, counter in (
+            (ENTITY, entity_names(metadata.get("entities")), self._entities),
+            (TOPIC, topic_names(metadata.get("topics")), self._topics),
+        ):
+            for name in names:
+                key = name.lower()
+                self._display_names.setdefault((node_type, key), name)
+                counter[document_id][key] += 1
+
+    def build(self, collection_name: str = "") -> CorpusKnowledgeGraph:
+        """Build the graph from the payloads added so far."""
+        documents = list(self._titles)
+        entity_keys = self._frequent_keys(self._entities)
+        topic_keys = self._frequent_keys(self._topics)
+        node_count = len(documents) + len(entity_keys) + len(topic_keys)
+
+        entity_offset = len(documents)
+        topic_offset = entity_offset + len(entity_keys)
+        entity_matrix = self._incidence(documents, self._entities, entity_keys)
+        topic_matrix = self._incidence(documents, self._topics, topic_keys)
+
+        edges = [
+            self._membership_edges(entity_matrix, entity_offset, MENTIONS),
+            self._membership_edges(topic_matrix, topic_offset, DISCUSSES),
+            self._cooccurrence_edges(entity_matrix, entity_offset),
+            self._similarity_edges(sparse.hstack([entity_matrix, topic_matrix])),
+        ]
+        rows = np.concatenate([edge[0] for edge in edges])
+        cols = np.concatenate([edge[1] for edge in edges])
+        weights = np.concatenate([edge[2] for edge in edges])
+        relationships = np.concatenate([edge[3] for edge in edges])
+
+        centrality, hub, authority = _centralities(
+            node_count, rows, cols, weights, relationships
+        )
+
+        # Store every edge in both directions, sorted by source node
+        sources = np.concatenate([rows, cols])
+        targets = np.concatenate([cols, rows])
+        order = np.lexsort((targets, sources))
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=indptr[1:])
+
+        titles = (
+            [self._titles[document_id] for document_id in documents]
+            + [self._display_names[(ENTITY, key)] for key in entity_keys]
+            + [self._display_names[(TOPIC, key)] for key in topic_keys]
+        )
+        node_types = np.repeat(
+            np.arange(len(NODE_TYPES), dtype=np.int8),
+            [len(documents), len(entity_keys), len(topic_keys)],
+        )
+
+        graph = CorpusKnowledgeGraph(
+            collection_name=collection_name,
+            node_keys=np.array(documents + entity_keys + topic_keys, dtype=str),
+            node_types=node_types,
+            node_titles=np.array(titles, dtype=str),
+            centrality=centrality.astype(np.float32),
+            hub=hub.astype(np.float32),
+            authority=authority.astype(np.float32),
+            indptr=indptr,
+            indices=targets[order].astype(np.int32),
+            weights=np.concatenate([weights, weights])[order].astype(np.float32),
+            relationships=np.concatenate([relationships, relationships])[order].astype(
+                np.int8
+            ),
+        )
+        logger.info("Built knowledge graph", **graph.get_statistics())
+        return graph
+
+    def _frequent_keys(self, counters: dict[str, Counter]) -> list[str]:
+        """Keys found in at least ``min_document_frequency`` documents."""
+        frequency = Counter()
+        for counter in counters.values():
+            frequency.update(counter.keys())
+        return sorted(
+            key
+            for key, count in frequency.items()
+            if count >= self.min_document_frequency
+        )
+
+    @staticmethod
+    def _incidence(
+        documents: list[str], counters: dict[str, Counter], keys: list[str]
+    ) -> sparse.csr_matrix:
+        """Binary document x key matrix."""
+        columns = {key: index for index, key in enumerate(keys)}
+        rows, cols = [], []
+        for row, document_id in enumerate(documents):
+            for key in counters.get(document_id, ()):
+                column = columns.get(key)
+                if column is not None:
+                    rows.append(row)
+                    cols.append(column)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(documents), len(keys)),
+        )
+
+    @staticmethod
+    def _membership_edges(
+        matrix: sparse.csr_matrix, offset: int, relationship: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Document -> entity or topic edges."""
+        coo = matrix.tocoo()
+        weight = MENTIONS_WEIGHT if relationship == MENTIONS else DISCUSSES_WEIGHT
+        return (
+            coo.row.astype(np.int64),
+            coo.col.astype(np.int64) + offset,
+            np.full(coo.nnz, weight),
+            np.full(coo.nnz, relationship, dtype=np.int8),
+        )
+
+    def _cooccurrence_edges(
+        self, entity_matrix: sparse.csr_matrix, offset: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Edges between entities mentioned together in several documents."""
+        counts = sparse.triu(entity_matrix.T @ entity_matrix, k=1).tocoo()
+        keep = counts.data >= self.min_document_frequency
+        return (
+            counts.row[keep].astype(np.int64) + offset,
+            counts.col[keep].astype(np.int64) + offset,
+            np.minimum(1.0, counts.data[keep] / 5.0),
+            np.full(int(keep.sum()), CO_OCCURS, dtype=np.int8),
+        )
+
+    def _similarity_edges(
+        self, features: sparse.csr_matrix
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Edges between documents sharing entities and topics."""
+        empty = (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0),
+            np.empty(0, dtype=np.int8),
+        )
+        if self.similar_documents == 0 or features.shape[0] < 2:
+            return empty
+
+        # Entities and topics most documents share say little about similarity
+        # and make the intersection matrix dense
+        features = features.tocsc()
+        document_frequency = np.diff(features.indptr)
+        max_frequency = max(
+            self.min_document_frequency,
+            int(self.max_feature_share * features.shape[0]),
+        )
+        features = features[:, document_frequency <= max_frequency].tocsr()
+
+        sizes = np.diff(features.indptr)
+        intersections = sparse.triu(features @ features.T, k=1).tocoo()
+        unions = sizes[intersections.row] + sizes[intersections.col]
+        jaccard = intersections.data / (unions - intersections.data)
+        keep = jaccard > self.similarity_threshold
+        rows = intersections.row[keep]
+        cols = intersections.col[keep]
+        jaccard = jaccard[keep]
+        if not len(jaccard):
+            return empty
+
+        # Keep an edge if it is among the strongest of either document
+        selected = np.zeros(len(jaccard), dtype=bool)
+        for ends in (rows, cols):
+            order = np.lexsort((-jaccard, ends))
+            ranked = ends[order]
+            first = np.searchsorted(ranked, ranked)
+            selected[order[np.arange(len(order)) - first < self.similar_documents]] = (
+                True
+            )
+        return (
+            rows[selected].astype(np.int64),
+            cols[selected].astype(np.int64),
+            jaccard[selected],
+            np.full(int(selected.sum()), SIMILAR_TO, dtype=np.int8),
+        )
+
+
+def _centralities(
+    node_count: int,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    relationships: np.ndarray,
+    max_iter: int = 100,
+    tolerance: float = 1e-8,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute centrality, hub and authority scores.
+
+    Centrality combines degree centrality with PageRank, which replaces the
+    betweenness centrality of the per-request graph: it costs one sparse
+    product per iteration instead of a shortest-path search per node.
+    Hub and authority scores come from HITS over the directed edges;
+    co-occurrence and similarity edges count in both directions.
+    """
+    zeros = np.zeros(node_count)
+    if node_count == 0 or not len(rows):
+        return zeros, zeros.copy(), zeros.copy()
+
+    symmetric_relation = (relationships == CO_OCCURS) | (relationships == SIMILAR_TO)
+    directed = sparse.csr_matrix(
+        (
+            np.concatenate([weights, weights[symmetric_relation]]),
+            (
+                np.concatenate([rows, cols[symmetric_relation]]),
+                np.concatenate([cols, rows[symmetric_relation]]),
+            ),
+        ),
+        shape=(node_count, node_count),
+    )
+    undirected = sparse.csr_matrix(
+        (
+            np.concatenate([weights, weights]),
+            (np.concatenate([rows, cols]), np.concatenate([cols, rows])),
+        ),
+        shape=(node_count, node_count),
+    )
+
+    degree = np.diff(undirected.indptr) / max(node_count - 1, 1)
+
+    strength = np.asarray(undirected.sum(axis=1)).ravel()
+    inverse_strength = np.divide(
+        1.0, strength, out=np.zeros_like(strength), where=strength > 0
+    )
+    transition = (sparse.diags(inverse_strength) @ undirected).T.tocsr()
+    dangling = strength == 0
+    rank = np.full(node_count, 1.0 / node_count)
+    for _ in range(max_iter):
+        updated = 0.85 * (transition @ rank + rank[dangling].sum() / node_count)
+        updated += 0.15 / node_count
+        converged = np.abs(updated - rank).sum() < node_count * tolerance
+        rank = updated
+        if converged:
+            break
+
+    hub = np.full(node_count, 1.0 / node_count)
+    authority = hub
+    directed_t = directed.T.tocsr()
+    for _ in range(max_iter):
+        authority = directed_t @ hub
+        authority /= authority.sum() or 1.0
+        updated = directed @ authority
+        updated /= updated.sum() or 1.0
+        converged = np.abs(updated - hub).sum() < node_count * tolerance
+        hub = updated
+        if converged:
+            break
+
+    centrality = 0.4 * degree + 0.6 * rank / rank.max()
+    return centrality, hub, authority
+
+
+async def build_knowledge_graph(
+    qdrant_manager: QdrantManager,
+    path: str | Path,
+    min_document_frequency: int = 2,
+    similar_documents: int = 10,
+    batch_size: int = 256,
+) -> CorpusKnowledgeGraph:
+    """Build the knowledge graph of a collection and write it to ``path``.
+
+    Only the payload fields the graph needs are read from Qdrant.
+    """
+    builder = KnowledgeGraphBuilder(
+        min_document_frequency=min_document_frequency,
+        similar_documents=similar_documents,
+    )
+    offset = None
+    while True:
+        points, offset = await qdrant_manager.scroll_points(
+            limit=batch_size, offset=offset, with_payload=GRAPH_PAYLOAD_FIELDS
+        )
+        for point in points:
+            builder.add_payload(point.payload or {})
+        if offset is None:
+            break
+
+    graph = await asyncio.to_thread(builder.build, qdrant_manager.collection_name)
+    await asyncio.to_thread(graph.save, path)
+    logger.info("Saved knowledge graph", path=str(path))
+    return graph
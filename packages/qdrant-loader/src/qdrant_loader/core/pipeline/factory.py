@@ -1,10 +1,12 @@
 """Factory for creating pipeline components."""
 
 import concurrent.futures
+import os
 from pathlib import Path
 
 from qdrant_loader.config import Settings
 from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import create_chunking_process_pool
 from qdrant_loader.core.embedding.embedding_service import EmbeddingService
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
 from qdrant_loader.core.qdrant_manager import QdrantManager
@@ -62,10 +64,24 @@ class PipelineComponentsFactory:
         )
         embedding_service = EmbeddingService(settings)
 
-        # Create thread pool executor for chunking
-        chunk_executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=config.max_chunk_workers
-        )
+        # Create the executor for chunking: threads by default, or worker
+        # processes to spread CPU-bound chunking over all cores
+        chunking_config = settings.global_config.chunking
+        chunk_executor: concurrent.futures.Executor
+        max_chunk_workers = config.max_chunk_workers
+        if chunking_config.use_process_pool:
+            process_count = chunking_config.process_pool_workers or os.cpu_count() or 1
+            # Workers load the topic models trained in this process from disk
+            topic_model_dir = chunking_service.topic_models.use_temporary_directory()
+            chunk_executor = create_chunking_process_pool(
+                settings, process_count, topic_model_dir
+            )
+            # Keep every worker process busy
+            max_chunk_workers = max(max_chunk_workers, process_count)
+        else:
+            chunk_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=config.max_chunk_workers
+            )
         resource_manager.set_chunk_executor(chunk_executor)
 
         # Create performance monitor
@@ -84,7 +100,7 @@ class PipelineComponentsFactory:
         chunking_worker = ChunkingWorker(
             chunking_service=chunking_service,
             chunk_executor=chunk_executor,
-            max_workers=config.max_chunk_workers,
+            max_workers=max_chunk_workers,
             queue_size=config.queue_size,
             shutdown_event=resource_manager.shutdown_event,
         )
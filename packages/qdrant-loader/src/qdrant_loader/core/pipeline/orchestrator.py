@@ -126,7 +126,7 @@ class PipelineOrchestrator:
 
             # Collect documents from all sources
             documents = await self._collect_documents_from_sources(
-                filtered_config, current_project_id
+                filtered_config, current_project_id, force
             )
 
             if not documents:
@@ -207,43 +207,77 @@ class PipelineOrchestrator:
         return all_documents
 
     async def _collect_documents_from_sources(
-        self, filtered_config: SourcesConfig, project_id: str | None = None
+        self,
+        filtered_config: SourcesConfig,
+        project_id: str | None = None,
+        force: bool = False,
     ) -> list[Document]:
-        """Collect documents from all configured sources."""
+        """Collect documents from all configured sources.
+
+        Unless ``force`` is set, the state manager is handed to the connectors so
+        they can skip items that have not changed since the last ingestion.
+        """
         documents = []
+        unchanged_documents = getattr(
+            self.components.source_processor, "unchanged_documents", None
+        )
+        if isinstance(unchanged_documents, set):
+            unchanged_documents.clear()
+
+        state_manager = None
+        if not force:
+            state_manager = self.components.state_manager
+            if not state_manager._initialized:
+                logger.debug("Initializing state manager for source pre-filtering")
+                await state_manager.initialize()
 
         # Process each source type with project context
         if filtered_config.confluence:
             confluence_docs = (
                 await self.components.source_processor.process_source_type(
-                    filtered_config.confluence, ConfluenceConnector, "Confluence"
+                    filtered_config.confluence,
+                    ConfluenceConnector,
+                    "Confluence",
+                    state_manager=state_manager,
                 )
             )
             documents.extend(confluence_docs)
 
         if filtered_config.git:
             git_docs = await self.components.source_processor.process_source_type(
-                filtered_config.git, GitConnector, "Git"
+                filtered_config.git,
+                GitConnector,
+                "Git",
+                state_manager=state_manager,
             )
             documents.extend(git_docs)
 
         if filtered_config.jira:
             jira_docs = await self.components.source_processor.process_source_type(
-                filtered_config.jira, JiraConnector, "Jira"
+                filtered_config.jira,
+                JiraConnector,
+                "Jira",
+                state_manager=state_manager,
             )
             documents.extend(jira_docs)
 
         if filtered_config.publicdocs:
             publicdocs_docs = (
                 await self.components.source_processor.process_source_type(
-                    filtered_config.publicdocs, PublicDocsConnector, "PublicDocs"
+                    filtered_config.publicdocs,
+                    PublicDocsConnector,
+                    "PublicDocs",
+                    state_manager=state_manager,
                 )
             )
             documents.extend(publicdocs_docs)
 
         if filtered_config.localfile:
             localfile_docs = await self.components.source_processor.process_source_type(
-                filtered_config.localfile, LocalFileConnector, "LocalFile"
+                filtered_config.localfile,
+                LocalFileConnector,
+                "LocalFile",
+                state_manager=state_manager,
             )
             documents.extend(localfile_docs)
 
@@ -279,9 +313,20 @@ class PipelineOrchestrator:
             async with StateChangeDetector(
                 self.components.state_manager
             ) as change_detector:
-                changes = await change_detector.detect_changes(
-                    documents, filtered_config
+                # Documents skipped by the connectors are unchanged, not deleted
+                unchanged_documents = getattr(
+                    self.components.source_processor, "unchanged_documents", None
                 )
+                if isinstance(unchanged_documents, set) and unchanged_documents:
+                    changes = await change_detector.detect_changes(
+                        documents,
+                        filtered_config,
+                        unchanged_documents=unchanged_documents,
+                    )
+                else:
+                    changes = await change_detector.detect_changes(
+                        documents, filtered_config
+                    )
 
                 logger.info(
                     f"🔍 Change detection: {len(changes['new'])} new, "
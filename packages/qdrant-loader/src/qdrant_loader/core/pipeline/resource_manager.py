@@ -17,12 +17,12 @@ class ResourceManager:
         self.shutdown_event = asyncio.Event()
         self.active_tasks: set[asyncio.Task] = set()
         self.cleanup_done = False
-        self.chunk_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.chunk_executor: concurrent.futures.Executor | None = None
         self._signal_shutdown = (
             False  # Flag to track if shutdown was triggered by signal
         )
 
-    def set_chunk_executor(self, executor: concurrent.futures.ThreadPoolExecutor):
+    def set_chunk_executor(self, executor: concurrent.futures.Executor):
         """Set the chunk executor for cleanup."""
         self.chunk_executor = executor
 
@@ -58,7 +58,7 @@ class ResourceManager:
                     except Exception as e:
                         logger.error(f"Error in async cleanup: {e}")
 
-            # Shutdown thread pool executor
+            # Shutdown chunk executor
             if self.chunk_executor:
                 logger.debug("Shutting down chunk executor")
                 self.chunk_executor.shutdown(wait=True)
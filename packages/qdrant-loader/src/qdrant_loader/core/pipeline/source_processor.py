@@ -7,6 +7,7 @@ from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.connectors.base import BaseConnector
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import FileConversionConfig
+from qdrant_loader.core.state.state_manager import StateManager
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -22,12 +23,16 @@ class SourceProcessor:
     ):
         self.shutdown_event = shutdown_event or asyncio.Event()
         self.file_conversion_config = file_conversion_config
+        # (source_type, source, url) of the documents connectors skipped as
+        # unchanged since the last ingestion
+        self.unchanged_documents: set[tuple[str, str, str]] = set()
 
     async def process_source_type(
         self,
         source_configs: Mapping[str, SourceConfig],
         connector_class: type[BaseConnector],
         source_type: str,
+        state_manager: StateManager | None = None,
     ) -> list[Document]:
         """Process documents from a specific source type.
 
@@ -35,6 +40,8 @@ class SourceProcessor:
             source_configs: Mapping of source name to source configuration
             connector_class: The connector class to use for this source type
             source_type: The type of source being processed
+            state_manager: Optional initialized state manager that connectors
+                may use to skip items unchanged since the last ingestion
 
         Returns:
             List of documents from all sources of this type
@@ -68,6 +75,9 @@ class SourceProcessor:
                     )
                     connector.set_file_conversion_config(self.file_conversion_config)
 
+                if state_manager is not None:
+                    connector.set_state_manager(state_manager)
+
                 # Use the connector as an async context manager to ensure proper initialization
                 async with connector:
                     # Get documents from this source
@@ -77,6 +87,10 @@ class SourceProcessor:
                         f"Retrieved {len(documents)} documents from {source_type} source: {source_name}"
                     )
                     all_documents.extend(documents)
+                    self.unchanged_documents.update(
+                        (source_config.source_type, source_config.source, url)
+                        for url in getattr(connector, "unchanged_urls", ())
+                    )
 
             except Exception as e:
                 logger.error(
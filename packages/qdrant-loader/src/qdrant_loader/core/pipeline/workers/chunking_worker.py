@@ -7,6 +7,11 @@ from collections.abc import AsyncIterator
 import psutil
 
 from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import (
+    chunk_packed_document,
+    pack_document,
+    unpack_document,
+)
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.utils.logging import LoggingConfig
@@ -22,7 +27,7 @@ class ChunkingWorker(BaseWorker):
     def __init__(
         self,
         chunking_service: ChunkingService,
-        chunk_executor: concurrent.futures.ThreadPoolExecutor,
+        chunk_executor: concurrent.futures.Executor,
         max_workers: int = 10,
         queue_size: int = 1000,
         shutdown_event: asyncio.Event | None = None,
@@ -53,7 +58,7 @@ class ChunkingWorker(BaseWorker):
             prometheus_metrics.CPU_USAGE.set(psutil.cpu_percent())
             prometheus_metrics.MEMORY_USAGE.set(psutil.virtual_memory().percent)
 
-            # Run chunking in a thread pool for true parallelism
+            # Run chunking in the thread or process pool
             with prometheus_metrics.CHUNKING_DURATION.time():
                 # Calculate adaptive timeout based on document size
                 adaptive_timeout = self._calculate_adaptive_timeout(document)
@@ -66,12 +71,7 @@ class ChunkingWorker(BaseWorker):
 
                 # Add timeout to prevent hanging on chunking
                 chunks = await asyncio.wait_for(
-                    asyncio.get_running_loop().run_in_executor(
-                        self.chunk_executor,
-                        self.chunking_service.chunk_document,
-                        document,
-                    ),
-                    timeout=adaptive_timeout,
+                    self._chunk_document(document), timeout=adaptive_timeout
                 )
 
                 # Check for shutdown before returning chunks
@@ -105,6 +105,22 @@ class ChunkingWorker(BaseWorker):
             logger.error(f"Chunking failed for doc {document.url}: {e}")
             raise
 
+    async def _chunk_document(self, document: Document) -> list[Document]:
+        """Chunk a document on the executor.
+
+        Process pools get the document in packed form and run the chunking
+        service of their worker processes.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(self.chunk_executor, concurrent.futures.ProcessPoolExecutor):
+            packed_chunks = await loop.run_in_executor(
+                self.chunk_executor, chunk_packed_document, pack_document(document)
+            )
+            return [unpack_document(values) for values in packed_chunks]
+        return await loop.run_in_executor(
+            self.chunk_executor, self.chunking_service.chunk_document, document
+        )
+
     async def process_documents(self, documents: list[Document]) -> AsyncIterator:
         """Process documents into chunks.
 
@@ -118,6 +134,10 @@ class ChunkingWorker(BaseWorker):
         logger.info(f"🔄 Processing {len(documents)} documents for chunking...")
 
         try:
+            # Train the corpus-level topic models once, so that chunking only
+            # has to infer the topics of every chunk
+            await asyncio.to_thread(self.chunking_service.train_topic_models, documents)
+
             # Process documents with controlled concurrency but stream results
             semaphore = asyncio.Semaphore(self.max_workers)
 
@@ -217,6 +217,65 @@ class QdrantManager:
             )
             raise
 
+    async def scroll_points(
+        self,
+        scroll_filter: models.Filter | None = None,
+        limit: int = 256,
+        offset: models.ExtendedPointId | None = None,
+        with_vectors: bool = False,
+        with_payload: bool | list[str] = True,
+    ) -> tuple[list[models.Record], models.ExtendedPointId | None]:
+        """Read a page of points from the collection.
+
+        Args:
+            scroll_filter: Optional filter restricting the returned points
+            limit: Maximum number of points to return
+            offset: Point ID to start from, as returned by the previous call
+            with_vectors: Whether to include the stored vectors
+            with_payload: Whether to include the payload, or the payload
+                fields to include
+
+        Returns:
+            The points and the offset of the next page (None when exhausted)
+        """
+        client = self._ensure_client_connected()
+        return await asyncio.to_thread(
+            client.scroll,
+            collection_name=self.collection_name,
+            scroll_filter=scroll_filter,
+            limit=limit,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+        )
+
+    async def delete_points(self, point_ids: list[models.ExtendedPointId]) -> None:
+        """Delete points from the collection by point ID.
+
+        Args:
+            point_ids: List of point IDs to delete
+        """
+        if not point_ids:
+            return
+
+        try:
+            client = self._ensure_client_connected()
+            await asyncio.to_thread(
+                client.delete,
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=point_ids),
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete points",
+                extra={
+                    "error": str(e),
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+            raise
+
     def search(
         self, query_vector: list[float], limit: int = 5
     ) -> list[models.ScoredPoint]:
@@ -212,3 +212,27 @@ class DocumentStateRecord(Base):
         Index("ix_document_conversion_method", "conversion_method"),
         Index("ix_document_project_id", "project_id"),
     )
+
+
+class HttpCacheRecord(Base):
+    """Tracks HTTP validators of crawled pages for conditional requests."""
+
+    __tablename__ = "http_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_type = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    url = Column(String, nullable=False)
+    etag = Column(String, nullable=True)  # ETag response header
+    last_modified = Column(String, nullable=True)  # Last-Modified response header
+    content_hash = Column(
+        String, nullable=False
+    )  # Hash of the document built from the response
+    links = Column(
+        Text, nullable=True
+    )  # JSON list of the links found on the page, crawled when it is not modified
+    updated_at = Column(UTCDateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("source_type", "source", "url", name="uix_http_cache_url"),
+    )
@@ -56,9 +56,19 @@ class StateChangeDetector:
             )
 
     async def detect_changes(
-        self, documents: list[Document], filtered_config: SourcesConfig
+        self,
+        documents: list[Document],
+        filtered_config: SourcesConfig,
+        unchanged_documents: set[tuple[str, str, str]] | None = None,
     ) -> dict[str, list[Document]]:
-        """Detect changes in documents efficiently."""
+        """Detect changes in documents efficiently.
+
+        Args:
+            documents: Documents collected from the sources
+            filtered_config: Configuration of the sources the documents come from
+            unchanged_documents: ``(source_type, source, url)`` of documents the
+                connectors skipped as unchanged; they are not reported as deleted
+        """
         if not self._initialized:
             raise RuntimeError(
                 "StateChangeDetector not initialized. Use as async context manager."
@@ -76,6 +86,10 @@ class StateChangeDetector:
             state.uri: state for state in previous_states
         }
         current_uris: set[str] = {state.uri for state in current_states}
+        current_uris.update(
+            self._generate_uri(url, source, source_type, "")
+            for source_type, source, url in unchanged_documents or ()
+        )
 
         # Find changes efficiently
         new_docs = [
@@ -14,11 +14,19 @@ from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.config.state import IngestionStatus, StateManagementConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state.exceptions import DatabaseError
-from qdrant_loader.core.state.models import Base, DocumentStateRecord, IngestionHistory
+from qdrant_loader.core.state.models import (
+    Base,
+    DocumentStateRecord,
+    HttpCacheRecord,
+    IngestionHistory,
+)
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# URLs per IN clause, well below SQLite's limit on bound variables
+URL_LOOKUP_BATCH_SIZE = 500
+
 
 class StateManager:
     """Manages state for document ingestion."""
@@ -471,6 +479,85 @@ class StateManager:
             )
             raise
 
+    async def get_http_cache_records(
+        self, source_config: SourceConfig
+    ) -> list[HttpCacheRecord]:
+        """Get the stored HTTP validators of all pages of a source."""
+        self.logger.debug(
+            f"Getting HTTP cache records for {source_config.source_type}:{source_config.source}"
+        )
+        try:
+            async with self._session_factory() as session:  # type: ignore
+                query = select(HttpCacheRecord).filter(
+                    HttpCacheRecord.source_type == source_config.source_type,
+                    HttpCacheRecord.source == source_config.source,
+                )
+                result = await session.execute(query)
+                return list(result.scalars().all())
+        except Exception as e:
+            self.logger.error(
+                f"Error getting HTTP cache records for {source_config.source_type}:{source_config.source}: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def update_http_cache_records(
+        self, source_config: SourceConfig, entries: list[dict[str, str | None]]
+    ) -> None:
+        """Insert or update the HTTP validators of crawled pages.
+
+        Args:
+            source_config: Configuration of the source the pages belong to
+            entries: One dict per page with ``url``, ``etag``, ``last_modified``,
+                ``content_hash`` and ``links`` keys
+        """
+        if not entries:
+            return
+
+        self.logger.debug(
+            f"Updating {len(entries)} HTTP cache records for {source_config.source_type}:{source_config.source}"
+        )
+        try:
+            async with self._session_factory() as session:  # type: ignore
+                urls = [entry["url"] for entry in entries]
+                existing: dict[str, HttpCacheRecord] = {}
+                for start in range(0, len(urls), URL_LOOKUP_BATCH_SIZE):
+                    query = select(HttpCacheRecord).filter(
+                        HttpCacheRecord.source_type == source_config.source_type,
+                        HttpCacheRecord.source == source_config.source,
+                        HttpCacheRecord.url.in_(
+                            urls[start : start + URL_LOOKUP_BATCH_SIZE]
+                        ),
+                    )
+                    result = await session.execute(query)
+                    existing.update(
+                        (record.url, record) for record in result.scalars().all()
+                    )
+
+                now = datetime.now(UTC)
+                for entry in entries:
+                    record = existing.get(entry["url"])
+                    if record is None:
+                        record = HttpCacheRecord(
+                            source_type=source_config.source_type,
+                            source=source_config.source,
+                            url=entry["url"],
+                        )
+                        session.add(record)
+                    record.etag = entry.get("etag")  # type: ignore
+                    record.last_modified = entry.get("last_modified")  # type: ignore
+                    record.content_hash = entry["content_hash"]  # type: ignore
+                    record.links = entry.get("links")  # type: ignore
+                    record.updated_at = now  # type: ignore
+
+                await session.commit()
+        except Exception as e:
+            self.logger.error(
+                f"Error updating HTTP cache records for {source_config.source_type}:{source_config.source}: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
     async def update_document_state(
         self, document: Document, project_id: str | None = None
     ) -> DocumentStateRecord:
@@ -0,0 +1,115 @@
+"""Bounded in-memory index of document vectors for cosine similarity."""
+
+import numpy as np
+
+
+class DocumentVectorIndex:
+    """Normalized document vectors stored in one matrix.
+
+    Similarities with all indexed documents are computed with a single
+    matrix-vector product. The index holds at most ``capacity`` documents;
+    adding more evicts the oldest ones.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize the index.
+
+        Args:
+            capacity: Maximum number of indexed documents
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        self.capacity = capacity
+        self._matrix: np.ndarray | None = None
+        # Row of every document, in insertion order (oldest first)
+        self._rows: dict[str, int] = {}
+        self._ids: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def add(self, doc_id: str, vector: np.ndarray) -> None:
+        """Add or replace the vector of a document.
+
+        Args:
+            doc_id: Document ID
+            vector: Document vector; zero vectors have zero similarity
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        if self._matrix is None:
+            self._matrix = np.zeros(
+                (min(self.capacity, 64), vector.shape[0]), dtype=np.float32
+            )
+        elif vector.shape[0] != self._matrix.shape[1]:
+            raise ValueError(
+                f"Vector has {vector.shape[0]} dimensions, "
+                f"the index has {self._matrix.shape[1]}"
+            )
+
+        self.remove(doc_id)
+        if len(self._ids) >= self.capacity:
+            self.remove(next(iter(self._rows)))
+        if len(self._ids) == self._matrix.shape[0]:
+            grown = np.zeros(
+                (min(self.capacity, 2 * len(self._ids)), self._matrix.shape[1]),
+                dtype=np.float32,
+            )
+            grown[: len(self._ids)] = self._matrix
+            self._matrix = grown
+
+        row = len(self._ids)
+        norm = np.linalg.norm(vector)
+        self._matrix[row] = vector / norm if norm > 0 else 0.0
+        self._rows[doc_id] = row
+        self._ids.append(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index if it is indexed."""
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return
+        # Move the last row into the freed one
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if row != last:
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+
+    def similarities(
+        self, vector: np.ndarray, top_k: int | None = None
+    ) -> dict[str, float]:
+        """Compute the cosine similarity of a vector with the indexed documents.
+
+        Args:
+            vector: Query vector
+            top_k: Only return the most similar documents (all by default)
+
+        Returns:
+            Similarity by document ID
+        """
+        if not self._ids:
+            return {}
+        count = len(self._ids)
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            scores = np.zeros(count, dtype=np.float32)
+        else:
+            scores = self._matrix[:count] @ (vector / norm)
+
+        if top_k is not None and top_k < count:
+            rows = np.argpartition(-scores, top_k)[:top_k]
+            rows = rows[np.argsort(-scores[rows])]
+        else:
+            rows = range(count)
+        return {self._ids[row]: float(scores[row]) for row in rows}
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._matrix = None
+        self._rows.clear()
+        self._ids.clear()
@@ -1,18 +1,27 @@
 """Semantic analysis module for text processing."""
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal
 
 import spacy
 from gensim import corpora
 from gensim.models import LdaModel
 from gensim.parsing.preprocessing import preprocess_string
+from qdrant_loader.core.text_processing.document_vector_index import (
+    DocumentVectorIndex,
+)
+from qdrant_loader.core.text_processing.topic_modeler import TopicModeler
 from spacy.cli.download import download as spacy_download
-from spacy.tokens import Doc
+from spacy.tokens import Doc, Span
 
 logger = logging.getLogger(__name__)
 
+# Components not needed for the "light" profile: dependency labels and lemmas
+# are dropped, sentence boundaries come from the cheaper senter component.
+LIGHT_PROFILE_DISABLED_PIPES = ("parser", "lemmatizer")
+
 
 @dataclass
 class SemanticAnalysisResult:
@@ -35,6 +44,12 @@ class SemanticAnalyzer:
         num_topics: int = 5,
         passes: int = 10,
         min_topic_freq: int = 2,
+        batch_size: int = 32,
+        n_process: int = 1,
+        pipeline_profile: Literal["full", "light"] = "full",
+        min_topic_tokens: int = 5,
+        cache_size: int = 1000,
+        similarity_top_k: int | None = None,
     ):
         """Initialize the semantic analyzer.
 
@@ -43,6 +58,15 @@ class SemanticAnalyzer:
             num_topics: Number of topics for LDA
             passes: Number of passes for LDA training
             min_topic_freq: Minimum frequency for topic terms
+            batch_size: Number of texts per spaCy batch in analyze_texts
+            n_process: Number of processes used by spaCy in analyze_texts
+            pipeline_profile: "full" keeps the whole spaCy pipeline, "light"
+                disables the parser and lemmatizer
+            min_topic_tokens: Texts with fewer tokens get no topic inference
+            cache_size: Maximum number of analyzed documents kept for caching
+                and similarity; the oldest ones are evicted first
+            similarity_top_k: Only report the most similar documents (all
+                cached documents by default)
         """
         self.logger = logging.getLogger(__name__)
 
@@ -54,6 +78,12 @@ class SemanticAnalyzer:
             spacy_download(spacy_model)
             self.nlp = spacy.load(spacy_model)
 
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.pipeline_profile = pipeline_profile
+        if pipeline_profile == "light":
+            self._configure_light_pipeline()
+
         # Initialize LDA parameters
         self.num_topics = num_topics
         self.passes = passes
@@ -63,8 +93,31 @@ class SemanticAnalyzer:
         self.lda_model = None
         self.dictionary = None
 
+        # Corpus-level topic model; when set, topics are inferred with it
+        # instead of training a model on every text
+        self.topic_model: TopicModeler | None = None
+        self.min_topic_tokens = min_topic_tokens
+
         # Cache for processed documents
-        self._doc_cache = {}
+        self._doc_cache: dict[str, SemanticAnalysisResult] = {}
+        self.cache_size = cache_size
+        self.similarity_top_k = similarity_top_k
+
+        # Entity context vectors of cached documents (models with vectors)
+        self._vector_index = DocumentVectorIndex(capacity=cache_size)
+        # Entity context tokens and entities of cached documents (models
+        # without vectors)
+        self._context_features: dict[str, tuple[set[str], set[str]]] = {}
+
+    def _configure_light_pipeline(self) -> None:
+        """Disable pipeline components that the light profile does not need."""
+        for name in LIGHT_PROFILE_DISABLED_PIPES:
+            if name in self.nlp.pipe_names:
+                self.nlp.disable_pipe(name)
+        # Entity contexts still need sentence boundaries
+        if "senter" in self.nlp.disabled:
+            self.nlp.enable_pipe("senter")
+        self.logger.debug(f"spaCy pipeline for light profile: {self.nlp.pipe_names}")
 
     def analyze_text(
         self, text: str, doc_id: str | None = None
@@ -82,9 +135,84 @@ class SemanticAnalyzer:
         if doc_id and doc_id in self._doc_cache:
             return self._doc_cache[doc_id]
 
-        # Process with spaCy
-        doc = self.nlp(text)
+        return self._analyze_doc(self.nlp(text), text, doc_id)
+
+    def analyze_texts(
+        self, texts: Sequence[str], doc_ids: Sequence[str | None] | None = None
+    ) -> list[SemanticAnalysisResult]:
+        """Analyze several texts, running spaCy on them in batches.
+
+        The texts are processed with ``nlp.pipe``, which is considerably faster
+        than calling the pipeline once per text. Results are computed in order,
+        so they are the same as calling ``analyze_text`` for every text.
+
+        Args:
+            texts: Texts to analyze
+            doc_ids: Optional document IDs for caching, one per text
+
+        Returns:
+            SemanticAnalysisResult for every text, in the same order
+        """
+        ids = list(doc_ids) if doc_ids is not None else [None] * len(texts)
+        if len(ids) != len(texts):
+            raise ValueError("doc_ids must contain one ID per text")
+
+        cached = {
+            index: self._doc_cache[doc_id]
+            for index, doc_id in enumerate(ids)
+            if doc_id and doc_id in self._doc_cache
+        }
+        pending = [index for index in range(len(texts)) if index not in cached]
+        docs = dict(
+            zip(
+                pending,
+                self.nlp.pipe(
+                    (texts[index] for index in pending),
+                    batch_size=self.batch_size,
+                    n_process=self.n_process,
+                ),
+                strict=True,
+            )
+        )
+
+        topics = {}
+        if self.topic_model is not None:
+            topics = dict(
+                zip(
+                    pending,
+                    self._infer_topics([texts[index] for index in pending]),
+                    strict=True,
+                )
+            )
+
+        results = []
+        for index, (text, doc_id) in enumerate(zip(texts, ids, strict=True)):
+            if index in docs:
+                results.append(
+                    self._analyze_doc(docs[index], text, doc_id, topics.get(index))
+                )
+            else:
+                results.append(cached[index])
+        return results
+
+    def _analyze_doc(
+        self,
+        doc: Doc,
+        text: str,
+        doc_id: str | None,
+        topics: list[dict[str, Any]] | None = None,
+    ) -> SemanticAnalysisResult:
+        """Build the analysis result of a text processed by spaCy.
+
+        Args:
+            doc: spaCy document of the text
+            text: The analyzed text
+            doc_id: Optional document ID for caching
+            topics: Topics of the text if already inferred
 
+        Returns:
+            SemanticAnalysisResult containing all analysis results
+        """
         # Extract entities with linking
         entities = self._extract_entities(doc)
 
@@ -95,13 +223,14 @@ class SemanticAnalyzer:
         dependencies = self._get_dependencies(doc)
 
         # Extract topics
-        topics = self._extract_topics(text)
+        if topics is None:
+            topics = self._extract_topics(text)
 
         # Extract key phrases
         key_phrases = self._extract_key_phrases(doc)
 
         # Calculate document similarity
-        doc_similarity = self._calculate_document_similarity(text)
+        doc_similarity = self._calculate_document_similarity(doc)
 
         # Create result
         result = SemanticAnalysisResult(
@@ -115,10 +244,34 @@ class SemanticAnalyzer:
 
         # Cache result
         if doc_id:
-            self._doc_cache[doc_id] = result
+            self._cache_result(doc_id, result, doc)
 
         return result
 
+    def _cache_result(
+        self, doc_id: str, result: SemanticAnalysisResult, doc: Doc
+    ) -> None:
+        """Cache a result and index its entity context for similarity."""
+        self._evict(doc_id)
+        while len(self._doc_cache) >= self.cache_size:
+            self._evict(next(iter(self._doc_cache)))
+        self._doc_cache[doc_id] = result
+
+        if result.entities and self.nlp.vocab.vectors_length > 0:
+            context = self._entity_context(doc, doc.ents[0])
+            self._vector_index.add(doc_id, context.vector)
+
+    def _evict(self, doc_id: str) -> None:
+        """Remove a document from the cache and the similarity data."""
+        self._doc_cache.pop(doc_id, None)
+        self._context_features.pop(doc_id, None)
+        self._vector_index.remove(doc_id)
+
+    @staticmethod
+    def _entity_context(doc: Doc, ent: Span) -> Span:
+        """Get the sentence of an entity, or the entity itself without sentences."""
+        return ent.sent if doc.has_annotation("SENT_START") else ent
+
     def _extract_entities(self, doc: Doc) -> list[dict[str, Any]]:
         """Extract named entities with linking.
 
@@ -131,8 +284,9 @@ class SemanticAnalyzer:
         entities = []
         for ent in doc.ents:
             # Get entity context
-            start_sent = ent.sent.start
-            end_sent = ent.sent.end
+            sent = self._entity_context(doc, ent)
+            start_sent = sent.start
+            end_sent = sent.end
             context = doc[start_sent:end_sent].text
 
             # Get entity description
@@ -140,7 +294,7 @@ class SemanticAnalyzer:
 
             # Get related entities
             related = []
-            for token in ent.sent:
+            for token in sent:
                 if token.ent_type_ and token.text != ent.text:
                     related.append(
                         {
@@ -210,15 +364,57 @@ class SemanticAnalyzer:
             )
         return dependencies
 
+    def _infer_topics(self, texts: list[str]) -> list[list[dict[str, Any]]]:
+        """Infer topics of several texts with the corpus-level topic model.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of topic dictionaries for every text
+        """
+        try:
+            topic_lists = self.topic_model.get_topics(texts, self.min_topic_tokens)
+        except Exception as e:
+            self.logger.warning(f"Topic inference failed: {e}", exc_info=True)
+            topic_lists = [[] for _ in texts]
+
+        return [
+            (
+                [
+                    {
+                        **topic,
+                        "coherence": self._calculate_topic_coherence(topic["terms"]),
+                    }
+                    for topic in topics
+                ]
+                if topics
+                else [
+                    {
+                        "id": 0,
+                        "terms": [{"term": "general", "weight": 1.0}],
+                        "coherence": 0.5,
+                    }
+                ]
+            )
+            for topics in topic_lists
+        ]
+
     def _extract_topics(self, text: str) -> list[dict[str, Any]]:
         """Extract topics using LDA.
 
+        Uses the corpus-level topic model when one is set, otherwise trains
+        a model on the text itself.
+
         Args:
             text: Text to analyze
 
         Returns:
             List of topic dictionaries
         """
+        if self.topic_model is not None:
+            return self._infer_topics([text])[0]
+
         try:
             # Preprocess text
             processed_text = preprocess_string(text)
@@ -320,10 +516,11 @@ class SemanticAnalyzer:
         """
         key_phrases = []
 
-        # Extract noun phrases
-        for chunk in doc.noun_chunks:
-            if len(chunk.text.split()) >= 2:  # Only multi-word phrases
-                key_phrases.append(chunk.text)
+        # Extract noun phrases (they need the dependency parse)
+        if doc.has_annotation("DEP"):
+            for chunk in doc.noun_chunks:
+                if len(chunk.text.split()) >= 2:  # Only multi-word phrases
+                    key_phrases.append(chunk.text)
 
         # Extract named entities
         for ent in doc.ents:
@@ -332,21 +529,27 @@ class SemanticAnalyzer:
 
         return list(set(key_phrases))  # Remove duplicates
 
-    def _calculate_document_similarity(self, text: str) -> dict[str, float]:
+    def _calculate_document_similarity(self, text: str | Doc) -> dict[str, float]:
         """Calculate similarity with other processed documents.
 
         Args:
-            text: Text to compare
+            text: Text to compare, or its spaCy document
 
         Returns:
             Dictionary of document similarities
         """
-        similarities = {}
-        doc = self.nlp(text)
+        doc = text if isinstance(text, Doc) else self.nlp(text)
 
         # Check if the model has word vectors
-        has_vectors = self.nlp.vocab.vectors_length > 0
+        if self.nlp.vocab.vectors_length > 0:
+            # Cosine similarity of the word vectors, as spaCy's Doc.similarity,
+            # with the entity contexts of all cached documents at once
+            return self._vector_index.similarities(doc.vector, self.similarity_top_k)
 
+        # Use alternative similarity calculation for models without word vectors
+        # This avoids the spaCy warning about missing word vectors
+        similarities = {}
+        features = self._lexical_features(doc)
         for doc_id, cached_result in self._doc_cache.items():
             # Check if cached_result has entities and the first entity has context
             if not cached_result.entities or not cached_result.entities[0].get(
@@ -354,17 +557,20 @@ class SemanticAnalyzer:
             ):
                 continue
 
-            cached_doc = self.nlp(cached_result.entities[0]["context"])
+            cached_features = self._context_features.get(doc_id)
+            if cached_features is None:
+                cached_features = self._lexical_features(
+                    self.nlp(cached_result.entities[0]["context"])
+                )
+                self._context_features[doc_id] = cached_features
 
-            if has_vectors:
-                # Use spaCy's built-in similarity which uses word vectors
-                similarity = doc.similarity(cached_doc)
-            else:
-                # Use alternative similarity calculation for models without word vectors
-                # This avoids the spaCy warning about missing word vectors
-                similarity = self._calculate_alternative_similarity(doc, cached_doc)
+            similarities[doc_id] = float(
+                self._lexical_similarity(features, cached_features)
+            )
 
-            similarities[doc_id] = float(similarity)
+        if self.similarity_top_k is not None:
+            top = sorted(similarities.items(), key=lambda item: item[1], reverse=True)
+            similarities = dict(top[: self.similarity_top_k])
 
         return similarities
 
@@ -380,17 +586,46 @@ class SemanticAnalyzer:
         Returns:
             Similarity score between 0 and 1
         """
-        # Extract lemmatized tokens (excluding stop words and punctuation)
-        tokens1 = {
-            token.lemma_.lower()
-            for token in doc1
-            if not token.is_stop and not token.is_punct and token.is_alpha
-        }
-        tokens2 = {
-            token.lemma_.lower()
-            for token in doc2
+        return self._lexical_similarity(
+            self._lexical_features(doc1), self._lexical_features(doc2)
+        )
+
+    @staticmethod
+    def _lexical_features(doc: Doc) -> tuple[set[str], set[str]]:
+        """Get the token and entity sets compared by the alternative similarity.
+
+        Args:
+            doc: spaCy document
+
+        Returns:
+            Lowercased lemmas and entity texts of the document
+        """
+        # Extract lemmatized tokens (excluding stop words and punctuation),
+        # falling back to the token text when the lemmatizer is disabled
+        tokens = {
+            (token.lemma_ or token.text).lower()
+            for token in doc
             if not token.is_stop and not token.is_punct and token.is_alpha
         }
+        # Extract named entities
+        entities = {ent.text.lower() for ent in doc.ents}
+        return tokens, entities
+
+    @staticmethod
+    def _lexical_similarity(
+        features1: tuple[set[str], set[str]], features2: tuple[set[str], set[str]]
+    ) -> float:
+        """Combine the token and entity overlap of two documents.
+
+        Args:
+            features1: Features of the first document, see _lexical_features
+            features2: Features of the second document
+
+        Returns:
+            Similarity score between 0 and 1
+        """
+        tokens1, entities1 = features1
+        tokens2, entities2 = features2
 
         # Calculate token overlap (Jaccard similarity)
         if not tokens1 and not tokens2:
@@ -402,10 +637,6 @@ class SemanticAnalyzer:
         union = len(tokens1.union(tokens2))
         token_similarity = intersection / union if union > 0 else 0.0
 
-        # Extract named entities
-        entities1 = {ent.text.lower() for ent in doc1.ents}
-        entities2 = {ent.text.lower() for ent in doc2.ents}
-
         # Calculate entity overlap
         entity_similarity = 0.0
         if entities1 or entities2:
@@ -434,10 +665,18 @@ class SemanticAnalyzer:
         weights = [term["weight"] for term in terms]
         return sum(weights) / len(weights) if weights else 0.0
 
+    def clear_document_cache(self):
+        """Forget previously analyzed documents while keeping the models loaded."""
+        self._doc_cache.clear()
+        self._context_features.clear()
+        self._vector_index.clear()
+
     def clear_cache(self):
         """Clear the document cache and release all resources."""
         # Clear document cache
         self._doc_cache.clear()
+        self._context_features.clear()
+        self._vector_index.clear()
 
         # Release LDA model resources
         if hasattr(self, "lda_model") and self.lda_model is not None:
@@ -14,6 +14,9 @@ MAX_TEXT_LENGTH_FOR_SPACY = 100_000  # 100KB limit for spaCy processing
 MAX_ENTITIES_TO_EXTRACT = 50  # Limit number of entities
 MAX_POS_TAGS_TO_EXTRACT = 200  # Limit number of POS tags
 
+# Pipeline components whose annotations are not used (dependencies, lemmas)
+UNUSED_PIPES = ("parser", "lemmatizer")
+
 
 class TextProcessor:
     """Text processing service integrating multiple NLP libraries."""
@@ -42,22 +45,14 @@ class TextProcessor:
             self.nlp = spacy.load(spacy_model)
             # Optimize spaCy pipeline for speed
             # Select only essential components for faster processing
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
+            self._disable_unused_pipes()
         except OSError:
             logger.info(f"Downloading spaCy model {spacy_model}...")
             download(spacy_model)
             self.nlp = spacy.load(spacy_model)
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
+            self._disable_unused_pipes()
+
+        self.batch_size = settings.global_config.semantic_analysis.batch_size
 
         # Initialize LangChain text splitter with configuration from settings
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -75,6 +70,17 @@ class TextProcessor:
             ],  # Added sentence-ending punctuation
         )
 
+    def _disable_unused_pipes(self) -> None:
+        """Optimize the spaCy pipeline for speed.
+
+        Keep only essential components: tokenizer, tagger, ner.
+        """
+        if any(pipe in self.nlp.pipe_names for pipe in UNUSED_PIPES):
+            essential_pipes = [
+                pipe for pipe in self.nlp.pipe_names if pipe not in UNUSED_PIPES
+            ]
+            self.nlp.select_pipes(enable=essential_pipes)
+
     def process_text(self, text: str) -> dict:
         """Process text using multiple NLP libraries with performance optimizations.
 
@@ -88,46 +94,72 @@ class TextProcessor:
                 - pos_tags: List of part-of-speech tags (limited)
                 - chunks: List of text chunks
         """
-        # Performance check: truncate very long text
-        if len(text) > MAX_TEXT_LENGTH_FOR_SPACY:
-            logger.debug(
-                f"Text too long for spaCy processing ({len(text)} chars), truncating to {MAX_TEXT_LENGTH_FOR_SPACY}"
-            )
-            text = text[:MAX_TEXT_LENGTH_FOR_SPACY]
+        text = self._truncate(text)
 
         try:
             # Process with spaCy (optimized)
-            doc = self.nlp(text)
-
-            # Extract features with limits to prevent timeouts
-            tokens = [token.text for token in doc][
-                :MAX_POS_TAGS_TO_EXTRACT
-            ]  # Limit tokens
-            entities = [(ent.text, ent.label_) for ent in doc.ents][
-                :MAX_ENTITIES_TO_EXTRACT
-            ]  # Limit entities
-            pos_tags = [(token.text, token.pos_) for token in doc][
-                :MAX_POS_TAGS_TO_EXTRACT
-            ]  # Limit POS tags
-
-            # Process with LangChain (fast)
-            chunks = self.text_splitter.split_text(text)
-
-            return {
-                "tokens": tokens,
-                "entities": entities,
-                "pos_tags": pos_tags,
-                "chunks": chunks,
-            }
+            return self._extract_features(self.nlp(text), text)
         except Exception as e:
             logger.warning(f"Text processing failed: {e}")
-            # Return minimal results on error
-            return {
-                "tokens": [],
-                "entities": [],
-                "pos_tags": [],
-                "chunks": [text] if text else [],
-            }
+            return self._empty_features(text)
+
+    def process_texts(self, texts: list[str]) -> list[dict]:
+        """Process several texts, running spaCy on them in batches.
+
+        Args:
+            texts: Input texts to process
+
+        Returns:
+            list[dict]: Processed text features for every text, see process_text
+        """
+        texts = [self._truncate(text) for text in texts]
+        try:
+            docs = self.nlp.pipe(texts, batch_size=self.batch_size)
+            return [
+                self._extract_features(doc, text)
+                for doc, text in zip(docs, texts, strict=True)
+            ]
+        except Exception as e:
+            logger.warning(f"Batched text processing failed: {e}")
+            return [self.process_text(text) for text in texts]
+
+    def _truncate(self, text: str) -> str:
+        """Performance check: truncate very long text."""
+        if len(text) > MAX_TEXT_LENGTH_FOR_SPACY:
+            logger.debug(
+                f"Text too long for spaCy processing ({len(text)} chars), truncating to {MAX_TEXT_LENGTH_FOR_SPACY}"
+            )
+            text = text[:MAX_TEXT_LENGTH_FOR_SPACY]
+        return text
+
+    def _extract_features(self, doc, text: str) -> dict:
+        """Extract the features of a text processed by spaCy."""
+        # Extract features with limits to prevent timeouts
+        tokens = [token.text for token in doc][:MAX_POS_TAGS_TO_EXTRACT]
+        entities = [(ent.text, ent.label_) for ent in doc.ents][
+            :MAX_ENTITIES_TO_EXTRACT
+        ]
+        pos_tags = [(token.text, token.pos_) for token in doc][:MAX_POS_TAGS_TO_EXTRACT]
+
+        # Process with LangChain (fast)
+        chunks = self.text_splitter.split_text(text)
+
+        return {
+            "tokens": tokens,
+            "entities": entities,
+            "pos_tags": pos_tags,
+            "chunks": chunks,
+        }
+
+    @staticmethod
+    def _empty_features(text: str) -> dict:
+        """Return minimal results when processing fails."""
+        return {
+            "tokens": [],
+            "entities": [],
+            "pos_tags": [],
+            "chunks": [text] if text else [],
+        }
 
     def get_entities(self, text: str) -> list[tuple]:
         """Extract named entities from text using spaCy with performance limits.
@@ -1,20 +1,43 @@
 """Topic modeling module for document analysis."""
 
-from typing import Any
+import hashlib
+import re
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import spacy
 from gensim import corpora, models
 from qdrant_loader.utils.logging import LoggingConfig
 from spacy.cli.download import download
 
+if TYPE_CHECKING:
+    from qdrant_loader.core.document import Document
+
 logger = LoggingConfig.get_logger(__name__)
 
+# Minimum share of a text a topic must have to be reported for it
+MIN_TOPIC_PROBABILITY = 0.1
+
+# Number of terms reported per topic
+TOPIC_TERM_COUNT = 10
+
+# Texts are tokenized in pieces of at most this many characters; spaCy
+# refuses texts longer than its max_length (1,000,000 by default)
+MAX_PIECE_LENGTH = 100_000
+
 
 class TopicModeler:
     """Handles batched LDA topic modeling for document analysis."""
 
     def __init__(
-        self, num_topics: int = 3, passes: int = 10, spacy_model: str = "en_core_web_md"
+        self,
+        num_topics: int = 3,
+        passes: int = 10,
+        spacy_model: str = "en_core_web_md",
+        nlp: spacy.language.Language | None = None,
     ):
         """Initialize the topic modeler.
 
@@ -22,6 +45,7 @@ class TopicModeler:
             num_topics: Number of topics to extract
             passes: Number of passes for LDA training
             spacy_model: spaCy model to use for text preprocessing
+            nlp: Already loaded spaCy model to share instead of loading one
         """
         self.num_topics = num_topics
         self.passes = passes
@@ -29,7 +53,12 @@ class TopicModeler:
         self.dictionary = None
         self.lda_model = None
         self._cached_topics = {}  # Cache for topic inference results
-        self._processed_texts = set()  # Track processed texts
+        self._processed_texts: set[str] = set()  # Digests of trained texts
+        self._topic_terms: dict[int, list[dict[str, Any]]] | None = None
+
+        if nlp is not None:
+            self.nlp = nlp
+            return
 
         # Initialize spaCy for text preprocessing
         try:
@@ -38,6 +67,9 @@ class TopicModeler:
             logger.info(f"Downloading spaCy model {spacy_model}...")
             download(spacy_model)
             self.nlp = spacy.load(spacy_model)
+        # Preprocessing only uses lexical attributes (stop words, punctuation),
+        # which the tokenizer provides without running the pipeline
+        self.nlp.select_pipes(disable=self.nlp.pipe_names)
 
     def _preprocess_text(self, text: str) -> list[str]:
         """Preprocess text for topic modeling.
@@ -52,7 +84,51 @@ class TopicModeler:
         if len(text.split()) < 5:
             return []
 
-        doc = self.nlp(text)
+        return [
+            token
+            for piece in self._pieces(text)
+            for token in self._tokens(self.nlp(piece))
+        ]
+
+    def _preprocess_texts(self, texts: list[str]) -> list[list[str]]:
+        """Preprocess several texts for topic modeling in one spaCy batch.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            List of preprocessed tokens for every text
+        """
+        pieces = [
+            (index, piece)
+            for index, text in enumerate(texts)
+            if len(text.split()) >= 5
+            for piece in self._pieces(text)
+        ]
+        token_lists: list[list[str]] = [[] for _ in texts]
+        for (index, _), doc in zip(
+            pieces, self.nlp.pipe(piece for _, piece in pieces), strict=True
+        ):
+            token_lists[index].extend(self._tokens(doc))
+        return token_lists
+
+    @staticmethod
+    def _pieces(text: str) -> list[str]:
+        """Split a text at spaces into pieces of at most ``MAX_PIECE_LENGTH``."""
+        pieces = []
+        start = 0
+        while len(text) - start > MAX_PIECE_LENGTH:
+            end = text.rfind(" ", start + 1, start + MAX_PIECE_LENGTH)
+            if end == -1:
+                end = start + MAX_PIECE_LENGTH
+            pieces.append(text[start:end])
+            start = end
+        pieces.append(text[start:])
+        return pieces
+
+    @staticmethod
+    def _tokens(doc: Iterable) -> list[str]:
+        """Get the lowercased tokens of a document without stop words and punctuation."""
         return [
             token.text.lower()
             for token in doc
@@ -70,17 +146,19 @@ class TopicModeler:
             return
 
         # Filter out short texts and already processed ones
-        new_texts = [
-            text
-            for text in texts
-            if text not in self._processed_texts and len(text.split()) >= 5
-        ]
+        new_texts = {}
+        for text in texts:
+            if len(text.split()) < 5:
+                continue
+            digest = hashlib.sha256(text.encode()).hexdigest()
+            if digest not in self._processed_texts:
+                new_texts[digest] = text
         if not new_texts:
             logger.info("No new texts to process")
             return
 
-        # Preprocess all texts
-        processed_texts = [self._preprocess_text(text) for text in new_texts]
+        # Preprocess all texts in one spaCy batch
+        processed_texts = self._preprocess_texts(list(new_texts.values()))
         processed_texts = [
             text for text in processed_texts if text
         ]  # Remove empty texts
@@ -89,11 +167,10 @@ class TopicModeler:
             logger.warning("No valid texts after preprocessing")
             return
 
-        # Create or update dictionary
-        if self.dictionary is None:
+        # Create the dictionary; a trained model keeps its vocabulary, as the
+        # LDA model cannot grow the number of terms when it is updated
+        if self.dictionary is None or self.lda_model is None:
             self.dictionary = corpora.Dictionary(processed_texts)
-        else:
-            self.dictionary.add_documents(processed_texts)
 
         # Create document-term matrix
         corpus = [self.dictionary.doc2bow(text) for text in processed_texts]
@@ -121,10 +198,11 @@ class TopicModeler:
             self.lda_model.update(corpus)
 
         # Update processed texts set
-        self._processed_texts.update(new_texts)
+        self._processed_texts.update(new_texts.keys())
 
         # Clear cache when model is updated
         self._cached_topics.clear()
+        self._topic_terms = None
 
         logger.info(
             "Trained/Updated LDA model",
@@ -200,3 +278,224 @@ class TopicModeler:
                 text_length=len(text),
             )
             return {"topics": [], "coherence": 0.0}
+
+    def topic_terms(self) -> dict[int, list[dict[str, Any]]]:
+        """Get the top terms of every topic of the trained model.
+
+        Returns:
+            Terms with their weights by topic ID
+        """
+        if self._topic_terms is None:
+            self._topic_terms = {
+                topic_id: [
+                    {"term": term, "weight": float(weight)}
+                    for term, weight in self.lda_model.show_topic(
+                        topic_id, topn=TOPIC_TERM_COUNT
+                    )
+                ]
+                for topic_id in range(self.lda_model.num_topics)
+            }
+        return self._topic_terms
+
+    def get_topics(
+        self, texts: list[str], min_tokens: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """Infer the topics of several texts with the trained model.
+
+        Unlike training, inference is cheap: the texts are tokenized in one
+        batch and their topic distributions are computed together.
+
+        Args:
+            texts: Texts to analyze
+            min_tokens: Texts with fewer preprocessed tokens are skipped
+
+        Returns:
+            For every text, its topics ordered by probability; empty for
+            skipped texts or when the model is not trained
+        """
+        results: list[list[dict[str, Any]]] = [[] for _ in texts]
+        if not self.lda_model or not self.dictionary:
+            return results
+
+        bows = {}
+        for index, tokens in enumerate(self._preprocess_texts(texts)):
+            if len(tokens) >= min_tokens:
+                bow = self.dictionary.doc2bow(tokens)
+                if bow:
+                    bows[index] = bow
+        if not bows:
+            return results
+
+        gamma, _ = self.lda_model.inference(list(bows.values()))
+        distributions = gamma / gamma.sum(axis=1, keepdims=True)
+        topic_terms = self.topic_terms()
+        for index, distribution in zip(bows, distributions, strict=True):
+            results[index] = [
+                {
+                    "id": int(topic_id),
+                    "terms": topic_terms[int(topic_id)],
+                    "probability": float(distribution[topic_id]),
+                }
+                for topic_id in distribution.argsort()[::-1]
+                if distribution[topic_id] >= MIN_TOPIC_PROBABILITY
+            ]
+        return results
+
+    def save(self, path: Path) -> None:
+        """Persist the trained model.
+
+        Args:
+            path: File to save the model to; gensim stores large arrays in
+                additional files next to it
+        """
+        if self.lda_model is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.lda_model.save(str(path))
+
+    def load(self, path: Path) -> bool:
+        """Load a model persisted with ``save``.
+
+        Args:
+            path: File the model was saved to
+
+        Returns:
+            True if a model was loaded
+        """
+        if not path.exists():
+            return False
+        self.lda_model = models.LdaModel.load(str(path))
+        self.dictionary = self.lda_model.id2word
+        self._cached_topics.clear()
+        self._topic_terms = None
+        return True
+
+
+class CorpusTopicModels:
+    """Corpus-level topic models, one per source.
+
+    Training an LDA model is expensive, so it is done once per source on the
+    documents of an ingestion run, before they are chunked. Chunking then only
+    runs the cheap inference of ``TopicModeler.get_topics``. When a model
+    directory is set, models are persisted there; later runs load them and
+    refresh them with the changed documents instead of training from scratch.
+    """
+
+    MODEL_FILE = "lda.model"
+
+    def __init__(
+        self,
+        num_topics: int = 3,
+        passes: int = 10,
+        spacy_model: str = "en_core_web_md",
+        model_dir: str | Path | None = None,
+    ):
+        """Initialize the topic models.
+
+        Args:
+            num_topics: Number of topics per model
+            passes: Number of passes for LDA training
+            spacy_model: spaCy model to use for text preprocessing
+            model_dir: Directory to persist the models in (optional)
+        """
+        self.num_topics = num_topics
+        self.passes = passes
+        self.spacy_model = spacy_model
+        self.model_dir = Path(model_dir) if model_dir else None
+        self._models: dict[str, TopicModeler] = {}
+        # Modification time of the persisted file each model was loaded from
+        self._loaded_mtimes: dict[str, float] = {}
+        self._nlp: spacy.language.Language | None = None
+        self._temporary_dir: tempfile.TemporaryDirectory | None = None
+
+    @staticmethod
+    def source_key(document: "Document") -> str:
+        """Get the key of the topic model a document belongs to."""
+        return f"{document.source_type}:{document.source}"
+
+    def use_temporary_directory(self) -> Path:
+        """Persist models in a temporary directory if no directory is set.
+
+        Worker processes load the models from this directory.
+
+        Returns:
+            The model directory
+        """
+        if self.model_dir is None:
+            self._temporary_dir = tempfile.TemporaryDirectory(
+                prefix="qdrant-loader-topics-"
+            )
+            self.model_dir = Path(self._temporary_dir.name)
+        return self.model_dir
+
+    def _model_path(self, key: str) -> Path | None:
+        if self.model_dir is None:
+            return None
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", key)[:64]
+        digest = hashlib.sha256(key.encode()).hexdigest()[:12]
+        return self.model_dir / f"{slug}-{digest}" / self.MODEL_FILE
+
+    def _new_model(self) -> TopicModeler:
+        model = TopicModeler(
+            num_topics=self.num_topics,
+            passes=self.passes,
+            spacy_model=self.spacy_model,
+            nlp=self._nlp,
+        )
+        self._nlp = model.nlp
+        return model
+
+    def train(self, documents: list["Document"]) -> None:
+        """Train or refresh the models of the sources of the given documents.
+
+        Args:
+            documents: Documents of the ingestion run
+        """
+        texts_by_source: dict[str, list[str]] = defaultdict(list)
+        for document in documents:
+            if document.content:
+                texts_by_source[self.source_key(document)].append(document.content)
+
+        for key, texts in texts_by_source.items():
+            try:
+                model = self.get(key) or self._new_model()
+                model.train_model(texts)
+                if model.lda_model is None:
+                    continue
+                self._models[key] = model
+                path = self._model_path(key)
+                if path is not None:
+                    model.save(path)
+                    self._loaded_mtimes[key] = path.stat().st_mtime
+            except Exception as e:
+                # The other sources still get their models
+                logger.warning(
+                    "Topic model training failed for source",
+                    source=key,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    def get(self, key: str) -> TopicModeler | None:
+        """Get the model of a source, loading it if it was persisted.
+
+        Persisted models that changed since they were loaded are reloaded, so
+        worker processes pick up models refreshed by the main process.
+
+        Args:
+            key: Source key, see ``source_key``
+
+        Returns:
+            The trained model, or None if the source has none
+        """
+        path = self._model_path(key)
+        if path is None or not path.exists():
+            return self._models.get(key)
+
+        mtime = path.stat().st_mtime
+        if key not in self._models or self._loaded_mtimes.get(key) != mtime:
+            model = self._new_model()
+            model.load(path)
+            self._models[key] = model
+            self._loaded_mtimes[key] = mtime
+        return self._models[key]
@@ -568,6 +568,17 @@ class LoggingConfig:
             clean_output,
         )
 
+    @classmethod
+    def get_current_config(cls) -> tuple | None:
+        """Get the arguments of the last ``setup`` call.
+
+        Returns:
+            The positional arguments to pass to ``setup`` to configure logging
+            the same way, e.g. in a worker process, or None if logging was
+            not set up yet
+        """
+        return cls._current_config
+
     @classmethod
     def get_logger(cls, name: str | None = None) -> structlog.BoundLogger:
         """Get a logger instance.
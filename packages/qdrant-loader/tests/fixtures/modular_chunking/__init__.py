@@ -1,5 +1,6 @@
 """Modular chunking test fixtures."""
 
+from .mixed_corpus import create_mixed_corpus
 from .sample_documents import (
     create_edge_case_document,
     create_formatted_text_document,
@@ -7,6 +8,7 @@ from .sample_documents import (
     create_sample_text_document,
     create_simple_text_document,
 )
+from .source_files import create_large_source_file
 
 __all__ = [
     "create_sample_text_document",
@@ -14,4 +16,6 @@ __all__ = [
     "create_simple_text_document",
     "create_long_text_document",
     "create_edge_case_document",
+    "create_mixed_corpus",
+    "create_large_source_file",
 ]
@@ -0,0 +1,94 @@
+"""Mixed corpus of generated documents for chunking benchmarks.
+
+The corpus cycles through the content types handled by the different
+chunking strategies (markdown, HTML, code, JSON and plain text).
+"""
+
+import json
+
+from qdrant_loader.core.document import Document
+
+_PARAGRAPH = (
+    "Vector databases store embeddings of documents so that semantically "
+    "similar content can be retrieved quickly. Chunking splits long documents "
+    "into pieces that fit the embedding model while keeping related sentences "
+    "together. "
+)
+
+
+def _markdown(index: int) -> str:
+    sections = [
+        f"## Section {section}\n\n{_PARAGRAPH * 6}\n\n```python\nprint({section})\n```"
+        for section in range(8)
+    ]
+    return f"# Guide {index}\n\n{_PARAGRAPH * 3}\n\n" + "\n\n".join(sections)
+
+
+def _html(index: int) -> str:
+    sections = "".join(
+        f"<section><h2>Topic {section}</h2><p>{_PARAGRAPH * 5}</p>"
+        f"<ul><li>First item</li><li>Second item</li></ul></section>"
+        for section in range(8)
+    )
+    return (
+        f"<html><head><title>Page {index}</title></head>"
+        f"<body><article><h1>Page {index}</h1>{sections}</article></body></html>"
+    )
+
+
+def _code(index: int) -> str:
+    functions = "\n\n".join(
+        f'def handler_{index}_{n}(items):\n    """Process items."""\n'
+        f"    total = 0\n    for item in items:\n        if item % {n + 2} == 0:\n"
+        f"            total += item\n    return total"
+        for n in range(20)
+    )
+    return (
+        f"import os\n\n\nclass Service{index}:\n    def run(self):\n        return os.getcwd()\n\n\n"
+        + functions
+    )
+
+
+def _json(index: int) -> str:
+    return json.dumps(
+        {
+            "id": index,
+            "items": [
+                {"name": f"item-{n}", "description": _PARAGRAPH, "tags": ["a", "b"]}
+                for n in range(30)
+            ],
+            "settings": {"enabled": True, "limits": {"max": 10, "min": 1}},
+        }
+    )
+
+
+def _text(index: int) -> str:
+    return f"Notes {index}\n\n" + "\n\n".join(_PARAGRAPH * 4 for _ in range(10))
+
+
+_GENERATORS = [
+    ("md", _markdown),
+    ("html", _html),
+    ("py", _code),
+    ("json", _json),
+    ("txt", _text),
+]
+
+
+def create_mixed_corpus(size: int = 50) -> list[Document]:
+    """Create ``size`` documents cycling through all chunking strategies."""
+    documents = []
+    for index in range(size):
+        content_type, generate = _GENERATORS[index % len(_GENERATORS)]
+        documents.append(
+            Document(
+                title=f"Document {index}",
+                content=generate(index),
+                content_type=content_type,
+                source_type="test",
+                source="benchmark",
+                url=f"https://example.com/corpus/{index}.{content_type}",
+                metadata={"file_name": f"{index}.{content_type}"},
+            )
+        )
+    return documents
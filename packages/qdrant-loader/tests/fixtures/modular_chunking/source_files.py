@@ -0,0 +1,63 @@
+"""Generated large source files for code chunking benchmarks."""
+
+from qdrant_loader.core.document import Document
+
+
+def _python_method(index: int) -> str:
+    return f'''
+    def process_batch_{index}(self, items, threshold={index % 7}):
+        """Process a batch of items and return the accepted ones.
+
+        Args:
+            items: Items to process
+            threshold: Minimum score of accepted items
+        """
+        accepted = []
+        for item in items:
+            score = self.score_item(item) * {index % 5 + 1}
+            if score > threshold and item.get("enabled"):
+                accepted.append({{"id": item["id"], "score": score}})
+            elif score == threshold:
+                self.pending.append(item)
+        while len(accepted) > self.limit:
+            accepted.pop()
+        return sorted(accepted, key=lambda entry: entry["score"])
+'''
+
+
+def _python_class(index: int, methods: int) -> str:
+    body = "".join(_python_method(index * methods + n) for n in range(methods))
+    return f'''
+
+class BatchProcessor{index}:
+    """Batch processor number {index}."""
+
+    def __init__(self, limit=100):
+        self.limit = limit
+        self.pending = []
+
+    def score_item(self, item):
+        return len(item.get("name", "")) + item.get("weight", 0)
+{body}'''
+
+
+def create_large_source_file(size: int) -> Document:
+    """Create a Python module of about ``size`` characters.
+
+    The module consists of classes with many methods that do not call each
+    other, the worst case for per-function analyses.
+    """
+    content = '"""Generated batch processors."""\n\nimport json\nimport os\n'
+    index = 0
+    while len(content) < size:
+        content += _python_class(index, methods=12)
+        index += 1
+    return Document(
+        title="processors.py",
+        content=content,
+        content_type="py",
+        source_type="git",
+        source="benchmark",
+        url="https://example.com/repo/processors.py",
+        metadata={"file_name": "processors.py"},
+    )
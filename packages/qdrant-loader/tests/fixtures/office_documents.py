@@ -0,0 +1,175 @@
+"""Generated PDF and Office documents for file conversion benchmarks.
+
+The documents are built from their XML parts directly, so no Office or PDF
+library is needed to create them.
+"""
+
+import zipfile
+from pathlib import Path
+
+_SENTENCE = "Quarterly revenue grew in every region while operating costs stayed flat. "
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    "{overrides}</Types>"
+)
+
+_RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="{type}" Target="{target}"/></Relationships>'
+)
+
+_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+    "officeDocument"
+)
+
+
+def _pdf(index: int, pages: int) -> bytes:
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (4 + 2 * page) for page in range(pages))
+        + b"] /Count %d >>" % pages,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for page in range(pages):
+        lines = [f"Report {index} page {page + 1}"] + [_SENTENCE] * 30
+        text = b"".join(b"(%s) Tj 0 -14 Td " % line.encode("latin-1") for line in lines)
+        stream = b"BT /F1 10 Tf 40 800 Td " + text + b"ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (5 + 2 * page)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+
+    content = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return content
+
+
+def _write_docx(path: Path, index: int, paragraphs: int) -> None:
+    body = "".join(
+        f"<w:p><w:r><w:t>Paragraph {n} of memo {index}. {_SENTENCE * 4}</w:t></w:r></w:p>"
+        for n in range(paragraphs)
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "[Content_Types].xml",
+            _CONTENT_TYPES.format(
+                overrides='<Override PartName="/word/document.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.'
+                'wordprocessingml.document.main+xml"/>'
+            ),
+        )
+        archive.writestr(
+            "_rels/.rels",
+            _RELATIONSHIPS.format(type=_OFFICE_DOCUMENT, target="word/document.xml"),
+        )
+        archive.writestr(
+            "word/document.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            f'wordprocessingml/2006/main"><w:body>{body}</w:body></w:document>',
+        )
+
+
+def _write_xlsx(path: Path, index: int, rows: int) -> None:
+    sheet_rows = "".join(
+        f'<row r="{row}">'
+        f'<c r="A{row}" t="inlineStr"><is><t>Item {index}-{row}</t></is></c>'
+        f'<c r="B{row}"><v>{row * 3.5}</v></c>'
+        f'<c r="C{row}" t="inlineStr"><is><t>{_SENTENCE}</t></is></c>'
+        "</row>"
+        for row in range(1, rows + 1)
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "[Content_Types].xml",
+            _CONTENT_TYPES.format(
+                overrides='<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.'
+                'spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/worksheets/sheet1.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.'
+                'spreadsheetml.worksheet+xml"/>'
+            ),
+        )
+        archive.writestr(
+            "_rels/.rels",
+            _RELATIONSHIPS.format(type=_OFFICE_DOCUMENT, target="xl/workbook.xml"),
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            _RELATIONSHIPS.format(
+                type="http://schemas.openxmlformats.org/officeDocument/2006/"
+                "relationships/worksheet",
+                target="worksheets/sheet1.xml",
+            ),
+        )
+        archive.writestr(
+            "xl/workbook.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/worksheets/sheet1.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f"<sheetData>{sheet_rows}</sheetData></worksheet>",
+        )
+
+
+def create_office_documents(directory: Path, count: int) -> list[Path]:
+    """Create a folder of mixed PDF, DOCX, XLSX and CSV documents.
+
+    Args:
+        directory: Directory to create the documents in
+        count: Number of documents to create
+
+    Returns:
+        Paths of the created documents
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            path = directory / f"report_{index}.pdf"
+            path.write_bytes(_pdf(index, pages=5))
+        elif kind == 1:
+            path = directory / f"memo_{index}.docx"
+            _write_docx(path, index, paragraphs=60)
+        elif kind == 2:
+            path = directory / f"figures_{index}.xlsx"
+            _write_xlsx(path, index, rows=300)
+        else:
+            path = directory / f"export_{index}.csv"
+            path.write_text(
+                "id,name,amount\n"
+                + "".join(
+                    f"{row},item-{index}-{row},{row * 2.5}\n" for row in range(500)
+                )
+            )
+        paths.append(path)
+    return paths
@@ -67,6 +67,8 @@ class TestChunkingIntegration:
 
         settings.global_config.semantic_analysis = Mock()
         settings.global_config.semantic_analysis.spacy_model = "en_core_web_sm"
+        settings.global_config.semantic_analysis.analysis_cache_size = 1000
+        settings.global_config.semantic_analysis.similarity_top_k = None
         settings.global_config.semantic_analysis.num_topics = 3
         settings.global_config.semantic_analysis.lda_passes = 10
         return settings
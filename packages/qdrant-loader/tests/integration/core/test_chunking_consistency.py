@@ -71,6 +71,8 @@ class TestChunkingConsistency:
 
         settings.global_config.semantic_analysis = Mock()
         settings.global_config.semantic_analysis.spacy_model = "en_core_web_sm"
+        settings.global_config.semantic_analysis.analysis_cache_size = 1000
+        settings.global_config.semantic_analysis.similarity_top_k = None
 
         return settings
 
@@ -425,6 +425,30 @@ class TestCommitDateOperations:
         result = git_operations.get_first_commit_date("/some/file.txt")
         assert result is None
 
+    def test_loaded_commit_dates_are_used(self, git_operations, mock_repo):
+        """Test that dates read by load_commit_dates need no history walk."""
+        git_operations.repo = mock_repo
+        mock_repo.git.execute.return_value = (
+            "\x002024-02-01T09:00:00+00:00\n\ndocs/guide.md\n"
+            "\x002024-01-10T10:30:00+00:00\n\ndocs/guide.md\nREADME.md"
+        )
+
+        git_operations.load_commit_dates()
+
+        guide = "/fake/repo/path/docs/guide.md"
+        assert git_operations.get_first_commit_date(guide) == datetime(
+            2024, 1, 10, 10, 30, 0, tzinfo=UTC
+        )
+        assert git_operations.get_last_commit_date(guide) == datetime(
+            2024, 2, 1, 9, 0, 0, tzinfo=UTC
+        )
+        mock_repo.iter_commits.assert_not_called()
+
+        # Files missing from the loaded history are looked up one by one
+        mock_repo.iter_commits.return_value = []
+        assert git_operations.get_last_commit_date("/fake/repo/path/new.md") is None
+        mock_repo.iter_commits.assert_called_once_with(paths="new.md", max_count=1)
+
 
 class TestListFiles:
     """Test file listing operations."""
@@ -0,0 +1,173 @@
+"""Tests for LocalFile connector file scanning and pre-filtering."""
+
+import os
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import AnyUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.localfile.config import LocalFileConfig
+
+
+def _state_record(url: str, updated_at: datetime, is_deleted: bool = False):
+    record = MagicMock()
+    record.url = url
+    record.updated_at = updated_at
+    record.is_deleted = is_deleted
+    return record
+
+
+class TestLocalFileConnector:
+    """Test LocalFile connector scanning behaviour."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory tree with test files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(20):
+                sub_dir = Path(temp_dir) / f"dir{i % 4}" / "nested"
+                sub_dir.mkdir(parents=True, exist_ok=True)
+                (sub_dir / f"file{i}.md").write_text(f"# File {i}\nContent {i}")
+            (Path(temp_dir) / "ignored.bin").write_bytes(b"\x00\x01")
+            yield temp_dir
+
+    @pytest.fixture
+    def localfile_config(self, temp_dir):
+        """Create LocalFile configuration."""
+        return LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.md"],
+            max_concurrent_reads=4,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_documents_reads_nested_files(self, localfile_config):
+        """All matching files in nested directories are returned."""
+        connector = LocalFileConnector(localfile_config)
+        async with connector:
+            documents = await connector.get_documents()
+
+        assert len(documents) == 20
+        assert {doc.title for doc in documents} == {f"file{i}.md" for i in range(20)}
+        assert all(doc.content.startswith("# File") for doc in documents)
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_streams_documents(self, localfile_config):
+        """Documents can be consumed incrementally."""
+        connector = LocalFileConnector(localfile_config)
+        titles = []
+        async with connector:
+            async for document in connector.iter_documents():
+                titles.append(document.title)
+
+        assert len(titles) == 20
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_skipped(self, localfile_config, temp_dir):
+        """Files not modified since their recorded state are not read."""
+        unchanged = os.path.realpath(
+            os.path.join(temp_dir, "dir0", "nested", "file0.md")
+        )
+        modified = os.path.realpath(
+            os.path.join(temp_dir, "dir1", "nested", "file1.md")
+        )
+        now = datetime.now(UTC)
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[
+                _state_record(f"file://{unchanged}", now + timedelta(minutes=1)),
+                _state_record(f"file://{modified}", now - timedelta(days=1)),
+            ]
+        )
+
+        connector = LocalFileConnector(localfile_config)
+        connector.set_state_manager(state_manager)
+        async with connector:
+            documents = await connector.get_documents()
+
+        titles = {doc.title for doc in documents}
+        assert len(documents) == 19
+        assert "file0.md" not in titles
+        assert "file1.md" in titles
+        state_manager.get_document_state_records.assert_awaited_once_with(
+            localfile_config
+        )
+
+    @pytest.mark.asyncio
+    async def test_excluded_files_are_not_reported_unchanged(self, temp_dir):
+        """Unchanged files excluded by the configuration are not kept."""
+        excluded = os.path.realpath(
+            os.path.join(temp_dir, "dir0", "nested", "file0.md")
+        )
+        config = LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.md"],
+            exclude_paths=["dir0/**"],
+        )
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[
+                _state_record(
+                    f"file://{excluded}", datetime.now(UTC) + timedelta(minutes=1)
+                )
+            ]
+        )
+
+        connector = LocalFileConnector(config)
+        connector.set_state_manager(state_manager)
+        async with connector:
+            documents = await connector.get_documents()
+
+        assert len(documents) == 15
+        assert connector.unchanged_urls == set()
+
+    @pytest.mark.asyncio
+    async def test_deleted_state_does_not_skip_file(self, localfile_config, temp_dir):
+        """A file whose recorded state is deleted is read again."""
+        path = os.path.realpath(os.path.join(temp_dir, "dir0", "nested", "file0.md"))
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[
+                _state_record(
+                    f"file://{path}",
+                    datetime.now(UTC) + timedelta(minutes=1),
+                    is_deleted=True,
+                )
+            ]
+        )
+
+        connector = LocalFileConnector(localfile_config)
+        connector.set_state_manager(state_manager)
+        async with connector:
+            documents = await connector.get_documents()
+
+        assert len(documents) == 20
+
+    @pytest.mark.asyncio
+    async def test_pre_filtering_can_be_disabled(self, temp_dir):
+        """skip_unchanged_files=False reads every file regardless of state."""
+        config = LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.md"],
+            skip_unchanged_files=False,
+        )
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock()
+
+        connector = LocalFileConnector(config)
+        connector.set_state_manager(state_manager)
+        async with connector:
+            documents = await connector.get_documents()
+
+        assert len(documents) == 20
+        state_manager.get_document_state_records.assert_not_called()
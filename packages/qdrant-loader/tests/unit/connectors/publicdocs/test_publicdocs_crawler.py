@@ -0,0 +1,273 @@
+"""Unit tests for the PublicDocs connector crawler."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import HttpUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.publicdocs.config import PublicDocsSourceConfig
+from qdrant_loader.connectors.publicdocs.connector import PublicDocsConnector
+from qdrant_loader.core.document import Document
+
+BASE_URL = "https://test.docs.com/"
+
+PAGES = {
+    BASE_URL: """
+        <html><head><title>Home</title></head><body>
+            <article><p>Home content</p>
+                <a href="/page1">Page 1</a>
+                <a href="/page2">Page 2</a>
+            </article>
+        </body></html>
+    """,
+    f"{BASE_URL}page1": """
+        <html><head><title>Page 1</title></head><body>
+            <article><p>Page 1 content</p><a href="/deep">Deep</a></article>
+        </body></html>
+    """,
+    f"{BASE_URL}page2": """
+        <html><head><title>Page 2</title></head><body>
+            <article><p>Page 2 content</p></article>
+        </body></html>
+    """,
+    f"{BASE_URL}deep": """
+        <html><head><title>Deep</title></head><body>
+            <article><p>Deep content</p></article>
+        </body></html>
+    """,
+    f"{BASE_URL}from-sitemap": """
+        <html><head><title>Sitemap page</title></head><body>
+            <article><p>Sitemap content</p></article>
+        </body></html>
+    """,
+    f"{BASE_URL}sitemap.xml": f"""<?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>{BASE_URL}from-sitemap</loc></url>
+            <url><loc>{BASE_URL}page1</loc></url>
+            <url><loc>https://elsewhere.com/page</loc></url>
+        </urlset>
+    """,
+}
+
+
+def _make_response(url: str, headers: dict | None = None) -> MagicMock:
+    request_headers = headers or {}
+    response = MagicMock()
+    if "If-None-Match" in request_headers:
+        response.status = 304
+        response.headers = {}
+        response.text = AsyncMock(return_value="")
+    else:
+        response.status = 200
+        response.headers = {"ETag": f'"etag-{url}"'}
+        response.text = AsyncMock(return_value=PAGES[url])
+    return response
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Mock aiohttp session serving the pages above."""
+    session = MagicMock()
+    session.get = AsyncMock(
+        side_effect=lambda url, headers=None: _make_response(url, headers)
+    )
+    session.close = AsyncMock()
+    return session
+
+
+def _make_config(**kwargs) -> PublicDocsSourceConfig:
+    return PublicDocsSourceConfig(
+        source_type=SourceType.PUBLICDOCS,
+        source="test_docs",
+        base_url=HttpUrl(BASE_URL),
+        version="1.0",
+        selectors={"content": "article"},
+        **kwargs,
+    )
+
+
+def _requested_urls(session: MagicMock) -> list[str]:
+    return [call.args[0] for call in session.get.call_args_list]
+
+
+class TestPublicDocsCrawler:
+    """Test crawling behaviour of the PublicDocs connector."""
+
+    @pytest.mark.asyncio
+    async def test_each_page_fetched_once(self, session: MagicMock) -> None:
+        """The base page is fetched once for discovery and content."""
+        connector = PublicDocsConnector(_make_config())
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.title for doc in documents] == ["Home", "Page 1", "Page 2"]
+        requested = _requested_urls(session)
+        assert sorted(requested) == sorted(
+            [BASE_URL, f"{BASE_URL}page1", f"{BASE_URL}page2"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_crawl_depth_follows_links(self, session: MagicMock) -> None:
+        """Links of discovered pages are followed up to crawl_depth."""
+        connector = PublicDocsConnector(_make_config(crawl_depth=2))
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.title for doc in documents] == [
+            "Home",
+            "Page 1",
+            "Page 2",
+            "Deep",
+        ]
+        assert len(_requested_urls(session)) == 4
+
+    @pytest.mark.asyncio
+    async def test_sitemap_seeds_crawl(self, session: MagicMock) -> None:
+        """URLs from the sitemap under the base URL are crawled."""
+        connector = PublicDocsConnector(_make_config(use_sitemap=True))
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        titles = [doc.title for doc in documents]
+        assert "Sitemap page" in titles
+        assert titles.count("Page 1") == 1
+        assert "https://elsewhere.com/page" not in _requested_urls(session)
+
+    @pytest.mark.asyncio
+    async def test_conditional_requests_skip_unchanged_pages(
+        self, session: MagicMock
+    ) -> None:
+        """Pages answered with 304 are skipped and validators are stored."""
+        config = _make_config()
+        page1 = f"{BASE_URL}page1"
+
+        # First run: no validators known, everything is fetched in full
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(return_value=[])
+        state_manager.get_http_cache_records = AsyncMock(return_value=[])
+        state_manager.update_http_cache_records = AsyncMock()
+
+        connector = PublicDocsConnector(config)
+        connector.set_state_manager(state_manager)
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                first_run = await connector.get_documents()
+
+        stored = state_manager.update_http_cache_records.call_args.args[1]
+        assert {entry["url"] for entry in stored} == {
+            BASE_URL,
+            page1,
+            f"{BASE_URL}page2",
+        }
+        page1_doc = next(doc for doc in first_run if doc.url == page1)
+
+        # Second run: page1 was ingested with the stored validators
+        state_record = MagicMock(
+            url=page1, content_hash=page1_doc.content_hash, is_deleted=False
+        )
+        cache_record = MagicMock(
+            url=page1,
+            etag=f'"etag-{page1}"',
+            last_modified=None,
+            content_hash=page1_doc.content_hash,
+        )
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[state_record]
+        )
+        state_manager.get_http_cache_records = AsyncMock(return_value=[cache_record])
+        session.get.reset_mock()
+
+        connector = PublicDocsConnector(config)
+        connector.set_state_manager(state_manager)
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                second_run = await connector.get_documents()
+
+        assert [doc.title for doc in second_run] == ["Home", "Page 2"]
+        page1_call = next(
+            call for call in session.get.call_args_list if call.args[0] == page1
+        )
+        assert page1_call.kwargs["headers"] == {"If-None-Match": f'"etag-{page1}"'}
+
+    @pytest.mark.asyncio
+    async def test_links_of_unchanged_pages_are_crawled(
+        self, session: MagicMock
+    ) -> None:
+        """Links stored with a page answered with 304 are still followed."""
+        page1 = f"{BASE_URL}page1"
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[MagicMock(url=page1, content_hash="hash", is_deleted=False)]
+        )
+        state_manager.get_http_cache_records = AsyncMock(
+            return_value=[
+                MagicMock(
+                    url=page1,
+                    etag=f'"etag-{page1}"',
+                    last_modified=None,
+                    content_hash="hash",
+                    links=f'["{BASE_URL}deep"]',
+                )
+            ]
+        )
+        state_manager.update_http_cache_records = AsyncMock()
+
+        connector = PublicDocsConnector(_make_config(crawl_depth=2))
+        connector.set_state_manager(state_manager)
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.title for doc in documents] == ["Home", "Page 2", "Deep"]
+        assert connector.unchanged_urls == {page1}
+        stored = state_manager.update_http_cache_records.call_args.args[1]
+        home_entry = next(entry for entry in stored if entry["url"] == BASE_URL)
+        assert json.loads(home_entry["links"]) == [page1, f"{BASE_URL}page2"]
+
+    @pytest.mark.asyncio
+    async def test_stale_validators_are_not_sent(self, session: MagicMock) -> None:
+        """Validators are ignored when the stored document differs."""
+        page1 = f"{BASE_URL}page1"
+        state_manager = MagicMock()
+        state_manager.get_document_state_records = AsyncMock(
+            return_value=[
+                MagicMock(url=page1, content_hash="ingested", is_deleted=False)
+            ]
+        )
+        state_manager.get_http_cache_records = AsyncMock(
+            return_value=[
+                MagicMock(
+                    url=page1,
+                    etag='"old"',
+                    last_modified=None,
+                    content_hash="never-ingested",
+                )
+            ]
+        )
+        state_manager.update_http_cache_records = AsyncMock()
+
+        connector = PublicDocsConnector(_make_config())
+        connector.set_state_manager(state_manager)
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert len(documents) == 3
+        assert all("headers" not in call.kwargs for call in session.get.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_document_ids_are_stable(self, session: MagicMock) -> None:
+        """Document IDs only depend on the source and the page URL."""
+        connector = PublicDocsConnector(_make_config())
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.id for doc in documents] == [
+            Document.generate_id("publicdocs", "test_docs", url)
+            for url in [BASE_URL, f"{BASE_URL}page1", f"{BASE_URL}page2"]
+        ]
@@ -0,0 +1,94 @@
+"""Tests for Tree-sitter and AST element extraction in CodeDocumentParser."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_loader.core.chunking.strategy.code import code_document_parser
+from qdrant_loader.core.chunking.strategy.code.code_document_parser import (
+    TREE_SITTER_AVAILABLE,
+    CodeDocumentParser,
+    CodeElementType,
+    get_element_query,
+    get_tree_sitter_parser,
+)
+
+requires_tree_sitter = pytest.mark.skipif(
+    not TREE_SITTER_AVAILABLE, reason="tree-sitter is not installed"
+)
+
+JAVASCRIPT_CODE = """// Shapes
+class Square {
+  area() {
+    return this.side * this.side;
+  }
+}
+
+async function draw(shape) {
+  function helper() {}
+  return helper();
+}
+"""
+
+
+@requires_tree_sitter
+def test_tree_sitter_elements_in_document_order():
+    parser = CodeDocumentParser(Mock())
+
+    elements = parser.parse_code_elements(JAVASCRIPT_CODE, "javascript")
+
+    assert [(e.element_type, e.name) for e in elements] == [
+        (CodeElementType.COMMENT, "unnamed_comment"),
+        (CodeElementType.METHOD, "unnamed_method_definition"),
+    ]
+    method = elements[1]
+    assert method.content.startswith("area() {")
+    assert (method.start_line, method.end_line) == (3, 5)
+    # Depth in the syntax tree: program > class body > method
+    assert method.level == 3
+
+
+@requires_tree_sitter
+def test_tree_sitter_skips_large_elements_with_their_children():
+    parser = CodeDocumentParser(Mock())
+    code = "class A {\n  m() {\n    // x\n    return 1;\n  }\n}\n// end\n"
+
+    elements = parser._parse_with_tree_sitter(code, "javascript")
+    assert [e.content for e in elements][1:] == ["// x", "// end"]
+
+    with patch.object(code_document_parser, "MAX_ELEMENT_SIZE", 10):
+        elements = parser._parse_with_tree_sitter(code, "javascript")
+
+    # The method and the comment inside it are skipped
+    assert [e.content for e in elements] == ["// end"]
+
+
+@requires_tree_sitter
+def test_tree_sitter_caches_are_shared_by_parser_instances():
+    assert get_tree_sitter_parser("javascript") is get_tree_sitter_parser("javascript")
+    assert get_element_query("javascript") is get_element_query("javascript")
+
+    # Parsers are not thread-safe and are not shared between threads
+    other_thread_parser = []
+    thread = threading.Thread(
+        target=lambda: other_thread_parser.append(get_tree_sitter_parser("javascript"))
+    )
+    thread.start()
+    thread.join()
+    assert other_thread_parser[0] is not get_tree_sitter_parser("javascript")
+
+
+def test_python_ast_elements():
+    parser = CodeDocumentParser(Mock())
+    code = 'class A:\n    """Doc."""\n\n    async def run(self, x):\n        return x\n'
+
+    elements = parser.parse_code_elements(code, "python")
+
+    assert [(e.element_type, e.name) for e in elements] == [
+        (CodeElementType.CLASS, "A"),
+        (CodeElementType.METHOD, "run"),
+    ]
+    assert elements[0].docstring == "Doc."
+    assert elements[1].content == "    async def run(self, x):\n        return x"
+    assert elements[1].is_async
+    assert elements[1].parameters == ["self", "x"]
@@ -0,0 +1,60 @@
+"""Tests for the shared scan of code chunks."""
+
+from qdrant_loader.core.chunking.strategy.code.code_scan import CodeScan
+
+PYTHON_CODE = '''# Utilities
+class Walker:
+    """Walk trees."""
+
+    def walk(self, node):
+        for child in node.children:
+            self.walk(child)
+
+    async def visit(self, node):
+        return node
+
+
+def helper(x):
+    -- not python, but counted as a dash comment
+    return x + 1
+'''
+
+
+def test_line_statistics():
+    scan = CodeScan(PYTHON_CODE)
+
+    lines = PYTHON_CODE.split("\n")
+    assert scan.line_count == len(lines)
+    assert scan.non_empty_lines == len([line for line in lines if line.strip()])
+    assert scan.comment_lines == 1
+    assert scan.dash_comment_lines == 1
+    assert scan.max_line_length == max(len(line) for line in lines)
+    assert scan.avg_line_length == sum(len(line) for line in lines) / len(lines)
+    assert scan.long_lines == 0
+    assert set(scan.indentations) == {4, 8, 12}
+
+
+def test_definitions():
+    scan = CodeScan(PYTHON_CODE)
+
+    assert scan.class_definitions == 1
+    # "async def" is not counted as a definition at line start
+    assert scan.function_definitions == 2
+    assert [name for _, name in scan.python_functions] == ["walk", "visit", "helper"]
+
+
+def test_tokens():
+    scan = CodeScan("total = price * 2 + tax_1 - 9x")
+
+    assert scan.identifiers == ["total", "price", "tax_1"]
+    assert scan.operator_count == 4
+    assert scan.meaningful_char_count == len("totalprice2tax_19x")
+
+
+def test_recursive_call_detection():
+    assert CodeScan(PYTHON_CODE).has_recursive_call()
+    assert not CodeScan("def f(x):\n    return g(x)\n").has_recursive_call()
+    # A call on the definition line itself does not count
+    assert not CodeScan("def f(x): return f\n").has_recursive_call()
+    assert CodeScan("def f(x):\n    return obj.f (x)\n").has_recursive_call()
+    assert not CodeScan("x = f(1)\n").has_recursive_call()
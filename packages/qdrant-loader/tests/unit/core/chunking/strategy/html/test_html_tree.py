@@ -0,0 +1,75 @@
+"""Tests for the shared HTML parsing helpers."""
+
+from qdrant_loader.core.chunking.strategy.html.html_metadata_extractor import (
+    HTMLMetadataExtractor,
+)
+from qdrant_loader.core.chunking.strategy.html.html_tree import (
+    HTMLElementScan,
+    parse_html,
+)
+from qdrant_loader.core.document import Document
+
+PAGE = """
+<html lang="en"><body>
+  <main id="main">
+    <section class="intro aria-like" aria-label="Intro" data-section="1">
+      <h2>Introduction</h2>
+      <p onclick="track()" style="color: red">Read the <a href="#setup">setup</a>.</p>
+      <form><label>Name</label><input type="text"><input type="submit"></form>
+    </section>
+    <section id="setup"><h2>Setup</h2><img src="a.png" alt="A"><my-widget></my-widget></section>
+  </main>
+</body></html>
+"""
+
+
+def _document() -> Document:
+    return Document(
+        content=PAGE,
+        metadata={},
+        source="test",
+        source_type="test",
+        url="https://example.com/page.html",
+        title="Page",
+        content_type="html",
+    )
+
+
+def test_scan_indexes_tags_and_attribute_names():
+    """Attribute statistics are based on attribute names, not class names."""
+    scan = HTMLElementScan([parse_html(PAGE)])
+
+    assert [element.name for element in scan.find_all("h2", "section")] == [
+        "section",
+        "h2",
+        "section",
+        "h2",
+    ]
+    assert scan.find("a")["href"] == "#setup"
+    assert scan.ids == ["main", "setup"]
+    assert scan.classes == ["intro", "aria-like"]
+    assert scan.aria_elements == 1
+    assert scan.data_attribute_elements == 1
+    assert scan.event_handler_elements == 1
+    assert scan.pointer_handler_elements == 1
+    assert scan.styled_elements == 1
+    assert scan.custom_elements == 1
+
+
+def test_section_nodes_give_same_metadata_as_parsing_content():
+    """Metadata of parsed section elements matches parsing their markup."""
+    extractor = HTMLMetadataExtractor()
+    sections = parse_html(PAGE).find_all("section")
+    content = "\n\n".join(str(section) for section in sections)
+
+    from_nodes = extractor.extract_hierarchical_metadata(
+        content, {}, _document(), HTMLElementScan(sections)
+    )
+    from_content = extractor.extract_hierarchical_metadata(content, {}, _document())
+
+    assert from_nodes == from_content
+    assert from_nodes["dom_path"] == "section.intro.aria-like"
+    assert from_nodes["interactive_elements"]["buttons"] == 1
+    assert sorted(
+        extractor.extract_entities(content, HTMLElementScan(sections))
+    ) == sorted(extractor.extract_entities(content))
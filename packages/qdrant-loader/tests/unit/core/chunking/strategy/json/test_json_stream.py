@@ -0,0 +1,137 @@
+"""Tests for the streaming JSON reader and the grouping of streamed records."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from qdrant_loader.config import Settings
+from qdrant_loader.core.chunking.strategy.json.json_document_parser import (
+    JSONElementType,
+)
+from qdrant_loader.core.chunking.strategy.json.json_section_splitter import (
+    JSONSectionSplitter,
+)
+from qdrant_loader.core.chunking.strategy.json.json_stream import JSONStreamReader
+
+
+def _create_splitter(chunk_size: int, max_array_items_per_chunk: int = 50):
+    settings = Mock(spec=Settings)
+    settings.global_config = Mock()
+    settings.global_config.chunking.chunk_size = chunk_size
+    settings.global_config.chunking.chunk_overlap = 0
+    settings.global_config.chunking.max_chunks_per_document = 500
+    json_strategy = settings.global_config.chunking.strategies.json_strategy
+    json_strategy.max_array_items_per_chunk = max_array_items_per_chunk
+    json_strategy.max_object_keys_to_process = 100
+    return JSONSectionSplitter(settings)
+
+
+def _large_document() -> dict:
+    return {
+        "name": "catalog",
+        "products": [
+            {
+                "id": n,
+                "title": f"Product [{n}] {{special}}",
+                "description": 'A "quoted" description. ' * (n % 7 + 1),
+                "tags": ["a", "b", f"tag-{n}"],
+            }
+            for n in range(200)
+        ],
+        "settings": {"enabled": True, "limits": {"max": 10, "min": 1}},
+    }
+
+
+class TestJSONStreamReader:
+    """Tests for JSONStreamReader."""
+
+    def test_small_document_is_one_record(self):
+        content = json.dumps({"a": 1, "b": [1, 2]})
+        records = list(JSONStreamReader(content, 1000, 5).records())
+
+        assert len(records) == 1
+        assert records[0].path == "$"
+        assert records[0].value == {"a": 1, "b": [1, 2]}
+
+    def test_large_containers_are_descended_into(self):
+        data = _large_document()
+        content = json.dumps(data, indent=2)
+        records = list(JSONStreamReader(content, 500, 5).records())
+
+        paths = [record.path for record in records]
+        assert paths[0] == "$.name"
+        assert paths[1:201] == [f"$.products[{n}]" for n in range(200)]
+        assert paths[-1] == "$.settings"
+        assert all(record.size <= 500 for record in records)
+
+        product = records[5]
+        assert product.name == "item_4"
+        assert product.parent_path == "$.products"
+        assert product.in_array
+        assert product.level == 2
+        assert product.value == data["products"][4]
+
+    def test_max_depth_limits_descent(self):
+        content = json.dumps({"products": [{"id": n} for n in range(100)]})
+        records = list(JSONStreamReader(content, 100, 1).records())
+
+        assert len(records) == 1
+        assert records[0].path == "$.products"
+        assert len(records[0].value) == 100
+
+    def test_scalar_and_empty_documents(self):
+        assert [r.value for r in JSONStreamReader("42", 10, 5).records()] == [42]
+        assert [r.value for r in JSONStreamReader(" [] ", 10, 5).records()] == [[]]
+
+    @pytest.mark.parametrize(
+        "content",
+        ['{"a": [1, 2', '{"a": 1} {"b": 2}', '{"a" 1}', "[1 2]", "{1: 2}"],
+    )
+    def test_invalid_json_raises(self, content):
+        with pytest.raises(json.JSONDecodeError):
+            list(JSONStreamReader(content, 4, 5).records())
+
+
+class TestSplitJSONRecords:
+    """Tests for JSONSectionSplitter.split_json_records."""
+
+    def test_groups_are_bounded_and_render_their_value(self):
+        data = _large_document()
+        splitter = _create_splitter(chunk_size=1000)
+        reader = JSONStreamReader(json.dumps(data), 1000, 5)
+
+        elements = list(splitter.split_json_records(reader.records()))
+
+        assert len(elements) > 1
+        for element in elements:
+            assert element.size <= 1000
+            assert element.content == json.dumps(element.value, indent=2)
+
+        groups = [e for e in elements if e.path.startswith("$.products[")]
+        assert groups[0].element_type == JSONElementType.ARRAY
+        assert groups[0].path.startswith("$.products[0:")
+        assert [item for g in groups for item in g.value] == data["products"]
+
+    def test_object_members_are_grouped(self):
+        data = {f"key_{n}": {"value": "x" * 50} for n in range(20)}
+        splitter = _create_splitter(chunk_size=300)
+        reader = JSONStreamReader(json.dumps(data), 300, 5)
+
+        elements = list(splitter.split_json_records(reader.records()))
+
+        assert all(e.element_type == JSONElementType.OBJECT for e in elements)
+        assert all(e.path == "$" for e in elements)
+        merged = {}
+        for element in elements:
+            merged.update(element.value)
+        assert merged == data
+
+    def test_max_items_per_chunk(self):
+        data = list(range(100))
+        splitter = _create_splitter(chunk_size=10_000, max_array_items_per_chunk=30)
+        reader = JSONStreamReader(json.dumps(data), 10, 5)
+
+        elements = list(splitter.split_json_records(reader.records()))
+
+        assert [len(e.value) for e in elements] == [30, 30, 30, 10]
+        assert elements[-1].path == "$[90:100]"
@@ -551,6 +551,49 @@ def func():
         assert len(header_elements) >= 50  # Should have many headers
         assert len(content_elements) >= 1  # Should have content
 
+    def test_parse_document_structure_elements(self):
+        """Test the exact elements, including empty lines and fenced headers."""
+        content = "Preamble\n\n# Title\n## Empty\n\n```\n# not a header\n```\n#Tag\n"
+
+        elements = DocumentParser().parse_document_structure(content)
+
+        assert elements == [
+            {"type": "content", "text": "Preamble\n", "level": 0},
+            {"type": "header", "text": "# Title", "level": 1, "title": "Title"},
+            {"type": "header", "text": "## Empty", "level": 2, "title": "Empty"},
+            {
+                "type": "content",
+                "text": "\n```\n# not a header\n```\n#Tag\n",
+                "level": 0,
+            },
+        ]
+
+    def test_parse_document_structure_edge_lines(self):
+        """Test headers at the document boundaries and with CRLF line endings."""
+        parser = DocumentParser()
+
+        assert parser.parse_document_structure("") == [
+            {"type": "content", "text": "", "level": 0}
+        ]
+        assert parser.parse_document_structure("# Only") == [
+            {"type": "header", "text": "# Only", "level": 1, "title": "Only"}
+        ]
+        assert parser.parse_document_structure("text\r\n### Windows\r\nmore") == [
+            {"type": "content", "text": "text\r", "level": 0},
+            {
+                "type": "header",
+                "text": "### Windows\r",
+                "level": 3,
+                "title": "Windows",
+            },
+            {"type": "content", "text": "more", "level": 0},
+        ]
+        # Seven hashes and headers without a space are not headers
+        assert [
+            element["type"]
+            for element in parser.parse_document_structure("####### x\n#x\n#\n")
+        ] == ["content"]
+
 
 class TestHierarchyBuilder:
     """Test HierarchyBuilder class."""
@@ -1,7 +1,9 @@
 """Comprehensive tests for Markdown SectionSplitter to achieve 80%+ coverage."""
 
+import time
 from unittest.mock import Mock, patch
 
+import pytest
 from qdrant_loader.core.chunking.strategy.markdown.section_splitter import (
     BaseSplitter,
     ExcelSplitter,
@@ -11,6 +13,7 @@ from qdrant_loader.core.chunking.strategy.markdown.section_splitter import (
     SectionSplitter,
     StandardSplitter,
 )
+from qdrant_loader.utils.logging import LoggingConfig
 
 
 class TestHeaderAnalysis:
@@ -710,6 +713,41 @@ class TestSectionSplitter:
                     for i, section in enumerate(result):
                         assert f"Part {i+1}" in section["title"]
 
+    def test_split_sections_paths(self):
+        """Test the parent headers recorded for each section."""
+        self.mock_settings.global_config.chunking.chunk_size = 10000
+        text = (
+            "# Guide\n## Install\n### Linux\nsteps\n## Usage\n### Linux\n"
+            "usage\n#### Details\n## Other\n"
+        )
+
+        with patch.object(
+            self.splitter, "determine_optimal_split_levels", return_value={1, 2, 3, 4}
+        ):
+            sections = self.splitter.split_sections(text)
+
+        assert [(s["title"], s["path"]) for s in sections] == [
+            ("Guide", []),
+            ("Install", ["Guide"]),
+            ("Linux", ["Guide", "Install"]),
+            ("Usage", ["Guide"]),
+            # Repeated headers get the path of their first occurrence
+            ("Linux", ["Guide", "Install"]),
+            ("Details", ["Guide", "Usage", "Linux"]),
+            ("Other", ["Guide"]),
+        ]
+        assert sections[0]["content"] == "# Guide\n"
+        assert sections[2]["content"] == "### Linux\nsteps\n"
+
+    def test_analyze_header_distribution_ignores_malformed_headers(self):
+        """Test header counting of indented, empty and overlong headers."""
+        text = "  # Indented\n#\n#   \n####### Seven\n#NoSpace\n## Two\n###\tTab"
+
+        analysis = self.splitter.analyze_header_distribution(text)
+
+        assert (analysis.h1, analysis.h2, analysis.h3) == (1, 1, 1)
+        assert analysis.total_headers == 3
+
     def test_merge_related_sections_empty_list(self):
         """Test merge_related_sections with empty input."""
         result = self.splitter.merge_related_sections([])
@@ -797,3 +835,35 @@ class TestSectionSplitter:
             assert result[0].content_analysis["has_code_blocks"] is True
             assert result[0].content_analysis["has_tables"] is True
             assert result[0].content_analysis["has_links"] is True
+
+    @pytest.mark.slow
+    def test_split_sections_large_document_benchmark(self):
+        """Benchmark splitting a 5 MB converted document."""
+        self.mock_settings.global_config.chunking.chunk_size = 1500
+        self.mock_settings.global_config.chunking.chunk_overlap = 200
+        self.mock_settings.global_config.chunking.max_chunks_per_document = 100000
+        markdown = self.mock_settings.global_config.chunking.strategies.markdown
+        markdown.max_chunks_per_section = 1000
+        markdown.max_overlap_percentage = 0.25
+
+        sentence = "Revenue grew in every region while operating costs stayed flat. "
+        section = (
+            "## Section\n\n"
+            f"{sentence * 5}\n\n### Details\n\n{sentence * 30}\n\n"
+            "```python\nprint(1)\n```\n\n"
+            + "".join(f"- item {n}: {sentence}\n" for n in range(5))
+            + "\n| a | b |\n|---|---|\n| 1 | 2 |\n\n"
+        )
+        text = "# Report\n\n" + section * (5_000_000 // len(section))
+
+        start = time.perf_counter()
+        result = self.splitter.split_sections(text)
+        elapsed = time.perf_counter() - start
+
+        assert all(len(section["content"]) <= 1500 for section in result)
+        LoggingConfig.get_logger(__name__).info(
+            "Section splitting benchmark",
+            megabytes=round(len(text) / 1_000_000, 1),
+            sections=len(result),
+            seconds=round(elapsed, 2),
+        )
@@ -1,5 +1,6 @@
 """Unit tests for modernized code chunking strategy."""
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,6 +8,8 @@ from qdrant_loader.config import Settings
 from qdrant_loader.config.types import SourceType
 from qdrant_loader.core.chunking.strategy.code_strategy import CodeChunkingStrategy
 from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+from tests.fixtures.modular_chunking import create_large_source_file
 
 
 @pytest.fixture
@@ -397,3 +400,25 @@ class TestCodeChunkingStrategyModern:
                 # (it might not be if fallback chunking is used)
                 if "document_structure" in metadata:
                     assert isinstance(metadata["document_structure"], dict)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size", [20_000, 40_000, 70_000])
+def test_large_source_file_chunking_benchmark(mock_settings, size):
+    """Chunk large Python modules parsed with the AST."""
+    with patch("qdrant_loader.core.chunking.strategy.base_strategy.TextProcessor"):
+        strategy = CodeChunkingStrategy(mock_settings)
+    document = create_large_source_file(size)
+
+    start = time.perf_counter()
+    chunks = strategy.chunk_document(document)
+    elapsed = time.perf_counter() - start
+
+    LoggingConfig.get_logger(__name__).info(
+        "Code chunking benchmark",
+        chars=len(document.content),
+        chunks=len(chunks),
+        seconds=round(elapsed, 2),
+    )
+    assert chunks
+    assert all(c.metadata["chunking_strategy"] == "code_modular" for c in chunks)
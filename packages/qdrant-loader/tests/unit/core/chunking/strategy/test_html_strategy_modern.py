@@ -1,12 +1,16 @@
 """Unit tests for modernized HTML chunking strategy."""
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
+from bs4 import BeautifulSoup
 from qdrant_loader.config import Settings
 from qdrant_loader.config.types import SourceType
+from qdrant_loader.core.chunking.strategy.html import html_tree
 from qdrant_loader.core.chunking.strategy.html_strategy import HTMLChunkingStrategy
 from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
 
 
 @pytest.fixture
@@ -274,3 +278,90 @@ class TestHTMLChunkingStrategyModern:
         # Test full integration
         chunks = strategy.chunk_document(sample_html_document)
         assert len(chunks) > 0
+
+    def test_document_parsed_once(self, mock_settings, sample_html_document):
+        """The document is parsed once and chunks reuse its elements."""
+        with patch("qdrant_loader.core.chunking.strategy.base_strategy.TextProcessor"):
+            strategy = HTMLChunkingStrategy(mock_settings)
+
+        with _count_parses() as parses:
+            chunks = strategy.chunk_document(sample_html_document)
+
+        assert chunks
+        assert parses.call_count == 1
+        assert all(html_tree.SECTION_NODES_KEY not in c.metadata for c in chunks)
+        assert chunks[0].title == "Main Title (Chunk 1)"
+
+
+def _count_parses():
+    """Count the HTML documents parsed with BeautifulSoup."""
+    return patch.object(
+        BeautifulSoup, "__init__", autospec=True, side_effect=BeautifulSoup.__init__
+    )
+
+
+def _confluence_page(size: int) -> str:
+    """Generate a Confluence-like page of about ``size`` characters."""
+    block = (
+        '<div class="confluence-information-macro" data-macro-name="info">'
+        '<div class="confluence-information-macro-body"><p>Note for {n}</p></div>'
+        "</div>"
+        '<h2 id="section-{n}">Section {n}</h2>'
+        '<p class="auto-cursor-target">Paragraph {n} describes the deployment '
+        "procedure in detail, with <strong>emphasis</strong> and "
+        '<a href="/wiki/spaces/DOC/pages/{n}">a link</a>.</p>'
+        '<div class="table-wrap"><table class="confluenceTable"><tbody>'
+        '<tr><th class="confluenceTh">Key</th><th class="confluenceTh">Value</th></tr>'
+        '<tr><td class="confluenceTd">name-{n}</td>'
+        '<td class="confluenceTd">value-{n}</td></tr>'
+        "</tbody></table></div>"
+        "<ul><li>First item {n}</li><li>Second item {n}</li></ul>"
+    )
+    parts = []
+    length = 0
+    n = 0
+    while length < size:
+        part = block.format(n=n)
+        parts.append(part)
+        length += len(part)
+        n += 1
+    return (
+        '<html lang="en"><head><title>Space page</title></head><body>'
+        f'<div id="main-content" class="wiki-content">{"".join(parts)}</div>'
+        "</body></html>"
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("megabytes", [1, 3, 5])
+def test_large_page_chunking_benchmark(mock_settings, megabytes):
+    """Chunk 1-5 MB Confluence-like pages that are small enough to be parsed."""
+    html_config = mock_settings.global_config.chunking.strategies.html
+    html_config.max_html_size_for_parsing = 10_000_000
+    with patch("qdrant_loader.core.chunking.strategy.base_strategy.TextProcessor"):
+        strategy = HTMLChunkingStrategy(mock_settings)
+    document = Document(
+        content=_confluence_page(megabytes * 1_000_000),
+        metadata={"file_name": "page.html"},
+        source="space",
+        source_type=SourceType.CONFLUENCE,
+        url="https://example.atlassian.net/wiki/page",
+        title="Space page",
+        content_type="html",
+    )
+
+    with _count_parses() as parses:
+        start = time.perf_counter()
+        chunks = strategy.chunk_document(document)
+        elapsed = time.perf_counter() - start
+
+    LoggingConfig.get_logger(__name__).info(
+        "HTML chunking benchmark",
+        megabytes=megabytes,
+        parser=html_tree.HTML_PARSER,
+        chunks=len(chunks),
+        seconds=round(elapsed, 2),
+        parses=parses.call_count,
+    )
+    assert chunks
+    assert all(c.metadata["chunking_strategy"] == "html_modular" for c in chunks)
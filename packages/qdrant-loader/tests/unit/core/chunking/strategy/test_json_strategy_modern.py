@@ -170,6 +170,40 @@ class TestJSONChunkingStrategyModern:
         assert len(chunks) > 0
         assert chunks[0].metadata.get("chunking_strategy") == "json_fallback"
 
+    def test_large_json_is_streamed(self, strategy):
+        """Test that large JSON documents are chunked without decoding them whole."""
+        data = {
+            "records": [
+                {"id": n, "name": f"record-{n}", "text": "lorem ipsum " * 20}
+                for n in range(3000)
+            ]
+        }
+        content = json.dumps(data)
+        assert len(content) > strategy.simple_chunking_threshold
+        large_doc = Document(
+            content=content,
+            source="large.json",
+            source_type="file",
+            title="Large JSON",
+            url="file://large.json",
+            content_type="application/json",
+            metadata={},
+        )
+
+        with patch(
+            "qdrant_loader.core.chunking.strategy.json_strategy.json.loads",
+            side_effect=AssertionError("document decoded as a whole"),
+        ):
+            chunks = strategy.chunk_document(large_doc)
+
+        # Capped like the regular path
+        assert len(chunks) == strategy.json_config.max_objects_to_process
+        assert all(c.metadata.get("chunking_strategy") == "json" for c in chunks)
+        assert all(c.metadata["total_chunks"] == len(chunks) for c in chunks)
+        assert all(len(c.content) <= strategy.chunk_size for c in chunks)
+        records = [record for c in chunks for record in json.loads(c.content)]
+        assert records == data["records"][: len(records)]
+
     def test_get_strategy_name(self, strategy):
         """Test strategy name."""
         assert strategy.get_strategy_name() == "json_modular"
@@ -72,6 +72,8 @@ class TestChunkingService:
 
         settings.global_config.semantic_analysis = Mock()
         settings.global_config.semantic_analysis.spacy_model = "en_core_web_sm"
+        settings.global_config.semantic_analysis.analysis_cache_size = 1000
+        settings.global_config.semantic_analysis.similarity_top_k = None
         settings.global_config.semantic_analysis.num_topics = 3
         settings.global_config.semantic_analysis.lda_passes = 10
         return settings
@@ -472,6 +474,34 @@ class TestChunkingService:
                 assert len(result) == 2
                 mock_strategy.chunk_document.assert_called_once_with(sample_document)
 
+    def test_train_topic_models_for_markdown_documents(
+        self, mock_global_config, mock_settings, sample_document
+    ):
+        """Test that topic models are trained on markdown documents only."""
+        with (
+            patch("qdrant_loader.core.chunking.chunking_service.Path"),
+            patch("qdrant_loader.core.chunking.chunking_service.IngestionMonitor"),
+            patch("qdrant_loader.core.chunking.chunking_service.LoggingConfig"),
+        ):
+            service = ChunkingService(mock_global_config, mock_settings)
+            code_document = sample_document.model_copy(update={"content_type": "py"})
+            topic_models = Mock()
+            service._topic_models = topic_models
+
+            service.train_topic_models([sample_document, code_document])
+            topic_models.train.assert_called_once_with([sample_document])
+
+            # The model of the document's source is handed to the strategy
+            mock_strategy = Mock()
+            mock_strategy.chunk_document.return_value = []
+            with patch.object(service, "_get_strategy", return_value=mock_strategy):
+                service.chunk_document(sample_document)
+
+            topic_models.get.assert_called_once_with("test:test_source")
+            mock_strategy.set_topic_model.assert_called_once_with(
+                topic_models.get.return_value
+            )
+
     def test_chunk_document_empty_content(
         self, mock_global_config, mock_settings, empty_document
     ):
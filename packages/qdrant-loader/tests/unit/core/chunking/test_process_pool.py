@@ -0,0 +1,119 @@
+"""Tests for process-pool chunking."""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+import pytest
+import spacy
+from qdrant_loader.core.chunking import process_pool
+from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import (
+    create_chunking_process_pool,
+    pack_document,
+    unpack_document,
+)
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.pipeline.workers.chunking_worker import ChunkingWorker
+from qdrant_loader.utils.logging import LoggingConfig
+from tests.fixtures.modular_chunking import create_mixed_corpus
+
+
+def _document(content: str = "Some content") -> Document:
+    return Document(
+        title="Doc",
+        content=content,
+        content_type="md",
+        source_type="test",
+        source="test_source",
+        url="https://example.com/doc.md",
+        metadata={"nested": {"key": [1, 2]}},
+    )
+
+
+class _UppercaseService:
+    """Chunking service stand-in inherited by forked worker processes."""
+
+    def chunk_document(self, document: Document) -> list[Document]:
+        return [
+            document.model_copy(
+                update={"id": f"{document.id}-{i}", "content": part.upper()}
+            )
+            for i, part in enumerate(document.content.split())
+        ]
+
+
+def test_pack_round_trip_preserves_document():
+    """Packed documents are rebuilt with identical fields."""
+    document = _document()
+    restored = unpack_document(pack_document(document))
+
+    assert restored == document
+    assert restored.content_hash == document.content_hash
+
+
+def test_chunk_packed_document_requires_initialized_worker():
+    """Calling the worker entry point outside a worker fails clearly."""
+    with pytest.raises(RuntimeError):
+        process_pool.chunk_packed_document(pack_document(_document()))
+
+
+@pytest.mark.asyncio
+async def test_chunking_worker_uses_process_pool(monkeypatch):
+    """Documents are chunked in worker processes and returned as documents."""
+    monkeypatch.setattr(process_pool, "_worker_service", _UppercaseService())
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("fork")
+    )
+    worker = ChunkingWorker(chunking_service=None, chunk_executor=executor)
+    try:
+        document = _document("alpha beta")
+        chunks = await worker.process(document)
+    finally:
+        executor.shutdown()
+
+    assert [chunk.content for chunk in chunks] == ["ALPHA", "BETA"]
+    assert [chunk.id for chunk in chunks] == [f"{document.id}-0", f"{document.id}-1"]
+    assert all(chunk.metadata["parent_document"] is document for chunk in chunks)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not spacy.util.is_package("en_core_web_md"),
+    reason="Benchmark requires the en_core_web_md spaCy model",
+)
+def test_process_pool_chunking_benchmark(test_settings):
+    """Compare thread and process pool chunking over a mixed corpus."""
+    documents = create_mixed_corpus(100)
+    workers = os.cpu_count() or 1
+
+    async def chunk_all(executor: concurrent.futures.Executor) -> list[list[str]]:
+        service = ChunkingService(test_settings.global_config, test_settings)
+        worker = ChunkingWorker(service, executor, max_workers=workers)
+        results = await asyncio.gather(*(worker.process(doc) for doc in documents))
+        return [[chunk.content for chunk in chunks] for chunks in results]
+
+    timings = {}
+    results = {}
+    for name, executor in (
+        ("thread", concurrent.futures.ThreadPoolExecutor(max_workers=workers)),
+        ("process", create_chunking_process_pool(test_settings, workers)),
+    ):
+        with executor:
+            # Warm up so that worker start-up and model loading are not timed
+            asyncio.run(chunk_all(executor))
+            start = time.perf_counter()
+            results[name] = asyncio.run(chunk_all(executor))
+            timings[name] = time.perf_counter() - start
+
+    LoggingConfig.get_logger(__name__).info(
+        "Process pool chunking benchmark",
+        documents=len(documents),
+        workers=workers,
+        thread_seconds=round(timings["thread"], 2),
+        process_seconds=round(timings["process"], 2),
+        speedup=round(timings["thread"] / timings["process"], 1),
+    )
+    assert results["process"] == results["thread"]
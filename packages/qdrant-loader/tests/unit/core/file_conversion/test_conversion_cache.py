@@ -0,0 +1,57 @@
+"""Tests for the on-disk conversion cache."""
+
+import os
+
+from qdrant_loader.core.file_conversion.conversion_cache import ConversionCache
+
+
+def test_entries_persist_across_instances(tmp_path):
+    ConversionCache(tmp_path, 1024, "v1").put_by_content("abc", "# Document")
+
+    cache = ConversionCache(tmp_path, 1024, "v1")
+    assert cache.get_by_content("abc") == "# Document"
+    assert cache.get_by_content("def") is None
+
+
+def test_content_and_source_keys_are_separate(tmp_path):
+    cache = ConversionCache(tmp_path, 1024, "v1")
+    cache.put_by_source("https://example.com/a.pdf|1|100|2024-01-01", "# A")
+
+    assert cache.get_by_source("https://example.com/a.pdf|1|100|2024-01-01") == "# A"
+    assert cache.get_by_source("https://example.com/a.pdf|1|100|2024-02-01") is None
+    assert cache.get_by_content("https://example.com/a.pdf|1|100|2024-01-01") is None
+
+
+def test_other_namespaces_are_not_returned(tmp_path):
+    ConversionCache(tmp_path, 1024, "markitdown-0.1.3").put_by_content("abc", "# Old")
+
+    assert (
+        ConversionCache(tmp_path, 1024, "markitdown-0.2.0").get_by_content("abc")
+        is None
+    )
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ConversionCache(tmp_path, 350, "v1")
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put_by_content(key, "x" * 100)
+        # Distinct modification times regardless of file system resolution
+        path = next(tmp_path.glob(f"*/{cache._key('content', key)}.md"))
+        os.utime(path, (1000 + index, 1000 + index))
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get_by_content("a") is not None
+    cache.put_by_content("d", "x" * 100)
+
+    assert cache.get_by_content("b") is None
+    assert cache.get_by_content("a") is not None
+    assert cache.get_by_content("d") is not None
+    assert cache._total_size <= 350
+
+
+def test_entries_larger_than_the_cache_are_not_stored(tmp_path):
+    cache = ConversionCache(tmp_path, 10, "v1")
+    cache.put_by_content("abc", "x" * 11)
+
+    assert cache.get_by_content("abc") is None
+    assert not list(tmp_path.glob("*/*"))
@@ -0,0 +1,161 @@
+"""Tests for the conversion worker pool."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from qdrant_loader.core.file_conversion.conversion_config import FileConversionConfig
+from qdrant_loader.core.file_conversion.conversion_pool import (
+    ConversionWorkerPool,
+    resource,
+)
+from qdrant_loader.core.file_conversion.exceptions import (
+    ConversionTimeoutError,
+    ConversionWorkerError,
+    FileConversionError,
+)
+from qdrant_loader.core.file_conversion.file_converter import FileConverter
+from qdrant_loader.utils.logging import LoggingConfig
+from tests.fixtures.office_documents import create_office_documents
+
+
+def _convert(file_path: str) -> str:
+    """Test conversion behaving according to the file name."""
+    name = os.path.basename(file_path)
+    if name.startswith("slow"):
+        time.sleep(float(name.split("_")[1]))
+    elif name == "hang":
+        time.sleep(3600)
+    elif name == "crash":
+        os._exit(3)
+    elif name == "invalid":
+        raise ValueError("invalid document")
+    elif name == "large":
+        return str(len(bytearray(1024 * 1024 * 1024)))
+    return f"{name} converted by {os.getpid()}"
+
+
+def _create_converter():
+    return _convert
+
+
+@pytest.fixture
+def pool():
+    pool = ConversionWorkerPool(_create_converter, max_workers=2, timeout=30)
+    yield pool
+    pool.close()
+
+
+def test_workers_are_reused(pool):
+    first = pool.convert("a.pdf")
+    second = pool.convert("b.pdf")
+
+    assert first.startswith("a.pdf converted by")
+    assert first.split()[-1] == second.split()[-1]
+
+
+def test_conversion_error_keeps_worker(pool):
+    pid = pool.convert("a.pdf").split()[-1]
+
+    with pytest.raises(FileConversionError, match="ValueError: invalid document"):
+        pool.convert("invalid")
+
+    assert pool.convert("b.pdf").split()[-1] == pid
+
+
+def test_timeout_kills_worker(pool):
+    pool.timeout = 1
+    pid = pool.convert("a.pdf").split()[-1]
+
+    start = time.perf_counter()
+    with pytest.raises(ConversionTimeoutError) as exc_info:
+        pool.convert("hang")
+
+    assert time.perf_counter() - start < 10
+    assert exc_info.value.file_path == "hang"
+    # The killed worker is replaced by a new one
+    assert pool.convert("b.pdf").split()[-1] != pid
+
+
+def test_worker_crash(pool):
+    with pytest.raises(ConversionWorkerError) as exc_info:
+        pool.convert("crash")
+
+    assert exc_info.value.exit_code == 3
+    assert pool.convert("a.pdf").startswith("a.pdf converted")
+
+
+@pytest.mark.skipif(resource is None, reason="memory limits require resource")
+def test_memory_limit():
+    pool = ConversionWorkerPool(
+        _create_converter, max_workers=1, timeout=30, memory_limit=512 * 1024 * 1024
+    )
+    try:
+        with pytest.raises(FileConversionError, match="MemoryError"):
+            pool.convert("large")
+        assert pool.convert("a.pdf").startswith("a.pdf converted")
+    finally:
+        pool.close()
+
+
+def test_conversions_run_in_parallel(pool):
+    # Start both workers first so the timing excludes process start-up
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(pool.convert, ["a.pdf", "b.pdf"]))
+
+        start = time.perf_counter()
+        results = list(executor.map(pool.convert, ["slow_1", "slow_1"]))
+        elapsed = time.perf_counter() - start
+
+    assert len({result.split()[-1] for result in results}) == 2
+    assert elapsed < 1.8
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("max_workers", [0, 2, 4])
+def test_mixed_office_folder_conversion_benchmark(tmp_path, max_workers):
+    paths = [str(path) for path in create_office_documents(tmp_path, count=40)]
+    converter = FileConverter(
+        FileConversionConfig(max_workers=max_workers, conversion_timeout=120)
+    )
+
+    def convert(file_path: str) -> str | None:
+        try:
+            return converter.convert_file(file_path)
+        except FileConversionError:
+            return None
+
+    # Without workers, convert in the main thread so conversions run in process
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers else None
+    run = executor.map if executor else map
+    try:
+        start = time.perf_counter()
+        first = list(run(convert, paths))
+        first_run = time.perf_counter() - start
+
+        # Converted files are not converted again
+        start = time.perf_counter()
+        second = list(run(convert, paths))
+        second_run = time.perf_counter() - start
+    finally:
+        if executor:
+            executor.shutdown()
+        converter.close()
+
+    converted = sum(markdown is not None for markdown in first)
+    # Conversions of the other formats depend on the installed markitdown extras
+    for path, markdown in zip(paths, first, strict=True):
+        if path.endswith(".csv"):
+            index = os.path.basename(path).split("_")[1].split(".")[0]
+            assert f"item-{index}-499" in markdown
+    assert second == first
+
+    LoggingConfig.get_logger(__name__).info(
+        "Office folder conversion benchmark",
+        files=len(paths),
+        max_workers=max_workers,
+        converted=converted,
+        first_run_seconds=round(first_run, 2),
+        second_run_seconds=round(second_run, 2),
+    )
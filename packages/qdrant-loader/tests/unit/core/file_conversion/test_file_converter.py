@@ -4,6 +4,8 @@ Unit tests for the file converter.
 
 import signal
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +16,7 @@ from qdrant_loader.core.file_conversion.conversion_config import (
 )
 from qdrant_loader.core.file_conversion.exceptions import (
     ConversionTimeoutError,
+    ConversionWorkerError,
     FileAccessError,
     FileSizeExceededError,
     MarkItDownError,
@@ -95,6 +98,26 @@ class TestTimeoutHandler:
         assert exc_info.value.timeout == 1
         assert exc_info.value.file_path == "/path/to/file.pdf"
 
+    def test_timeout_handler_outside_main_thread(self):
+        """Test that no signal handler is installed outside the main thread."""
+        errors = []
+
+        def convert():
+            try:
+                with TimeoutHandler(30, "/path/to/file.pdf"):
+                    pass
+            except Exception as e:
+                errors.append(e)
+
+        with patch("signal.signal") as mock_signal, patch("signal.alarm") as mock_alarm:
+            thread = threading.Thread(target=convert)
+            thread.start()
+            thread.join()
+
+        assert errors == []
+        mock_signal.assert_not_called()
+        mock_alarm.assert_not_called()
+
 
 class TestFileConverterBasics:
     """Test basic file converter functionality."""
@@ -407,6 +430,197 @@ class TestFileConversion:
             temp_path.unlink(missing_ok=True)
 
 
+class TestConversionCache:
+    """Test reuse of conversions of identical file content."""
+
+    def test_identical_content_is_converted_once(self, file_converter, tmp_path):
+        """Test that files with the same content are converted once."""
+        first = tmp_path / "first.pdf"
+        second = tmp_path / "second.pdf"
+        other = tmp_path / "other.pdf"
+        first.write_bytes(b"PDF content")
+        second.write_bytes(b"PDF content")
+        other.write_bytes(b"Other PDF content")
+
+        with (
+            patch.object(file_converter, "_validate_file"),
+            patch.object(
+                file_converter, "_convert_in_process", side_effect=["# A", "# B"]
+            ) as mock_convert,
+        ):
+            assert file_converter.convert_file(str(first)) == "# A"
+            assert file_converter.convert_file(str(second)) == "# A"
+            assert file_converter.convert_file(str(other)) == "# B"
+
+        assert mock_convert.call_count == 2
+
+    def test_failed_conversions_are_not_cached(self, file_converter, tmp_path):
+        """Test that a failed conversion is retried."""
+        file_path = tmp_path / "document.pdf"
+        file_path.write_bytes(b"PDF content")
+
+        with (
+            patch.object(file_converter, "_validate_file"),
+            patch.object(
+                file_converter,
+                "_convert_in_process",
+                side_effect=[Exception("Conversion failed"), "# Document"],
+            ),
+        ):
+            with pytest.raises(MarkItDownError):
+                file_converter.convert_file(str(file_path))
+            assert file_converter.convert_file(str(file_path)) == "# Document"
+
+    def test_least_recently_used_conversion_is_evicted(self, file_converter):
+        """Test that the cache is bounded."""
+        with patch(
+            "qdrant_loader.core.file_conversion.file_converter.MAX_CACHED_CONVERSIONS",
+            2,
+        ):
+            file_converter._cache_conversion("a", "# A")
+            file_converter._cache_conversion("b", "# B")
+            assert file_converter._get_cached_conversion("a") == "# A"
+            file_converter._cache_conversion("c", "# C")
+
+        assert file_converter._get_cached_conversion("b") is None
+        assert file_converter._get_cached_conversion("a") == "# A"
+        assert file_converter._get_cached_conversion("c") == "# C"
+
+
+class TestPersistentConversionCache:
+    """Test conversions persisted across converters."""
+
+    def test_conversions_persist_across_runs(self, tmp_path):
+        """Test that a later converter reuses persisted conversions."""
+        config = FileConversionConfig(cache_dir=str(tmp_path / "cache"))
+        file_path = tmp_path / "document.pdf"
+        file_path.write_bytes(b"PDF content")
+
+        first = FileConverter(config)
+        with (
+            patch.object(first, "_validate_file"),
+            patch.object(first, "_convert_in_process", return_value="# Document"),
+        ):
+            first.convert_file(str(file_path))
+
+        second = FileConverter(config)
+        with (
+            patch.object(second, "_validate_file"),
+            patch.object(second, "_convert_in_process") as mock_convert,
+        ):
+            assert second.convert_file(str(file_path)) == "# Document"
+
+        mock_convert.assert_not_called()
+
+    def test_conversion_options_are_part_of_the_key(self, tmp_path):
+        """Test that conversions with other options are not reused."""
+        cache_dir = str(tmp_path / "cache")
+        plain = FileConverter(FileConversionConfig(cache_dir=cache_dir))
+        with_llm = FileConverter(
+            FileConversionConfig(
+                cache_dir=cache_dir,
+                markitdown=MarkItDownConfig(enable_llm_descriptions=True),
+            )
+        )
+
+        plain.cache_conversion("https://example.com/a.pdf|1|100|v1", "# Plain")
+
+        assert plain.get_cached_conversion("https://example.com/a.pdf|1|100|v1")
+        assert (
+            with_llm.get_cached_conversion("https://example.com/a.pdf|1|100|v1") is None
+        )
+
+    def test_no_cache_directory(self, file_converter):
+        """Test that source keys are not cached without a cache directory."""
+        file_converter.cache_conversion("key", "# Document")
+
+        assert file_converter.get_cached_conversion("key") is None
+
+
+class TestWorkerConversion:
+    """Test conversion in worker processes."""
+
+    def test_workers_are_used_when_configured(self, tmp_path):
+        """Test that conversions run in the worker pool with max_workers set."""
+        config = FileConversionConfig(max_workers=2, conversion_timeout=30)
+        converter = FileConverter(config)
+        file_path = tmp_path / "document.pdf"
+        file_path.write_bytes(b"PDF content")
+
+        with (
+            patch.object(converter, "_validate_file"),
+            patch(
+                "qdrant_loader.core.file_conversion.file_converter.ConversionWorkerPool"
+            ) as mock_pool_class,
+        ):
+            mock_pool_class.return_value.convert.return_value = "# Document"
+
+            assert converter.convert_file(str(file_path)) == "# Document"
+            converter.close()
+
+        _, kwargs = mock_pool_class.call_args
+        assert kwargs["max_workers"] == 2
+        assert kwargs["timeout"] == 30
+        assert kwargs["memory_limit"] == config.worker_memory_limit
+        mock_pool_class.return_value.convert.assert_called_once_with(str(file_path))
+        mock_pool_class.return_value.close.assert_called_once()
+
+    def test_workers_are_used_outside_main_thread(self, tmp_path):
+        """Test that conversions outside the main thread always run in a worker."""
+        converter = FileConverter(FileConversionConfig(max_workers=0))
+        file_path = tmp_path / "document.pdf"
+        file_path.write_bytes(b"PDF content")
+
+        with (
+            patch.object(converter, "_validate_file"),
+            patch(
+                "qdrant_loader.core.file_conversion.file_converter.ConversionWorkerPool"
+            ) as mock_pool_class,
+        ):
+            mock_pool_class.return_value.convert.return_value = "# Document"
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(converter.convert_file, str(file_path))
+                assert result.result() == "# Document"
+            converter.close()
+
+        _, kwargs = mock_pool_class.call_args
+        assert kwargs["max_workers"] == 1
+
+    def test_worker_errors_are_not_wrapped(self, tmp_path):
+        """Test that timeouts and worker failures are raised as-is."""
+        converter = FileConverter(FileConversionConfig(max_workers=1))
+        file_path = tmp_path / "document.pdf"
+        file_path.write_bytes(b"PDF content")
+        pool = MagicMock()
+        converter._worker_pool = pool
+
+        with patch.object(converter, "_validate_file"):
+            pool.convert.side_effect = ConversionTimeoutError(300, str(file_path))
+            with pytest.raises(ConversionTimeoutError):
+                converter.convert_file(str(file_path))
+
+            pool.convert.side_effect = ConversionWorkerError(-9, str(file_path))
+            with pytest.raises(ConversionWorkerError) as exc_info:
+                converter.convert_file(str(file_path))
+
+        assert exc_info.value.exit_code == -9
+
+    def test_worker_converts_csv_file(self, tmp_path):
+        """Test a real conversion in a worker process."""
+        converter = FileConverter(FileConversionConfig(max_workers=1))
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,value\nalpha,1\n")
+
+        try:
+            result = converter.convert_file(str(file_path))
+        finally:
+            converter.close()
+
+        assert "| name | value |" in result
+        assert "| alpha | 1 |" in result
+
+
 class TestFallbackDocument:
     """Test fallback document creation."""
 
@@ -31,6 +31,7 @@ class TestAsyncIngestionPipeline:
         settings.global_config.state_management = Mock()
         settings.global_config.qdrant = Mock()
         settings.global_config.qdrant.collection_name = "test_collection"
+        settings.global_config.knowledge_graph.path = None
         settings.projects_config = Mock()
         return settings
 
@@ -350,6 +351,56 @@ class TestAsyncIngestionPipeline:
 
             assert result == sample_documents
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("build_error", [None, RuntimeError("scroll failed")])
+    async def test_process_documents_builds_knowledge_graph(
+        self, mock_settings, mock_qdrant_manager, sample_documents, build_error
+    ):
+        """Test that the knowledge graph is rebuilt after documents changed."""
+        mock_settings.global_config.knowledge_graph.path = "/graphs/kg.npz"
+        mock_settings.global_config.knowledge_graph.min_document_frequency = 2
+        mock_settings.global_config.knowledge_graph.similar_documents = 10
+        with (
+            patch(
+                "qdrant_loader.core.async_ingestion_pipeline.PipelineComponentsFactory"
+            ),
+            patch(
+                "qdrant_loader.core.async_ingestion_pipeline.PipelineOrchestrator"
+            ) as mock_orchestrator_class,
+            patch("qdrant_loader.core.async_ingestion_pipeline.ResourceManager"),
+            patch("qdrant_loader.core.async_ingestion_pipeline.IngestionMonitor"),
+            patch("qdrant_loader.core.async_ingestion_pipeline.prometheus_metrics"),
+            patch("qdrant_loader.core.async_ingestion_pipeline.Path") as mock_path,
+            patch(
+                "qdrant_loader.core.async_ingestion_pipeline.build_knowledge_graph",
+                new_callable=AsyncMock,
+                side_effect=build_error,
+            ) as mock_build,
+        ):
+            self._setup_path_mocks(mock_path)
+            mock_orchestrator = Mock()
+            mock_orchestrator.process_documents = AsyncMock(
+                return_value=sample_documents
+            )
+            mock_orchestrator_class.return_value = mock_orchestrator
+
+            pipeline = AsyncIngestionPipeline(
+                settings=mock_settings, qdrant_manager=mock_qdrant_manager
+            )
+            pipeline.state_manager._initialized = True
+            pipeline.project_manager._initialized = True
+
+            result = await pipeline.process_documents(source_type="git")
+
+            mock_build.assert_awaited_once_with(
+                mock_qdrant_manager,
+                "/graphs/kg.npz",
+                min_document_frequency=2,
+                similar_documents=10,
+            )
+            # A failed graph build does not fail the ingestion
+            assert result == sample_documents
+
     @pytest.mark.asyncio
     async def test_process_documents_error_handling(
         self, mock_settings, mock_qdrant_manager
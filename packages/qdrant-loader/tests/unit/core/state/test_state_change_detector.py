@@ -251,6 +251,36 @@ class TestStateChangeDetector:
         assert deleted_doc.content == ""
         assert deleted_doc.url == "http://example.com/deleted_doc"
 
+    @pytest.mark.asyncio
+    async def test_detect_changes_skipped_documents_not_deleted(
+        self, mock_state_manager, sample_documents, filtered_config
+    ):
+        """Test that documents skipped as unchanged are not reported as deleted."""
+        detector = StateChangeDetector(mock_state_manager)
+
+        previous_record = DocumentStateRecord(
+            url="http://example.com/unchanged_doc",
+            source="repo1",
+            source_type="git",
+            document_id="unchanged_doc",
+            content_hash="unchanged_hash",
+            updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+        )
+
+        mock_state_manager.get_document_state_records.return_value = [previous_record]
+
+        async with detector:
+            result = await detector.detect_changes(
+                sample_documents,
+                filtered_config,
+                unchanged_documents={
+                    ("git", "repo1", "http://example.com/unchanged_doc")
+                },
+            )
+
+        assert len(result["new"]) == 2
+        assert len(result["deleted"]) == 0
+
     @pytest.mark.asyncio
     async def test_detect_changes_no_changes(
         self, mock_state_manager, sample_documents, filtered_config
@@ -561,3 +561,69 @@ class TestTimezoneHandling:
 
         # Should set to None for invalid format
         assert state_record.attachment_created_at is None
+
+
+@pytest.mark.asyncio
+async def test_http_cache_records_round_trip(state_manager):
+    """Test storing and updating HTTP validators of crawled pages."""
+    source_config = SourceConfig(
+        source_type="publicdocs",
+        source="docs",
+        base_url=HttpUrl("https://docs.example.com/"),
+    )
+
+    await state_manager.update_http_cache_records(
+        source_config,
+        [
+            {
+                "url": "https://docs.example.com/a",
+                "etag": '"v1"',
+                "last_modified": None,
+                "content_hash": "hash-a",
+            }
+        ],
+    )
+    await state_manager.update_http_cache_records(
+        source_config,
+        [
+            {
+                "url": "https://docs.example.com/a",
+                "etag": '"v2"',
+                "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                "content_hash": "hash-a2",
+            }
+        ],
+    )
+
+    records = await state_manager.get_http_cache_records(source_config)
+    assert len(records) == 1
+    assert records[0].etag == '"v2"'
+    assert records[0].last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert records[0].content_hash == "hash-a2"
+
+
+@pytest.mark.asyncio
+async def test_http_cache_records_many_urls(state_manager):
+    """Test updating more HTTP cache records than fit in one URL lookup."""
+    source_config = SourceConfig(
+        source_type="publicdocs",
+        source="docs",
+        base_url=HttpUrl("https://docs.example.com/"),
+    )
+    entries = [
+        {
+            "url": f"https://docs.example.com/page{i}",
+            "etag": f'"v{i}"',
+            "last_modified": None,
+            "content_hash": f"hash-{i}",
+            "links": "[]",
+        }
+        for i in range(1200)
+    ]
+
+    await state_manager.update_http_cache_records(source_config, entries)
+    await state_manager.update_http_cache_records(source_config, entries)
+
+    records = await state_manager.get_http_cache_records(source_config)
+    assert len(records) == 1200
+    assert all(record.links == "[]" for record in records)
@@ -2,7 +2,11 @@
 Unit tests for the attachment downloader service.
 """
 
+import hashlib
+import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -584,6 +588,280 @@ class TestDownloadAndProcessAttachments:
         assert len(documents) == 0
 
 
+class TestCachedAttachments:
+    """Test skipping unchanged attachments converted in earlier runs."""
+
+    @staticmethod
+    def _create_downloader(mock_session, cache_dir):
+        return AttachmentDownloader(
+            session=mock_session,
+            file_conversion_config=FileConversionConfig(cache_dir=str(cache_dir)),
+            enable_file_conversion=True,
+        )
+
+    @staticmethod
+    def _parent_document():
+        return Document(
+            title="Parent Document",
+            content="Parent content",
+            content_type="html",
+            source_type="confluence",
+            source="test_space",
+            url="https://example.com/parent",
+            metadata={},
+        )
+
+    @staticmethod
+    def _attachment(**kwargs):
+        values = {
+            "id": "att_001",
+            "filename": "document.pdf",
+            "size": 1024,
+            "mime_type": "application/pdf",
+            "download_url": "https://example.com/document.pdf?version=1",
+            "parent_document_id": "doc_456",
+            "updated_at": "2024-01-15T10:30:00Z",
+        }
+        values.update(kwargs)
+        return AttachmentMetadata(**values)
+
+    async def _run(self, downloader, attachment, tmp_path, content=b"PDF content"):
+        temp_file = tmp_path / "download.pdf"
+        temp_file.write_bytes(content)
+        with (
+            patch.object(
+                downloader, "download_attachment", return_value=str(temp_file)
+            ) as mock_download,
+            patch.object(downloader.file_converter, "_get_worker_pool") as mock_pool,
+        ):
+            # Attachments are converted off the main thread, in the worker pool
+            mock_convert = mock_pool.return_value.convert
+            mock_convert.return_value = "# Converted"
+            documents = await downloader.download_and_process_attachments(
+                [attachment], self._parent_document()
+            )
+        return documents, mock_download, mock_convert
+
+    @pytest.mark.asyncio
+    async def test_unchanged_attachment_skips_download(self, mock_session, tmp_path):
+        """Test that a converted attachment is not downloaded again."""
+        cache_dir = tmp_path / "cache"
+        attachment = self._attachment()
+
+        first_documents, _, _ = await self._run(
+            self._create_downloader(mock_session, cache_dir), attachment, tmp_path
+        )
+        documents, mock_download, mock_convert = await self._run(
+            self._create_downloader(mock_session, cache_dir), attachment, tmp_path
+        )
+
+        mock_download.assert_not_called()
+        mock_convert.assert_not_called()
+        assert len(documents) == 1
+        assert documents[0].content == "# Converted"
+        assert documents[0].metadata == first_documents[0].metadata
+        assert documents[0].url == first_documents[0].url
+
+    @pytest.mark.asyncio
+    async def test_changed_attachment_is_downloaded(self, mock_session, tmp_path):
+        """Test that a new version of an attachment is downloaded."""
+        cache_dir = tmp_path / "cache"
+
+        await self._run(
+            self._create_downloader(mock_session, cache_dir),
+            self._attachment(),
+            tmp_path,
+        )
+        _, mock_download, mock_convert = await self._run(
+            self._create_downloader(mock_session, cache_dir),
+            self._attachment(size=2048, updated_at="2024-02-01T09:00:00Z"),
+            tmp_path,
+            content=b"New PDF content",
+        )
+
+        mock_download.assert_called_once()
+        mock_convert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_attachment_without_version_is_downloaded(
+        self, mock_session, tmp_path
+    ):
+        """Test that attachments of unknown size are always downloaded."""
+        cache_dir = tmp_path / "cache"
+        attachment = self._attachment(size=0, updated_at=None)
+
+        await self._run(
+            self._create_downloader(mock_session, cache_dir), attachment, tmp_path
+        )
+        _, mock_download, _ = await self._run(
+            self._create_downloader(mock_session, cache_dir), attachment, tmp_path
+        )
+
+        mock_download.assert_called_once()
+
+
+class TestStreamingDownload:
+    """Test streaming attachments into the spool directory."""
+
+    @staticmethod
+    def _response(content: bytes, content_length: int | None = None):
+        response = MagicMock()
+        response.headers = {"content-type": "application/pdf"}
+        if content_length is not None:
+            response.headers["content-length"] = str(content_length)
+        response.iter_content.side_effect = lambda chunk_size: [
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        ]
+        return response
+
+    @staticmethod
+    def _attachment(index: int = 1, size: int = 0) -> AttachmentMetadata:
+        return AttachmentMetadata(
+            id=f"att_{index}",
+            filename=f"document_{index}.pdf",
+            size=size,
+            mime_type="application/pdf",
+            download_url=f"https://example.com/document_{index}.pdf",
+            parent_document_id="doc_456",
+        )
+
+    @staticmethod
+    def _parent_document() -> Document:
+        return Document(
+            title="Parent Document",
+            content="Parent content",
+            content_type="html",
+            source_type="confluence",
+            source="test_space",
+            url="https://example.com/parent",
+            metadata={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_content_length_above_limit_aborts_download(self, mock_session):
+        """Test that oversized attachments are not read."""
+        downloader = AttachmentDownloader(session=mock_session, max_attachment_size=100)
+        response = self._response(b"x" * 200, content_length=200)
+        mock_session.get.return_value = response
+
+        # The size in the metadata is unknown, only the response tells
+        assert await downloader.download_attachment(self._attachment()) is None
+        response.iter_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_above_limit_is_removed(self, mock_session):
+        """Test that a download without Content-Length stops at the limit."""
+        downloader = AttachmentDownloader(session=mock_session, max_attachment_size=100)
+        mock_session.get.return_value = self._response(b"x" * 200)
+
+        try:
+            assert await downloader.download_attachment(self._attachment()) is None
+            assert not os.listdir(downloader._get_spool_dir())
+        finally:
+            downloader.close()
+
+    @pytest.mark.asyncio
+    async def test_downloaded_content_is_hashed_once(
+        self, attachment_downloader, mock_session
+    ):
+        """Test that the hash computed while downloading is used for conversion."""
+        content = b"%PDF-1.4 " * 300000  # Several chunks
+        mock_session.get.return_value = self._response(content, len(content))
+
+        with (
+            patch.object(
+                attachment_downloader.file_converter, "_get_worker_pool"
+            ) as mock_pool,
+            patch.object(
+                attachment_downloader.file_converter, "_hash_file"
+            ) as mock_hash,
+        ):
+            mock_pool.return_value.convert.return_value = "# Converted"
+            documents = await attachment_downloader.download_and_process_attachments(
+                [self._attachment()], self._parent_document()
+            )
+
+        mock_hash.assert_not_called()
+        assert documents[0].content == "# Converted"
+        assert attachment_downloader.file_converter._get_cached_conversion(
+            hashlib.sha256(content).hexdigest()
+        )
+
+    @pytest.mark.asyncio
+    async def test_spool_dir_is_cleaned(self, attachment_downloader, mock_session):
+        """Test that downloads are deleted after processing and on close."""
+        mock_session.get.return_value = self._response(b"PDF content")
+
+        with patch.object(
+            attachment_downloader.file_converter, "_get_worker_pool"
+        ) as mock_pool:
+            mock_pool.return_value.convert.return_value = "# Converted"
+            await attachment_downloader.download_and_process_attachments(
+                [self._attachment()], self._parent_document()
+            )
+
+        spool_dir = attachment_downloader._get_spool_dir()
+        assert os.listdir(spool_dir) == []
+        assert attachment_downloader._downloads == {}
+
+        attachment_downloader.close()
+        assert not os.path.exists(spool_dir)
+
+    @pytest.mark.asyncio
+    async def test_downloads_run_concurrently(self, mock_session):
+        """Test that downloads overlap, up to the concurrency limit."""
+        downloader = AttachmentDownloader(
+            session=mock_session, max_concurrent_downloads=2
+        )
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def get(url, **kwargs):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.2)
+            with lock:
+                active -= 1
+            return self._response(url.encode())
+
+        mock_session.get.side_effect = get
+        attachments = [self._attachment(index) for index in range(4)]
+
+        try:
+            documents = await downloader.download_and_process_attachments(
+                attachments, self._parent_document()
+            )
+        finally:
+            downloader.close()
+
+        assert max_active == 2
+        # Documents keep the order of the attachments
+        assert [document.metadata["attachment_id"] for document in documents] == [
+            attachment.id for attachment in attachments
+        ]
+
+    @pytest.mark.asyncio
+    async def test_throughput_is_tracked_per_source(self, mock_session):
+        """Test that downloaded bytes are counted per source."""
+        downloader = AttachmentDownloader(session=mock_session)
+        mock_session.get.side_effect = lambda url, **kwargs: self._response(b"x" * 1000)
+
+        await downloader.download_and_process_attachments(
+            [self._attachment(1), self._attachment(2)], self._parent_document()
+        )
+
+        stats = downloader.download_stats["test_space"]
+        assert stats.files == 2
+        assert stats.bytes == 2000
+        assert stats.throughput > 0
+
+        downloader.close()
+        assert downloader.download_stats == {}
+
+
 class TestCleanup:
     """Test cleanup functionality."""
 
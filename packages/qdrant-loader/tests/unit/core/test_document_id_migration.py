@@ -0,0 +1,179 @@
+"""Tests for the PublicDocs document ID migration."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from qdrant_client.http import models
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.document_id_migration import (
+    PublicDocsIdMigration,
+    migrate_point_id,
+)
+from qdrant_loader.core.state.models import DocumentStateRecord
+from qdrant_loader.core.state.state_manager import StateManager
+from sqlalchemy import select
+
+PAGE_URL = "https://docs.example.com/page"
+OLD_ID = "-4242424242424242424"
+STALE_ID = "1313131313131313131"
+NEW_ID = Document.generate_id("publicdocs", "docs", PAGE_URL)
+
+
+@pytest_asyncio.fixture
+async def state_manager():
+    """State manager with an in-memory database."""
+    config = MagicMock(spec=StateManagementConfig)
+    config.database_path = "sqlite:///:memory:"
+    config.connection_pool = {"size": 5, "timeout": 30}
+    manager = StateManager(config)
+    await manager.initialize()
+    yield manager
+    await manager.dispose()
+
+
+def _record(document_id: str, updated_at: datetime, **kwargs) -> DocumentStateRecord:
+    return DocumentStateRecord(
+        document_id=document_id,
+        source_type="publicdocs",
+        source="docs",
+        url=kwargs.pop("url", PAGE_URL),
+        title="Page",
+        content_hash="hash",
+        created_at=updated_at,
+        updated_at=updated_at,
+        **kwargs,
+    )
+
+
+def _point(point_id: str, document_id: str, chunk_index: int, **metadata):
+    return models.Record(
+        id=point_id,
+        vector=[0.1, 0.2],
+        payload={
+            "content": "chunk",
+            "source_type": "publicdocs",
+            "document_id": document_id,
+            "metadata": {
+                "chunk_index": chunk_index,
+                "parent_document_id": document_id,
+                **metadata,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def points():
+    """Points of the current page, an older page version and an attachment."""
+    return [
+        _point(Document.generate_chunk_id(OLD_ID, 0), OLD_ID, 0),
+        _point(Document.generate_chunk_id(OLD_ID, 1), OLD_ID, 1),
+        _point(Document.generate_chunk_id(STALE_ID, 0), STALE_ID, 0),
+        _point(Document.generate_chunk_id(NEW_ID, 0), NEW_ID, 0, is_attachment=True),
+    ]
+
+
+@pytest.fixture
+def qdrant_manager(points):
+    """Qdrant manager serving the points above in a single page."""
+    manager = MagicMock()
+    manager.scroll_points = AsyncMock(return_value=(points, None))
+    manager.upsert_points = AsyncMock()
+    manager.delete_points = AsyncMock()
+    return manager
+
+
+@pytest_asyncio.fixture
+async def populated_state(state_manager):
+    """State with two versions of a page and an attachment of it."""
+    now = datetime.now(UTC)
+    async with await state_manager.get_session() as session:
+        session.add_all(
+            [
+                _record(OLD_ID, now),
+                _record(STALE_ID, now - timedelta(days=1)),
+                _record(
+                    NEW_ID,
+                    now,
+                    url=f"{PAGE_URL}#attachment-{OLD_ID}_0",
+                    is_attachment=True,
+                    parent_document_id=OLD_ID,
+                ),
+            ]
+        )
+        await session.commit()
+    return state_manager
+
+
+def test_migrate_point_id_keeps_chunk_id_scheme():
+    """The chunk ID scheme of the original point is preserved."""
+    assert migrate_point_id(
+        Document.generate_chunk_id(OLD_ID, 3), OLD_ID, NEW_ID, 3
+    ) == Document.generate_chunk_id(NEW_ID, 3)
+    assert migrate_point_id("unrelated-id", OLD_ID, NEW_ID, 3) == "unrelated-id"
+
+
+@pytest.mark.asyncio
+async def test_migration_rewrites_state_and_points(populated_state, qdrant_manager):
+    """Pages move to stable IDs with their vectors; leftovers are removed."""
+    result = await PublicDocsIdMigration(populated_state, qdrant_manager).run()
+
+    assert result.documents_migrated == 1
+    assert result.state_records_removed == 2
+    assert result.points_migrated == 2
+    assert result.points_removed == 2
+
+    async with await populated_state.get_session() as session:
+        records = (await session.execute(select(DocumentStateRecord))).scalars().all()
+    assert [(record.document_id, record.url) for record in records] == [
+        (NEW_ID, PAGE_URL)
+    ]
+
+    deleted = [
+        point_id
+        for call in qdrant_manager.delete_points.call_args_list
+        for point_id in call.args[0]
+    ]
+    assert sorted(deleted) == sorted(
+        [
+            Document.generate_chunk_id(STALE_ID, 0),
+            Document.generate_chunk_id(NEW_ID, 0),
+            Document.generate_chunk_id(OLD_ID, 0),
+            Document.generate_chunk_id(OLD_ID, 1),
+        ]
+    )
+    # Obsolete points are removed before any migrated point is written
+    assert qdrant_manager.delete_points.call_args_list[0].args[0] == [
+        Document.generate_chunk_id(STALE_ID, 0),
+        Document.generate_chunk_id(NEW_ID, 0),
+    ]
+
+    upserted = qdrant_manager.upsert_points.call_args.args[0]
+    assert [point.id for point in upserted] == [
+        Document.generate_chunk_id(NEW_ID, 0),
+        Document.generate_chunk_id(NEW_ID, 1),
+    ]
+    assert all(point.vector == [0.1, 0.2] for point in upserted)
+    assert all(point.payload["document_id"] == NEW_ID for point in upserted)
+    assert all(
+        point.payload["metadata"]["parent_document_id"] == NEW_ID for point in upserted
+    )
+
+
+@pytest.mark.asyncio
+async def test_dry_run_changes_nothing(populated_state, qdrant_manager):
+    """A dry run reports the migration without writing anything."""
+    result = await PublicDocsIdMigration(
+        populated_state, qdrant_manager, dry_run=True
+    ).run()
+
+    assert result.documents_migrated == 1
+    assert result.points_migrated == 2
+    qdrant_manager.upsert_points.assert_not_called()
+    qdrant_manager.delete_points.assert_not_called()
+    async with await populated_state.get_session() as session:
+        records = (await session.execute(select(DocumentStateRecord))).scalars().all()
+    assert len(records) == 3
@@ -0,0 +1,163 @@
+"""Tests for the corpus knowledge graph built after ingestion."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client.http import models
+from qdrant_loader.core.knowledge_graph import (
+    CO_OCCURS,
+    DISCUSSES,
+    DOCUMENT,
+    ENTITY,
+    GRAPH_PAYLOAD_FIELDS,
+    MENTIONS,
+    SIMILAR_TO,
+    TOPIC,
+    CorpusKnowledgeGraph,
+    KnowledgeGraphBuilder,
+    build_knowledge_graph,
+    entity_names,
+    topic_names,
+)
+
+
+def _payload(document_id: str, entities: list, topics: list) -> dict:
+    return {
+        "document_id": document_id,
+        "title": f"Title of {document_id}",
+        "metadata": {
+            "entities": [[entity, "ORG"] for entity in entities],
+            "topics": [
+                {"id": 0, "terms": [{"term": topic, "weight": 0.5}]} for topic in topics
+            ],
+        },
+    }
+
+
+PAYLOADS = [
+    _payload("auth", ["OAuth", "Keycloak"], ["login"]),
+    _payload("sso", ["oauth", "Keycloak"], ["login"]),
+    _payload("db", ["Postgres"], ["storage"]),
+]
+
+
+def _edges(graph: CorpusKnowledgeGraph) -> set[tuple[str, str, int]]:
+    edges = set()
+    for node in range(graph.node_count):
+        for position in range(graph.indptr[node], graph.indptr[node + 1]):
+            edges.add(
+                (
+                    str(graph.node_keys[node]),
+                    str(graph.node_keys[graph.indices[position]]),
+                    int(graph.relationships[position]),
+                )
+            )
+    return edges
+
+
+def test_entity_and_topic_names_accept_stored_formats():
+    assert entity_names(
+        [["OAuth", "ORG"], {"text": "Keycloak", "label": "ORG"}, "Postgres", "x"]
+    ) == ["OAuth", "Keycloak", "Postgres"]
+    assert topic_names(
+        [
+            {"id": 0, "terms": [{"term": "login", "weight": 0.4}]},
+            {"id": 0, "terms": [{"term": "general", "weight": 1.0}]},
+            {"text": "storage", "score": 0.2},
+        ]
+    ) == ["login", "storage"]
+
+
+def test_build_links_documents_entities_and_topics():
+    builder = KnowledgeGraphBuilder()
+    for payload in PAYLOADS + [_payload("auth", ["OAuth"], [])]:
+        builder.add_payload(payload)
+
+    graph = builder.build("docs")
+
+    # Entities and topics of a single document are not nodes
+    assert graph.node_keys.tolist() == [
+        "auth",
+        "sso",
+        "db",
+        "keycloak",
+        "oauth",
+        "login",
+    ]
+    assert graph.node_types.tolist() == [DOCUMENT] * 3 + [ENTITY] * 2 + [TOPIC]
+    assert graph.node_titles[0] == "Title of auth"
+    assert graph.node_titles[4] == "OAuth"
+
+    edges = _edges(graph)
+    assert ("auth", "oauth", MENTIONS) in edges
+    assert ("oauth", "auth", MENTIONS) in edges
+    assert ("sso", "login", DISCUSSES) in edges
+    assert ("keycloak", "oauth", CO_OCCURS) in edges
+    assert ("auth", "sso", SIMILAR_TO) in edges
+    assert not any("db" in edge[:2] for edge in edges)
+    assert graph.get_statistics()["relationship_types"] == {
+        "mentions": 4,
+        "discusses": 2,
+        "co_occurs": 1,
+        "similar_to": 1,
+    }
+
+    # Connected documents rank above the isolated one
+    assert graph.centrality[0] > graph.centrality[2]
+    assert graph.hub[0] > 0 and graph.authority[4] > 0
+
+
+def test_similar_documents_are_capped():
+    builder = KnowledgeGraphBuilder(similar_documents=1, max_feature_share=1.0)
+    for index in range(4):
+        builder.add_payload(_payload(f"doc{index}", ["OAuth", "Keycloak"], []))
+
+    graph = builder.build()
+
+    similar = graph.relationships == SIMILAR_TO
+    # Each document keeps its strongest link; links are stored both ways
+    assert 0 < similar.sum() // 2 < 6
+
+
+def test_save_and_load_round_trip(tmp_path):
+    builder = KnowledgeGraphBuilder()
+    for payload in PAYLOADS:
+        builder.add_payload(payload)
+    graph = builder.build("docs")
+    path = tmp_path / "graphs" / "kg.npz"
+
+    graph.save(path)
+    loaded = CorpusKnowledgeGraph.load(path)
+
+    assert loaded.collection_name == "docs"
+    assert list(tmp_path.joinpath("graphs").iterdir()) == [path]
+    for name in ("node_keys", "indptr", "indices", "weights", "centrality"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(graph, name))
+
+
+def test_empty_graph():
+    graph = KnowledgeGraphBuilder().build()
+
+    assert graph.node_count == 0
+    assert graph.indptr.tolist() == [0]
+
+
+@pytest.mark.asyncio
+async def test_build_knowledge_graph_scrolls_collection(tmp_path):
+    pages = [
+        ([models.Record(id=1, payload=payload) for payload in PAYLOADS[:2]], 3),
+        ([models.Record(id=3, payload=PAYLOADS[2])], None),
+    ]
+    qdrant_manager = MagicMock()
+    qdrant_manager.collection_name = "docs"
+    qdrant_manager.scroll_points = AsyncMock(side_effect=pages)
+    path = tmp_path / "kg.npz"
+
+    graph = await build_knowledge_graph(qdrant_manager, path)
+
+    assert graph.node_count == 6
+    assert CorpusKnowledgeGraph.load(path).node_count == 6
+    first_call = qdrant_manager.scroll_points.await_args_list[0]
+    assert first_call.kwargs["with_payload"] == GRAPH_PAYLOAD_FIELDS
+    assert qdrant_manager.scroll_points.await_args_list[1].kwargs["offset"] == 3
@@ -0,0 +1,65 @@
+"""Tests for DocumentVectorIndex."""
+
+import numpy as np
+import pytest
+from qdrant_loader.core.text_processing.document_vector_index import (
+    DocumentVectorIndex,
+)
+
+
+def test_similarities_are_cosine_similarities():
+    """Similarities match the cosine similarity of the raw vectors."""
+    rng = np.random.default_rng(0)
+    vectors = {f"doc{i}": rng.normal(size=8) for i in range(5)}
+    index = DocumentVectorIndex()
+    for doc_id, vector in vectors.items():
+        index.add(doc_id, vector)
+
+    query = rng.normal(size=8)
+    similarities = index.similarities(query)
+
+    assert set(similarities) == set(vectors)
+    for doc_id, vector in vectors.items():
+        expected = vector @ query / (np.linalg.norm(vector) * np.linalg.norm(query))
+        assert similarities[doc_id] == pytest.approx(expected, abs=1e-5)
+
+
+def test_top_k_returns_most_similar_first():
+    """Only the most similar documents are returned with top_k."""
+    index = DocumentVectorIndex()
+    index.add("x", [1.0, 0.0])
+    index.add("y", [0.0, 1.0])
+    index.add("xy", [1.0, 1.0])
+
+    assert list(index.similarities([1.0, 0.1], top_k=2)) == ["x", "xy"]
+
+
+def test_capacity_evicts_oldest_documents():
+    """The index is bounded and evicts the oldest documents first."""
+    index = DocumentVectorIndex(capacity=100)
+    vectors = np.eye(150)
+    for i in range(150):
+        index.add(f"doc{i}", vectors[i])
+
+    assert len(index) == 100
+    assert "doc49" not in index
+    assert "doc50" in index
+    # Rows moved by removals still belong to the right documents
+    for i in (50, 120, 149):
+        similarities = index.similarities(vectors[i])
+        assert max(similarities, key=similarities.get) == f"doc{i}"
+
+
+def test_remove_and_zero_vectors():
+    """Removed documents disappear; zero vectors have zero similarity."""
+    index = DocumentVectorIndex()
+    index.add("a", [1.0, 0.0])
+    index.add("zero", [0.0, 0.0])
+    index.add("b", [0.0, 1.0])
+    index.remove("a")
+
+    assert index.similarities([0.0, 2.0]) == {"b": 1.0, "zero": 0.0}
+    assert index.similarities([0.0, 0.0]) == {"b": 0.0, "zero": 0.0}
+
+    with pytest.raises(ValueError):
+        index.add("c", [1.0, 2.0, 3.0])
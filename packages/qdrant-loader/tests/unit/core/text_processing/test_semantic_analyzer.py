@@ -3,11 +3,13 @@
 import logging
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from qdrant_loader.core.text_processing.semantic_analyzer import (
     SemanticAnalysisResult,
     SemanticAnalyzer,
 )
+from spacy.tokens import Doc
 
 
 class TestSemanticAnalysisResult:
@@ -428,6 +430,137 @@ class TestSemanticAnalyzer:
 
             assert len(analyzer._doc_cache) == 0
 
+    def test_clear_document_cache_keeps_model(self, mock_nlp):
+        """Test that clearing analyzed documents keeps the model loaded."""
+        with patch("spacy.load", return_value=mock_nlp):
+            analyzer = SemanticAnalyzer()
+            analyzer._doc_cache["chunk_0"] = Mock()
+
+            analyzer.clear_document_cache()
+
+            assert analyzer._doc_cache == {}
+            assert analyzer.nlp is mock_nlp
+            assert analyzer.nlp.vocab.strings
+
+    def test_analyze_texts_uses_pipe(self, mock_nlp, mock_doc):
+        """Test that batched analysis runs spaCy once for all texts."""
+        with (
+            patch("spacy.load", return_value=mock_nlp),
+            patch.object(SemanticAnalyzer, "_extract_topics", return_value=[]),
+        ):
+            mock_doc.__class__ = Doc
+            mock_nlp.return_value = mock_doc
+            mock_nlp.pipe.side_effect = lambda texts, **kwargs: (
+                mock_doc for _ in texts
+            )
+            analyzer = SemanticAnalyzer(batch_size=8, n_process=2)
+            cached = analyzer.analyze_texts(["Cached"], ["doc0"])[0]
+
+            results = analyzer.analyze_texts(
+                ["Cached", "Apple is a company", "Apple again"],
+                ["doc0", "doc1", "doc2"],
+            )
+
+            assert results[0] is cached
+            assert [call.kwargs for call in mock_nlp.pipe.call_args_list] == [
+                {"batch_size": 8, "n_process": 2}
+            ] * 2
+            assert list(mock_nlp.pipe.call_args.args[0]) == []
+            # spaCy only runs on entity contexts, each parsed once
+            assert mock_nlp.call_count == 2
+            assert set(analyzer._doc_cache) == {"doc0", "doc1", "doc2"}
+            # Later texts are compared with the earlier ones, like analyze_text
+            assert set(results[2].document_similarity) == {"doc0", "doc1"}
+
+    def test_topics_inferred_with_corpus_model(self, mock_nlp):
+        """Test that a corpus-level topic model replaces per-text training."""
+        topic_model = Mock()
+        topic_model.get_topics.return_value = [
+            [
+                {
+                    "id": 1,
+                    "terms": [{"term": "vector", "weight": 0.4}],
+                    "probability": 0.9,
+                }
+            ],
+            [],
+        ]
+        with (
+            patch("spacy.load", return_value=mock_nlp),
+            patch(
+                "qdrant_loader.core.text_processing.semantic_analyzer.LdaModel"
+            ) as lda_class,
+        ):
+            analyzer = SemanticAnalyzer(min_topic_tokens=8)
+            analyzer.topic_model = topic_model
+
+            topics = analyzer._infer_topics(["long text", "short"])
+
+            lda_class.assert_not_called()
+            topic_model.get_topics.assert_called_once_with(["long text", "short"], 8)
+            assert topics[0] == [
+                {
+                    "id": 1,
+                    "terms": [{"term": "vector", "weight": 0.4}],
+                    "probability": 0.9,
+                    "coherence": 0.4,
+                }
+            ]
+            assert topics[1][0]["terms"] == [{"term": "general", "weight": 1.0}]
+
+    def test_similarity_uses_vector_index(self, mock_nlp, mock_doc):
+        """Test that models with vectors compare cached contexts in one index."""
+        mock_nlp.vocab.vectors_length = 2
+        mock_doc.__class__ = Doc
+        with (
+            patch("spacy.load", return_value=mock_nlp),
+            patch.object(SemanticAnalyzer, "_extract_topics", return_value=[]),
+        ):
+            analyzer = SemanticAnalyzer(cache_size=2)
+            for index, vector in enumerate([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]):
+                mock_doc.ents[0].sent.vector = np.array(vector)
+                mock_doc.vector = np.array([1.0, 0.0])
+                result = analyzer._analyze_doc(mock_doc, "text", f"chunk_{index}")
+
+            # chunk_0 was evicted after chunk_2 was compared with it
+            assert result.document_similarity == pytest.approx(
+                {"chunk_0": 1.0, "chunk_1": 0.0}
+            )
+            assert set(analyzer._doc_cache) == {"chunk_1", "chunk_2"}
+            assert analyzer._calculate_document_similarity(mock_doc) == pytest.approx(
+                {"chunk_1": 0.0, "chunk_2": 2**-0.5}
+            )
+            mock_nlp.assert_not_called()
+
+    def test_analyze_texts_requires_one_id_per_text(self, mock_nlp):
+        """Test that mismatched document IDs are rejected."""
+        with patch("spacy.load", return_value=mock_nlp):
+            analyzer = SemanticAnalyzer()
+
+            with pytest.raises(ValueError):
+                analyzer.analyze_texts(["one", "two"], ["doc1"])
+
+    def test_light_profile_disables_pipes(self, mock_nlp):
+        """Test that the light profile disables the parser and lemmatizer."""
+        mock_nlp.pipe_names = ["tok2vec", "tagger", "parser", "lemmatizer", "ner"]
+        mock_nlp.disabled = ["senter"]
+        with patch("spacy.load", return_value=mock_nlp):
+            SemanticAnalyzer(pipeline_profile="light")
+
+        disabled = [call.args[0] for call in mock_nlp.disable_pipe.call_args_list]
+        assert disabled == ["parser", "lemmatizer"]
+        mock_nlp.enable_pipe.assert_called_once_with("senter")
+
+    def test_key_phrases_without_parser(self, mock_nlp, mock_doc):
+        """Test that noun chunks are skipped without a dependency parse."""
+        mock_doc.has_annotation = Mock(side_effect=lambda name: name != "DEP")
+        with patch("spacy.load", return_value=mock_nlp):
+            analyzer = SemanticAnalyzer()
+
+            key_phrases = analyzer._extract_key_phrases(mock_doc)
+
+            assert key_phrases == ["Apple"]
+
     def test_logging_configuration(self, mock_nlp):
         """Test that logging is properly configured."""
         with patch("spacy.load", return_value=mock_nlp):
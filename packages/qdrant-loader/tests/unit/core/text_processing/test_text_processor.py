@@ -579,6 +579,57 @@ class TestTextProcessor:
         # Verify select_pipes was not called (no parser to remove)
         self.mock_nlp.select_pipes.assert_not_called()
 
+    @patch("qdrant_loader.core.text_processing.text_processor.spacy.load")
+    @patch(
+        "qdrant_loader.core.text_processing.text_processor.RecursiveCharacterTextSplitter"
+    )
+    @patch("qdrant_loader.core.text_processing.text_processor.nltk")
+    def test_pipeline_optimization_disables_lemmatizer(
+        self, mock_nltk, mock_text_splitter_class, mock_spacy_load, mock_settings
+    ):
+        """Test that the parser and lemmatizer are disabled."""
+        mock_nltk.data.find.return_value = True
+        mock_spacy_load.return_value = self.mock_nlp
+        mock_text_splitter_class.return_value = self.mock_text_splitter
+        self.mock_nlp.pipe_names = ["tagger", "parser", "lemmatizer", "ner"]
+
+        TextProcessor(mock_settings)
+
+        self.mock_nlp.select_pipes.assert_called_once_with(enable=["tagger", "ner"])
+
+    @patch("qdrant_loader.core.text_processing.text_processor.spacy.load")
+    @patch(
+        "qdrant_loader.core.text_processing.text_processor.RecursiveCharacterTextSplitter"
+    )
+    @patch("qdrant_loader.core.text_processing.text_processor.nltk")
+    def test_process_texts_uses_pipe(
+        self, mock_nltk, mock_text_splitter_class, mock_spacy_load, mock_settings
+    ):
+        """Test batched text processing with nlp.pipe."""
+        mock_nltk.data.find.return_value = True
+        mock_settings.global_config.semantic_analysis.batch_size = 16
+
+        docs = []
+        for text in ["Hello", "world"]:
+            token = MagicMock()
+            token.text = text
+            token.pos_ = "NOUN"
+            doc = MagicMock()
+            doc.__iter__.side_effect = lambda token=token: iter([token])
+            doc.ents = []
+            docs.append(doc)
+        self.mock_nlp.pipe.return_value = iter(docs)
+        mock_spacy_load.return_value = self.mock_nlp
+        mock_text_splitter_class.return_value = self.mock_text_splitter
+
+        processor = TextProcessor(mock_settings)
+        results = processor.process_texts(["Hello", "world"])
+
+        self.mock_nlp.pipe.assert_called_once_with(["Hello", "world"], batch_size=16)
+        self.mock_nlp.assert_not_called()
+        assert [result["tokens"] for result in results] == [["Hello"], ["world"]]
+        assert results[1]["pos_tags"] == [("world", "NOUN")]
+
     @patch("qdrant_loader.core.text_processing.text_processor.spacy.load")
     @patch(
         "qdrant_loader.core.text_processing.text_processor.RecursiveCharacterTextSplitter"
@@ -3,7 +3,12 @@
 from unittest.mock import Mock, patch
 
 import pytest
-from qdrant_loader.core.text_processing.topic_modeler import TopicModeler
+import spacy
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.text_processing.topic_modeler import (
+    CorpusTopicModels,
+    TopicModeler,
+)
 
 
 @pytest.fixture
@@ -121,6 +126,9 @@ def test_train_model(mock_lda_model, mock_dictionary, topic_modeler):
         ]  # Always return 5 tokens
 
     topic_modeler._preprocess_text = Mock(side_effect=mock_preprocess)
+    topic_modeler._preprocess_texts = Mock(
+        side_effect=lambda texts: [mock_preprocess(text) for text in texts]
+    )
 
     # Mock the dictionary and model
     mock_dict_instance = Mock()
@@ -171,6 +179,9 @@ def test_infer_topics_with_training(mock_lda_model, mock_dictionary, topic_model
         ]  # Always return 5 tokens
 
     topic_modeler._preprocess_text = Mock(side_effect=mock_preprocess)
+    topic_modeler._preprocess_texts = Mock(
+        side_effect=lambda texts: [mock_preprocess(text) for text in texts]
+    )
 
     # Mock the dictionary and model
     mock_dict_instance = Mock()
@@ -227,6 +238,9 @@ def test_small_corpus_handling(mock_lda_model, mock_dictionary, topic_modeler):
         ]  # Always return 5 tokens
 
     topic_modeler._preprocess_text = Mock(side_effect=mock_preprocess)
+    topic_modeler._preprocess_texts = Mock(
+        side_effect=lambda texts: [mock_preprocess(text) for text in texts]
+    )
 
     # Mock the dictionary and model
     mock_dict_instance = Mock()
@@ -247,3 +261,134 @@ def test_small_corpus_handling(mock_lda_model, mock_dictionary, topic_modeler):
     assert "coherence" in result
     # Small corpus may not generate meaningful topics
     assert len(result["topics"]) >= 0  # May be empty for very small corpus
+
+
+CORPUS = {
+    "databases": [
+        "Vector databases store embeddings and answer similarity queries over large collections.",
+        "Embeddings of documents are indexed by the database to speed up similarity search.",
+        "A vector database shards collections and replicates the stored embeddings.",
+    ],
+    "cooking": [
+        "Bake the bread dough in a hot oven until the crust turns golden brown.",
+        "Knead the dough with flour, water and yeast before letting the bread rise.",
+        "Slice the warm bread and serve it with butter fresh from the oven.",
+    ],
+}
+
+
+def _corpus_documents() -> list[Document]:
+    return [
+        Document(
+            title=f"{source} {index}",
+            content=text,
+            content_type="md",
+            source_type="localfile",
+            source=source,
+            url=f"file:///{source}/{index}.md",
+            metadata={},
+        )
+        for source, texts in CORPUS.items()
+        for index, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def blank_nlp():
+    """Tokenizer-only spaCy pipeline, enough for topic preprocessing."""
+    with patch(
+        "qdrant_loader.core.text_processing.topic_modeler.spacy.load",
+        return_value=spacy.blank("en"),
+    ):
+        yield
+
+
+def test_corpus_models_train_one_model_per_source(blank_nlp):
+    """One model is trained per source and used for batched inference."""
+    topic_models = CorpusTopicModels(num_topics=2, passes=2)
+    topic_models.train(_corpus_documents())
+
+    model = topic_models.get("localfile:databases")
+    assert model is not None
+    assert topic_models.get("localfile:cooking") is not model
+    assert topic_models.get("localfile:unknown") is None
+
+    topics = model.get_topics(
+        [
+            "Similarity search over embeddings stored in the vector database.",
+            "Too short",
+        ]
+    )
+    assert topics[1] == []
+    assert topics[0]
+    assert sum(topic["probability"] for topic in topics[0]) == pytest.approx(
+        1.0, abs=0.1
+    )
+    assert {term["term"] for term in topics[0][0]["terms"]} <= set(
+        model.dictionary.token2id
+    )
+
+
+def test_get_topics_skips_texts_below_token_threshold(blank_nlp):
+    """Texts with fewer tokens than the threshold get no topics."""
+    topic_models = CorpusTopicModels(num_topics=2, passes=2)
+    topic_models.train(_corpus_documents())
+    model = topic_models.get("localfile:cooking")
+
+    text = "Knead the bread dough and bake it in the oven."
+    assert model.get_topics([text], min_tokens=3)[0]
+    assert model.get_topics([text], min_tokens=50)[0] == []
+
+
+def test_corpus_models_are_persisted_and_refreshed(blank_nlp, tmp_path):
+    """Persisted models are loaded by other instances and refreshed."""
+    CorpusTopicModels(num_topics=2, passes=2, model_dir=tmp_path).train(
+        _corpus_documents()
+    )
+
+    # Another process loads the persisted model
+    reader = CorpusTopicModels(num_topics=2, passes=2, model_dir=tmp_path)
+    model = reader.get("localfile:databases")
+    assert model is not None
+    vocabulary = dict(model.dictionary.token2id)
+
+    # Refreshing keeps the vocabulary of the persisted model
+    with patch(
+        "qdrant_loader.core.text_processing.topic_modeler.models.LdaModel"
+    ) as lda_class:
+        reader.train(_corpus_documents()[:1])
+    lda_class.assert_not_called()
+    assert reader.get("localfile:databases").dictionary.token2id == vocabulary
+
+
+def test_texts_longer_than_spacy_max_length_are_trained(blank_nlp):
+    """Documents above spaCy's max_length are tokenized in pieces."""
+    documents = _corpus_documents()
+    long_text = " ".join(CORPUS["databases"]) + " "
+    documents[0].content = long_text * (1_200_000 // len(long_text))
+    assert len(documents[0].content) > spacy.blank("en").max_length
+
+    topic_models = CorpusTopicModels(num_topics=2, passes=2)
+    topic_models.train(documents)
+
+    model = topic_models.get("localfile:databases")
+    assert model is not None
+    assert "embeddings" in model.dictionary.token2id
+    assert all(len(digest) == 64 for digest in model._processed_texts)
+
+
+def test_failed_source_does_not_stop_training(blank_nlp):
+    """A source whose training fails is skipped, the others get models."""
+    topic_models = CorpusTopicModels(num_topics=2, passes=2)
+    train_model = TopicModeler.train_model
+
+    def fail_for_cooking(self, texts):
+        if "bread" in texts[0]:
+            raise RuntimeError("training failed")
+        train_model(self, texts)
+
+    with patch.object(TopicModeler, "train_model", fail_for_cooking):
+        topic_models.train(_corpus_documents())
+
+    assert topic_models.get("localfile:cooking") is None
+    assert topic_models.get("localfile:databases") is not None
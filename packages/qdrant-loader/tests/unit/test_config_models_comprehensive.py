@@ -54,7 +54,18 @@ class TestSemanticAnalysisConfig:
         )
 
         data = config.model_dump()
-        expected = {"num_topics": 7, "lda_passes": 15, "spacy_model": "en_core_web_lg"}
+        expected = {
+            "num_topics": 7,
+            "lda_passes": 15,
+            "spacy_model": "en_core_web_lg",
+            "batch_size": 32,
+            "n_process": 1,
+            "pipeline_profile": "full",
+            "topic_model_dir": None,
+            "min_topic_tokens": 5,
+            "analysis_cache_size": 1000,
+            "similarity_top_k": None,
+        }
         assert data == expected
 
 